@@ -15,6 +15,8 @@ import re
 from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass
 
+from nextvision.utils.parse_cache import ParseCache, get_parse_cache, prompt_version
+
 # Configuration du logging isolé pour ce module
 cv_logger = logging.getLogger('gpt_modules.cv_parser')
 
@@ -58,10 +60,11 @@ class CVParserGPT:
     Parser CV GPT v4.0.4 - Template prompt corrigé avec échappement accolades JSON
     """
     
-    def __init__(self, openai_client=None):
+    def __init__(self, openai_client=None, parse_cache: Optional[ParseCache] = None):
         self.client = openai_client
         self.logger = cv_logger
         self.version = "4.0.4"
+        self.model = "gpt-4"
         
         # Prompt optimisé avec accolades JSON échappées
         self.prompt_template = """Analysez ce CV et extrayez TOUTES les informations dans ce format JSON exact:
@@ -105,6 +108,11 @@ RÈGLES IMPORTANTES:
 CV à analyser:
 {cv_text}"""
 
+        # Cache de parsing : la clé inclut la version du prompt et du modèle
+        self.parse_cache = parse_cache or get_parse_cache(
+            "cv_gpt", prompt_version(self.version, self.model, self.prompt_template), CVData
+        )
+
     def _safe_int_conversion(self, value: Any, field_name: str = "") -> Optional[int]:
         """
         Conversion sécurisée vers int avec gestion des cas spéciaux
@@ -218,28 +226,8 @@ CV à analyser:
                 self.logger.warning("Pas de client OpenAI configuré, utilisation du profil fallback")
                 return self._get_fallback_profile()
             
-            # Appel OpenAI avec prompt optimisé (template corrigé)
-            prompt = self.prompt_template.format(cv_text=cv_text)
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                max_tokens=2000
-            )
-            
-            response_text = response.choices[0].message.content.strip()
-            self.logger.debug(f"Réponse GPT brute: {response_text[:200]}...")
-            
-            # Nettoyage robuste du JSON
-            cleaned_json = self.clean_json_response(response_text)
-            self.logger.debug(f"JSON nettoyé: {cleaned_json[:200]}...")
-            
-            # Parse JSON
-            parsed_data = json.loads(cleaned_json)
-            
-            # Conversion en CVData avec validation
-            cv_data = self._validate_and_convert(parsed_data)
+            # Cache de parsing (un seul appel GPT par CV identique)
+            cv_data = self.parse_cache.get_or_parse(cv_text, self._parse_with_gpt)
             
             # Log des performances
             elapsed_time = (time.time() - start_time) * 1000
@@ -249,7 +237,6 @@ CV à analyser:
             
         except json.JSONDecodeError as e:
             self.logger.error(f"Erreur JSON parsing: {str(e)}")
-            self.logger.error(f"JSON problématique: {response_text if 'response_text' in locals() else 'N/A'}")
             elapsed_time = (time.time() - start_time) * 1000
             self.logger.info(f"Fallback utilisé après {elapsed_time:.1f}ms")
             return self._get_fallback_profile()
@@ -260,6 +247,37 @@ CV à analyser:
             self.logger.info(f"Fallback utilisé après {elapsed_time:.1f}ms")
             return self._get_fallback_profile()
 
+    def _parse_with_gpt(self, cv_text: str) -> CVData:
+        """
+        Appel GPT et conversion (lève une exception en cas d'échec : rien n'est mis en cache)
+        """
+        # Appel OpenAI avec prompt optimisé (template corrigé)
+        prompt = self.prompt_template.format(cv_text=cv_text)
+        
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.1,
+            max_tokens=2000
+        )
+        
+        response_text = response.choices[0].message.content.strip()
+        self.logger.debug(f"Réponse GPT brute: {response_text[:200]}...")
+        
+        # Nettoyage robuste du JSON
+        cleaned_json = self.clean_json_response(response_text)
+        self.logger.debug(f"JSON nettoyé: {cleaned_json[:200]}...")
+        
+        # Parse JSON
+        try:
+            parsed_data = json.loads(cleaned_json)
+        except json.JSONDecodeError:
+            self.logger.error(f"JSON problématique: {response_text}")
+            raise
+        
+        # Conversion en CVData avec validation
+        return self._validate_and_convert(parsed_data)
+
     def extract_hierarchical_level(self, experience_years: int, titre_poste: str) -> str:
         """
         Détermine le niveau hiérarchique selon l'expérience et le titre
@@ -14,6 +14,8 @@ import time
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
+from nextvision.utils.skill_index import get_default_skill_index
+
 # Configuration du logging isolé pour ce module
 integration_logger = logging.getLogger('gpt_modules.integration')
 
@@ -59,6 +61,9 @@ class GPTNextvisionIntegrator:
         self.critical_mismatch_threshold = 0.4  # Charlotte vs comptable < 0.4
         self.hierarchical_gap_threshold = 2     # Plus de 2 niveaux d'écart
         self.performance_target_ms = 100       # < 100ms maintenue
+        
+        # Index de compétences partagé avec le SemanticScorer
+        self.skill_index = get_default_skill_index()
 
     def calculate_sector_score(self, candidate_sector: str, job_sector: str) -> float:
         """
@@ -243,33 +248,15 @@ class GPTNextvisionIntegrator:
         if not candidate_skills or not job_required_skills:
             return 0.4  # Score par défaut plus bas
         
-        # Calcul de compatibilité sémantique simple
-        candidate_skills_lower = [skill.lower() for skill in candidate_skills]
-        required_skills_lower = [skill.lower() for skill in job_required_skills]
-        preferred_skills_lower = [skill.lower() for skill in job_preferred_skills]
-        
-        # Compétences requises matchées
-        required_matches = 0
-        for req_skill in required_skills_lower:
-            for cand_skill in candidate_skills_lower:
-                if req_skill in cand_skill or cand_skill in req_skill:
-                    required_matches += 1
-                    break
-        
-        # Compétences préférées matchées  
-        preferred_matches = 0
-        for pref_skill in preferred_skills_lower:
-            for cand_skill in candidate_skills_lower:
-                if pref_skill in cand_skill or cand_skill in pref_skill:
-                    preferred_matches += 1
-                    break
-        
-        # Score basé sur les matches
-        if not required_skills_lower:
-            return 0.4
-            
-        required_ratio = required_matches / len(required_skills_lower)
-        preferred_ratio = preferred_matches / len(preferred_skills_lower) if preferred_skills_lower else 0
+        # Profil candidat compilé une fois (correspondance stricte, sans synonymes)
+        candidate_profile = self.skill_index.compile_profile(candidate_skills)
+        
+        # Compétences requises et préférées matchées
+        required_matches = self.skill_index.count_matches(job_required_skills, candidate_profile, use_synonyms=False)
+        preferred_matches = self.skill_index.count_matches(job_preferred_skills, candidate_profile, use_synonyms=False)
+        
+        required_ratio = required_matches / len(job_required_skills)
+        preferred_ratio = preferred_matches / len(job_preferred_skills) if job_preferred_skills else 0
         
         # Score combiné (70% requis, 30% préféré)
         semantic_score = (required_ratio * 0.7) + (preferred_ratio * 0.3)
@@ -14,6 +14,8 @@ import time
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 
+from nextvision.utils.parse_cache import ParseCache, get_parse_cache, prompt_version
+
 # Configuration du logging isolé pour ce module
 job_logger = logging.getLogger('gpt_modules.job_parser')
 
@@ -64,10 +66,11 @@ class JobParserGPT:
     Parser fiches de poste GPT v3.0.2 - Template prompt corrigé avec échappement accolades JSON
     """
     
-    def __init__(self, openai_client=None):
+    def __init__(self, openai_client=None, parse_cache: Optional[ParseCache] = None):
         self.client = openai_client
         self.logger = job_logger
         self.version = "3.0.2"
+        self.model = "gpt-4"
         
         # Prompt optimisé avec accolades JSON échappées
         self.prompt_template = """Analysez cette fiche de poste et extrayez TOUTES les informations dans ce format JSON exact:
@@ -112,6 +115,11 @@ RÈGLES IMPORTANTES:
 Fiche de poste à analyser:
 {job_text}"""
 
+        # Cache de parsing : la clé inclut la version du prompt et du modèle
+        self.parse_cache = parse_cache or get_parse_cache(
+            "job_gpt", prompt_version(self.version, self.model, self.prompt_template), JobData
+        )
+
     def extract_hierarchical_level(self, experience_min: int, experience_max: int, titre_poste: str) -> str:
         """
         Détermine le niveau hiérarchique selon l'expérience et le titre
@@ -189,35 +197,8 @@ Fiche de poste à analyser:
                 self.logger.warning("Pas de client OpenAI configuré, utilisation du poste fallback")
                 return self._get_fallback_job()
             
-            # Appel OpenAI avec prompt optimisé (template corrigé)
-            prompt = self.prompt_template.format(job_text=job_text)
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                max_tokens=2000
-            )
-            
-            response_text = response.choices[0].message.content.strip()
-            self.logger.debug(f"Réponse GPT brute: {response_text[:200]}...")
-            
-            # Nettoyage du JSON si encapsulé dans des backticks
-            if response_text.startswith('```json'):
-                response_text = response_text.replace('```json', '').replace('```', '').strip()
-            elif response_text.startswith('```'):
-                response_text = response_text.replace('```', '').strip()
-            
-            # Extraction JSON robuste
-            json_start = response_text.find('{')
-            json_end = response_text.rfind('}')
-            if json_start >= 0 and json_end > json_start:
-                response_text = response_text[json_start:json_end + 1]
-            
-            parsed_data = json.loads(response_text)
-            
-            # Conversion en JobData avec validation
-            job_data = self._validate_and_convert(parsed_data)
+            # Cache de parsing (un seul appel GPT par fiche identique)
+            job_data = self.parse_cache.get_or_parse(job_text, self._parse_with_gpt)
             
             # Log des performances
             elapsed_time = (time.time() - start_time) * 1000
@@ -231,6 +212,40 @@ Fiche de poste à analyser:
             self.logger.info(f"Fallback utilisé après {elapsed_time:.1f}ms")
             return self._get_fallback_job()
 
+    def _parse_with_gpt(self, job_text: str) -> JobData:
+        """
+        Appel GPT et conversion (lève une exception en cas d'échec : rien n'est mis en cache)
+        """
+        # Appel OpenAI avec prompt optimisé (template corrigé)
+        prompt = self.prompt_template.format(job_text=job_text)
+        
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.1,
+            max_tokens=2000
+        )
+        
+        response_text = response.choices[0].message.content.strip()
+        self.logger.debug(f"Réponse GPT brute: {response_text[:200]}...")
+        
+        # Nettoyage du JSON si encapsulé dans des backticks
+        if response_text.startswith('```json'):
+            response_text = response_text.replace('```json', '').replace('```', '').strip()
+        elif response_text.startswith('```'):
+            response_text = response_text.replace('```', '').strip()
+        
+        # Extraction JSON robuste
+        json_start = response_text.find('{')
+        json_end = response_text.rfind('}')
+        if json_start >= 0 and json_end > json_start:
+            response_text = response_text[json_start:json_end + 1]
+        
+        parsed_data = json.loads(response_text)
+        
+        # Conversion en JobData avec validation
+        return self._validate_and_convert(parsed_data)
+
     def _validate_and_convert(self, parsed_data: Dict[str, Any]) -> JobData:
         """
         Valide et convertit les données parsées en JobData
@@ -32,6 +32,7 @@ from nextvision.api.v3.intelligent_matching import router as v3_intelligent_rout
 
 # === GOOGLE MAPS INTELLIGENCE IMPORTS (Prompt 2) ===
 from nextvision.services.google_maps_service import GoogleMapsService
+from nextvision.services.geo_cache_store import build_geo_cache_store
 from nextvision.services.transport_calculator import TransportCalculator
 from nextvision.engines.transport_filtering import TransportFilteringEngine, FilteringResult
 from nextvision.engines.location_scoring import LocationScoringEngine, LocationScoreExplainer
@@ -46,6 +47,8 @@ from nextvision.models.questionnaire_advanced import (
     MotivationsClassees, DisponibiliteType
 )
 from nextvision.config.google_maps_config import get_google_maps_config, setup_google_maps_logging
+from nextvision.config.production_settings import get_config
+from nextvision.utils.rate_limiter import GCRARateLimiter, add_rate_limiting_middleware
 from nextvision.utils.google_maps_helpers import get_cache, get_performance_monitor
 
 # Configuration du logging
@@ -59,7 +62,12 @@ setup_google_maps_logging(google_maps_config)
 # Services Google Maps
 google_maps_service = GoogleMapsService(
     api_key=google_maps_config.api_key,
-    cache_duration_hours=google_maps_config.geocode_cache_duration_hours
+    cache_duration_hours=google_maps_config.geocode_cache_duration_hours,
+    cache_store=build_geo_cache_store(
+        memory_entries=google_maps_config.memory_cache_max_entries,
+        sqlite_path=google_maps_config.geo_cache_sqlite_path
+    ),
+    negative_cache_minutes=google_maps_config.negative_cache_minutes
 )
 
 transport_calculator = TransportCalculator(google_maps_service)
@@ -138,6 +146,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Rate limiting GCRA : limites strictes sur les routes de parsing GPT
+# (/api/v2/jobs/parse, /api/v2/conversion/commitment, /api/v3/intelligent-matching)
+security_config = get_config().security
+rate_limiter = GCRARateLimiter.from_config(security_config) if security_config.enable_rate_limiting else None
+add_rate_limiting_middleware(app, lambda: rate_limiter)
+
 # === INTÉGRATION ENDPOINT INTELLIGENT v3.2.1 ===
 app.include_router(v3_intelligent_router, tags=["🎯 Intelligent Matching v3.2.1"])
 
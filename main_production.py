@@ -30,14 +30,15 @@ import uvicorn
 from nextvision.config.production_settings import get_config, Environment, health_check_config
 from nextvision.logging.structured_logging import (
     setup_production_logging, get_structured_logger, get_request_tracker,
-    log_operation, LogComponent, LogContext
+    log_operation, LogComponent, LogContext, shutdown_logging, get_logging_stats
 )
 from nextvision.monitoring.health_metrics import create_monitoring_stack
 from nextvision.cache.redis_intelligent_cache import create_cache_manager
 from nextvision.error_handling.graceful_degradation import (
     GracefulDegradationManager, GoogleMapsFallbacks, CacheFallbacks, DatabaseFallbacks
 )
-from nextvision.utils.retry_strategies import create_retry_executor
+from nextvision.utils.retry_strategies import create_retry_executor, is_hedge_attempt
+from nextvision.utils.rate_limiter import GCRARateLimiter, add_rate_limiting_middleware
 from nextvision.performance.batch_processing import BatchProcessor, PerformanceOptimizer
 from nextvision.tests.stress_testing import PerformanceTestRunner
 
@@ -66,6 +67,7 @@ app_state = {
     "filtering_engine": None,
     "location_scoring_engine": None,
     "commitment_bridge": None,
+    "rate_limiter": GCRARateLimiter.from_config(config.security),
     "startup_time": None,
     "shutdown_initiated": False
 }
@@ -110,6 +112,9 @@ async def lifespan(app: FastAPI):
         await cleanup_production_services()
         
         logger.info("✅ Nextvision production shutdown complete")
+        
+        # Vidage de la file de logs en dernier
+        shutdown_logging()
 
 
 async def initialize_production_services():
@@ -126,7 +131,10 @@ async def initialize_production_services():
                 enable_file_logging=config.logging.enable_file_logging,
                 log_file_path=config.logging.log_file_path,
                 max_file_size_mb=config.logging.max_file_size_mb,
-                backup_count=config.logging.backup_count
+                backup_count=config.logging.backup_count,
+                async_logging=config.logging.enable_async_logging,
+                queue_size=config.logging.log_queue_size,
+                sampling_rules=config.logging.logger_sampling
             )
         
         logger.info("📋 Production configuration loaded", extra={
@@ -160,6 +168,17 @@ async def initialize_production_services():
             else:
                 logger.warning("⚠️ Cache manager running in memory-only mode")
         
+        # Rate limiting partagé entre workers (réutilise la connexion Redis du cache)
+        if config.security.rate_limit_backend == "redis":
+            shared_cache = app_state["cache_manager"].cache if app_state["cache_manager"] else None
+            if shared_cache is not None and shared_cache.is_connected:
+                app_state["rate_limiter"] = GCRARateLimiter.from_config(
+                    config.security, redis_client=shared_cache.redis_client
+                )
+                logger.info("🚦 Rate limiting partagé via Redis")
+            else:
+                logger.warning("⚠️ Rate limiting Redis demandé mais Redis indisponible - limites par worker")
+        
         # 4. Graceful degradation manager
         app_state["degradation_manager"] = GracefulDegradationManager(
             metrics_collector=app_state["monitoring_stack"]["metrics_collector"] if app_state["monitoring_stack"] else None
@@ -215,21 +234,41 @@ async def initialize_production_services():
             cache_duration_hours=config.google_maps.geocode_cache_duration_hours
         )
         
-        # Wrapping avec retry et degradation
+        # Wrapping avec retry (budget, hedging, deadline) et degradation
         original_geocode = app_state["google_maps_service"].geocode_address
+        original_route = app_state["google_maps_service"].calculate_route
+        
+        async def retry_google_maps(operation, context):
+            result = await app_state["retry_executor"].execute_with_retry(operation, "google_maps", context=context)
+            if not result.success:
+                raise result.final_error
+            return result.final_result
         
         async def robust_geocode(address: str, force_refresh: bool = False):
             return await app_state["degradation_manager"].execute_with_fallback(
                 "google_maps",
-                lambda: app_state["retry_executor"].execute_with_retry(
-                    lambda: original_geocode(address, force_refresh),
-                    "google_maps",
-                    context={"address": address}
+                lambda: retry_google_maps(
+                    lambda: original_geocode(address, force_refresh, coalesce=not is_hedge_attempt()),
+                    {"address": address}
                 ),
                 {"address": address}
             )
         
+        async def robust_route(origin, destination, travel_mode, departure_time=None):
+            context = {"travel_mode": travel_mode.value}
+            return await app_state["degradation_manager"].execute_with_fallback(
+                "google_maps",
+                lambda: retry_google_maps(
+                    lambda: original_route(
+                        origin, destination, travel_mode, departure_time, coalesce=not is_hedge_attempt()
+                    ),
+                    context
+                ),
+                context
+            )
+        
         app_state["google_maps_service"].geocode_address = robust_geocode
+        app_state["google_maps_service"].calculate_route = robust_route
         
         # 8. Transport services
         app_state["transport_calculator"] = TransportCalculator(app_state["google_maps_service"])
@@ -348,35 +387,10 @@ if config.is_production():
     trusted_hosts = ["nextvision.com", "*.nextvision.com", "localhost"]
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=trusted_hosts)
 
-# Rate limiting middleware (basique)
-from collections import defaultdict
-from time import time as current_time
-
-request_counts = defaultdict(list)
-
-@app.middleware("http")
-async def rate_limiting_middleware(request: Request, call_next):
-    if config.security.enable_rate_limiting:
-        client_ip = request.client.host
-        current_minute = int(current_time() // 60)
-        
-        # Nettoyer anciennes requêtes
-        request_counts[client_ip] = [
-            req_time for req_time in request_counts[client_ip]
-            if req_time > current_minute - 1
-        ]
-        
-        # Vérifier limite
-        if len(request_counts[client_ip]) >= config.security.rate_limit_requests_per_minute:
-            return JSONResponse(
-                status_code=429,
-                content={"error": "Rate limit exceeded"}
-            )
-        
-        request_counts[client_ip].append(current_minute)
-    
-    response = await call_next(request)
-    return response
+# Rate limiting middleware (GCRA, limites par route)
+add_rate_limiting_middleware(
+    app, lambda: app_state["rate_limiter"] if config.security.enable_rate_limiting else None
+)
 
 # Request tracking middleware
 @app.middleware("http")
@@ -623,6 +637,12 @@ async def get_performance_metrics():
         except Exception as e:
             performance_data["system_resources"] = {"error": str(e)}
     
+    # Pipeline de logs (file, records abandonnés)
+    performance_data["logging"] = get_logging_stats()
+    
+    # Rate limiting (requêtes acceptées / refusées, clés suivies)
+    performance_data["rate_limiting"] = app_state["rate_limiter"].get_stats()
+    
     # Requests actives
     performance_data["active_requests"] = {
         "count": request_tracker.get_active_requests_count(),
@@ -744,6 +764,8 @@ async def get_current_configuration():
         },
         "security_config": {
             "rate_limiting_enabled": config.security.enable_rate_limiting,
+            "rate_limit_backend": config.security.rate_limit_backend,
+            "rate_limit_route_limits": config.security.rate_limit_route_limits,
             "cors_origins": config.security.cors_origins
         }
     }
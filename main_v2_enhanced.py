@@ -47,7 +47,7 @@ from nextvision.config.google_maps_config import get_google_maps_config, setup_g
 from nextvision.utils.google_maps_helpers import get_cache, get_performance_monitor
 
 # === NOUVEAUX IMPORTS BIDIRECTIONNELS v2.0 ===
-from nextvision.api.v2.bidirectional_endpoints import bidirectional_router
+from nextvision.api.v2.bidirectional_endpoints import bidirectional_router, configure_bidirectional_matcher
 from nextvision.services.bidirectional_matcher import BiDirectionalMatcherFactory
 from nextvision.adapters.chatgpt_commitment_adapter import CommitmentNextvisionBridge as NewBridge
 
@@ -167,6 +167,25 @@ app.add_middleware(
 app.include_router(bidirectional_router)
 app.include_router(enhanced_router)
 
+@app.on_event("startup")
+async def configure_shared_matching_cache():
+    """🔧 Matcher partagé des endpoints v2 : services Google Maps + cache Redis (CacheManager)"""
+    cache_manager = None
+    try:
+        # Import différé : le cache Redis est optionnel pour l'API v2
+        from nextvision.cache.redis_intelligent_cache import create_cache_manager
+        cache_manager = create_cache_manager(redis_url=os.getenv("REDIS_URL", "redis://localhost:6379"))
+        await cache_manager.initialize()
+    except Exception as e:
+        logger.warning(f"⚠️ Cache Redis indisponible, cache local du matching conservé: {e}")
+        cache_manager = None
+
+    configure_bidirectional_matcher(
+        cache_manager=cache_manager,
+        google_maps_service=google_maps_service,
+        location_scoring_engine=location_scoring_engine
+    )
+
 # 🏗️ Modèles Pydantic simplifiés (conservés v1.0)
 
 class PersonalInfo(BaseModel):
@@ -5,6 +5,7 @@ Nouveaux endpoints pour matching bidirectionnel avec :
 - /api/v2/matching/bidirectional : Matching principal candidat ↔ entreprise
 - /api/v2/conversion/commitment : Conversion depuis Commitment-
 - /api/v2/batch/matching : Matching en lot pour performances
+- /api/v2/batch/matching/stream : Matching en lot en streaming (NDJSON/SSE, sans limite)
 - /api/v2/analytics/scoring : Analytics détaillées des scores
 - Intégration complète avec l'architecture existante
 
@@ -13,9 +14,9 @@ Version: 2.0.0 - Bidirectional API
 """
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Literal, Optional, Union
 import asyncio
 import time
 import nextvision_logging as logging
@@ -31,6 +32,10 @@ from nextvision.services.bidirectional_matcher import (
     BiDirectionalMatcher, BiDirectionalMatcherFactory
 )
 
+from nextvision.services.batch_matching_stream import (
+    StreamingBatchMatcher, format_ndjson, format_sse
+)
+
 from nextvision.adapters.chatgpt_commitment_adapter import (
     CommitmentNextvisionBridge, EnhancedParserV4Output, ChatGPTCommitmentOutput
 )
@@ -57,6 +62,16 @@ class BatchMatchingRequest(BaseModel):
     enable_parallel_processing: bool = Field(True, description="Activer traitement parallèle")
     score_threshold: float = Field(0.3, ge=0.0, le=1.0, description="Seuil score minimum")
 
+class StreamingBatchMatchingRequest(BaseModel):
+    """Requête matching en lot streaming (sans limite de combinaisons)"""
+    candidats: List[BiDirectionalCandidateProfile] = Field(..., min_items=1, description="Liste candidats")
+    entreprises: List[BiDirectionalCompanyProfile] = Field(..., min_items=1, description="Liste entreprises")
+    score_threshold: float = Field(0.3, ge=0.0, le=1.0, description="Seuil score minimum (filtré côté serveur)")
+    top_k: int = Field(20, ge=0, le=1000, description="Taille du classement final")
+    max_concurrency: int = Field(16, ge=1, le=64, description="Matchings simultanés maximum")
+    emit_matches: bool = Field(True, description="Émettre chaque match au-dessus du seuil (sinon résumé seul)")
+    stream_format: Literal["ndjson", "sse"] = Field("ndjson", description="Format du flux")
+
 class BatchMatchingResponse(BaseModel):
     """Réponse matching en lot"""
     total_matches: int
@@ -74,11 +89,29 @@ class ScoringAnalyticsRequest(BaseModel):
 
 # === INITIALISATION SERVICES ===
 
+# Matcher partagé entre requêtes (son cache de résultats l'est donc aussi)
+_shared_matcher: Optional[BiDirectionalMatcher] = None
+
 # Factory pour créer le matcher avec services Google Maps
 def get_bidirectional_matcher() -> BiDirectionalMatcher:
     """Dependency injection pour le matcher bidirectionnel"""
+    global _shared_matcher
     # TODO: Intégrer avec les services Google Maps existants
-    return BiDirectionalMatcherFactory.create_basic_matcher()
+    if _shared_matcher is None:
+        _shared_matcher = BiDirectionalMatcherFactory.create_basic_matcher()
+    return _shared_matcher
+
+def configure_bidirectional_matcher(cache_manager=None,
+                                    google_maps_service=None,
+                                    location_scoring_engine=None) -> BiDirectionalMatcher:
+    """🔧 Remplace le matcher partagé (appelé au démarrage : cache Redis via CacheManager, Google Maps)"""
+    global _shared_matcher
+    _shared_matcher = BiDirectionalMatcherFactory.create_matcher(
+        google_maps_service=google_maps_service,
+        location_scoring_engine=location_scoring_engine,
+        cache_manager=cache_manager
+    )
+    return _shared_matcher
 
 # Bridge Commitment-
 commitment_bridge = CommitmentNextvisionBridge()
@@ -116,7 +149,7 @@ async def calculate_bidirectional_matching(
         logger.info(f"🏢 Entreprise: {request.entreprise.entreprise.nom} - {request.entreprise.poste.titre}")
         
         # Matching bidirectionnel principal
-        result = await matcher.calculate_bidirectional_match(request)
+        result = await matcher.calculate_bidirectional_match(request, endpoint="matching_bidirectional")
         
         # Logs de résultat
         processing_time = (time.time() - start_time) * 1000
@@ -234,7 +267,7 @@ async def convert_and_match_direct(
             use_google_maps_intelligence=True
         )
         
-        result = await matcher.calculate_bidirectional_match(matching_request)
+        result = await matcher.calculate_bidirectional_match(matching_request, endpoint="conversion_direct_match")
         
         processing_time = (time.time() - start_time) * 1000
         logger.info(f"🚀 Pipeline complet terminé en {processing_time:.2f}ms")
@@ -267,6 +300,8 @@ async def batch_matching(
     - **Seuil de score** : Filtrage automatique des matches faibles
     - **Cache intelligent** : Réutilisation des calculs
     - **Limite raisonnable** : 50 candidats × 20 entreprises = 1000 matches max
+    
+    Pour les lots plus importants : `/api/v2/batch/matching/stream`
     """
     try:
         start_time = time.time()
@@ -326,6 +361,49 @@ async def batch_matching(
             detail=f"Erreur batch matching: {str(e)}"
         )
 
+@router_v2.post("/batch/matching/stream",
+                summary="🌊 Matching en lot en streaming (NDJSON/SSE)")
+async def batch_matching_stream(
+    request: StreamingBatchMatchingRequest,
+    matcher: BiDirectionalMatcher = Depends(get_bidirectional_matcher)
+):
+    """
+    🌊 **Matching en lot streaming** : résultats émis au fil des calculs
+    
+    **Mémoire constante** :
+    - **Aucune limite de combinaisons** : paires générées à la volée
+    - **Concurrence bornée** : `max_concurrency` matchings simultanés
+    - **Backpressure** : le calcul ralentit si le client lit lentement
+    - **Seuil + top-K serveur** : seuls les matches utiles sont émis, classement final dans le dernier événement
+    
+    **Format** : une ligne JSON par événement (`ndjson`) ou Server-Sent Events (`sse`),
+    événements `match` puis un événement `summary` final.
+    """
+    total_combinations = len(request.candidats) * len(request.entreprises)
+    logger.info(f"🌊 Matching en lot streaming: {total_combinations} combinaisons")
+    
+    streaming_matcher = StreamingBatchMatcher(
+        matcher,
+        max_concurrency=request.max_concurrency,
+        score_threshold=request.score_threshold,
+        top_k=request.top_k,
+        emit_matches=request.emit_matches
+    )
+    formatter = format_sse if request.stream_format == "sse" else format_ndjson
+    
+    async def event_stream():
+        try:
+            async for event in streaming_matcher.stream(request.candidats, request.entreprises):
+                yield formatter(event)
+        except Exception as e:
+            logger.error(f"❌ Erreur batch matching streaming: {e}")
+            yield formatter({"type": "error", "detail": f"Erreur batch matching: {str(e)}"})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream" if request.stream_format == "sse" else "application/x-ndjson"
+    )
+
 @router_v2.post("/analytics/scoring",
                 summary="📊 Analytics détaillées des scores")
 async def scoring_analytics(
@@ -351,7 +429,7 @@ async def scoring_analytics(
             force_adaptive_weighting=True
         )
         
-        result = await matcher.calculate_bidirectional_match(matching_request)
+        result = await matcher.calculate_bidirectional_match(matching_request, endpoint="analytics_scoring")
         
         # Analytics enrichies
         analytics = {
@@ -475,7 +553,7 @@ async def get_performance_statistics(
                 "matcher_performance": matcher.get_performance_stats(),
                 "bridge_performance": commitment_bridge.get_bridge_stats(),
                 "system_metrics": {
-                    "cache_size": len(matcher.cache),
+                    "cache_size": matcher.cache.size,
                     "average_response_time_target": "< 150ms",
                     "batch_capacity": "1000 combinations",
                     "supported_formats": ["Enhanced Parser v4.0", "ChatGPT Commitment-"]
@@ -501,7 +579,7 @@ async def _process_batch_parallel(request: BatchMatchingRequest,
                 candidat=candidat,
                 entreprise=entreprise
             )
-            task = matcher.calculate_bidirectional_match(matching_request)
+            task = matcher.calculate_bidirectional_match(matching_request, endpoint="batch_matching")
             tasks.append(task)
     
     results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -536,7 +614,7 @@ async def _process_batch_sequential(request: BatchMatchingRequest,
                     entreprise=entreprise
                 )
                 
-                result = await matcher.calculate_bidirectional_match(matching_request)
+                result = await matcher.calculate_bidirectional_match(matching_request, endpoint="batch_matching")
                 
                 matches.append({
                     "candidat_id": f"{candidat.personal_info.firstName} {candidat.personal_info.lastName}",
@@ -209,7 +209,7 @@ async def convert_and_match_enhanced_direct(
             use_google_maps_intelligence=True
         )
         
-        result = await matcher.calculate_bidirectional_match(matching_request)
+        result = await matcher.calculate_bidirectional_match(matching_request, endpoint="enhanced_pipeline")
         
         processing_time = (time.time() - start_time) * 1000
         logger.info(f"🚀 Pipeline Enhanced complet terminé en {processing_time:.2f}ms")
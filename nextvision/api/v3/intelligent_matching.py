@@ -15,7 +15,8 @@ Innovation: Workflow unifié automatique + Transport Intelligence intégré
 
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
 from fastapi.responses import JSONResponse
-from typing import Dict, List, Optional, Any
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple
+import asyncio
 import logging
 import time
 import json
@@ -35,6 +36,8 @@ from nextvision.engines.location_scoring import LocationScoringEngine
 from nextvision.engines.transport_filtering import TransportFilteringEngine
 from nextvision.services.transport_calculator import TransportCalculator
 from nextvision.services.google_maps_service import GoogleMapsService
+from nextvision.services.geo_cache_store import build_geo_cache_store
+from nextvision.services.document_extraction import get_document_extractor
 from nextvision.config.google_maps_config import get_google_maps_config
 
 # 🚀 Import SERVICE GPT DIRECT (NOUVEAU)
@@ -59,7 +62,12 @@ google_maps_config = get_google_maps_config()
 # Services Google Maps et Transport Intelligence
 google_maps_service = GoogleMapsService(
     api_key=google_maps_config.api_key,
-    cache_duration_hours=google_maps_config.geocode_cache_duration_hours
+    cache_duration_hours=google_maps_config.geocode_cache_duration_hours,
+    cache_store=build_geo_cache_store(
+        memory_entries=google_maps_config.memory_cache_max_entries,
+        sqlite_path=google_maps_config.geo_cache_sqlite_path
+    ),
+    negative_cache_minutes=google_maps_config.negative_cache_minutes
 )
 
 transport_calculator = TransportCalculator(google_maps_service)
@@ -92,9 +100,13 @@ class IntelligentMatchingService:
     **Transformation** : 5 étapes → 1 étape automatique
     """
     
-    def __init__(self):
+    def __init__(self, cv_parse_timeout: float = 10.0, job_parse_timeout: float = 10.0):
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
+        # Timeouts indépendants (lecture + décodage + parsing GPT) par fichier
+        self.cv_parse_timeout = cv_parse_timeout
+        self.job_parse_timeout = job_parse_timeout
+        
     async def process_intelligent_matching(
         self,
         cv_file: UploadFile,
@@ -125,7 +137,7 @@ class IntelligentMatchingService:
             # === PHASE 1: PARSING WITH GPT DIRECT ===
             parsing_start = time.time()
             
-            cv_data, job_data = await self._parse_files_with_gpt_direct(cv_file, job_file)
+            cv_data, job_data, parsing_breakdown = await self._parse_files_with_gpt_direct(cv_file, job_file)
             
             parsing_time = (time.time() - parsing_start) * 1000
             self.logger.info(f"✅ Parsing completed in {parsing_time:.2f}ms")
@@ -214,6 +226,7 @@ class IntelligentMatchingService:
                 "performance": {
                     "total_time_ms": round(total_time, 2),
                     "parsing_time_ms": round(parsing_time, 2),
+                    "parsing_breakdown": parsing_breakdown,
                     "adaptation_time_ms": round(adaptation_time, 2),
                     "matching_time_ms": round(matching_time, 2),
                     "target_achieved": total_time < 2000,
@@ -260,74 +273,132 @@ class IntelligentMatchingService:
         self, 
         cv_file: UploadFile, 
         job_file: Optional[UploadFile]
-    ) -> tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
-        """🚀 Parse CV + Job avec GPT Direct Service"""
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], Dict[str, Any]]:
+        """🚀 Parse CV + Job avec GPT Direct Service (en parallèle)
         
-        cv_data = {}
-        job_data = None
+        Lecture, décodage et parsing des deux fichiers s'exécutent de façon
+        concurrente, chacun avec son propre timeout et son propre fallback.
+        """
         
-        # === CV PARSING WITH GPT DIRECT ===
-        try:
-            # Lecture fichier CV
-            cv_content = await cv_file.read()
-            cv_content_str = cv_content.decode('utf-8', errors='ignore')
-            
-            # Parse CV avec GPT Direct
-            cv_parsed: CVData = await parse_cv_direct(cv_content_str)
-            
-            cv_data = {
-                "name": cv_parsed.name,
-                "email": cv_parsed.email,
-                "phone": cv_parsed.phone,
-                "skills": cv_parsed.skills,
-                "years_of_experience": cv_parsed.years_of_experience,
-                "education": cv_parsed.education,
-                "job_titles": cv_parsed.job_titles,
-                "companies": cv_parsed.companies,
-                "location": cv_parsed.location,
-                "summary": cv_parsed.summary,
-                "objective": cv_parsed.objective,
-                "languages": cv_parsed.languages,
-                "certifications": cv_parsed.certifications
-            }
+        tasks = [self._parse_cv_file(cv_file)]
+        if job_file:
+            tasks.append(self._parse_job_file(job_file))
+        
+        results = await asyncio.gather(*tasks)
+        
+        cv_data, cv_timings = results[0]
+        job_data, job_timings = results[1] if job_file else (None, None)
+        
+        parsing_breakdown = {"cv": cv_timings, "job": job_timings, "parallel": True}
+        return cv_data, job_data, parsing_breakdown
+    
+    async def _read_document_text(self, upload: UploadFile) -> str:
+        """📄 Texte d'un fichier uploadé via l'extracteur partagé (pool de processus + cache)"""
+        content = await upload.read()
+        extracted = await get_document_extractor().extract(content, upload.filename or "")
+        if extracted.error:
+            # Bibliothèque PDF/DOCX absente : décodage brut comme auparavant
+            return content.decode('utf-8', errors='ignore')
+        return extracted.text
+    
+    @staticmethod
+    def _cancelled_by_caller() -> bool:
+        """La tâche courante est-elle elle-même en cours d'annulation ?"""
+        task = asyncio.current_task()
+        cancelling = getattr(task, "cancelling", None)
+        # Avant Python 3.11 : origine inconnue, l'annulation est propagée
+        return task is None or cancelling is None or cancelling() > 0
+    
+    async def _parse_cv_file(self, cv_file: UploadFile) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """📄 Lecture + parsing CV avec timeout et fallback"""
+        return await self._parse_document(
+            cv_file, "CV", self._gpt_parse_cv, self.cv_parse_timeout, self._create_fallback_cv_data
+        )
+    
+    async def _parse_job_file(self, job_file: UploadFile) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """💼 Lecture + parsing Job avec timeout et fallback"""
+        return await self._parse_document(
+            job_file, "Job", self._gpt_parse_job, self.job_parse_timeout, self._create_fallback_job_data
+        )
+    
+    async def _parse_document(
+        self,
+        upload: UploadFile,
+        label: str,
+        parse: Callable[[str], Awaitable[Dict[str, Any]]],
+        timeout: float,
+        build_fallback: Callable[[UploadFile], Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """📑 Lecture + parsing GPT Direct d'un document avec timeout, timings et fallback"""
+        
+        timings = {"read_ms": 0.0, "parse_ms": 0.0, "fallback": False}
+        
+        async def read_and_parse() -> Dict[str, Any]:
+            stage_start = time.time()
             
-            self.logger.info(f"✅ CV GPT Direct parsé: {cv_parsed.name}")
+            # Lecture fichier (extraction PDF/DOCX hors boucle, 3000 premiers caractères)
+            content_str = await self._read_document_text(upload)
+            timings["read_ms"] = round((time.time() - stage_start) * 1000, 2)
             
+            stage_start = time.time()
+            parsed = await parse(content_str)
+            timings["parse_ms"] = round((time.time() - stage_start) * 1000, 2)
+            return parsed
+        
+        try:
+            return await asyncio.wait_for(read_and_parse(), timeout=timeout), timings
+        except asyncio.TimeoutError:
+            self.logger.warning(f"⚠️ GPT Direct {label} parsing timeout ({timeout}s), using fallback")
+        except asyncio.CancelledError:
+            # Annulation de cette requête : propagée ; annulation d'un parsing partagé : fallback
+            if self._cancelled_by_caller():
+                raise
+            self.logger.warning(f"⚠️ GPT Direct {label} parsing cancelled elsewhere, using fallback")
         except Exception as e:
-            self.logger.warning(f"⚠️ GPT Direct CV parsing failed: {e}, using fallback")
-            cv_data = self._create_fallback_cv_data(cv_file)
+            self.logger.warning(f"⚠️ GPT Direct {label} parsing failed: {e}, using fallback")
         
-        # === JOB PARSING WITH GPT DIRECT ===
-        if job_file:
-            try:
-                # Lecture fichier Job
-                job_content = await job_file.read()
-                job_content_str = job_content.decode('utf-8', errors='ignore')
-                
-                # Parse Job avec GPT Direct
-                job_parsed: JobData = await parse_job_direct(job_content_str)
-                
-                job_data = {
-                    "title": job_parsed.title,
-                    "company": job_parsed.company,
-                    "location": job_parsed.location,
-                    "contract_type": job_parsed.contract_type,
-                    "required_skills": job_parsed.required_skills,
-                    "preferred_skills": job_parsed.preferred_skills,
-                    "responsibilities": job_parsed.responsibilities,
-                    "requirements": job_parsed.requirements,
-                    "benefits": job_parsed.benefits,
-                    "salary_range": job_parsed.salary_range,
-                    "remote_policy": job_parsed.remote_policy
-                }
-                
-                self.logger.info(f"✅ Job GPT Direct parsé: {job_parsed.title}")
-                
-            except Exception as e:
-                self.logger.warning(f"⚠️ GPT Direct Job parsing failed: {e}, using fallback")
-                job_data = self._create_fallback_job_data(job_file)
+        timings["fallback"] = True
+        return build_fallback(upload), timings
+    
+    async def _gpt_parse_cv(self, cv_content_str: str) -> Dict[str, Any]:
+        """📄 Parse CV avec GPT Direct"""
+        cv_parsed: CVData = await parse_cv_direct(cv_content_str)
+        self.logger.info(f"✅ CV GPT Direct parsé: {cv_parsed.name}")
+        
+        return {
+            "name": cv_parsed.name,
+            "email": cv_parsed.email,
+            "phone": cv_parsed.phone,
+            "skills": cv_parsed.skills,
+            "years_of_experience": cv_parsed.years_of_experience,
+            "education": cv_parsed.education,
+            "job_titles": cv_parsed.job_titles,
+            "companies": cv_parsed.companies,
+            "location": cv_parsed.location,
+            "summary": cv_parsed.summary,
+            "objective": cv_parsed.objective,
+            "languages": cv_parsed.languages,
+            "certifications": cv_parsed.certifications
+        }
+    
+    async def _gpt_parse_job(self, job_content_str: str) -> Dict[str, Any]:
+        """💼 Parse Job avec GPT Direct"""
+        job_parsed: JobData = await parse_job_direct(job_content_str)
+        self.logger.info(f"✅ Job GPT Direct parsé: {job_parsed.title}")
         
-        return cv_data, job_data
+        return {
+            "title": job_parsed.title,
+            "company": job_parsed.company,
+            "location": job_parsed.location,
+            "contract_type": job_parsed.contract_type,
+            "required_skills": job_parsed.required_skills,
+            "preferred_skills": job_parsed.preferred_skills,
+            "responsibilities": job_parsed.responsibilities,
+            "requirements": job_parsed.requirements,
+            "benefits": job_parsed.benefits,
+            "salary_range": job_parsed.salary_range,
+            "remote_policy": job_parsed.remote_policy
+        }
     
     async def _calculate_intelligent_matching(
         self,
@@ -490,7 +561,10 @@ class IntelligentMatchingService:
         }
 
 # Instance du service
-intelligent_matching_service = IntelligentMatchingService()
+intelligent_matching_service = IntelligentMatchingService(
+    cv_parse_timeout=float(os.getenv("INTELLIGENT_MATCHING_CV_PARSE_TIMEOUT", "10")),
+    job_parse_timeout=float(os.getenv("INTELLIGENT_MATCHING_JOB_PARSE_TIMEOUT", "10"))
+)
 
 # === ENDPOINT PRINCIPAL RÉVOLUTIONNAIRE ===
 
@@ -11,10 +11,13 @@ Features:
 """
 
 import asyncio
+import fnmatch
+import heapq
 import json
 import pickle
+import sys
 import time
-import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -29,6 +32,7 @@ except ImportError:
     
 from ..logging.structured_logging import get_structured_logger
 from ..monitoring.health_metrics import MetricsCollector
+from ..utils.fingerprint import canonical_bytes, digest, fingerprint, fingerprint_text
 
 logger = get_structured_logger(__name__)
 
@@ -69,9 +73,8 @@ class CacheKey:
     @classmethod
     def generate_params_hash(cls, params: Dict[str, Any]) -> str:
         """Génère un hash des paramètres"""
-        # Sérialisation déterministe pour hash consistant
-        params_str = json.dumps(params, sort_keys=True, default=str)
-        return hashlib.md5(params_str.encode()).hexdigest()[:8]
+        # Sérialisation canonique pour hash consistant entre workers
+        return digest(canonical_bytes(params))
 
 
 @dataclass
@@ -82,6 +85,8 @@ class CacheStats:
     sets: int = 0
     deletes: int = 0
     errors: int = 0
+    evictions: int = 0
+    expirations: int = 0
     total_size_bytes: int = 0
     average_access_time_ms: float = 0.0
     hit_rate_percent: float = 0.0
@@ -94,55 +99,174 @@ class CacheStats:
 
 
 class MemoryCache:
-    """💾 Cache en mémoire local (niveau 1)"""
+    """💾 Cache en mémoire local (niveau 1)
     
-    def __init__(self, max_size: int = 1000):
-        self.cache: Dict[str, Dict[str, Any]] = {}
-        self.access_times: Dict[str, float] = {}
+    LRU en O(1) (OrderedDict), expiration via un tas de TTL purgé de façon
+    amortie, budgets d'entrées par namespace et comptage optionnel en octets.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 1000,
+        namespace_budgets: Optional[Dict[str, int]] = None,
+        max_bytes: Optional[int] = None
+    ):
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.namespace_budgets = namespace_budgets or {}
+        
+        # Index LRU par namespace (pour les budgets) et tas d'expiration
+        self.namespaces: Dict[str, "OrderedDict[str, None]"] = {}
+        self._expiry_heap: List[tuple] = []
+        
+        self.stats = CacheStats()
         
     async def get(self, key: str) -> Optional[Any]:
         """Récupère depuis le cache mémoire"""
-        if key in self.cache:
-            entry = self.cache[key]
-            # Vérifier expiration
-            if entry["expires_at"] > time.time():
-                self.access_times[key] = time.time()
-                return entry["value"]
-            else:
-                # Expiration
-                await self.delete(key)
-        return None
+        entry = self.cache.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        
+        # Vérifier expiration
+        if entry["expires_at"] <= time.time():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        
+        # Accès récent : fin de la file LRU
+        self.cache.move_to_end(key)
+        self.namespaces[entry["namespace"]].move_to_end(key)
+        self.stats.hits += 1
+        return entry["value"]
     
-    async def set(self, key: str, value: Any, ttl: int = 300):
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int = 300,
+        namespace: Optional[str] = None,
+        size_bytes: Optional[int] = None
+    ):
         """Stocke dans le cache mémoire"""
-        # Vérifier taille max
-        if len(self.cache) >= self.max_size:
-            await self._evict_oldest()
-            
+        now = time.time()
+        namespace = namespace or "default"
+        
+        if key in self.cache:
+            self._remove(key)
+        
+        if self.max_bytes is not None and size_bytes is None:
+            size_bytes = self._estimate_size(value)
+        
+        expires_at = now + ttl
         self.cache[key] = {
             "value": value,
-            "created_at": time.time(),
-            "expires_at": time.time() + ttl
+            "created_at": now,
+            "expires_at": expires_at,
+            "namespace": namespace,
+            "size_bytes": size_bytes or 0
         }
-        self.access_times[key] = time.time()
+        self.namespaces.setdefault(namespace, OrderedDict())[key] = None
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        self.stats.sets += 1
+        self.stats.total_size_bytes += size_bytes or 0
+        
+        self._purge_expired(now)
+        self._enforce_limits(namespace)
     
     async def delete(self, key: str):
         """Supprime du cache mémoire"""
-        self.cache.pop(key, None)
-        self.access_times.pop(key, None)
+        if key in self.cache:
+            self._remove(key)
+            self.stats.deletes += 1
     
     async def _evict_oldest(self):
         """Éviction LRU"""
-        if not self.access_times:
-            return
-            
-        oldest_key = min(self.access_times.items(), key=lambda x: x[1])[0]
-        await self.delete(oldest_key)
+        if self.cache:
+            self._remove(next(iter(self.cache)))
+            self.stats.evictions += 1
+    
+    def _remove(self, key: str):
+        """Retire une entrée de tous les index (le tas est nettoyé paresseusement)"""
+        entry = self.cache.pop(key)
+        namespace_keys = self.namespaces.get(entry["namespace"])
+        if namespace_keys is not None:
+            namespace_keys.pop(key, None)
+            if not namespace_keys:
+                del self.namespaces[entry["namespace"]]
+        self.stats.total_size_bytes -= entry["size_bytes"]
+    
+    def _purge_expired(self, now: float):
+        """Purge les entrées expirées en tête du tas (coût amorti)"""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self.cache.get(key)
+            # Entrée de tas obsolète si la clé a été réécrite ou supprimée
+            if entry is not None and entry["expires_at"] == expires_at:
+                self._remove(key)
+                self.stats.expirations += 1
+        
+        # Compactage des entrées obsolètes si le tas dérive
+        if len(heap) > 2 * len(self.cache) + 64:
+            self._expiry_heap = [
+                (entry["expires_at"], key) for key, entry in self.cache.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+    
+    def _enforce_limits(self, namespace: str):
+        """Applique budget du namespace, taille max et budget en octets"""
+        budget = self.namespace_budgets.get(namespace)
+        if budget is not None:
+            namespace_keys = self.namespaces.get(namespace)
+            while namespace_keys and len(namespace_keys) > budget:
+                self._remove(next(iter(namespace_keys)))
+                self.stats.evictions += 1
+        
+        while len(self.cache) > self.max_size:
+            self._remove(next(iter(self.cache)))
+            self.stats.evictions += 1
+        
+        if self.max_bytes is not None:
+            while self.cache and self.stats.total_size_bytes > self.max_bytes:
+                self._remove(next(iter(self.cache)))
+                self.stats.evictions += 1
+    
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        """Estimation de la taille en octets d'une valeur"""
+        try:
+            return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return sys.getsizeof(value)
     
     def get_size(self) -> int:
         """Taille actuelle du cache"""
         return len(self.cache)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """📊 Statistiques du cache mémoire"""
+        self.stats.update_hit_rate()
+        return {
+            "size": len(self.cache),
+            "max_size": self.max_size,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "hit_rate_percent": round(self.stats.hit_rate_percent, 2),
+            "evictions": self.stats.evictions,
+            "expirations": self.stats.expirations,
+            "total_size_bytes": self.stats.total_size_bytes,
+            "max_bytes": self.max_bytes,
+            "namespaces": {
+                namespace: {
+                    "size": len(keys),
+                    "budget": self.namespace_budgets.get(namespace)
+                }
+                for namespace, keys in self.namespaces.items()
+            }
+        }
 
 
 class IntelligentRedisCache:
@@ -154,6 +278,7 @@ class IntelligentRedisCache:
         default_ttl: int = TTLPolicy.MEDIUM.value,
         enable_memory_cache: bool = True,
         memory_cache_size: int = 1000,
+        memory_cache_max_bytes: Optional[int] = None,
         metrics_collector: Optional[MetricsCollector] = None
     ):
         self.redis_url = redis_url
@@ -161,16 +286,20 @@ class IntelligentRedisCache:
         self.redis_client: Optional[redis.Redis] = None
         self.is_connected = False
         
-        # Cache mémoire niveau 1
-        self.memory_cache = MemoryCache(memory_cache_size) if enable_memory_cache else None
+        # Configuration par namespace
+        self.namespace_configs = self._setup_namespace_configs()
+        
+        # Cache mémoire niveau 1 (budgets par namespace)
+        self.memory_cache = MemoryCache(
+            memory_cache_size,
+            namespace_budgets=self._get_memory_budgets(memory_cache_size),
+            max_bytes=memory_cache_max_bytes
+        ) if enable_memory_cache else None
         
         # Statistiques
         self.stats = CacheStats()
         self.metrics = metrics_collector
         
-        # Configuration par namespace
-        self.namespace_configs = self._setup_namespace_configs()
-        
         # Cache warming
         self.warming_tasks: Dict[str, asyncio.Task] = {}
     
@@ -180,30 +309,43 @@ class IntelligentRedisCache:
             "geocoding": {
                 "ttl": TTLPolicy.VERY_LONG.value,  # 6h pour géocodage
                 "strategy": CacheStrategy.CACHE_ASIDE,
-                "warm_on_startup": True
+                "warm_on_startup": True,
+                "memory_share": 0.35  # Part du cache mémoire L1
             },
             "transport": {
                 "ttl": TTLPolicy.LONG.value,  # 1h pour calculs transport
                 "strategy": CacheStrategy.TTL_BASED,
-                "warm_on_startup": False
+                "warm_on_startup": False,
+                "memory_share": 0.30  # Part du cache mémoire L1
             },
             "matching": {
                 "ttl": TTLPolicy.MEDIUM.value,  # 30min pour résultats matching
                 "strategy": CacheStrategy.WRITE_THROUGH,
-                "warm_on_startup": False
+                "warm_on_startup": False,
+                "memory_share": 0.20  # Part du cache mémoire L1
             },
             "bridge_data": {
                 "ttl": TTLPolicy.SHORT.value,  # 5min pour données bridge
                 "strategy": CacheStrategy.REFRESH_AHEAD,
-                "warm_on_startup": True
+                "warm_on_startup": True,
+                "memory_share": 0.10  # Part du cache mémoire L1
             },
             "performance": {
                 "ttl": TTLPolicy.SHORT.value,  # 5min pour métriques
                 "strategy": CacheStrategy.WRITE_BEHIND,
-                "warm_on_startup": False
+                "warm_on_startup": False,
+                "memory_share": 0.05  # Part du cache mémoire L1
             }
         }
     
+    def _get_memory_budgets(self, memory_cache_size: int) -> Dict[str, int]:
+        """💾 Budgets d'entrées du cache mémoire par namespace"""
+        return {
+            namespace: max(1, int(memory_cache_size * config["memory_share"]))
+            for namespace, config in self.namespace_configs.items()
+            if "memory_share" in config
+        }
+    
     async def connect(self) -> bool:
         """🔗 Connexion à Redis avec fallback gracieux"""
         if not REDIS_AVAILABLE:
@@ -285,7 +427,10 @@ class IntelligentRedisCache:
                     if self.memory_cache:
                         namespace = self._extract_namespace(key_str)
                         ttl = self._get_memory_ttl(namespace)
-                        await self.memory_cache.set(key_str, value, ttl)
+                        await self.memory_cache.set(
+                            key_str, value, ttl,
+                            namespace=namespace, size_bytes=len(redis_result)
+                        )
                     
                     self._record_metrics("redis_hit", time.time() - start_time)
                     self.stats.hits += 1
@@ -335,7 +480,11 @@ class IntelligentRedisCache:
             # Niveau 1: Cache mémoire
             if self.memory_cache:
                 memory_ttl = min(ttl, 300)  # Max 5min en mémoire
-                await self.memory_cache.set(key_str, value, memory_ttl)
+                await self.memory_cache.set(
+                    key_str, value, memory_ttl,
+                    namespace=self._extract_namespace(key_str),
+                    size_bytes=len(serialized_value) if isinstance(serialized_value, (bytes, str)) else None
+                )
             
             # Niveau 2: Redis
             if self.is_connected and self.redis_client:
@@ -372,6 +521,34 @@ class IntelligentRedisCache:
             logger.error(f"❌ Erreur cache delete: {e}")
             return False
     
+    async def delete_pattern(self, pattern: str) -> int:
+        """🧹 Suppression multi-niveau des clés correspondant à un motif glob"""
+        removed = set()
+        
+        try:
+            # Niveau 1 : seules les clés du namespace du motif sont parcourues
+            if self.memory_cache:
+                namespace_keys = self.memory_cache.namespaces.get(self._extract_namespace(pattern), {})
+                for key in [key for key in namespace_keys if fnmatch.fnmatchcase(key, pattern)]:
+                    await self.memory_cache.delete(key)
+                    removed.add(key)
+            
+            # Niveau 2 : SCAN incrémental (KEYS bloquerait Redis)
+            if self.is_connected and self.redis_client:
+                redis_keys = [key async for key in self.redis_client.scan_iter(match=pattern, count=500)]
+                if redis_keys:
+                    await self.redis_client.delete(*redis_keys)
+                    removed.update(key.decode() if isinstance(key, bytes) else key for key in redis_keys)
+            
+            self.stats.deletes += len(removed)
+            logger.debug(f"🧹 Cache delete pattern: {pattern} ({len(removed)} clés)")
+            
+        except Exception as e:
+            self.stats.errors += 1
+            logger.error(f"❌ Erreur cache delete pattern: {e}")
+        
+        return len(removed)
+    
     async def get_or_set(
         self,
         cache_key: Union[str, CacheKey],
@@ -471,7 +648,7 @@ class IntelligentRedisCache:
             for address in common_addresses:
                 cache_key = CacheKey(
                     namespace="geocoding",
-                    identifier=f"address_{hashlib.md5(address.encode()).hexdigest()[:8]}"
+                    identifier=f"address_{fingerprint_text(address)}"
                 )
                 # Pré-chauffer avec données factices si pas en cache
                 if await cache_instance.get(cache_key) is None:
@@ -500,6 +677,7 @@ class IntelligentRedisCache:
             "redis_connected": self.is_connected,
             "memory_cache_enabled": self.memory_cache is not None,
             "memory_cache_size": self.memory_cache.get_size() if self.memory_cache else 0,
+            "memory_cache": self.memory_cache.get_stats() if self.memory_cache else None,
             "namespace_configs": self.namespace_configs
         }
 
@@ -529,7 +707,7 @@ class CacheManager:
         """🗺️ Cache spécialisé géocodage"""
         cache_key = CacheKey(
             namespace="geocoding",
-            identifier=f"addr_{hashlib.md5(address.encode()).hexdigest()[:12]}",
+            identifier=f"addr_{fingerprint_text(address)}",
             params_hash=CacheKey.generate_params_hash({"address": address})
         )
         
@@ -561,7 +739,7 @@ class CacheManager:
         context = context or {}
         cache_key = CacheKey(
             namespace="transport",
-            identifier=f"{mode}_{hashlib.md5(f'{origin}_{destination}'.encode()).hexdigest()[:8]}",
+            identifier=f"{mode}_{fingerprint(origin, destination)}",
             params_hash=CacheKey.generate_params_hash({
                 "origin": origin,
                 "destination": destination,
@@ -581,9 +759,16 @@ class CacheManager:
         candidate_id: str,
         job_id: str,
         matching_func: Callable,
-        context: Dict[str, Any] = None
+        context: Dict[str, Any] = None,
+        encode: Optional[Callable[[Any], bytes]] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
+        force_refresh: bool = False
     ) -> Any:
-        """🎯 Cache spécialisé matching"""
+        """🎯 Cache spécialisé matching
+        
+        Avec `encode`/`decode`, le résultat est stocké sous forme d'octets
+        (sérialisation compacte choisie par l'appelant) sur les deux niveaux.
+        """
         context = context or {}
         cache_key = CacheKey(
             namespace="matching",
@@ -591,11 +776,44 @@ class CacheManager:
             params_hash=CacheKey.generate_params_hash(context)
         )
         
-        return await self.cache.get_or_set(
-            cache_key,
-            lambda: matching_func(candidate_id, job_id, **context),
-            TTLPolicy.MEDIUM.value
-        )
+        if encode is None or decode is None:
+            if force_refresh:
+                await self.cache.delete(cache_key)
+            return await self.cache.get_or_set(
+                cache_key,
+                lambda: matching_func(candidate_id, job_id, **context),
+                TTLPolicy.MEDIUM.value
+            )
+        
+        if not force_refresh:
+            raw = await self.cache.get(cache_key, deserialize=False)
+            if raw is not None:
+                try:
+                    return decode(raw)
+                except Exception as e:
+                    logger.warning(f"⚠️ Entrée matching illisible, recalcul: {e}")
+                    await self.cache.delete(cache_key)
+        
+        result = matching_func(candidate_id, job_id, **context)
+        if asyncio.iscoroutine(result):
+            result = await result
+        await self.cache.set(cache_key, encode(result), TTLPolicy.MEDIUM.value, serialize=False)
+        return result
+    
+    async def invalidate_matching(
+        self,
+        candidate_id: Optional[str] = None,
+        job_id: Optional[str] = None
+    ) -> int:
+        """🧹 Invalidation des résultats de matching d'un candidat et/ou d'une offre"""
+        if candidate_id is None and job_id is None:
+            return 0
+        pattern = CacheKey(
+            namespace="matching",
+            identifier=f"c{candidate_id or '*'}_j{job_id or '*'}",
+            params_hash="*"
+        ).to_string()
+        return await self.cache.delete_pattern(pattern)
     
     async def performance_cache(
         self,
@@ -40,6 +40,9 @@ class GoogleMapsConfig:
     enable_memory_cache: bool = True
     enable_redis_cache: bool = False
     redis_url: Optional[str] = None
+    memory_cache_max_entries: int = 10000
+    geo_cache_sqlite_path: Optional[str] = None  # Cache disque persistant (runs hors ligne)
+    negative_cache_minutes: int = 60             # Adresses introuvables
     
     # Timeout Configuration
     request_timeout_seconds: int = 30
@@ -179,6 +182,7 @@ class GoogleMapsConfigManager:
             "GOOGLE_MAPS_MAX_RETRIES": ("max_retries", int),
             "GOOGLE_MAPS_ENABLE_REDIS": ("enable_redis_cache", self._str_to_bool),
             "REDIS_URL": ("redis_url", str),
+            "GOOGLE_MAPS_CACHE_SQLITE_PATH": ("geo_cache_sqlite_path", str),
             "GOOGLE_MAPS_LOG_REQUESTS": ("log_requests", self._str_to_bool)
         }
         
@@ -158,6 +158,20 @@ class SecurityConfig:
     enable_rate_limiting: bool = True
     rate_limit_requests_per_minute: int = 100
     rate_limit_burst: int = 20
+    rate_limit_backend: str = "memory"  # "memory" (par worker) ou "redis" (partagé)
+    
+    # Limites par préfixe de route (endpoints coûteux) et routes exemptées
+    # Parsing GPT : /api/v2/* et /api/v3/intelligent-matching (main.py)
+    rate_limit_route_limits: Dict[str, Dict[str, int]] = field(default_factory=lambda: {
+        "/api/v2/conversion/commitment": {"requests_per_minute": 20, "burst": 5},
+        "/api/v2/jobs/parse": {"requests_per_minute": 20, "burst": 5},
+        "/api/v3/intelligent-matching": {"requests_per_minute": 20, "burst": 5},
+        "/admin/stress-test": {"requests_per_minute": 2, "burst": 1}
+    })
+    # Sondes de santé (préfixes) : jamais limitées
+    rate_limit_exempt_paths: List[str] = field(default_factory=lambda: [
+        "/health", "/api/v1/health", "/api/v1/integration/health", "/api/v2/maps/health", "/api/v3/health"
+    ])
     
     # Headers sécurité
     security_headers: Dict[str, str] = field(default_factory=lambda: {
@@ -251,6 +265,16 @@ class LoggingConfig:
     max_file_size_mb: int = 100
     backup_count: int = 5
     
+    # Pipeline asynchrone (écriture dans un thread dédié)
+    enable_async_logging: bool = True
+    log_queue_size: int = 10000
+    
+    # Échantillonnage / débit max (DEBUG/INFO) par préfixe de logger
+    logger_sampling: Dict[str, Dict[str, float]] = field(default_factory=lambda: {
+        "nextvision.services.bidirectional_matcher": {"max_per_second": 200},
+        "nextvision.services.bidirectional_scorer": {"sample_rate": 0.1, "max_per_second": 100}
+    })
+    
     # Niveaux par composant
     component_log_levels: Dict[str, str] = field(default_factory=lambda: {
         "nextvision.api": "INFO",
@@ -461,6 +485,8 @@ class ProductionConfig(BaseConfig):
         self.security.cors_origins = os.getenv("CORS_ORIGINS", "").split(",")
         self.security.enable_rate_limiting = True
         self.security.rate_limit_requests_per_minute = 1000
+        self.security.rate_limit_burst = 200
+        self.security.rate_limit_backend = os.getenv("RATE_LIMIT_BACKEND", "redis")
         self.security.max_request_size_mb = 50
         
         # Performance optimisée
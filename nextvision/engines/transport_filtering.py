@@ -18,6 +18,7 @@ import time
 from ..services.transport_calculator import TransportCalculator
 from ..models.transport_models import ConfigTransport, TransportCompatibility
 from ..models.questionnaire_advanced import QuestionnaireComplet
+from ..utils.fingerprint import fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +36,8 @@ class FilteringResult:
         filtering_time_seconds: float,
         exclusion_rate_percent: float,
         performance_gain_percent: float,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        stage_counts: Optional[Dict[str, int]] = None
     ):
         self.original_job_count = original_job_count
         self.compatible_jobs = compatible_jobs
@@ -45,6 +47,8 @@ class FilteringResult:
         self.exclusion_rate_percent = exclusion_rate_percent
         self.performance_gain_percent = performance_gain_percent
         self.error_message = error_message
+        # Nombre de jobs décidés à chaque étape (distance, routage, ...)
+        self.stage_counts = stage_counts or {}
         
         # Métriques dérivées
         self.compatible_job_count = len(compatible_jobs)
@@ -85,6 +89,7 @@ class FilteringResult:
             "performance_rating": self.performance_rating,
             "is_success": self.is_success,
             "error_message": self.error_message,
+            "stage_counts": self.stage_counts,
             "top_exclusion_reasons": self._get_top_exclusion_reasons()
         }
     
@@ -118,6 +123,9 @@ class TransportFilteringEngine:
         # Cache exclusions fréquentes
         self._exclusion_patterns_cache: Dict[str, List[str]] = {}
         
+        # Cumul des décisions par étape de filtrage
+        self.stage_totals: Dict[str, int] = {}
+        
     async def pre_filter_jobs(
         self,
         candidat_questionnaire: QuestionnaireComplet,
@@ -147,14 +155,15 @@ class TransportFilteringEngine:
                     job_addresses, transport_config
                 )
             
-            # 3. Filtrage transport par batch
+            # 3. Filtrage transport par batch (pré-filtre distance puis routage)
+            stage_counts: Dict[str, int] = {}
             filtering_results = await self._batch_filter_transport(
-                transport_config, job_addresses, strict_mode
+                transport_config, job_addresses, strict_mode, stage_counts
             )
             
             # 4. Analytics et métriques
             result = self._create_filtering_result(
-                job_addresses, filtering_results, start_time
+                job_addresses, filtering_results, start_time, stage_counts
             )
             
             # 5. Logging final
@@ -233,10 +242,14 @@ class TransportFilteringEngine:
         self,
         transport_config: ConfigTransport,
         job_addresses: List[str],
-        strict_mode: bool
+        strict_mode: bool,
+        stage_counts: Optional[Dict[str, int]] = None
     ) -> Dict[str, TransportCompatibility]:
         """🚀 Filtrage par batch pour performance optimale"""
         
+        if stage_counts is None:
+            stage_counts = {}
+        
         # Division en batches pour éviter la surcharge
         batches = [
             job_addresses[i:i + self.batch_size]
@@ -247,6 +260,8 @@ class TransportFilteringEngine:
         
         for i, batch in enumerate(batches):
             logger.debug(f"Processing batch {i+1}/{len(batches)}: {len(batch)} jobs")
+            # Décomptes propres à ce batch (ignorés si le batch expire)
+            batch_stages: Dict[str, int] = {}
             
             try:
                 # Calcul batch avec timeout
@@ -254,19 +269,24 @@ class TransportFilteringEngine:
                     self.transport_calculator.batch_calculate_job_compatibility(
                         transport_config, 
                         batch,
-                        max_concurrent=self.max_concurrent_filters
+                        max_concurrent=self.max_concurrent_filters,
+                        stage_counts=batch_stages
                     ),
                     timeout=self.timeout_seconds
                 )
                 
                 all_results.update(batch_results)
                 
+                for stage, count in batch_stages.items():
+                    stage_counts[stage] = stage_counts.get(stage, 0) + count
+                
             except asyncio.TimeoutError:
                 logger.warning(f"Timeout batch {i+1} - mode dégradé")
                 
                 # Mode dégradé: marquer tous comme compatibles
                 for job_addr in batch:
                     all_results[job_addr] = self._create_fallback_compatibility(job_addr)
+                stage_counts["fallback"] = stage_counts.get("fallback", 0) + len(batch)
                     
             except Exception as e:
                 logger.error(f"Erreur batch {i+1}: {e}")
@@ -274,6 +294,7 @@ class TransportFilteringEngine:
                 # Mode dégradé
                 for job_addr in batch:
                     all_results[job_addr] = self._create_fallback_compatibility(job_addr)
+                stage_counts["fallback"] = stage_counts.get("fallback", 0) + len(batch)
         
         return all_results
     
@@ -329,7 +350,8 @@ class TransportFilteringEngine:
         self,
         original_jobs: List[str],
         filtering_results: Dict[str, TransportCompatibility],
-        start_time: float
+        start_time: float,
+        stage_counts: Optional[Dict[str, int]] = None
     ) -> FilteringResult:
         """📊 Crée résultat filtrage avec métriques"""
         
@@ -348,7 +370,7 @@ class TransportFilteringEngine:
         
         # Métriques
         filtering_time = time.time() - start_time
-        exclusion_rate = len(incompatible_jobs) / len(original_jobs) * 100
+        exclusion_rate = len(incompatible_jobs) / max(len(original_jobs), 1) * 100
         
         # Performance gain estimation (CPU économisé sur pondération)
         performance_gain = exclusion_rate * 0.7  # 70% du temps pondération économisé
@@ -357,6 +379,8 @@ class TransportFilteringEngine:
         self.total_jobs_processed += len(original_jobs)
         self.total_jobs_excluded += len(incompatible_jobs)
         self.total_filtering_time += filtering_time
+        for stage, count in (stage_counts or {}).items():
+            self.stage_totals[stage] = self.stage_totals.get(stage, 0) + count
         
         return FilteringResult(
             original_job_count=len(original_jobs),
@@ -365,7 +389,8 @@ class TransportFilteringEngine:
             exclusion_reasons=exclusion_reasons,
             filtering_time_seconds=filtering_time,
             exclusion_rate_percent=exclusion_rate,
-            performance_gain_percent=performance_gain
+            performance_gain_percent=performance_gain,
+            stage_counts=stage_counts
         )
     
     def _create_fallback_compatibility(self, job_address: str) -> TransportCompatibility:
@@ -406,16 +431,11 @@ class TransportFilteringEngine:
     def _get_exclusion_cache_key(self, transport_config: ConfigTransport) -> str:
         """🔑 Clé cache pour patterns d'exclusion"""
         
-        import hashlib
-        
-        key_parts = [
-            "_".join(sorted([m.value for m in transport_config.transport_preferences.moyens_selectionnes])),
-            str(sorted(transport_config.transport_preferences.temps_max.items())),
-            str(transport_config.telework_days_per_week)
-        ]
-        
-        combined = "_".join(key_parts)
-        return hashlib.md5(combined.encode()).hexdigest()[:8]
+        return fingerprint(
+            set(transport_config.transport_preferences.moyens_selectionnes),
+            transport_config.transport_preferences.temps_max,
+            transport_config.telework_days_per_week
+        )
     
     def _log_filtering_summary(self, result: FilteringResult):
         """📝 Log résumé filtrage"""
@@ -428,6 +448,9 @@ class TransportFilteringEngine:
             f"gain CPU estimé: {result.performance_gain_percent:.1f}%)"
         )
         
+        if result.stage_counts:
+            logger.info(f"Décisions par étape: {result.stage_counts}")
+        
         # Log top exclusion reasons
         if result.exclusion_reasons:
             reason_counts = {}
@@ -454,5 +477,6 @@ class TransportFilteringEngine:
             "global_exclusion_rate_percent": global_exclusion_rate,
             "average_filtering_time_seconds": avg_filtering_time,
             "total_filtering_time_seconds": self.total_filtering_time,
-            "cache_patterns_count": len(self._exclusion_patterns_cache)
+            "cache_patterns_count": len(self._exclusion_patterns_cache),
+            "stage_totals": dict(self.stage_totals)
         }
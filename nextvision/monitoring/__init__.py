@@ -11,6 +11,7 @@ from .health_metrics import (
     HealthStatus,
     SystemMonitor
 )
+from .metric_store import MetricStore, QuantileSketch
 
 __all__ = [
     "MetricsCollector",
@@ -18,5 +19,7 @@ __all__ = [
     "ServiceHealth",
     "MetricType",
     "HealthStatus",
-    "SystemMonitor"
+    "SystemMonitor",
+    "MetricStore",
+    "QuantileSketch"
 ]
\ No newline at end of file
@@ -15,20 +15,20 @@ import time
 import psutil
 import threading
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Any, Callable, Union
 import json
 import nextvision_logging as logging
-from collections import defaultdict, deque
 
 try:
-    from prometheus_client import Counter, Histogram, Gauge, Info, start_http_server
+    from prometheus_client import REGISTRY, start_http_server
     PROMETHEUS_AVAILABLE = True
 except ImportError:
     PROMETHEUS_AVAILABLE = False
 
 from ..logging.structured_logging import get_structured_logger
+from .metric_store import MetricStore, PrometheusStoreCollector
 
 logger = get_structured_logger(__name__)
 
@@ -101,22 +101,50 @@ class SystemResources:
 class MetricsCollector:
     """📊 Collecteur de métriques central"""
     
+    # Noms exportés historiques (dashboards existants) : nom interne → (nom Prometheus, description)
+    PROMETHEUS_NAMES = {
+        # Performance
+        "api_requests_total": ("nextvision_api_requests_total", "Total API requests"),
+        "api_request_duration": ("nextvision_api_request_duration_seconds", "API request duration"),
+        "matching_jobs_processed": ("nextvision_matching_jobs_processed_total", "Total matching jobs processed"),
+        "matching_duration": ("nextvision_matching_duration_seconds", "Matching job duration"),
+        
+        # Cache
+        "cache_operations": ("nextvision_cache_operations_total", "Cache operations"),
+        "cache_hit_rate": ("nextvision_cache_hit_rate", "Cache hit rate percentage"),
+        
+        # Services externes
+        "external_api_calls": ("nextvision_external_api_calls_total", "External API calls"),
+        "external_api_duration": ("nextvision_external_api_duration_seconds", "External API call duration"),
+        
+        # Système
+        "system_cpu_usage": ("nextvision_system_cpu_usage_percent", "System CPU usage percentage"),
+        "system_memory_usage": ("nextvision_system_memory_usage_percent", "System memory usage percentage"),
+        "system_disk_usage": ("nextvision_system_disk_usage_percent", "System disk usage percentage"),
+        
+        # Business metrics
+        "active_candidates": ("nextvision_active_candidates", "Number of active candidates"),
+        "job_matches_per_hour": ("nextvision_job_matches_per_hour", "Job matches generated per hour"),
+        "error_rate": ("nextvision_error_rate_percent", "Overall error rate percentage")
+    }
+    
     def __init__(
         self,
         enable_prometheus: bool = True,
         prometheus_port: int = 8090,
-        retention_hours: int = 24
+        retention_hours: int = 24,
+        history_size: int = 10000
     ):
         self.enable_prometheus = enable_prometheus and PROMETHEUS_AVAILABLE
         self.prometheus_port = prometheus_port
         self.retention_hours = retention_hours
         
-        # Stockage des métriques
-        self.metrics_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=10000))
-        self.current_metrics: Dict[str, MetricValue] = {}
-        
-        # Métriques Prometheus si disponible
-        self.prometheus_metrics: Dict[str, Any] = {}
+        # Stockage des métriques : séries à labels internés, anneaux bornés, quantiles en flux
+        self.store = MetricStore(
+            retention_seconds=retention_hours * 3600,
+            capacity=history_size
+        )
+        self.prometheus_collector: Optional[PrometheusStoreCollector] = None
         
         # Statistiques d'usage
         self.stats = {
@@ -130,85 +158,10 @@ class MetricsCollector:
             self._setup_prometheus()
     
     def _setup_prometheus(self):
-        """🔧 Configuration Prometheus"""
+        """🔧 Configuration Prometheus (export lu directement depuis le store au scrape)"""
         try:
-            # Métriques core Nextvision
-            self.prometheus_metrics.update({
-                # Performance
-                "api_requests_total": Counter(
-                    "nextvision_api_requests_total",
-                    "Total API requests",
-                    ["endpoint", "method", "status"]
-                ),
-                "api_request_duration": Histogram(
-                    "nextvision_api_request_duration_seconds",
-                    "API request duration",
-                    ["endpoint", "method"]
-                ),
-                "matching_jobs_processed": Counter(
-                    "nextvision_matching_jobs_processed_total",
-                    "Total matching jobs processed",
-                    ["status"]
-                ),
-                "matching_duration": Histogram(
-                    "nextvision_matching_duration_seconds",
-                    "Matching job duration",
-                    ["job_type"]
-                ),
-                
-                # Cache
-                "cache_operations": Counter(
-                    "nextvision_cache_operations_total",
-                    "Cache operations",
-                    ["operation", "cache_type", "result"]
-                ),
-                "cache_hit_rate": Gauge(
-                    "nextvision_cache_hit_rate",
-                    "Cache hit rate percentage",
-                    ["cache_type"]
-                ),
-                
-                # Services externes
-                "external_api_calls": Counter(
-                    "nextvision_external_api_calls_total",
-                    "External API calls",
-                    ["service", "status"]
-                ),
-                "external_api_duration": Histogram(
-                    "nextvision_external_api_duration_seconds",
-                    "External API call duration",
-                    ["service"]
-                ),
-                
-                # Système
-                "system_cpu_usage": Gauge(
-                    "nextvision_system_cpu_usage_percent",
-                    "System CPU usage percentage"
-                ),
-                "system_memory_usage": Gauge(
-                    "nextvision_system_memory_usage_percent",
-                    "System memory usage percentage"
-                ),
-                "system_disk_usage": Gauge(
-                    "nextvision_system_disk_usage_percent",
-                    "System disk usage percentage"
-                ),
-                
-                # Business metrics
-                "active_candidates": Gauge(
-                    "nextvision_active_candidates",
-                    "Number of active candidates"
-                ),
-                "job_matches_per_hour": Gauge(
-                    "nextvision_job_matches_per_hour",
-                    "Job matches generated per hour"
-                ),
-                "error_rate": Gauge(
-                    "nextvision_error_rate_percent",
-                    "Overall error rate percentage",
-                    ["service"]
-                )
-            })
+            self.prometheus_collector = PrometheusStoreCollector(self.store, self.PROMETHEUS_NAMES)
+            REGISTRY.register(self.prometheus_collector)
             
             # Démarrer serveur Prometheus
             start_http_server(self.prometheus_port)
@@ -225,25 +178,7 @@ class MetricsCollector:
         labels: Dict[str, str] = None
     ):
         """📈 Incrémenter un compteur"""
-        labels = labels or {}
-        
-        # Stockage interne
-        metric = MetricValue(
-            name=name,
-            value=value,
-            timestamp=datetime.now(),
-            labels=labels,
-            metric_type=MetricType.COUNTER
-        )
-        
-        self._store_metric(metric)
-        
-        # Prometheus si disponible
-        if self.enable_prometheus and name in self.prometheus_metrics:
-            if labels:
-                self.prometheus_metrics[name].labels(**labels).inc(value)
-            else:
-                self.prometheus_metrics[name].inc(value)
+        self._store_metric(name, value, labels, MetricType.COUNTER)
     
     def record_gauge(
         self, 
@@ -252,24 +187,7 @@ class MetricsCollector:
         labels: Dict[str, str] = None
     ):
         """📏 Enregistrer une jauge"""
-        labels = labels or {}
-        
-        metric = MetricValue(
-            name=name,
-            value=value,
-            timestamp=datetime.now(),
-            labels=labels,
-            metric_type=MetricType.GAUGE
-        )
-        
-        self._store_metric(metric)
-        
-        # Prometheus
-        if self.enable_prometheus and name in self.prometheus_metrics:
-            if labels:
-                self.prometheus_metrics[name].labels(**labels).set(value)
-            else:
-                self.prometheus_metrics[name].set(value)
+        self._store_metric(name, value, labels, MetricType.GAUGE)
     
     def record_timer(
         self, 
@@ -278,25 +196,7 @@ class MetricsCollector:
         labels: Dict[str, str] = None
     ):
         """⏱️ Enregistrer une durée"""
-        labels = labels or {}
-        
-        metric = MetricValue(
-            name=name,
-            value=duration,
-            timestamp=datetime.now(),
-            labels=labels,
-            metric_type=MetricType.TIMER
-        )
-        
-        self._store_metric(metric)
-        
-        # Prometheus histogram
-        histogram_name = name.replace("_time", "_duration")
-        if self.enable_prometheus and histogram_name in self.prometheus_metrics:
-            if labels:
-                self.prometheus_metrics[histogram_name].labels(**labels).observe(duration)
-            else:
-                self.prometheus_metrics[histogram_name].observe(duration)
+        self._store_metric(name, duration, labels, MetricType.TIMER)
     
     def record_histogram(
         self, 
@@ -307,93 +207,57 @@ class MetricsCollector:
         """📊 Enregistrer dans un histogramme"""
         self.record_timer(name, value, labels)  # Same logic
     
-    def _store_metric(self, metric: MetricValue):
-        """💾 Stockage interne de métrique"""
-        key = f"{metric.name}_{json.dumps(metric.labels, sort_keys=True)}"
-        
-        self.metrics_history[key].append(metric)
-        self.current_metrics[key] = metric
+    def _store_metric(
+        self,
+        name: str,
+        value: float,
+        labels: Optional[Dict[str, str]],
+        metric_type: MetricType
+    ):
+        """💾 Stockage interne de métrique (expiration amortie par le store)"""
+        self.store.record(name, value, labels, metric_type.value)
         self.stats["metrics_collected"] += 1
-        
-        # Nettoyage automatique
-        self._cleanup_old_metrics()
     
-    def _cleanup_old_metrics(self):
-        """🧹 Nettoyage des métriques anciennes"""
-        cutoff_time = datetime.now() - timedelta(hours=self.retention_hours)
-        
-        for key, history in self.metrics_history.items():
-            # Supprimer les métriques trop anciennes
-            while history and history[0].timestamp < cutoff_time:
-                history.popleft()
+    @property
+    def current_metrics(self) -> Dict[str, MetricValue]:
+        """📸 Dernière valeur de chaque série (vue construite à la demande)"""
+        return {
+            f"{series.name}_{json.dumps(dict(series.labels), sort_keys=True)}": MetricValue(
+                name=series.name,
+                value=series.last_value,
+                timestamp=datetime.fromtimestamp(series.last_timestamp),
+                labels=dict(series.labels),
+                metric_type=MetricType(series.metric_type)
+            )
+            for series in self.store.iter_series()
+        }
     
     def get_metric_summary(self, name: str, hours: int = 1) -> Dict[str, Any]:
-        """📊 Résumé d'une métrique"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        
-        # Collecter toutes les valeurs pour cette métrique
-        values = []
-        for key, history in self.metrics_history.items():
-            if key.startswith(name):
-                recent_values = [
-                    m.value for m in history 
-                    if m.timestamp >= cutoff_time
-                ]
-                values.extend(recent_values)
-        
-        if not values:
+        """📊 Résumé d'une métrique (min/max/moyenne, tendance, p50/p95/p99 pour les durées)"""
+        summary = self.store.summarize(name, hours * 3600)
+        if summary is None:
             return {"status": "no_data"}
         
-        # Calculs statistiques
         return {
             "metric_name": name,
             "time_window_hours": hours,
-            "sample_count": len(values),
-            "current_value": values[-1] if values else None,
-            "min_value": min(values),
-            "max_value": max(values),
-            "avg_value": sum(values) / len(values),
-            "sum_value": sum(values),
-            "recent_trend": self._calculate_trend(values)
+            **summary
         }
     
-    def _calculate_trend(self, values: List[float]) -> str:
-        """📈 Calcul de tendance"""
-        if len(values) < 2:
-            return "stable"
-        
-        recent_half = values[len(values)//2:]
-        older_half = values[:len(values)//2]
-        
-        if not older_half or not recent_half:
-            return "stable"
-        
-        recent_avg = sum(recent_half) / len(recent_half)
-        older_avg = sum(older_half) / len(older_half)
-        
-        change_percent = ((recent_avg - older_avg) / older_avg) * 100 if older_avg != 0 else 0
-        
-        if change_percent > 10:
-            return "increasing"
-        elif change_percent < -10:
-            return "decreasing"
-        else:
-            return "stable"
-    
     def get_all_metrics_summary(self) -> Dict[str, Any]:
         """📊 Résumé de toutes les métriques"""
-        # Métriques uniques
-        unique_metrics = set()
-        for key in self.metrics_history.keys():
-            metric_name = key.split("_{")[0]  # Enlever les labels
-            unique_metrics.add(metric_name)
+        unique_metrics = self.store.names()
         
         summaries = {}
         for metric_name in unique_metrics:
             summaries[metric_name] = self.get_metric_summary(metric_name)
         
         return {
-            "collector_stats": self.stats,
+            "collector_stats": {
+                **self.stats,
+                "series_count": len(self.store),
+                "series_expired": self.store.series_expired
+            },
             "metrics_count": len(unique_metrics),
             "prometheus_enabled": self.enable_prometheus,
             "metric_summaries": summaries
@@ -0,0 +1,420 @@
+"""
+📦 Nextvision - Stockage compact des métriques
+
+Stockage utilisé par MetricsCollector :
+- Jeux de labels internés (une clé par série, sans sérialisation JSON par échantillon)
+- Historique en anneau de taille fixe (array('d') : valeurs + horodatages)
+- Expiration amortie : lecture bornée par recherche dichotomique, balayage
+  périodique des séries inactives au lieu d'un parcours à chaque échantillon
+- Sketch de quantiles en flux (p50/p95/p99) à erreur relative bornée
+- Export Prometheus lu directement depuis les séries (aucune copie d'historique)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Compact Metric Store
+"""
+
+import math
+import threading
+import time
+from array import array
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    from prometheus_client.core import (
+        CounterMetricFamily, GaugeMetricFamily, SummaryMetricFamily
+    )
+    from prometheus_client.samples import Sample
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+DEFAULT_CAPACITY = 10000
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+# Types de métriques (valeurs de MetricType)
+COUNTER = "counter"
+GAUGE = "gauge"
+TIMER = "timer"
+HISTOGRAM = "histogram"
+_SKETCHED_TYPES = frozenset({TIMER, HISTOGRAM})
+
+
+class QuantileSketch:
+    """📐 Sketch de quantiles à buckets logarithmiques (erreur relative bornée, fusionnable)"""
+
+    _MIN_MAGNITUDE = 1e-9
+
+    __slots__ = ("relative_accuracy", "max_buckets", "_gamma", "_log_gamma",
+                 "positive", "negative", "zero_count", "count")
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float):
+        self.count += 1
+        if value > self._MIN_MAGNITUDE:
+            buckets = self.positive
+        elif value < -self._MIN_MAGNITUDE:
+            buckets = self.negative
+            value = -value
+        else:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        buckets[index] = buckets.get(index, 0) + 1
+        if len(buckets) > self.max_buckets:
+            self._collapse(buckets)
+
+    def _collapse(self, buckets: Dict[int, int]):
+        """Fusionne les deux plus petites magnitudes (la queue haute reste exacte)"""
+        lowest, second = sorted(buckets)[:2]
+        buckets[second] += buckets.pop(lowest)
+
+    def merge(self, other: "QuantileSketch"):
+        for source, target in ((other.positive, self.positive), (other.negative, self.negative)):
+            for index, count in source.items():
+                target[index] = target.get(index, 0) + count
+            while len(target) > self.max_buckets:
+                self._collapse(target)
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def _bucket_value(self, index: int) -> float:
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return -self._bucket_value(index)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return self._bucket_value(index)
+        return self._bucket_value(max(self.positive)) if self.positive else 0.0
+
+
+class MetricSeries:
+    """📈 Série (nom + labels) : anneau de valeurs, agrégats cumulés et sketch tournant"""
+
+    __slots__ = ("name", "labels", "metric_type", "capacity", "values", "timestamps",
+                 "head", "total", "count", "last_value", "last_timestamp",
+                 "sketch_window", "sketch", "previous_sketch", "sketch_started_at")
+
+    def __init__(
+        self,
+        name: str,
+        labels: LabelSet,
+        metric_type: str,
+        capacity: int = DEFAULT_CAPACITY,
+        sketch_window_seconds: float = 300.0
+    ):
+        self.name = name
+        self.labels = labels
+        self.metric_type = metric_type
+        self.capacity = capacity
+        # Croissance jusqu'à `capacity`, puis écrasement circulaire à `head`
+        self.values = array("d")
+        self.timestamps = array("d")
+        self.head = 0
+        # Agrégats depuis le démarrage (compteurs Prometheus, _sum/_count)
+        self.total = 0.0
+        self.count = 0
+        self.last_value = 0.0
+        self.last_timestamp = 0.0
+        # Deux générations de sketch : quantiles sur les 1 à 2 dernières fenêtres
+        self.sketch_window = sketch_window_seconds
+        self.sketch = QuantileSketch() if metric_type in _SKETCHED_TYPES else None
+        self.previous_sketch: Optional[QuantileSketch] = None
+        self.sketch_started_at = 0.0
+
+    def add(self, value: float, timestamp: float):
+        if len(self.values) < self.capacity:
+            self.values.append(value)
+            self.timestamps.append(timestamp)
+        else:
+            self.values[self.head] = value
+            self.timestamps[self.head] = timestamp
+            self.head = (self.head + 1) % self.capacity
+        self.total += value
+        self.count += 1
+        self.last_value = value
+        self.last_timestamp = timestamp
+
+        if self.sketch is not None:
+            elapsed = timestamp - self.sketch_started_at
+            if elapsed >= self.sketch_window:
+                self.previous_sketch = self.sketch if elapsed < 2 * self.sketch_window else None
+                self.sketch = QuantileSketch()
+                self.sketch_started_at = timestamp
+            self.sketch.add(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _physical(self, logical: int) -> int:
+        return (self.head + logical) % len(self.values) if self.head else logical
+
+    def first_index_since(self, cutoff: float) -> int:
+        """Premier indice logique (ordre chronologique) dont l'horodatage est ≥ cutoff"""
+        low, high = 0, len(self.values)
+        timestamps = self.timestamps
+        while low < high:
+            middle = (low + high) // 2
+            if timestamps[self._physical(middle)] < cutoff:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def window(self, start: int, stop: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Plages physiques [a, b) des indices logiques [start, stop)"""
+        size = len(self.values)
+        stop = size if stop is None else stop
+        if start >= stop:
+            return []
+        first, last = self._physical(start), self._physical(stop - 1) + 1
+        return [(first, last)] if first < last else [(first, size), (0, last)]
+
+    def merge_sketch_into(self, target: QuantileSketch, now: float):
+        """Fusionne les générations encore dans la fenêtre (série inactive : ignorées)"""
+        age = now - self.sketch_started_at
+        if self.sketch is None or age >= 2 * self.sketch_window:
+            return
+        target.merge(self.sketch)
+        if self.previous_sketch is not None and age < self.sketch_window:
+            target.merge(self.previous_sketch)
+
+    def quantiles(self, quantiles=DEFAULT_QUANTILES, now: Optional[float] = None) -> Dict[float, Optional[float]]:
+        if self.sketch is None:
+            return {}
+        merged = QuantileSketch()
+        self.merge_sketch_into(merged, time.time() if now is None else now)
+        return {q: merged.quantile(q) for q in quantiles}
+
+
+class MetricStore:
+    """📦 Registre de séries indexées par nom et jeu de labels interné"""
+
+    def __init__(
+        self,
+        retention_seconds: float = 24 * 3600,
+        capacity: int = DEFAULT_CAPACITY,
+        sweep_interval_seconds: float = 60.0,
+        sketch_window_seconds: float = 300.0
+    ):
+        self.retention_seconds = retention_seconds
+        self.capacity = capacity
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.sketch_window_seconds = sketch_window_seconds
+
+        self._series: Dict[Tuple[str, LabelSet], MetricSeries] = {}
+        self._by_name: Dict[str, List[MetricSeries]] = {}
+        # Ordre d'insertion des labels → jeu trié interné (évite le tri par échantillon)
+        self._interned: Dict[Tuple[str, tuple], MetricSeries] = {}
+        self._lock = threading.Lock()
+        self._next_sweep = time.time() + sweep_interval_seconds
+        self.samples_recorded = 0
+        self.series_expired = 0
+
+    def record(
+        self,
+        name: str,
+        value: float,
+        labels: Optional[Dict[str, str]] = None,
+        metric_type: str = GAUGE,
+        timestamp: Optional[float] = None
+    ) -> MetricSeries:
+        timestamp = time.time() if timestamp is None else timestamp
+        raw_key = (name, tuple(labels.items()) if labels else ())
+        series = self._interned.get(raw_key)
+        if series is None:
+            series = self._get_or_create(raw_key, metric_type)
+        series.add(float(value), timestamp)
+        self.samples_recorded += 1
+
+        if timestamp >= self._next_sweep:
+            self.sweep(timestamp)
+        return series
+
+    def _get_or_create(self, raw_key: Tuple[str, tuple], metric_type: str) -> MetricSeries:
+        name, raw_labels = raw_key
+        label_set: LabelSet = tuple(sorted((str(k), str(v)) for k, v in raw_labels))
+        with self._lock:
+            series = self._series.get((name, label_set))
+            if series is None:
+                series = MetricSeries(name, label_set, metric_type, self.capacity, self.sketch_window_seconds)
+                self._series[(name, label_set)] = series
+                self._by_name.setdefault(name, []).append(series)
+            self._interned[raw_key] = series
+        return series
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """🧹 Retire les séries sans échantillon dans la période de rétention"""
+        now = time.time() if now is None else now
+        self._next_sweep = now + self.sweep_interval_seconds
+        cutoff = now - self.retention_seconds
+        with self._lock:
+            expired = [key for key, series in self._series.items() if series.last_timestamp < cutoff]
+            for key in expired:
+                series = self._series.pop(key)
+                remaining = [s for s in self._by_name.get(series.name, []) if s is not series]
+                if remaining:
+                    self._by_name[series.name] = remaining
+                else:
+                    self._by_name.pop(series.name, None)
+            if expired:
+                self._interned = {
+                    raw_key: series for raw_key, series in self._interned.items()
+                    if (series.name, series.labels) in self._series
+                }
+        self.series_expired += len(expired)
+        return len(expired)
+
+    def names(self) -> List[str]:
+        return list(self._by_name)
+
+    def series_for(self, name: str) -> List[MetricSeries]:
+        return self._by_name.get(name, [])
+
+    def iter_series(self) -> Iterator[MetricSeries]:
+        # Copie des références uniquement (l'export peut tourner dans un autre thread)
+        with self._lock:
+            series = tuple(self._series.values())
+        return iter(series)
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def summarize(self, name: str, window_seconds: float, now: Optional[float] = None) -> Optional[Dict]:
+        """📊 Agrégats d'une métrique (toutes séries) sur la fenêtre, lus directement dans les anneaux"""
+        now = time.time() if now is None else now
+        cutoff = now - min(window_seconds, self.retention_seconds)
+
+        halves = {"older": [0.0, 0], "recent": [0.0, 0]}
+        minimum, maximum = math.inf, -math.inf
+        current_value, current_timestamp = None, -math.inf
+        sketch = None
+
+        for series in self.series_for(name):
+            start = series.first_index_since(cutoff)
+            size = len(series)
+            if start >= size:
+                continue
+            middle = start + (size - start) // 2
+            for half, lo, hi in (("older", start, middle), ("recent", middle, size)):
+                # islice : lecture de l'anneau sans copie ni export de buffer
+                # (un append concurrent peut redimensionner le tableau)
+                for a, b in series.window(lo, hi):
+                    halves[half][0] += sum(islice(series.values, a, b))
+                    halves[half][1] += b - a
+                    minimum = min(minimum, min(islice(series.values, a, b)))
+                    maximum = max(maximum, max(islice(series.values, a, b)))
+            if series.last_timestamp > current_timestamp:
+                current_value, current_timestamp = series.last_value, series.last_timestamp
+            if series.sketch is not None:
+                sketch = sketch or QuantileSketch()
+                series.merge_sketch_into(sketch, now)
+
+        (older_sum, older_count), (recent_sum, recent_count) = halves["older"], halves["recent"]
+        sample_count = older_count + recent_count
+        if not sample_count:
+            return None
+
+        total = older_sum + recent_sum
+        summary = {
+            "sample_count": sample_count,
+            "current_value": current_value,
+            "min_value": minimum,
+            "max_value": maximum,
+            "avg_value": total / sample_count,
+            "sum_value": total,
+            "recent_trend": _trend(older_sum, older_count, recent_sum, recent_count)
+        }
+        if sketch is not None:
+            for q in DEFAULT_QUANTILES:
+                summary[f"p{round(q * 100)}"] = sketch.quantile(q)
+        return summary
+
+
+def _trend(older_sum: float, older_count: float, recent_sum: float, recent_count: float) -> str:
+    """📈 Compare la moyenne de la moitié récente à celle de la moitié ancienne"""
+    if not older_count or not recent_count:
+        return "stable"
+    older_avg = older_sum / older_count
+    recent_avg = recent_sum / recent_count
+    change_percent = ((recent_avg - older_avg) / older_avg) * 100 if older_avg != 0 else 0
+    if change_percent > 10:
+        return "increasing"
+    if change_percent < -10:
+        return "decreasing"
+    return "stable"
+
+
+class PrometheusStoreCollector:
+    """📤 Collecteur Prometheus lisant les séries du MetricStore au moment du scrape"""
+
+    def __init__(self, store: MetricStore, exported_names: Optional[Dict[str, Tuple[str, str]]] = None,
+                 namespace: str = "nextvision"):
+        self.store = store
+        # nom interne → (nom exporté, description)
+        self.exported_names = exported_names or {}
+        self.namespace = namespace
+
+    def _export_name(self, series: MetricSeries) -> Tuple[str, str]:
+        if series.name in self.exported_names:
+            return self.exported_names[series.name]
+        name = f"{self.namespace}_{series.name}"
+        if series.metric_type in _SKETCHED_TYPES:
+            name = name.replace("_time", "_duration")
+            if not name.endswith("_seconds"):
+                name += "_seconds"
+        return name, series.name.replace("_", " ")
+
+    def collect(self):
+        if not PROMETHEUS_AVAILABLE:
+            return
+        now = time.time()
+        families: Dict[str, object] = {}
+
+        for series in self.store.iter_series():
+            name, documentation = self._export_name(series)
+            label_names = [label for label, _ in series.labels]
+            label_values = [value for _, value in series.labels]
+
+            family = families.get(name)
+            if series.metric_type == COUNTER:
+                # CounterMetricFamily gère le suffixe _total
+                family = family or CounterMetricFamily(name, documentation, labels=label_names)
+                family.add_metric(label_values, series.total)
+            elif series.metric_type in _SKETCHED_TYPES:
+                family = family or SummaryMetricFamily(name, documentation, labels=label_names)
+                family.add_metric(label_values, count_value=series.count, sum_value=series.total)
+                for q, value in series.quantiles(now=now).items():
+                    if value is not None:
+                        family.samples.append(Sample(
+                            family.name, dict(zip(label_names, label_values), quantile=str(q)), value
+                        ))
+            else:
+                family = family or GaugeMetricFamily(name, documentation, labels=label_names)
+                family.add_metric(label_values, series.last_value)
+            families[name] = family
+
+        yield from families.values()
@@ -9,21 +9,32 @@ Features:
 - Error context preservation
 - Multi-environment configuration
 - Log aggregation ready
+- Asynchronous pipeline (queue + background writer thread)
+- Per-logger sampling and rate limits
 """
 
+import atexit
 import json
 import nextvision_logging as logging
+import queue
 import time
 import uuid
 from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Any, Optional, List, Union
 import traceback
 import threading
 from functools import wraps
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class LogLevel(Enum):
     """📏 Niveaux de log"""
@@ -78,40 +89,130 @@ class ContextualFilter(logging.Filter):
     
     def filter(self, record):
         # Ajouter contexte depuis thread-local storage
+        # (horodatage et thread : déjà portés par le record, formatés à l'écriture)
         context = get_current_context()
         if context:
             for key, value in context.to_dict().items():
                 setattr(record, key, value)
         
-        # Ajouter timestamp ISO
-        record.timestamp_iso = datetime.now().isoformat()
-        
-        # Ajouter info thread
-        record.thread_name = threading.current_thread().name
-        record.thread_id = threading.get_ident()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """🎲 Échantillonnage et limite de débit par logger (DEBUG/INFO uniquement)
+    
+    Règles par préfixe de nom de logger, ex :
+    {"nextvision.services.bidirectional_matcher": {"sample_rate": 0.1, "max_per_second": 200}}
+    WARNING et au-delà ne sont jamais filtrés.
+    """
+    
+    def __init__(self, rules: Optional[Dict[str, Dict[str, float]]] = None):
+        super().__init__()
+        self.rules = rules or {}
+        self._lock = threading.Lock()
+        # Règle résolue par nom de logger (préfixe le plus long)
+        self._resolved: Dict[str, Optional[str]] = {}
+        # État par règle : crédit d'échantillonnage et seau à jetons
+        self._state: Dict[str, Dict[str, float]] = {}
+        self.dropped: Dict[str, int] = {}
+    
+    def _resolve(self, name: str) -> Optional[str]:
+        prefix = self._resolved.get(name, "")
+        if prefix != "":
+            return prefix
+        matches = [rule for rule in self.rules if name == rule or name.startswith(rule + ".")]
+        prefix = max(matches, key=len) if matches else None
+        self._resolved[name] = prefix
+        return prefix
+    
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or not self.rules:
+            return True
+        # Décision unique par record (filtre partagé entre plusieurs handlers)
+        decision = getattr(record, "_sampling_kept", None)
+        if decision is None:
+            decision = record._sampling_kept = self._decide(record)
+        return decision
+    
+    def _decide(self, record) -> bool:
+        prefix = self._resolve(record.name)
+        if prefix is None:
+            return True
+        
+        rule = self.rules[prefix]
+        with self._lock:
+            state = self._state.setdefault(prefix, {"credit": 0.0, "tokens": None, "refilled_at": record.created})
+            
+            # Échantillonnage déterministe : 1 record sur 1/sample_rate
+            sample_rate = rule.get("sample_rate", 1.0)
+            if sample_rate < 1.0:
+                state["credit"] += sample_rate
+                if state["credit"] < 1.0:
+                    return self._drop(prefix)
+                state["credit"] -= 1.0
+            
+            # Limite de débit : seau à jetons (rafale = 1 seconde de débit)
+            max_per_second = rule.get("max_per_second")
+            if max_per_second:
+                if state["tokens"] is None:
+                    state["tokens"] = float(max_per_second)
+                state["tokens"] = min(
+                    float(max_per_second),
+                    state["tokens"] + (record.created - state["refilled_at"]) * max_per_second
+                )
+                state["refilled_at"] = record.created
+                if state["tokens"] < 1.0:
+                    return self._drop(prefix)
+                state["tokens"] -= 1.0
         
         return True
+    
+    def _drop(self, prefix: str) -> bool:
+        self.dropped[prefix] = self.dropped.get(prefix, 0) + 1
+        return False
 
 
 class StructuredFormatter(logging.Formatter):
     """📏 Formateur JSON pour logs structurés"""
     
+    # Attributs standard d'un LogRecord (+ ajoutés par Formatter / QueueHandler)
+    SYSTEM_FIELDS = frozenset(
+        logging.LogRecord("", logging.INFO, "", 0, "", None, None).__dict__
+    ) | {"message", "asctime", "exc_text", "stack_info", "taskName"}
+    
+    CONTEXT_FIELDS = (
+        'request_id', 'user_id', 'session_id', 'component', 
+        'operation', 'correlation_id', 'performance_data', 'business_context'
+    )
+    
+    _MAX_CACHED_LAYOUTS = 1024
+    
     def __init__(self, include_extra_fields: bool = True):
         super().__init__()
         self.include_extra_fields = include_extra_fields
-        
-        # Champs système standard
-        self.system_fields = {
-            'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 
-            'filename', 'module', 'funcName', 'lineno', 'created', 
-            'msecs', 'relativeCreated', 'thread', 'threadName', 
-            'processName', 'process', 'stack_info', 'exc_info', 'exc_text'
-        }
+        self.system_fields = self.SYSTEM_FIELDS
+        
+        # Disposition des attributs d'un record → noms des champs extra
+        # (un site d'appel produit toujours la même disposition)
+        self._extra_keys_cache: Dict[tuple, tuple] = {}
+    
+    def _extra_keys(self, record) -> tuple:
+        layout = tuple(record.__dict__)
+        keys = self._extra_keys_cache.get(layout)
+        if keys is None:
+            excluded = self.system_fields.union(self.CONTEXT_FIELDS)
+            keys = tuple(key for key in layout if key not in excluded and not key.startswith('_'))
+            if len(self._extra_keys_cache) >= self._MAX_CACHED_LAYOUTS:
+                self._extra_keys_cache.clear()
+            self._extra_keys_cache[layout] = keys
+        return keys
     
     def format(self, record):
+        record_dict = record.__dict__
+        
         # Structure de base
         log_entry = {
-            "timestamp": getattr(record, 'timestamp_iso', datetime.now().isoformat()),
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -119,52 +220,42 @@ class StructuredFormatter(logging.Formatter):
             "function": record.funcName,
             "line": record.lineno,
             "thread": {
-                "name": getattr(record, 'thread_name', 'unknown'),
-                "id": getattr(record, 'thread_id', 0)
+                "name": record.threadName,
+                "id": record.thread
             }
         }
         
         # Ajout contexte si disponible
-        context_fields = [
-            'request_id', 'user_id', 'session_id', 'component', 
-            'operation', 'correlation_id', 'performance_data', 'business_context'
-        ]
-        
-        context = {}
-        for field in context_fields:
-            value = getattr(record, field, None)
-            if value is not None:
-                context[field] = value
-        
+        context = {
+            field: record_dict[field] for field in self.CONTEXT_FIELDS
+            if record_dict.get(field) is not None
+        }
         if context:
             log_entry["context"] = context
         
-        # Exception si présente
+        # Exception si présente (déjà rendue si le record vient de la file)
         if record.exc_info:
             log_entry["exception"] = {
                 "type": record.exc_info[0].__name__,
                 "message": str(record.exc_info[1]),
                 "traceback": self.formatException(record.exc_info)
             }
+        elif record.exc_text:
+            log_entry["exception"] = {"traceback": record.exc_text}
         
         # Champs extra personnalisés
         if self.include_extra_fields:
-            extra = {}
-            for key, value in record.__dict__.items():
-                if key not in self.system_fields and key not in context_fields:
-                    if not key.startswith('_'):
-                        try:
-                            # Vérifier que la valeur est JSON serializable
-                            json.dumps(value)
-                            extra[key] = value
-                        except (TypeError, ValueError):
-                            extra[key] = str(value)
-            
+            extra = {key: record_dict[key] for key in self._extra_keys(record)}
             if extra:
                 log_entry["extra"] = extra
         
-        # Sérialisation JSON
+        # Sérialisation JSON en une passe (valeurs non sérialisables → str)
         try:
+            if ORJSON_AVAILABLE:
+                try:
+                    return orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+                except TypeError:
+                    pass  # Entiers > 64 bits, etc. : json standard
             return json.dumps(log_entry, ensure_ascii=False, default=str)
         except Exception as e:
             # Fallback si problème serialisation
@@ -203,6 +294,78 @@ class LogFormatter:
         )
 
 
+class _NonBlockingQueueHandler(QueueHandler):
+    """📥 Côté appelant : contexte capturé, record enfilé sans jamais bloquer"""
+    
+    def __init__(self, log_queue: queue.SimpleQueue, max_size: int):
+        super().__init__(log_queue)
+        self.max_size = max_size
+        self.dropped = 0
+    
+    def prepare(self, record):
+        # Formatage JSON différé au thread d'écriture ; seul le message est
+        # rendu ici si des arguments (potentiellement mutables) sont présents
+        if record.args:
+            record = logging.makeLogRecord(record.__dict__)
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+    
+    def enqueue(self, record):
+        # SimpleQueue (C, sans verrou Python) : borne vérifiée à l'enfilage
+        if self.queue.qsize() >= self.max_size:
+            self.dropped += 1
+            return
+        self.queue.put_nowait(record)
+
+
+class AsyncLogPipeline:
+    """🚀 Pipeline de logs asynchrone : file bornée + thread d'écriture dédié
+    
+    Les handlers finaux (console, fichier) et le formatage JSON s'exécutent
+    dans le thread du QueueListener, hors du chemin des requêtes.
+    """
+    
+    def __init__(
+        self,
+        handlers: List[logging.Handler],
+        queue_size: int = 10000,
+        sampling_filter: Optional["SamplingFilter"] = None
+    ):
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.queue_size = queue_size
+        self.handlers = handlers
+        self.handler = _NonBlockingQueueHandler(self.queue, queue_size)
+        self.sampling_filter = sampling_filter or SamplingFilter()
+        # Échantillonnage d'abord (le moins cher), puis capture du contexte du thread appelant
+        self.handler.addFilter(self.sampling_filter)
+        self.handler.addFilter(ContextualFilter())
+        self.listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.running = False
+    
+    def start(self):
+        if not self.running:
+            self.listener.start()
+            self.running = True
+    
+    def stop(self):
+        """Vide la file puis arrête le thread d'écriture"""
+        if self.running:
+            self.listener.stop()
+            self.running = False
+            for handler in self.handlers:
+                handler.flush()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "queue_depth": self.queue.qsize(),
+            "queue_size": self.queue_size,
+            "dropped_queue_full": self.handler.dropped,
+            "dropped_sampling": dict(self.sampling_filter.dropped)
+        }
+
+
 # =====================================
 # 💾 CONTEXT MANAGEMENT
 # =====================================
@@ -387,6 +550,15 @@ class RequestTracker:
 _configured_loggers: Dict[str, logging.Logger] = {}
 _request_tracker = RequestTracker()
 
+# Configuration production active (handlers portés par le logger racine 'nextvision')
+_production_root_configured = False
+_log_pipeline: Optional[AsyncLogPipeline] = None
+_shutdown_registered = False
+
+
+def _routes_to_production_root(name: str) -> bool:
+    return _production_root_configured and (name == 'nextvision' or name.startswith('nextvision.'))
+
 
 def get_structured_logger(name: str) -> logging.Logger:
     """🏭 Obtient un logger structuré configuré"""
@@ -395,6 +567,11 @@ def get_structured_logger(name: str) -> logging.Logger:
     
     logger = logging.getLogger(name)
     
+    # Logging production configuré : propagation vers le logger racine
+    if _routes_to_production_root(name):
+        _configured_loggers[name] = logger
+        return logger
+    
     # Éviter la duplication si déjà configuré
     if not logger.handlers:
         # Handler pour stdout
@@ -427,15 +604,28 @@ def setup_production_logging(
     enable_file_logging: bool = True,
     log_file_path: str = "/var/log/nextvision/app.log",
     max_file_size_mb: int = 100,
-    backup_count: int = 5
+    backup_count: int = 5,
+    async_logging: bool = True,
+    queue_size: int = 10000,
+    sampling_rules: Optional[Dict[str, Dict[str, float]]] = None
 ) -> Dict[str, Any]:
-    """🔧 Configuration complète pour production"""
+    """🔧 Configuration complète pour production
+    
+    async_logging : les handlers s'exécutent dans un thread d'écriture dédié
+    (file bornée de `queue_size` records, les records en excès sont comptés
+    et abandonnés plutôt que de bloquer les requêtes).
+    sampling_rules : échantillonnage / débit max par préfixe de logger.
+    """
+    global _production_root_configured, _log_pipeline, _shutdown_registered
     import os
     from logging.handlers import RotatingFileHandler
     
     # Configuration niveau global
     log_level_obj = getattr(logging, log_level.upper(), logging.INFO)
     
+    # Pipeline précédent arrêté (reconfiguration)
+    shutdown_logging()
+    
     # Logger racine Nextvision
     root_logger = logging.getLogger('nextvision')
     root_logger.setLevel(log_level_obj)
@@ -443,12 +633,14 @@ def setup_production_logging(
     # Effacer handlers existants
     root_logger.handlers.clear()
     
+    sampling_filter = SamplingFilter(sampling_rules)
+    output_handlers: List[logging.Handler] = []
+    
     # Handler console (JSON structuré)
     console_handler = logging.StreamHandler()
-    console_handler.addFilter(ContextualFilter())
     console_handler.setFormatter(LogFormatter.get_production_formatter())
     console_handler.setLevel(log_level_obj)
-    root_logger.addHandler(console_handler)
+    output_handlers.append(console_handler)
     
     # Handler fichier si activé
     if enable_file_logging:
@@ -462,16 +654,35 @@ def setup_production_logging(
                 backupCount=backup_count,
                 encoding='utf-8'
             )
-            file_handler.addFilter(ContextualFilter())
             file_handler.setFormatter(LogFormatter.get_production_formatter())
             file_handler.setLevel(log_level_obj)
-            root_logger.addHandler(file_handler)
+            output_handlers.append(file_handler)
             
         except Exception as e:
             # Log warning si impossible de configurer fichier
             console_logger = get_structured_logger('nextvision.logging')
             console_logger.warning(f"Failed to setup file logging: {e}")
     
+    if async_logging:
+        _log_pipeline = AsyncLogPipeline(output_handlers, queue_size, sampling_filter)
+        _log_pipeline.start()
+        root_logger.addHandler(_log_pipeline.handler)
+        if not _shutdown_registered:
+            atexit.register(shutdown_logging)
+            _shutdown_registered = True
+    else:
+        for handler in output_handlers:
+            handler.addFilter(sampling_filter)
+            handler.addFilter(ContextualFilter())
+            root_logger.addHandler(handler)
+    
+    # Loggers structurés déjà créés : propagation vers la racine (plus de handler propre)
+    _production_root_configured = True
+    for name, configured_logger in _configured_loggers.items():
+        if _routes_to_production_root(name) and name != 'nextvision':
+            configured_logger.handlers.clear()
+            configured_logger.propagate = True
+    
     # Empêcher propagation
     root_logger.propagate = False
     
@@ -501,6 +712,9 @@ def setup_production_logging(
     return {
         "status": "configured",
         "log_level": log_level,
+        "async_logging": async_logging,
+        "queue_size": queue_size if async_logging else None,
+        "sampling_rules": sampling_rules or {},
         "handlers": [
             {"type": "console", "formatter": "structured_json"},
             {"type": "file", "path": log_file_path, "enabled": enable_file_logging}
@@ -509,6 +723,29 @@ def setup_production_logging(
     }
 
 
+def shutdown_logging():
+    """🛑 Vide la file de logs et arrête le thread d'écriture (handlers rebranchés en direct)"""
+    global _log_pipeline
+    pipeline, _log_pipeline = _log_pipeline, None
+    if pipeline is None:
+        return
+    
+    pipeline.stop()
+    root_logger = logging.getLogger('nextvision')
+    root_logger.removeHandler(pipeline.handler)
+    for handler in pipeline.handlers:
+        handler.addFilter(pipeline.sampling_filter)
+        handler.addFilter(ContextualFilter())
+        root_logger.addHandler(handler)
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    """📊 État du pipeline de logs (profondeur de file, records abandonnés)"""
+    if _log_pipeline is None:
+        return {"async_logging": False}
+    return {"async_logging": True, **_log_pipeline.get_stats()}
+
+
 def get_request_tracker() -> RequestTracker:
     """🔍 Obtient l'instance du request tracker"""
     return _request_tracker
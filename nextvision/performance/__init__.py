@@ -8,6 +8,7 @@ from .batch_processing import (
     BatchJob,
     BatchResult,
     BatchStrategy,
+    JobScheduler,
     PerformanceOptimizer,
     ConcurrencyManager
 )
@@ -17,6 +18,7 @@ __all__ = [
     "BatchJob", 
     "BatchResult",
     "BatchStrategy",
+    "JobScheduler",
     "PerformanceOptimizer",
     "ConcurrencyManager"
 ]
\ No newline at end of file
@@ -8,15 +8,19 @@ Features:
 - Memory-efficient streaming
 - Progress tracking
 - Graceful degradation under load
+- Priority scheduling with bounded retries (exponential backoff) and cancellation
 """
 
 import asyncio
+import heapq
+import itertools
+import random
 import time
 import psutil
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Dict, Any, Optional, Callable, AsyncGenerator, Union
+from typing import List, Dict, Any, Optional, Callable, Union
 import nextvision_logging as logging
 import math
 from concurrent.futures import ThreadPoolExecutor
@@ -24,6 +28,7 @@ from concurrent.futures import ThreadPoolExecutor
 from ..logging.structured_logging import get_structured_logger
 from ..monitoring.health_metrics import MetricsCollector
 from ..cache.redis_intelligent_cache import CacheManager
+from ..utils.fingerprint import fingerprint
 
 logger = get_structured_logger(__name__)
 
@@ -39,7 +44,7 @@ class BatchStrategy(Enum):
 
 @dataclass
 class BatchJob:
-    """📋 Job individuel dans un batch"""
+    """📋 Job individuel dans un batch (priority : plus la valeur est haute, plus le job passe tôt)"""
     id: str
     data: Dict[str, Any]
     priority: int = 1
@@ -50,6 +55,7 @@ class BatchJob:
     completed_at: Optional[datetime] = None
     error: Optional[str] = None
     processing_time_ms: Optional[float] = None
+    cancelled: bool = False
 
 
 @dataclass 
@@ -67,6 +73,8 @@ class BatchResult:
     cache_hit_rate: float = 0.0
     performance_rating: str = "unknown"
     errors: List[Dict[str, Any]] = field(default_factory=list)
+    retried_jobs: int = 0
+    cancelled_jobs: int = 0
     
     @property
     def success_rate(self) -> float:
@@ -216,6 +224,105 @@ class BatchSizeOptimizer:
         return new_size
 
 
+class JobScheduler:
+    """🗂️ File de jobs à priorités avec retries différés"""
+    
+    def __init__(
+        self,
+        retry_base_delay: float = 0.1,
+        retry_max_delay: float = 5.0,
+        retry_jitter: float = 0.1
+    ):
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.retry_jitter = retry_jitter
+        
+        # Tas des jobs prêts : (-priorité, ordre d'arrivée, job)
+        self._ready: List[tuple] = []
+        # Tas des retries en attente : (instant de reprise, ordre d'arrivée, job)
+        self._delayed: List[tuple] = []
+        self._sequence = itertools.count()
+        self._cancelled_ids: set = set()
+        self._dropped: List[BatchJob] = []
+        self.cancelled = False
+    
+    def push(self, job: BatchJob):
+        """Ajoute un job prêt à être traité"""
+        heapq.heappush(self._ready, (-job.priority, next(self._sequence), job))
+    
+    def retry_delay(self, job: BatchJob) -> float:
+        """Backoff exponentiel borné avec jitter"""
+        delay = min(self.retry_max_delay, self.retry_base_delay * (2 ** max(0, job.retry_count - 1)))
+        return delay * (1 + random.uniform(0, self.retry_jitter))
+    
+    def schedule_retry(self, job: BatchJob) -> bool:
+        """Replanifie un job en échec ; False si ses retries sont épuisés ou s'il est annulé"""
+        if job.retry_count > job.max_retries or self.is_cancelled(job):
+            return False
+        ready_at = time.monotonic() + self.retry_delay(job)
+        heapq.heappush(self._delayed, (ready_at, next(self._sequence), job))
+        return True
+    
+    def _promote_due_retries(self):
+        now = time.monotonic()
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, job = heapq.heappop(self._delayed)
+            self.push(job)
+    
+    def pop_ready(self, max_jobs: int) -> List[BatchJob]:
+        """Jusqu'à max_jobs jobs prêts, par priorité décroissante (jobs annulés écartés)"""
+        self._promote_due_retries()
+        jobs = []
+        while self._ready and len(jobs) < max_jobs:
+            _, _, job = heapq.heappop(self._ready)
+            if self.is_cancelled(job):
+                job.cancelled = True
+                self._dropped.append(job)
+                continue
+            jobs.append(job)
+        return jobs
+    
+    def next_retry_delay(self) -> Optional[float]:
+        """Attente avant le prochain retry (None s'il n'y en a pas)"""
+        if not self._delayed:
+            return None
+        return max(0.0, self._delayed[0][0] - time.monotonic())
+    
+    def drain_cancelled(self) -> List[BatchJob]:
+        """Retire et renvoie tous les jobs en attente annulés"""
+        kept_ready, kept_delayed, cancelled = [], [], []
+        for heap, kept in ((self._ready, kept_ready), (self._delayed, kept_delayed)):
+            for entry in heap:
+                (cancelled if self.is_cancelled(entry[2]) else kept).append(entry)
+        heapq.heapify(kept_ready)
+        heapq.heapify(kept_delayed)
+        self._ready, self._delayed = kept_ready, kept_delayed
+        for _, _, job in cancelled:
+            job.cancelled = True
+        dropped, self._dropped = self._dropped, []
+        return dropped + [job for _, _, job in cancelled]
+    
+    def cancel(self, job_id: str) -> bool:
+        """Annule un job (les jobs déjà en cours vont à leur terme sans retry)"""
+        if self.cancelled:
+            return False
+        pending = any(entry[2].id == job_id for entry in itertools.chain(self._ready, self._delayed))
+        self._cancelled_ids.add(job_id)
+        return pending
+    
+    def cancel_all(self) -> int:
+        """Annule tous les jobs restants ; renvoie le nombre de jobs en attente annulés"""
+        self.cancelled = True
+        return len(self._ready) + len(self._delayed)
+    
+    def is_cancelled(self, job: BatchJob) -> bool:
+        return self.cancelled or job.cancelled or job.id in self._cancelled_ids
+    
+    @property
+    def pending(self) -> int:
+        return len(self._ready) + len(self._delayed)
+
+
 class BatchProcessor:
     """⚡ Processeur batch haute performance pour 1000+ jobs"""
     
@@ -226,7 +333,9 @@ class BatchProcessor:
         initial_concurrency: int = 10,
         max_concurrency: int = 50,
         cache_manager: Optional[CacheManager] = None,
-        metrics_collector: Optional[MetricsCollector] = None
+        metrics_collector: Optional[MetricsCollector] = None,
+        retry_base_delay: float = 0.1,
+        retry_max_delay: float = 5.0
     ):
         self.strategy = strategy
         self.cache_manager = cache_manager
@@ -240,9 +349,47 @@ class BatchProcessor:
             initial_batch_size, min_batch_size=10, max_batch_size=200
         )
         
+        # Retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        
+        # Pool de threads partagé pour les processor_func synchrones (créé à la demande)
+        self.max_concurrency = max_concurrency
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
         # État
         self.active_batches: Dict[str, List[BatchJob]] = {}
         self.completed_batches: List[BatchResult] = []
+        self._schedulers: Dict[str, JobScheduler] = {}
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix="nextvision-batch"
+            )
+        return self._executor
+    
+    def cancel_job(self, job_id: str, batch_id: Optional[str] = None) -> bool:
+        """🛑 Annule un job en attente (tous batches actifs si batch_id absent)"""
+        if batch_id is not None:
+            scheduler = self._schedulers.get(batch_id)
+            return scheduler.cancel(job_id) if scheduler else False
+        return any([scheduler.cancel(job_id) for scheduler in list(self._schedulers.values())])
+    
+    def cancel_batch(self, batch_id: str) -> int:
+        """🛑 Annule un batch actif ; renvoie le nombre de jobs en attente annulés"""
+        scheduler = self._schedulers.get(batch_id)
+        if scheduler is None:
+            return 0
+        logger.info(f"🛑 Annulation batch {batch_id}")
+        return scheduler.cancel_all()
+    
+    def shutdown(self, wait: bool = True):
+        """🔌 Arrêt du pool de threads partagé"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
         
     async def process_jobs(
         self,
@@ -250,8 +397,12 @@ class BatchProcessor:
         processor_func: Callable,
         progress_callback: Optional[Callable] = None
     ) -> BatchResult:
-        """🚀 Traitement principal optimisé pour gros volumes"""
-        batch_id = f"batch_{int(time.time())}_{len(jobs)}"
+        """🚀 Traitement principal optimisé pour gros volumes
+        
+        Les jobs sont servis par priorité décroissante ; un job en échec est
+        replanifié avec backoff exponentiel tant que retry_count <= max_retries.
+        """
+        batch_id = f"batch_{int(time.time())}_{len(jobs)}_{id(jobs):x}"
         logger.info(f"🚀 Démarrage batch {batch_id}: {len(jobs)} jobs")
         
         # Monitoring performance
@@ -261,17 +412,34 @@ class BatchProcessor:
         # Résultats
         successful_jobs = 0
         failed_jobs = 0
+        cancelled_jobs = 0
+        retried_jobs = 0
         errors = []
         cache_hits = 0
         
+        # File à priorités du batch
+        scheduler = JobScheduler(self.retry_base_delay, self.retry_max_delay)
+        for job in jobs:
+            scheduler.push(job)
+        self.active_batches[batch_id] = jobs
+        self._schedulers[batch_id] = scheduler
+        
         try:
             # Traitement par chunks adaptatifs
             total_processed = 0
             current_batch_size = self.batch_optimizer.current_batch_size
             current_concurrency = self.concurrency_manager.current_concurrency
             
-            # Générateur de chunks
-            async for batch_chunk in self._create_adaptive_chunks(jobs, current_batch_size):
+            while scheduler.pending:
+                cancelled_jobs += len(scheduler.drain_cancelled())
+                batch_chunk = scheduler.pop_ready(current_batch_size)
+                
+                if not batch_chunk:
+                    # Seuls des retries en attente de backoff
+                    retry_delay = scheduler.next_retry_delay()
+                    if retry_delay is not None:
+                        await asyncio.sleep(retry_delay)
+                    continue
                 
                 # Ajustement dynamique de la concurrence
                 perf_stats = perf_monitor.get_current_stats()
@@ -285,11 +453,17 @@ class BatchProcessor:
                 )
                 
                 # Agrégation résultats
-                for result in chunk_results:
+                for job, result in zip(batch_chunk, chunk_results):
                     if result.get("success", False):
                         successful_jobs += 1
                         if result.get("from_cache", False):
                             cache_hits += 1
+                    elif scheduler.schedule_retry(job):
+                        retried_jobs += 1
+                        continue
+                    elif scheduler.is_cancelled(job):
+                        job.cancelled = True
+                        cancelled_jobs += 1
                     else:
                         failed_jobs += 1
                         errors.append({
@@ -297,8 +471,7 @@ class BatchProcessor:
                             "error": result.get("error", "Unknown error"),
                             "retry_count": result.get("retry_count", 0)
                         })
-                
-                total_processed += len(batch_chunk)
+                    total_processed += 1
                 
                 # Callback progress
                 if progress_callback:
@@ -324,6 +497,8 @@ class BatchProcessor:
                 
                 logger.debug(f"📊 Chunk terminé: {len(batch_chunk)} jobs, {jobs_per_second:.1f} jobs/s")
             
+            cancelled_jobs += len(scheduler.drain_cancelled())
+            
             # Statistiques finales
             total_time = time.time() - start_time
             final_stats = perf_monitor.get_current_stats()
@@ -345,7 +520,9 @@ class BatchProcessor:
                 concurrency_used=self.concurrency_manager.current_concurrency,
                 cache_hit_rate=(cache_hits / len(jobs)) * 100 if len(jobs) > 0 else 0,
                 performance_rating=performance_rating,
-                errors=errors[:10]  # Limite erreurs
+                errors=errors[:10],  # Limite erreurs
+                retried_jobs=retried_jobs,
+                cancelled_jobs=cancelled_jobs
             )
             
             # Metrics
@@ -356,7 +533,10 @@ class BatchProcessor:
                 self.metrics.increment_counter("batch_processed", len(jobs))
             
             self.completed_batches.append(result)
-            logger.info(f"✅ Batch {batch_id} terminé: {jobs_per_second:.1f} jobs/s, {result.success_rate:.1f}% succès")
+            logger.info(
+                f"✅ Batch {batch_id} terminé: {jobs_per_second:.1f} jobs/s, {result.success_rate:.1f}% succès "
+                f"({retried_jobs} retries, {cancelled_jobs} annulés)"
+            )
             
             return result
             
@@ -377,21 +557,10 @@ class BatchProcessor:
                 performance_rating="failed",
                 errors=[{"error": str(e), "type": "critical"}]
             )
-    
-    async def _create_adaptive_chunks(
-        self, 
-        jobs: List[BatchJob], 
-        initial_batch_size: int
-    ) -> AsyncGenerator[List[BatchJob], None]:
-        """🔄 Générateur de chunks adaptatifs"""
-        current_batch_size = initial_batch_size
-        
-        for i in range(0, len(jobs), current_batch_size):
-            chunk = jobs[i:i + current_batch_size]
-            yield chunk
-            
-            # Ajustement dynamique pour le prochain chunk
-            current_batch_size = self.batch_optimizer.current_batch_size
+        
+        finally:
+            self.active_batches.pop(batch_id, None)
+            self._schedulers.pop(batch_id, None)
     
     async def _process_chunk_concurrent(
         self,
@@ -399,16 +568,19 @@ class BatchProcessor:
         processor_func: Callable,
         concurrency: int
     ) -> List[Dict[str, Any]]:
-        """⚡ Traitement concurrent d'un chunk"""
-        semaphore = asyncio.Semaphore(concurrency)
+        """⚡ Traitement concurrent d'un chunk (nombre fixe de workers, pas une tâche par job)"""
+        results: List[Any] = [None] * len(chunk)
+        indexes = iter(range(len(chunk)))
         
-        async def process_single_job(job: BatchJob) -> Dict[str, Any]:
-            async with semaphore:
-                return await self._process_single_job_with_cache(job, processor_func)
+        async def worker():
+            for index in indexes:
+                try:
+                    results[index] = await self._process_single_job_with_cache(chunk[index], processor_func)
+                except Exception as e:
+                    results[index] = e
         
         # Exécution concurrente
-        tasks = [process_single_job(job) for job in chunk]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.gather(*[worker() for _ in range(max(1, min(concurrency, len(chunk))))])
         
         # Traitement des exceptions
         processed_results = []
@@ -436,8 +608,9 @@ class BatchProcessor:
         
         try:
             # Vérification cache si disponible
+            cache_key = None
             if self.cache_manager:
-                cache_key = f"job_result_{job.id}_{hash(str(job.data))}"
+                cache_key = f"job_result_{job.id}_{fingerprint(job.data)}"
                 cached_result = await self.cache_manager.cache.get(cache_key)
                 
                 if cached_result is not None:
@@ -456,14 +629,12 @@ class BatchProcessor:
             if asyncio.iscoroutinefunction(processor_func):
                 result = await processor_func(job)
             else:
-                # Exécution synchrone dans thread pool
-                loop = asyncio.get_event_loop()
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    result = await loop.run_in_executor(executor, processor_func, job)
+                # Exécution synchrone dans le pool de threads partagé
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._get_executor(), processor_func, job)
             
             # Mise en cache du résultat
             if self.cache_manager and result:
-                cache_key = f"job_result_{job.id}_{hash(str(job.data))}"
                 await self.cache_manager.cache.set(cache_key, result, 3600)  # 1h TTL
             
             job.completed_at = datetime.now()
@@ -535,6 +706,9 @@ class BatchProcessor:
             "total_processing_time_seconds": round(total_time, 2),
             "current_batch_size": self.batch_optimizer.current_batch_size,
             "current_concurrency": self.concurrency_manager.current_concurrency,
+            "total_retries": sum(batch.retried_jobs for batch in self.completed_batches),
+            "total_cancelled": sum(batch.cancelled_jobs for batch in self.completed_batches),
+            "active_batches": len(self.active_batches),
             "predominant_performance_rating": most_common_rating,
             "target_achieved": avg_jobs_per_second >= 500
         }
@@ -18,6 +18,7 @@ from .gpt_direct_service import (
     parse_cv_direct,
     parse_job_direct
 )
+from .openai_client_pool import OpenAIClientPool, TokenBucket
 
 # 🌉 Bridge Commitment (service principal conservé)
 from .commitment_bridge import CommitmentNextvisionBridge, BridgeRequest, BridgeResponse, BridgeConfig
@@ -51,6 +52,8 @@ __all__ = [
     "get_gpt_service",
     "parse_cv_direct",
     "parse_job_direct",
+    "OpenAIClientPool",
+    "TokenBucket",
     
     # 🌉 Bridge services (conservés)
     "CommitmentNextvisionBridge",
@@ -0,0 +1,202 @@
+"""
+🌊 Nextvision - Matching en lot en streaming (NDJSON / SSE)
+
+Traitement de gros lots candidats × entreprises à mémoire constante :
+- Paires générées à la volée (aucune liste de combinaisons en mémoire)
+- Pool fixe de workers (concurrence bornée)
+- File bornée entre workers et client : backpressure si le client lit lentement
+- Filtrage par seuil côté serveur et top-K maintenu dans un tas
+
+Author: NEXTEN Team
+Version: 1.0.0 - Streaming Batch Matching
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import time
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import nextvision_logging as logging
+
+from ..models.bidirectional_models import (
+    BiDirectionalCandidateProfile, BiDirectionalCompanyProfile, BiDirectionalMatchingRequest
+)
+from .bidirectional_matcher import BiDirectionalMatcher
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class StreamingBatchMatcher:
+    """🌊 Matching en lot émis au fil de l'eau"""
+
+    def __init__(
+        self,
+        matcher: BiDirectionalMatcher,
+        max_concurrency: int = 16,
+        score_threshold: float = 0.3,
+        top_k: int = 20,
+        emit_matches: bool = True,
+        queue_size: Optional[int] = None
+    ):
+        self.matcher = matcher
+        self.max_concurrency = max_concurrency
+        self.score_threshold = score_threshold
+        self.top_k = top_k
+        self.emit_matches = emit_matches
+        self.queue_size = queue_size or max_concurrency * 2
+
+        self.stats = {
+            "processed_combinations": 0,
+            "matches_above_threshold": 0,
+            "failed_combinations": 0,
+            "score_sum": 0.0
+        }
+
+    @staticmethod
+    def _build_match(
+        candidat_index: int,
+        entreprise_index: int,
+        candidat: BiDirectionalCandidateProfile,
+        entreprise: BiDirectionalCompanyProfile,
+        result
+    ) -> Dict:
+        return {
+            "candidat_index": candidat_index,
+            "entreprise_index": entreprise_index,
+            "candidat_id": f"{candidat.personal_info.firstName} {candidat.personal_info.lastName}",
+            "entreprise_id": f"{entreprise.entreprise.nom}",
+            "matching_score": result.matching_score,
+            "compatibility": result.compatibility,
+            "confidence": result.confidence,
+            "processing_time_ms": result.processing_time_ms
+        }
+
+    async def _worker(
+        self,
+        pairs: Iterator[Tuple[Tuple[int, BiDirectionalCandidateProfile], Tuple[int, BiDirectionalCompanyProfile]]],
+        queue: asyncio.Queue
+    ):
+        # Itérateur partagé : chaque worker tire la paire suivante (pas de liste de tâches)
+        for (candidat_index, candidat), (entreprise_index, entreprise) in pairs:
+            try:
+                result = await self.matcher.calculate_bidirectional_match(
+                    BiDirectionalMatchingRequest(candidat=candidat, entreprise=entreprise),
+                    endpoint="batch_matching_stream"
+                )
+                match = self._build_match(candidat_index, entreprise_index, candidat, entreprise, result)
+            except Exception as e:
+                logger.warning(f"⚠️ Match {candidat_index}x{entreprise_index} failed: {e}")
+                match = None
+            # Bloque si le client ne consomme pas assez vite (backpressure)
+            await queue.put(match)
+
+    async def stream(
+        self,
+        candidats: Sequence[BiDirectionalCandidateProfile],
+        entreprises: Sequence[BiDirectionalCompanyProfile]
+    ) -> AsyncIterator[Dict]:
+        """Émet {"type": "match"} au fil des scores puis un {"type": "summary"} final"""
+
+        start_time = time.time()
+        total_combinations = len(candidats) * len(entreprises)
+        pairs = itertools.product(enumerate(candidats), enumerate(entreprises))
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        top_heap: List[Tuple[float, int, Dict]] = []
+        sequence = itertools.count()
+
+        async def run_workers():
+            workers = [
+                asyncio.create_task(self._worker(pairs, queue))
+                for _ in range(min(self.max_concurrency, max(total_combinations, 1)))
+            ]
+            cancelled = False
+            try:
+                await asyncio.gather(*workers)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                # Client déconnecté : plus de lecteur, la sentinelle bloquerait sur une file pleine
+                if not cancelled:
+                    await queue.put(_DONE)
+
+        producer = asyncio.create_task(run_workers())
+        logger.info(
+            f"🌊 Streaming batch: {total_combinations} combinaisons, "
+            f"concurrence={self.max_concurrency}, seuil={self.score_threshold}"
+        )
+
+        try:
+            while True:
+                match = await queue.get()
+                if match is _DONE:
+                    break
+
+                self.stats["processed_combinations"] += 1
+                if match is None:
+                    self.stats["failed_combinations"] += 1
+                    continue
+                if match["matching_score"] < self.score_threshold:
+                    continue
+
+                self.stats["matches_above_threshold"] += 1
+                self.stats["score_sum"] += match["matching_score"]
+
+                if self.top_k > 0:
+                    entry = (match["matching_score"], next(sequence), match)
+                    if len(top_heap) < self.top_k:
+                        heapq.heappush(top_heap, entry)
+                    elif entry[0] > top_heap[0][0]:
+                        heapq.heapreplace(top_heap, entry)
+
+                if self.emit_matches:
+                    yield {"type": "match", **match}
+
+            await producer
+        finally:
+            # Client déconnecté ou erreur : arrêt (et attente) des workers
+            if not producer.done():
+                producer.cancel()
+                try:
+                    await producer
+                except asyncio.CancelledError:
+                    pass
+
+        processing_time = (time.time() - start_time) * 1000
+        above_threshold = self.stats["matches_above_threshold"]
+
+        yield {
+            "type": "summary",
+            "total_combinations": total_combinations,
+            "processed_combinations": self.stats["processed_combinations"],
+            "failed_combinations": self.stats["failed_combinations"],
+            "total_matches": above_threshold,
+            "top_matches": [match for _, _, match in sorted(top_heap, key=lambda e: (-e[0], e[1]))],
+            "processing_time_ms": processing_time,
+            "performance_stats": {
+                "processing_mode": "streaming",
+                "max_concurrency": self.max_concurrency,
+                "avg_score": self.stats["score_sum"] / max(1, above_threshold),
+                "matches_per_second": self.stats["processed_combinations"] / max(0.001, processing_time / 1000)
+            }
+        }
+
+        logger.info(f"🌊 Streaming batch terminé: {above_threshold} matches valides en {processing_time:.2f}ms")
+
+
+def format_ndjson(event: Dict) -> str:
+    """Une ligne JSON par événement"""
+    return json.dumps(event, ensure_ascii=False, default=str) + "\n"
+
+
+def format_sse(event: Dict) -> str:
+    """Événement Server-Sent Events (event: match|summary)"""
+    return f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
@@ -17,22 +17,26 @@ import time
 import asyncio
 from datetime import datetime
 
+import numpy as np
+
 # Import des modèles et scorers
 from nextvision.models.bidirectional_models import (
     BiDirectionalCandidateProfile, BiDirectionalCompanyProfile,
     BiDirectionalMatchingRequest, BiDirectionalMatchingResponse,
     ComponentWeights, AdaptiveWeightingConfig, MatchingComponentScores,
-    RaisonEcouteCandidat, UrgenceRecrutement
+    RaisonEcouteCandidat, UrgenceRecrutement, NiveauExperience
 )
 
 from nextvision.services.bidirectional_scorer import (
     SemanticScorer, SalaryScorer, ExperienceScorer, LocationScorer,
     ScoringResult
 )
+from nextvision.services.compiled_profiles import CompiledCandidate, CompiledCompany
 
 # Import des services Google Maps existants
 from nextvision.services.google_maps_service import GoogleMapsService
 from nextvision.engines.location_scoring import LocationScoringEngine
+from nextvision.services.matching_result_cache import MatchingResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -114,16 +118,21 @@ class AdaptiveWeightingEngine:
         }
     
     def calculate_adaptive_weights(self, candidat: BiDirectionalCandidateProfile,
-                                 entreprise: BiDirectionalCompanyProfile) -> AdaptiveWeightingConfig:
-        """🎯 Calcule pondération adaptative bidirectionnelle"""
+                                 entreprise: BiDirectionalCompanyProfile,
+                                 entreprise_weights: Optional[ComponentWeights] = None) -> AdaptiveWeightingConfig:
+        """🎯 Calcule pondération adaptative bidirectionnelle
+        
+        `entreprise_weights` : poids finaux déjà calculés (ranking vectorisé)
+        """
         
         # 1. Adaptation côté candidat
         candidat_weights = self._apply_candidat_adaptation(candidat.motivations.raison_ecoute)
         
         # 2. Adaptation côté entreprise (tolerance boost)
-        entreprise_weights = self._apply_entreprise_adaptation(
-            candidat_weights, entreprise.recrutement.urgence
-        )
+        if entreprise_weights is None:
+            entreprise_weights = self._apply_entreprise_adaptation(
+                candidat_weights, entreprise.recrutement.urgence
+            )
         
         # 3. Configuration finale
         config = AdaptiveWeightingConfig(
@@ -135,10 +144,11 @@ class AdaptiveWeightingEngine:
             reasoning_entreprise=self.entreprise_adaptations[entreprise.recrutement.urgence]["reasoning"]
         )
         
-        logger.info(f"🎯 Pondération adaptative calculée:")
-        logger.info(f"   👤 Candidat: {candidat.motivations.raison_ecoute.value}")
-        logger.info(f"   🏢 Entreprise: {entreprise.recrutement.urgence.value}")
-        logger.info(f"   📊 Poids finaux: {entreprise_weights.dict()}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"🎯 Pondération adaptative calculée:")
+            logger.info(f"   👤 Candidat: {candidat.motivations.raison_ecoute.value}")
+            logger.info(f"   🏢 Entreprise: {entreprise.recrutement.urgence.value}")
+            logger.info(f"   📊 Poids finaux: {entreprise_weights.dict()}")
         
         return config
     
@@ -163,12 +173,21 @@ class AdaptiveWeightingEngine:
         adaptation = self.entreprise_adaptations[urgence]
         boost_factor = adaptation["boost_factor"]
         
-        # Application du boost sur tous les composants
+        # Application du boost sur tous les composants, puis renormalisation
+        # (la somme des poids doit rester égale à 1.0)
+        boosted = [
+            min(1.0, candidat_weights.semantique * boost_factor),
+            min(1.0, candidat_weights.salaire * boost_factor),
+            min(1.0, candidat_weights.experience * boost_factor),
+            min(1.0, candidat_weights.localisation * boost_factor)
+        ]
+        total = sum(boosted)
+        semantique, salaire, experience, localisation = (weight / total for weight in boosted)
         return ComponentWeights(
-            semantique=min(1.0, candidat_weights.semantique * boost_factor),
-            salaire=min(1.0, candidat_weights.salaire * boost_factor),
-            experience=min(1.0, candidat_weights.experience * boost_factor),
-            localisation=min(1.0, candidat_weights.localisation * boost_factor)
+            semantique=semantique,
+            salaire=salaire,
+            experience=experience,
+            localisation=localisation
         )
 
 # === BIDIRECTIONAL MATCHER ===
@@ -177,7 +196,8 @@ class BiDirectionalMatcher:
     """🎯 Moteur principal de matching bidirectionnel"""
     
     def __init__(self, google_maps_service: GoogleMapsService = None,
-                 location_scoring_engine: LocationScoringEngine = None):
+                 location_scoring_engine: LocationScoringEngine = None,
+                 cache_manager=None, cache_max_entries: int = 2048):
         
         # Initialisation des scorers
         self.semantic_scorer = SemanticScorer()
@@ -188,112 +208,67 @@ class BiDirectionalMatcher:
             location_scoring_engine=location_scoring_engine
         )
         
+        # Profils compilés (cache par empreinte), même index de compétences que le scorer sémantique
+        self.profile_compiler = self.semantic_scorer.profile_compiler
+        
         # Moteur de pondération adaptative
         self.weighting_engine = AdaptiveWeightingEngine()
         
-        # Cache pour optimisation performance
-        self.cache = {}
-        self.cache_ttl = 3600  # 1 heure
+        # Cache de résultats borné (partagé via CacheManager si fourni)
+        self.cache = MatchingResultCache(cache_manager, max_local_entries=cache_max_entries)
         
         # Stats performance
         self.stats = {
             "total_matches": 0,
+            "computed_matches": 0,
             "cache_hits": 0,
+            "total_ranked_jobs": 0,
             "avg_processing_time": 0.0,
             "last_reset": datetime.now()
         }
     
-    async def calculate_bidirectional_match(self, request: BiDirectionalMatchingRequest) -> BiDirectionalMatchingResponse:
-        """🎯 MATCHING PRINCIPAL : Calcul bidirectionnel candidat ↔ entreprise"""
+    async def calculate_bidirectional_match(self, request: BiDirectionalMatchingRequest,
+                                            endpoint: str = "default",
+                                            force_refresh: bool = False) -> BiDirectionalMatchingResponse:
+        """🎯 MATCHING PRINCIPAL : Calcul bidirectionnel candidat ↔ entreprise
+        
+        `endpoint` sert uniquement aux statistiques de cache par endpoint ;
+        `force_refresh` ignore le résultat en cache et le remplace.
+        """
         start_time = time.time()
         
         try:
-            logger.info(f"🎯 === MATCHING BIDIRECTIONNEL ===")
-            logger.info(f"👤 Candidat: {request.candidat.personal_info.firstName} {request.candidat.personal_info.lastName}")
-            logger.info(f"🏢 Entreprise: {request.entreprise.entreprise.nom} - {request.entreprise.poste.titre}")
-            
-            # 1. Vérification cache
-            cache_key = self._generate_cache_key(request)
-            if cache_key in self.cache and not request.force_adaptive_weighting:
-                cached_result = self.cache[cache_key]
-                if self._is_cache_valid(cached_result["timestamp"]):
-                    self.stats["cache_hits"] += 1
-                    logger.info("⚡ Résultat depuis cache")
-                    return cached_result["response"]
-            
-            # 2. Pondération adaptative bidirectionnelle
-            adaptive_config = self.weighting_engine.calculate_adaptive_weights(
-                request.candidat, request.entreprise
-            )
-            weights = adaptive_config.entreprise_weights
-            
-            # 3. Calcul parallèle des 4 composants
-            scoring_tasks = [
-                self._calculate_semantic_score(request.candidat, request.entreprise),
-                self._calculate_salary_score(request.candidat, request.entreprise),
-                self._calculate_experience_score(request.candidat, request.entreprise),
-                self._calculate_location_score(request.candidat, request.entreprise)
-            ]
-            
-            semantic_result, salary_result, experience_result, location_result = await asyncio.gather(*scoring_tasks)
+            # Chemin chaud : messages construits seulement si INFO est actif
+            log_info = logger.isEnabledFor(logging.INFO)
+            if log_info:
+                logger.info(f"🎯 === MATCHING BIDIRECTIONNEL ===")
+                logger.info(f"👤 Candidat: {request.candidat.personal_info.firstName} {request.candidat.personal_info.lastName}")
+                logger.info(f"🏢 Entreprise: {request.entreprise.entreprise.nom} - {request.entreprise.poste.titre}")
             
-            # 4. Agrégation scores avec pondération adaptative
-            component_scores = MatchingComponentScores(
-                semantique_score=semantic_result.score,
-                semantique_details=semantic_result.details,
-                salaire_score=salary_result.score,
-                salaire_details=salary_result.details,
-                experience_score=experience_result.score,
-                experience_details=experience_result.details,
-                localisation_score=location_result.score,
-                localisation_details=location_result.details
-            )
-            
-            # 5. Score final pondéré
-            final_score = (
-                semantic_result.score * weights.semantique +
-                salary_result.score * weights.salaire +
-                experience_result.score * weights.experience +
-                location_result.score * weights.localisation
-            )
-            
-            # 6. Calcul confiance et compatibilité
-            confidence = self._calculate_confidence(semantic_result, salary_result, experience_result, location_result)
-            compatibility = self._determine_compatibility(final_score)
-            
-            # 7. Génération recommandations
-            recommandations = self._generate_recommendations(
-                request.candidat, request.entreprise, component_scores, adaptive_config
-            )
-            
-            # 8. Construction réponse
-            processing_time = (time.time() - start_time) * 1000
-            
-            response = BiDirectionalMatchingResponse(
-                matching_score=round(final_score, 3),
-                confidence=round(confidence, 3),
-                compatibility=compatibility,
-                component_scores=component_scores,
-                adaptive_weighting=adaptive_config,
-                recommandations_candidat=recommandations["candidat"],
-                recommandations_entreprise=recommandations["entreprise"],
-                points_forts=recommandations["points_forts"],
-                points_attention=recommandations["points_attention"],
-                processing_time_ms=round(processing_time, 2)
+            # 1. Cache (la pondération adaptative est déterministe : un résultat en cache l'inclut)
+            response, cache_hit = await self.cache.get_or_compute(
+                request,
+                lambda candidate_key, company_key: self._compute_match(
+                    request, start_time, candidate_key, company_key
+                ),
+                endpoint=endpoint,
+                force_refresh=force_refresh
             )
             
-            # 9. Cache du résultat
-            self.cache[cache_key] = {
-                "response": response,
-                "timestamp": datetime.now()
-            }
+            self.stats["total_matches"] += 1
+            if cache_hit:
+                self.stats["cache_hits"] += 1
+                if log_info:
+                    logger.info("⚡ Résultat depuis cache")
+                return response
             
-            # 10. Mise à jour stats
-            self._update_stats(processing_time)
+            # Mise à jour stats
+            self._update_stats(response.processing_time_ms)
             
-            logger.info(f"✅ Matching terminé en {processing_time:.2f}ms")
-            logger.info(f"📊 Score final: {final_score:.3f} (confiance: {confidence:.3f})")
-            logger.info(f"🎯 Compatibilité: {compatibility}")
+            if log_info:
+                logger.info(f"✅ Matching terminé en {response.processing_time_ms:.2f}ms")
+                logger.info(f"📊 Score final: {response.matching_score:.3f} (confiance: {response.confidence:.3f})")
+                logger.info(f"🎯 Compatibilité: {response.compatibility}")
             
             return response
             
@@ -320,27 +295,341 @@ class BiDirectionalMatcher:
                 processing_time_ms=(time.time() - start_time) * 1000
             )
     
+    async def _compute_match(self, request: BiDirectionalMatchingRequest,
+                             start_time: float,
+                             candidate_key: Optional[str] = None,
+                             company_key: Optional[str] = None) -> BiDirectionalMatchingResponse:
+        """Calcul complet d'un matching (hors cache)
+        
+        `candidate_key` / `company_key` : empreintes déjà calculées par le cache,
+        réutilisées comme clés des profils compilés.
+        """
+        candidat, entreprise = request.candidat, request.entreprise
+        
+        # 2. Pondération adaptative bidirectionnelle
+        adaptive_config = self.weighting_engine.calculate_adaptive_weights(candidat, entreprise)
+        
+        # 3. Profils compilés une fois pour les 4 composants
+        compiled = (
+            self.profile_compiler.compile_candidate(candidat, candidate_key),
+            self.profile_compiler.compile_company(entreprise, company_key)
+        )
+        
+        scoring_tasks = [
+            self._calculate_semantic_score(candidat, entreprise, *compiled),
+            self._calculate_salary_score(candidat, entreprise, *compiled),
+            self._calculate_experience_score(candidat, entreprise, *compiled),
+            self._calculate_location_score(candidat, entreprise, *compiled)
+        ]
+        
+        semantic_result, salary_result, experience_result, location_result = await asyncio.gather(*scoring_tasks)
+        
+        # 4-8. Agrégation, recommandations et construction réponse
+        return self._build_matching_response(
+            request.candidat, request.entreprise, adaptive_config,
+            semantic_result, salary_result, experience_result, location_result,
+            start_time
+        )
+    
+    def _build_matching_response(self, candidat: BiDirectionalCandidateProfile,
+                                 entreprise: BiDirectionalCompanyProfile,
+                                 adaptive_config: AdaptiveWeightingConfig,
+                                 semantic_result: ScoringResult,
+                                 salary_result: ScoringResult,
+                                 experience_result: ScoringResult,
+                                 location_result: ScoringResult,
+                                 start_time: float) -> BiDirectionalMatchingResponse:
+        """Agrège les 4 composants et construit la réponse complète"""
+        weights = adaptive_config.entreprise_weights
+        
+        # Agrégation scores avec pondération adaptative
+        component_scores = MatchingComponentScores(
+            semantique_score=semantic_result.score,
+            semantique_details=semantic_result.details,
+            salaire_score=salary_result.score,
+            salaire_details=salary_result.details,
+            experience_score=experience_result.score,
+            experience_details=experience_result.details,
+            localisation_score=location_result.score,
+            localisation_details=location_result.details
+        )
+        
+        # Score final pondéré
+        final_score = (
+            semantic_result.score * weights.semantique +
+            salary_result.score * weights.salaire +
+            experience_result.score * weights.experience +
+            location_result.score * weights.localisation
+        )
+        
+        # Calcul confiance et compatibilité
+        confidence = self._calculate_confidence(semantic_result, salary_result, experience_result, location_result)
+        compatibility = self._determine_compatibility(final_score)
+        
+        # Génération recommandations
+        recommandations = self._generate_recommendations(
+            candidat, entreprise, component_scores, adaptive_config
+        )
+        
+        processing_time = (time.time() - start_time) * 1000
+        
+        return BiDirectionalMatchingResponse(
+            matching_score=round(final_score, 3),
+            confidence=round(confidence, 3),
+            compatibility=compatibility,
+            component_scores=component_scores,
+            adaptive_weighting=adaptive_config,
+            recommandations_candidat=recommandations["candidat"],
+            recommandations_entreprise=recommandations["entreprise"],
+            points_forts=recommandations["points_forts"],
+            points_attention=recommandations["points_attention"],
+            processing_time_ms=round(processing_time, 2)
+        )
+    
+    # === RANKING BATCH : 1 CANDIDAT vs N ENTREPRISES ===
+    
+    async def rank_jobs(self, candidat: BiDirectionalCandidateProfile,
+                        entreprises: List[BiDirectionalCompanyProfile],
+                        top_k: int = 20) -> List[Tuple[int, BiDirectionalMatchingResponse]]:
+        """🚀 Classe N offres pour un candidat et retourne les top_k meilleures
+        
+        Les caractéristiques du candidat sont calculées une seule fois, les
+        composants salaire/expérience et l'agrégation pondérée sont vectorisés
+        avec NumPy. Les réponses complètes (recommandations incluses) ne sont
+        construites que pour les top_k offres.
+        
+        Returns:
+            Liste de tuples (index dans `entreprises`, réponse), triée par score décroissant
+        """
+        start_time = time.time()
+        
+        if not entreprises or top_k <= 0:
+            return []
+        
+        scores = self.score_jobs_vectorized(candidat, entreprises)
+        final_scores = scores["final_scores"]
+        
+        # Sélection top-k sans tri complet
+        k = min(top_k, len(entreprises))
+        if k < len(entreprises):
+            top_indices = np.argpartition(-final_scores, k - 1)[:k]
+        else:
+            top_indices = np.arange(len(entreprises))
+        top_indices = top_indices[np.argsort(-final_scores[top_indices], kind="stable")]
+        
+        # Réponses complètes uniquement pour le top-k
+        weights = scores["weights"]
+        semantic_results = scores["semantic_results"]
+        location_results = scores["location_results"]
+        compiled_candidat = scores["compiled_candidat"]
+        compiled_entreprises = scores["compiled_entreprises"]
+        ranking = []
+        
+        for idx in top_indices:
+            idx = int(idx)
+            entreprise = entreprises[idx]
+            compiled = (compiled_candidat, compiled_entreprises[idx])
+            pair_start = time.time()
+            # Réponse construite avec les poids ayant servi au classement
+            semantique, salaire, experience, localisation = (float(w) for w in weights[idx])
+            adaptive_config = self.weighting_engine.calculate_adaptive_weights(
+                candidat, entreprise,
+                ComponentWeights(
+                    semantique=semantique, salaire=salaire,
+                    experience=experience, localisation=localisation
+                )
+            )
+            response = self._build_matching_response(
+                candidat, entreprise, adaptive_config,
+                semantic_results[idx],
+                self.salary_scorer.calculate_score(candidat, entreprise, *compiled),
+                self.experience_scorer.calculate_score(candidat, entreprise, *compiled),
+                location_results[idx],
+                pair_start
+            )
+            ranking.append((idx, response))
+        
+        processing_time = (time.time() - start_time) * 1000
+        self.stats["total_ranked_jobs"] += len(entreprises)
+        
+        logger.info(f"🚀 Ranking {len(entreprises)} offres → top {k} en {processing_time:.2f}ms")
+        
+        return ranking
+    
+    def score_jobs_vectorized(self, candidat: BiDirectionalCandidateProfile,
+                              entreprises: List[BiDirectionalCompanyProfile]) -> Dict:
+        """Calcule les scores des 4 composants et le score final pour N entreprises
+        
+        Les scores salaire/expérience reproduisent exactement SalaryScorer et
+        ExperienceScorer, sous forme de tableaux NumPy.
+        """
+        n = len(entreprises)
+        
+        # 1. Caractéristiques candidat (calculées une seule fois)
+        candidat_weights = self.weighting_engine._apply_candidat_adaptation(candidat.motivations.raison_ecoute)
+        base_weights = np.array([
+            candidat_weights.semantique, candidat_weights.salaire,
+            candidat_weights.experience, candidat_weights.localisation
+        ])
+        compiled_candidat = self.profile_compiler.compile_candidate(candidat)
+        exp_candidat = compiled_candidat.experience_years
+        progression_score = compiled_candidat.progression_score
+        candidat_experimente = compiled_candidat.experienced
+        
+        # 2. Extraction des colonnes entreprises
+        e_min = np.empty(n)
+        e_max = np.empty(n)
+        exp_min_req = np.empty(n)
+        exp_max_req = np.empty(n)
+        urgence_bonus = np.empty(n)
+        boost_factors = np.empty(n)
+        qualite_scores = np.empty(n)
+        semantic_results = []
+        location_results = []
+        compiled_entreprises: List[CompiledCompany] = []
+        
+        urgence_bonus_map = {UrgenceRecrutement.CRITIQUE: 0.3, UrgenceRecrutement.URGENT: 0.2}
+        
+        for i, entreprise in enumerate(entreprises):
+            compiled_entreprise = self.profile_compiler.compile_company(entreprise)
+            compiled_entreprises.append(compiled_entreprise)
+            
+            e_min[i] = compiled_entreprise.salary_min
+            e_max[i] = compiled_entreprise.salary_max
+            exp_min_req[i] = compiled_entreprise.experience_min
+            exp_max_req[i] = compiled_entreprise.experience_max
+            
+            urgence = entreprise.recrutement.urgence
+            urgence_bonus[i] = urgence_bonus_map.get(urgence, 0.0)
+            adaptation = self.weighting_engine.entreprise_adaptations.get(urgence)
+            boost_factors[i] = adaptation["boost_factor"] if adaptation else 1.0
+            
+            qualite_scores[i] = self.experience_scorer.calculate_experience_quality(compiled_candidat, compiled_entreprise)
+            semantic_results.append(
+                self.semantic_scorer.calculate_score(candidat, entreprise, compiled_candidat, compiled_entreprise)
+            )
+            location_results.append(
+                self.location_scorer.calculate_score(candidat, entreprise, compiled_candidat, compiled_entreprise)
+            )
+        
+        semantic_scores = np.fromiter((r.score for r in semantic_results), dtype=float, count=n)
+        location_scores = np.fromiter((r.score for r in location_results), dtype=float, count=n)
+        
+        # 3. Composants vectorisés
+        salary_scores = self._vectorized_salary_scores(
+            candidat.attentes.salaire_min, candidat.attentes.salaire_max,
+            e_min, e_max, urgence_bonus, candidat_experimente
+        )
+        experience_scores = (
+            self._vectorized_experience_match(exp_candidat, exp_min_req, exp_max_req) * 0.70 +
+            qualite_scores * 0.20 +
+            progression_score * 0.10
+        )
+        
+        # 4. Agrégation pondérée (N x 4)
+        weights = np.minimum(1.0, base_weights[np.newaxis, :] * boost_factors[:, np.newaxis])
+        weights /= weights.sum(axis=1, keepdims=True)  # Même renormalisation que _apply_entreprise_adaptation
+        component_matrix = np.column_stack([semantic_scores, salary_scores, experience_scores, location_scores])
+        final_scores = np.einsum("ij,ij->i", component_matrix, weights)
+        
+        return {
+            "final_scores": final_scores,
+            "component_scores": component_matrix,
+            "weights": weights,
+            "semantic_results": semantic_results,
+            "location_results": location_results,
+            "compiled_candidat": compiled_candidat,
+            "compiled_entreprises": compiled_entreprises
+        }
+    
+    @staticmethod
+    def _vectorized_salary_scores(c_min: int, c_max: int, e_min: np.ndarray, e_max: np.ndarray,
+                                  urgence_bonus: np.ndarray, candidat_experimente: bool) -> np.ndarray:
+        """Version vectorisée de SalaryScorer (compatibilité 60%, positionnement 25%, négociabilité 15%)"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            has_overlap = (e_max >= c_min) & (e_min <= c_max)
+            
+            # Compatibilité de base
+            overlap = np.minimum(c_max, e_max) - np.maximum(c_min, e_min)
+            avg_range = ((c_max - c_min) + (e_max - e_min)) / 2
+            overlap_score = np.minimum(1.0, overlap / avg_range)
+            trop_bas_score = np.maximum(0.0, 1.0 - (c_min - e_max) / c_min)
+            trop_haut_score = np.maximum(0.0, 1.0 - (e_min - c_max) / e_min)
+            compatibilite = np.where(
+                has_overlap, overlap_score,
+                np.where(c_min > e_max, trop_bas_score, trop_haut_score)
+            )
+            
+            # Positionnement dans les fourchettes
+            candidat_mid = (c_min + c_max) / 2
+            ecart = np.abs(candidat_mid - (e_min + e_max) / 2) / candidat_mid
+            hors_fourchette = (e_max < c_min) | (e_min > c_max)
+            positionnement = np.select(
+                [e_max < c_min, e_min > c_max, ecart < 0.1, ecart < 0.2],
+                [0.0, 0.2, 1.0, 0.8],
+                default=0.5
+            )
+            if candidat_mid == 0:
+                positionnement = np.where(hors_fourchette, positionnement, np.nan)
+            
+            # Négociabilité
+            negociabilite = np.minimum(1.0, 0.5 + urgence_bonus + (0.2 if candidat_experimente else 0.0))
+            
+            scores = compatibilite * 0.60 + positionnement * 0.25 + negociabilite * 0.15
+        
+        # Divisions par zéro : SalaryScorer retourne 0.0 dans ce cas
+        return np.where(np.isfinite(scores), scores, 0.0)
+    
+    @staticmethod
+    def _vectorized_experience_match(exp_candidat: int, exp_min: np.ndarray, exp_max: np.ndarray) -> np.ndarray:
+        """Version vectorisée de ExperienceScorer._calculate_experience_match"""
+        gap = exp_min - exp_candidat
+        excess = exp_candidat - exp_max
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sous_qualifie = np.maximum(0.2, 1.0 - gap / exp_min)
+        
+        return np.select(
+            [
+                (exp_min <= exp_candidat) & (exp_candidat <= exp_max),
+                (gap > 0) & (gap <= 1),
+                (gap > 0) & (gap <= 2),
+                gap > 0,
+                excess <= 2,
+                excess <= 5
+            ],
+            [1.0, 0.8, 0.6, sous_qualifie, 0.9, 0.7],
+            default=0.5
+        )
+    
     # === MÉTHODES DE SCORING ASYNCHRONES ===
     
     async def _calculate_semantic_score(self, candidat: BiDirectionalCandidateProfile,
-                                       entreprise: BiDirectionalCompanyProfile) -> ScoringResult:
+                                       entreprise: BiDirectionalCompanyProfile,
+                                       compiled_candidat: Optional[CompiledCandidate] = None,
+                                       compiled_entreprise: Optional[CompiledCompany] = None) -> ScoringResult:
         """Calcul sémantique asynchrone"""
-        return self.semantic_scorer.calculate_score(candidat, entreprise)
+        return self.semantic_scorer.calculate_score(candidat, entreprise, compiled_candidat, compiled_entreprise)
     
     async def _calculate_salary_score(self, candidat: BiDirectionalCandidateProfile,
-                                    entreprise: BiDirectionalCompanyProfile) -> ScoringResult:
+                                    entreprise: BiDirectionalCompanyProfile,
+                                    compiled_candidat: Optional[CompiledCandidate] = None,
+                                    compiled_entreprise: Optional[CompiledCompany] = None) -> ScoringResult:
         """Calcul salarial asynchrone"""
-        return self.salary_scorer.calculate_score(candidat, entreprise)
+        return self.salary_scorer.calculate_score(candidat, entreprise, compiled_candidat, compiled_entreprise)
     
     async def _calculate_experience_score(self, candidat: BiDirectionalCandidateProfile,
-                                        entreprise: BiDirectionalCompanyProfile) -> ScoringResult:
+                                        entreprise: BiDirectionalCompanyProfile,
+                                        compiled_candidat: Optional[CompiledCandidate] = None,
+                                        compiled_entreprise: Optional[CompiledCompany] = None) -> ScoringResult:
         """Calcul expérience asynchrone"""
-        return self.experience_scorer.calculate_score(candidat, entreprise)
+        return self.experience_scorer.calculate_score(candidat, entreprise, compiled_candidat, compiled_entreprise)
     
     async def _calculate_location_score(self, candidat: BiDirectionalCandidateProfile,
-                                      entreprise: BiDirectionalCompanyProfile) -> ScoringResult:
+                                      entreprise: BiDirectionalCompanyProfile,
+                                      compiled_candidat: Optional[CompiledCandidate] = None,
+                                      compiled_entreprise: Optional[CompiledCompany] = None) -> ScoringResult:
         """Calcul localisation asynchrone"""
-        return self.location_scorer.calculate_score(candidat, entreprise)
+        return self.location_scorer.calculate_score(candidat, entreprise, compiled_candidat, compiled_entreprise)
     
     # === MÉTHODES UTILITAIRES ===
     
@@ -426,26 +715,11 @@ class BiDirectionalMatcher:
             "points_attention": points_attention
         }
     
-    def _generate_cache_key(self, request: BiDirectionalMatchingRequest) -> str:
-        """Génère clé de cache unique"""
-        candidat_id = f"{request.candidat.personal_info.email}_{hash(str(request.candidat.dict()))}"
-        entreprise_id = f"{request.entreprise.entreprise.nom}_{hash(str(request.entreprise.dict()))}"
-        return f"match_{candidat_id}_{entreprise_id}"
-    
-    def _is_cache_valid(self, timestamp: datetime) -> bool:
-        """Vérifie validité du cache"""
-        return (datetime.now() - timestamp).seconds < self.cache_ttl
-    
     def _update_stats(self, processing_time: float):
-        """Met à jour statistiques"""
-        self.stats["total_matches"] += 1
-        if self.stats["total_matches"] == 1:
-            self.stats["avg_processing_time"] = processing_time
-        else:
-            self.stats["avg_processing_time"] = (
-                (self.stats["avg_processing_time"] * (self.stats["total_matches"] - 1) + processing_time) 
-                / self.stats["total_matches"]
-            )
+        """Met à jour statistiques (matchings calculés uniquement)"""
+        self.stats["computed_matches"] += 1
+        computed = self.stats["computed_matches"]
+        self.stats["avg_processing_time"] += (processing_time - self.stats["avg_processing_time"]) / computed
     
     def get_performance_stats(self) -> Dict:
         """Retourne statistiques de performance"""
@@ -455,13 +729,16 @@ class BiDirectionalMatcher:
             "total_matches": self.stats["total_matches"],
             "cache_hits": self.stats["cache_hits"],
             "cache_hit_rate_percent": round(cache_hit_rate, 2),
+            "total_ranked_jobs": self.stats["total_ranked_jobs"],
             "avg_processing_time_ms": round(self.stats["avg_processing_time"], 2),
-            "cache_size": len(self.cache),
-            "uptime_hours": (datetime.now() - self.stats["last_reset"]).seconds / 3600
+            "cache_size": self.cache.size,
+            "cache": self.cache.get_stats(),
+            "compiled_profiles": self.profile_compiler.get_stats(),
+            "uptime_hours": (datetime.now() - self.stats["last_reset"]).total_seconds() / 3600
         }
     
     def clear_cache(self):
-        """Vide le cache"""
+        """Vide le cache local"""
         self.cache.clear()
         logger.info("🧹 Cache vidé")
 
@@ -472,11 +749,13 @@ class BiDirectionalMatcherFactory:
     
     @staticmethod
     def create_matcher(google_maps_service: GoogleMapsService = None,
-                      location_scoring_engine: LocationScoringEngine = None) -> BiDirectionalMatcher:
-        """Crée un matcher avec les services Google Maps"""
+                      location_scoring_engine: LocationScoringEngine = None,
+                      cache_manager=None) -> BiDirectionalMatcher:
+        """Crée un matcher avec les services Google Maps (et le cache partagé si fourni)"""
         return BiDirectionalMatcher(
             google_maps_service=google_maps_service,
-            location_scoring_engine=location_scoring_engine
+            location_scoring_engine=location_scoring_engine,
+            cache_manager=cache_manager
         )
     
     @staticmethod
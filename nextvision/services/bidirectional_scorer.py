@@ -18,7 +18,6 @@ Version: 2.0.0 - Bidirectional Scoring
 from typing import Dict, List, Tuple, Optional
 import nextvision_logging as logging
 import time
-import re
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -34,6 +33,13 @@ from nextvision.models.bidirectional_models import (
 from nextvision.services.google_maps_service import GoogleMapsService
 from nextvision.engines.location_scoring import LocationScoringEngine
 from nextvision.services.transport_calculator import TransportCalculator
+from nextvision.utils.skill_index import (
+    DEFAULT_SKILL_SYNONYMS, CompiledSkill, CompiledSkillProfile, SkillIndex
+)
+from nextvision.services.compiled_profiles import (
+    CompiledCandidate, CompiledCompany, CompiledExperience, ProfileCompiler,
+    get_default_profile_compiler, parse_duree_experience, parse_experience_requise
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,61 +55,82 @@ class ScoringResult:
     error_message: Optional[str] = None
 
 class BaseScorer:
-    """Interface de base pour tous les scorers"""
+    """Interface de base pour tous les scorers
     
-    def __init__(self, weight: float = 1.0):
+    Les profils compilés (CompiledCandidate / CompiledCompany) sont fournis par
+    l'appelant quand il score plusieurs paires ; à défaut ils sont construits
+    à la volée (sans cache).
+    """
+    
+    def __init__(self, weight: float = 1.0, profile_compiler: Optional[ProfileCompiler] = None):
         self.weight = weight
         self.name = self.__class__.__name__
+        self.profile_compiler = profile_compiler or get_default_profile_compiler()
     
     def calculate_score(self, candidat: BiDirectionalCandidateProfile, 
-                       entreprise: BiDirectionalCompanyProfile) -> ScoringResult:
+                       entreprise: BiDirectionalCompanyProfile,
+                       compiled_candidat: Optional[CompiledCandidate] = None,
+                       compiled_entreprise: Optional[CompiledCompany] = None) -> ScoringResult:
         """Méthode abstraite à implémenter par chaque scorer"""
         raise NotImplementedError
+    
+    def _compiled(self, candidat: BiDirectionalCandidateProfile,
+                  entreprise: BiDirectionalCompanyProfile,
+                  compiled_candidat: Optional[CompiledCandidate],
+                  compiled_entreprise: Optional[CompiledCompany]) -> Tuple[CompiledCandidate, CompiledCompany]:
+        """Profils compilés fournis, sinon construits pour cet appel"""
+        if compiled_candidat is None:
+            compiled_candidat = self.profile_compiler.build_candidate(candidat)
+        if compiled_entreprise is None:
+            compiled_entreprise = self.profile_compiler.build_company(entreprise)
+        return compiled_candidat, compiled_entreprise
 
 # === 1. SEMANTIC SCORER (35% - COMPOSANT LE PLUS IMPORTANT) ===
 
 class SemanticScorer(BaseScorer):
     """🧠 Scoring sémantique : Correspondance CV ↔ Fiche de poste"""
     
-    def __init__(self, weight: float = 0.35):
-        super().__init__(weight)
+    def __init__(self, weight: float = 0.35, skill_index: Optional[SkillIndex] = None,
+                 profile_compiler: Optional[ProfileCompiler] = None):
+        # Les profils compilés doivent utiliser le même index de compétences
+        if profile_compiler is None and skill_index is not None:
+            profile_compiler = ProfileCompiler(skill_index)
+        super().__init__(weight, profile_compiler)
         # Dictionnaire de synonymes pour matching intelligent
-        self.synonymes_competences = {
-            "comptabilité": ["comptable", "gestion comptable", "finance", "fiscalité"],
-            "cegid": ["sage", "erp comptable", "logiciel comptable"],
-            "python": ["programmation python", "développement python", "coding python"],
-            "javascript": ["js", "développement web", "frontend", "nodejs"],
-            "management": ["encadrement", "leadership", "gestion équipe"],
-        }
+        self.synonymes_competences = DEFAULT_SKILL_SYNONYMS
+        # Index précompilé (normalisation + synonymes), partagé entre instances
+        self.skill_index = self.profile_compiler.skill_index
     
     def calculate_score(self, candidat: BiDirectionalCandidateProfile, 
-                       entreprise: BiDirectionalCompanyProfile) -> ScoringResult:
+                       entreprise: BiDirectionalCompanyProfile,
+                       compiled_candidat: Optional[CompiledCandidate] = None,
+                       compiled_entreprise: Optional[CompiledCompany] = None) -> ScoringResult:
         """Calcule correspondance sémantique candidat ↔ entreprise"""
         start_time = time.time()
         
         try:
+            compiled_candidat, compiled_entreprise = self._compiled(
+                candidat, entreprise, compiled_candidat, compiled_entreprise
+            )
+            
             # 1. Matching compétences techniques (40% du score sémantique)
-            competences_score = self._match_competences(
-                candidat.competences.competences_techniques,
-                entreprise.exigences.competences_obligatoires + entreprise.exigences.competences_souhaitees
+            competences_score = self._match_compiled_competences(
+                compiled_candidat.skills, compiled_entreprise.required_skills
             )
             
             # 2. Matching titre/poste (30% du score sémantique)
-            poste_score = self._match_poste_title(
-                candidat.experiences_detaillees,
-                entreprise.poste.titre
+            poste_score = self._match_compiled_poste_title(
+                compiled_candidat.experiences, compiled_entreprise.title_words
             )
             
             # 3. Matching secteur d'activité (20% du score sémantique)
-            secteur_score = self._match_secteur(
-                candidat.attentes.secteurs_preferes,
-                entreprise.entreprise.secteur
+            secteur_score = self._match_compiled_secteur(
+                compiled_candidat.preferred_sectors, compiled_entreprise.sector
             )
             
             # 4. Matching logiciels/outils (10% du score sémantique)
-            logiciels_score = self._match_logiciels(
-                candidat.competences.logiciels_maitrise,
-                entreprise.poste.competences_requises
+            logiciels_score = self._match_compiled_logiciels(
+                compiled_candidat.software, compiled_entreprise.job_skills
             )
             
             # Score sémantique final pondéré
@@ -119,14 +146,21 @@ class SemanticScorer(BaseScorer):
                 "poste_score": poste_score,
                 "secteur_score": secteur_score,
                 "logiciels_score": logiciels_score,
-                "competences_matchees": self._get_matched_competences(candidat, entreprise),
-                "competences_manquantes": self._get_missing_competences(candidat, entreprise)
+                "competences_matchees": [
+                    skill.text for skill in compiled_entreprise.mandatory_skills
+                    if self.skill_index.matches(skill, compiled_candidat.skills)
+                ],
+                "competences_manquantes": [
+                    skill.text for skill in compiled_entreprise.mandatory_skills
+                    if not self.skill_index.matches(skill, compiled_candidat.skills)
+                ]
             }
             
             processing_time = (time.time() - start_time) * 1000
             confidence = min(0.95, semantic_score * 1.1)  # Confiance basée sur le score
             
-            logger.info(f"🧠 Semantic Score: {semantic_score:.3f} (confiance: {confidence:.3f})")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"🧠 Semantic Score: {semantic_score:.3f} (confiance: {confidence:.3f})")
             
             return ScoringResult(
                 score=semantic_score,
@@ -147,117 +181,86 @@ class SemanticScorer(BaseScorer):
     
     def _match_competences(self, competences_candidat: List[str], competences_requises: List[str]) -> float:
         """Matching intelligent des compétences avec synonymes"""
-        if not competences_requises:
+        return self._match_compiled_competences(
+            self.skill_index.compile_profile(competences_candidat),
+            [self.skill_index.compile_skill(comp) for comp in competences_requises]
+        )
+    
+    def _match_compiled_competences(self, profil: CompiledSkillProfile, requises: Tuple[CompiledSkill, ...]) -> float:
+        if not requises:
             return 1.0
         
-        matches = 0
-        for comp_requise in competences_requises:
-            if self._is_competence_match(comp_requise, competences_candidat):
-                matches += 1
-        
-        return min(1.0, matches / len(competences_requises))
+        matches = self.skill_index.count_matches(requises, profil)
+        return min(1.0, matches / len(requises))
     
     def _is_competence_match(self, competence_requise: str, competences_candidat: List[str]) -> bool:
         """Vérifie si une compétence match (exact ou synonyme)"""
-        comp_requise_lower = competence_requise.lower()
-        
-        for comp_candidat in competences_candidat:
-            comp_candidat_lower = comp_candidat.lower()
-            
-            # Match exact
-            if comp_requise_lower in comp_candidat_lower or comp_candidat_lower in comp_requise_lower:
-                return True
-            
-            # Match via synonymes
-            for mot_cle, synonymes in self.synonymes_competences.items():
-                if mot_cle in comp_requise_lower:
-                    for synonyme in synonymes:
-                        if synonyme in comp_candidat_lower:
-                            return True
-        
-        return False
+        profil = self.skill_index.compile_profile(competences_candidat)
+        return self.skill_index.matches(competence_requise, profil)
     
-    def _match_poste_title(self, experiences: List, titre_poste: str) -> float:
-        """Match titre de poste avec expériences"""
+    def _match_compiled_poste_title(self, experiences: Tuple[CompiledExperience, ...],
+                                    mots_titre: frozenset) -> float:
+        """Match titre de poste avec expériences (mots communs)"""
         if not experiences:
             return 0.5  # Score neutre si pas d'expérience
         
-        titre_lower = titre_poste.lower()
         best_match = 0.0
-        
         for exp in experiences:
-            poste_lower = exp.poste.lower()
-            # Score basé sur les mots communs
-            mots_titre = set(titre_lower.split())
-            mots_poste = set(poste_lower.split())
-            communs = len(mots_titre.intersection(mots_poste))
-            score = communs / max(len(mots_titre), len(mots_poste))
+            communs = len(mots_titre & exp.poste_words)
+            score = communs / max(len(mots_titre), len(exp.poste_words))
             best_match = max(best_match, score)
         
         return min(1.0, best_match)
     
-    def _match_secteur(self, secteurs_candidat: List[str], secteur_entreprise: str) -> float:
-        """Match secteur d'activité"""
+    def _match_compiled_secteur(self, secteurs_candidat: Tuple[str, ...], secteur_entreprise: str) -> float:
+        """Match secteur d'activité (valeurs en minuscules)"""
         if not secteurs_candidat:
             return 0.7  # Score neutre si pas de préférence secteur
         
-        secteur_lower = secteur_entreprise.lower()
         for secteur_pref in secteurs_candidat:
-            if secteur_pref.lower() in secteur_lower or secteur_lower in secteur_pref.lower():
+            if secteur_pref in secteur_entreprise or secteur_entreprise in secteur_pref:
                 return 1.0
         
         return 0.3  # Pénalité si secteur non préféré
     
-    def _match_logiciels(self, logiciels_candidat: List[str], competences_poste: List[str]) -> float:
+    def _match_compiled_logiciels(self, logiciels: CompiledSkillProfile,
+                                  competences_poste: Tuple[CompiledSkill, ...]) -> float:
         """Match logiciels/outils maîtrisés"""
         if not competences_poste:
             return 1.0
         
-        matches = 0
-        for comp_poste in competences_poste:
-            for logiciel in logiciels_candidat:
-                if logiciel.lower() in comp_poste.lower():
-                    matches += 1
-                    break
-        
-        return min(1.0, matches / len(competences_poste)) if competences_poste else 1.0
-    
-    def _get_matched_competences(self, candidat: BiDirectionalCandidateProfile, 
-                                entreprise: BiDirectionalCompanyProfile) -> List[str]:
-        """Retourne les compétences qui matchent"""
-        matched = []
-        for comp_req in entreprise.exigences.competences_obligatoires:
-            if self._is_competence_match(comp_req, candidat.competences.competences_techniques):
-                matched.append(comp_req)
-        return matched
-    
-    def _get_missing_competences(self, candidat: BiDirectionalCandidateProfile,
-                                entreprise: BiDirectionalCompanyProfile) -> List[str]:
-        """Retourne les compétences manquantes"""
-        missing = []
-        for comp_req in entreprise.exigences.competences_obligatoires:
-            if not self._is_competence_match(comp_req, candidat.competences.competences_techniques):
-                missing.append(comp_req)
-        return missing
+        # Un logiciel maîtrisé doit apparaître dans la compétence du poste
+        matches = sum(
+            1 for comp_poste in competences_poste
+            if self.skill_index.contains_profile_phrase(comp_poste, logiciels)
+        )
+        
+        return min(1.0, matches / len(competences_poste))
 
 # === 2. SALARY SCORER (25% - TRÈS IMPORTANT CÔTÉ BUDGET) ===
 
 class SalaryScorer(BaseScorer):
     """💰 Scoring salariale : Budget entreprise vs attentes candidat"""
     
-    def __init__(self, weight: float = 0.25):
-        super().__init__(weight)
+    def __init__(self, weight: float = 0.25, profile_compiler: Optional[ProfileCompiler] = None):
+        super().__init__(weight, profile_compiler)
     
     def calculate_score(self, candidat: BiDirectionalCandidateProfile,
-                       entreprise: BiDirectionalCompanyProfile) -> ScoringResult:
+                       entreprise: BiDirectionalCompanyProfile,
+                       compiled_candidat: Optional[CompiledCandidate] = None,
+                       compiled_entreprise: Optional[CompiledCompany] = None) -> ScoringResult:
         """Calcule compatibilité salariale bidirectionnelle"""
         start_time = time.time()
         
         try:
             candidat_min = candidat.attentes.salaire_min
             candidat_max = candidat.attentes.salaire_max
-            entreprise_min = entreprise.poste.salaire_min or 0
-            entreprise_max = entreprise.poste.salaire_max or 999999
+            if compiled_entreprise is not None:
+                entreprise_min = compiled_entreprise.salary_min
+                entreprise_max = compiled_entreprise.salary_max
+            else:
+                entreprise_min = entreprise.poste.salaire_min or 0
+                entreprise_max = entreprise.poste.salaire_max or 999999
             
             # 1. Compatibilité de base (60% du score)
             compatibilite_score = self._calculate_salary_compatibility(
@@ -271,7 +274,7 @@ class SalaryScorer(BaseScorer):
             
             # 3. Négociabilité (15% du score)
             negociabilite_score = self._calculate_negotiability_score(
-                candidat, entreprise
+                candidat, entreprise, compiled_candidat
             )
             
             # Score salarial final
@@ -294,7 +297,8 @@ class SalaryScorer(BaseScorer):
             processing_time = (time.time() - start_time) * 1000
             confidence = 0.9 if compatibilite_score > 0.7 else 0.6
             
-            logger.info(f"💰 Salary Score: {salary_score:.3f} (confiance: {confidence:.3f})")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"💰 Salary Score: {salary_score:.3f} (confiance: {confidence:.3f})")
             
             return ScoringResult(
                 score=salary_score,
@@ -351,7 +355,8 @@ class SalaryScorer(BaseScorer):
             return 0.5  # Alignement moyen
     
     def _calculate_negotiability_score(self, candidat: BiDirectionalCandidateProfile,
-                                     entreprise: BiDirectionalCompanyProfile) -> float:
+                                     entreprise: BiDirectionalCompanyProfile,
+                                     compiled_candidat: Optional[CompiledCandidate] = None) -> float:
         """Score de négociabilité basé sur contexte"""
         score = 0.5  # Base neutre
         
@@ -362,7 +367,11 @@ class SalaryScorer(BaseScorer):
             score += 0.2
         
         # Boost si candidat expérimenté
-        if candidat.experience_globale in [NiveauExperience.CONFIRME, NiveauExperience.SENIOR]:
+        experimente = (
+            compiled_candidat.experienced if compiled_candidat is not None
+            else candidat.experience_globale in (NiveauExperience.CONFIRME, NiveauExperience.SENIOR)
+        )
+        if experimente:
             score += 0.2
         
         return min(1.0, score)
@@ -390,29 +399,36 @@ class SalaryScorer(BaseScorer):
 class ExperienceScorer(BaseScorer):
     """📈 Scoring expérience : Années requises vs expérience candidat"""
     
-    def __init__(self, weight: float = 0.20):
-        super().__init__(weight)
+    def __init__(self, weight: float = 0.20, profile_compiler: Optional[ProfileCompiler] = None):
+        super().__init__(weight, profile_compiler)
     
     def calculate_score(self, candidat: BiDirectionalCandidateProfile,
-                       entreprise: BiDirectionalCompanyProfile) -> ScoringResult:
+                       entreprise: BiDirectionalCompanyProfile,
+                       compiled_candidat: Optional[CompiledCandidate] = None,
+                       compiled_entreprise: Optional[CompiledCompany] = None) -> ScoringResult:
         """Calcule adéquation expérience candidat vs exigences"""
         start_time = time.time()
         
         try:
-            # 1. Parse de l'expérience requise (format "5 ans - 10 ans")
-            exp_min_req, exp_max_req = self._parse_experience_requise(entreprise.exigences.experience_requise)
+            compiled_candidat, compiled_entreprise = self._compiled(
+                candidat, entreprise, compiled_candidat, compiled_entreprise
+            )
+            
+            # 1. Expérience requise (format "5 ans - 10 ans", parsée à la compilation)
+            exp_min_req = compiled_entreprise.experience_min
+            exp_max_req = compiled_entreprise.experience_max
             
-            # 2. Extraction années d'expérience candidat
-            exp_candidat = self._get_candidat_experience_years(candidat)
+            # 2. Années d'expérience candidat
+            exp_candidat = compiled_candidat.experience_years
             
             # 3. Calcul score de base (70% du score)
             base_score = self._calculate_experience_match(exp_candidat, exp_min_req, exp_max_req)
             
             # 4. Bonus qualité expérience (20% du score)
-            qualite_score = self._calculate_experience_quality(candidat, entreprise)
+            qualite_score = self.calculate_experience_quality(compiled_candidat, compiled_entreprise)
             
             # 5. Bonus progression carrière (10% du score)
-            progression_score = self._calculate_career_progression(candidat)
+            progression_score = compiled_candidat.progression_score
             
             # Score expérience final
             experience_score = (
@@ -436,7 +452,8 @@ class ExperienceScorer(BaseScorer):
             processing_time = (time.time() - start_time) * 1000
             confidence = 0.9 if base_score > 0.8 else 0.7
             
-            logger.info(f"📈 Experience Score: {experience_score:.3f} (confiance: {confidence:.3f})")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"📈 Experience Score: {experience_score:.3f} (confiance: {confidence:.3f})")
             
             return ScoringResult(
                 score=experience_score,
@@ -457,69 +474,15 @@ class ExperienceScorer(BaseScorer):
     
     def _parse_experience_requise(self, exp_requise: str) -> Tuple[int, int]:
         """Parse format ChatGPT '5 ans - 10 ans' vers (5, 10)"""
-        try:
-            # Regex pour capturer les nombres
-            pattern = r'(\d+)\s*ans?\s*-\s*(\d+)\s*ans?'
-            match = re.search(pattern, exp_requise.lower())
-            
-            if match:
-                return int(match.group(1)), int(match.group(2))
-            
-            # Fallback: essayer de trouver un seul nombre
-            single_pattern = r'(\d+)\s*ans?'
-            single_match = re.search(single_pattern, exp_requise.lower())
-            if single_match:
-                years = int(single_match.group(1))
-                return years, years + 2  # Fourchette par défaut
-            
-            # Valeur par défaut
-            return 2, 10
-            
-        except Exception:
-            return 2, 10  # Fourchette large par défaut
+        return parse_experience_requise(exp_requise)
     
     def _get_candidat_experience_years(self, candidat: BiDirectionalCandidateProfile) -> int:
         """Extrait années d'expérience du candidat"""
-        # Mapping des niveaux vers années
-        niveau_mapping = {
-            NiveauExperience.DEBUTANT: 1,
-            NiveauExperience.JUNIOR: 3,
-            NiveauExperience.CONFIRME: 7,
-            NiveauExperience.SENIOR: 12
-        }
-        
-        base_years = niveau_mapping.get(candidat.experience_globale, 3)
-        
-        # Ajustement basé sur les expériences détaillées
-        if candidat.experiences_detaillees:
-            total_experience = 0
-            for exp in candidat.experiences_detaillees:
-                # Parse durée si disponible
-                duree_years = self._parse_duree_experience(exp.duree)
-                total_experience += duree_years
-            
-            if total_experience > 0:
-                return min(total_experience, base_years + 2)  # Cap réaliste
-        
-        return base_years
+        return self.profile_compiler.build_candidate(candidat).experience_years
     
     def _parse_duree_experience(self, duree: str) -> int:
         """Parse durée d'expérience vers années"""
-        try:
-            # Patterns pour différents formats
-            if 'an' in duree.lower():
-                years_match = re.search(r'(\d+)\s*ans?', duree.lower())
-                if years_match:
-                    return int(years_match.group(1))
-            
-            if 'mois' in duree.lower():
-                months_match = re.search(r'(\d+)\s*mois', duree.lower())
-                if months_match:
-                    return max(1, int(months_match.group(1)) // 12)
-            
-            return 1  # Défaut 1 an
-        except:
-            return 1
+        return parse_duree_experience(duree)
     
     def _calculate_experience_match(self, exp_candidat: int, exp_min: int, exp_max: int) -> float:
         """Calcule adéquation expérience"""
@@ -549,24 +512,29 @@ class ExperienceScorer(BaseScorer):
     def _calculate_experience_quality(self, candidat: BiDirectionalCandidateProfile,
                                     entreprise: BiDirectionalCompanyProfile) -> float:
         """Score qualité de l'expérience"""
-        if not candidat.experiences_detaillees:
+        return self.calculate_experience_quality(*self._compiled(candidat, entreprise, None, None))
+    
+    @staticmethod
+    def calculate_experience_quality(candidat: CompiledCandidate, entreprise: CompiledCompany) -> float:
+        """Score qualité de l'expérience (profils compilés)"""
+        if not candidat.experiences:
             return 0.5
         
         quality_score = 0.0
         
-        for exp in candidat.experiences_detaillees:
+        for exp in candidat.experiences:
             # Bonus si expérience dans secteur similaire
-            if entreprise.entreprise.secteur.lower() in exp.entreprise.lower():
+            if entreprise.sector in exp.entreprise:
                 quality_score += 0.3
             
             # Bonus si titre de poste similaire
-            if any(mot in exp.poste.lower() for mot in entreprise.poste.titre.lower().split()):
+            if any(mot in exp.poste for mot in entreprise.title_tokens):
                 quality_score += 0.2
             
             # Bonus si compétences acquises pertinentes
             competences_pertinentes = 0
-            for comp in exp.competences_acquises:
-                if any(comp.lower() in req.lower() for req in entreprise.exigences.competences_obligatoires):
+            for comp in exp.competences:
+                if any(comp in req for req in entreprise.mandatory_lower):
                     competences_pertinentes += 1
             
             if competences_pertinentes > 0:
@@ -576,19 +544,7 @@ class ExperienceScorer(BaseScorer):
     
     def _calculate_career_progression(self, candidat: BiDirectionalCandidateProfile) -> float:
         """Score progression de carrière"""
-        if len(candidat.experiences_detaillees) < 2:
-            return 0.5
-        
-        # Simple heuristique basée sur évolution des titres
-        progression_indicators = ['senior', 'lead', 'chef', 'manager', 'directeur']
-        has_progression = False
-        
-        for exp in candidat.experiences_detaillees:
-            if any(indicator in exp.poste.lower() for indicator in progression_indicators):
-                has_progression = True
-                break
-        
-        return 0.8 if has_progression else 0.5
+        return self.profile_compiler.build_candidate(candidat).progression_score
     
     def _get_experience_adequation(self, exp_candidat: int, exp_min: int, exp_max: int) -> str:
         """Retourne évaluation textuelle de l'adéquation"""
@@ -613,13 +569,16 @@ class LocationScorer(BaseScorer):
     """📍 Scoring localisation : Impact géographique avec Google Maps Intelligence"""
     
     def __init__(self, weight: float = 0.15, google_maps_service: GoogleMapsService = None,
-                 location_scoring_engine: LocationScoringEngine = None):
-        super().__init__(weight)
+                 location_scoring_engine: LocationScoringEngine = None,
+                 profile_compiler: Optional[ProfileCompiler] = None):
+        super().__init__(weight, profile_compiler)
         self.google_maps_service = google_maps_service
         self.location_scoring_engine = location_scoring_engine
     
     def calculate_score(self, candidat: BiDirectionalCandidateProfile,
-                       entreprise: BiDirectionalCompanyProfile) -> ScoringResult:
+                       entreprise: BiDirectionalCompanyProfile,
+                       compiled_candidat: Optional[CompiledCandidate] = None,
+                       compiled_entreprise: Optional[CompiledCompany] = None) -> ScoringResult:
         """Calcule score localisation avec Google Maps Intelligence"""
         start_time = time.time()
         
@@ -629,7 +588,9 @@ class LocationScorer(BaseScorer):
                 return self._calculate_with_google_maps(candidat, entreprise, start_time)
             else:
                 # Fallback sur calcul simplifié
-                return self._calculate_simplified_location(candidat, entreprise, start_time)
+                return self._calculate_simplified_location(
+                    candidat, entreprise, start_time, compiled_candidat, compiled_entreprise
+                )
                 
         except Exception as e:
             logger.error(f"❌ Erreur LocationScorer: {e}")
@@ -651,19 +612,22 @@ class LocationScorer(BaseScorer):
     
     def _calculate_simplified_location(self, candidat: BiDirectionalCandidateProfile,
                                      entreprise: BiDirectionalCompanyProfile,
-                                     start_time: float) -> ScoringResult:
+                                     start_time: float,
+                                     compiled_candidat: Optional[CompiledCandidate] = None,
+                                     compiled_entreprise: Optional[CompiledCompany] = None) -> ScoringResult:
         """Calcul localisation simplifié"""
+        compiled_candidat, compiled_entreprise = self._compiled(
+            candidat, entreprise, compiled_candidat, compiled_entreprise
+        )
         
         # 1. Comparaison ville/arrondissement (60% du score)
-        ville_score = self._compare_cities(
-            candidat.attentes.localisation_preferee,
-            entreprise.poste.localisation
-        )
+        ville_score = self._compare_compiled_locations(compiled_candidat, compiled_entreprise)
         
         # 2. Distance approximative (25% du score)
-        distance_score = self._estimate_distance_score(
-            candidat.attentes.localisation_preferee,
-            entreprise.poste.localisation,
+        distance_score = self._estimate_distance_from_city_score(
+            ville_score,
+            compiled_candidat.location,
+            compiled_entreprise.location,
             candidat.attentes.distance_max_km
         )
         
@@ -691,7 +655,8 @@ class LocationScorer(BaseScorer):
         processing_time = (time.time() - start_time) * 1000
         confidence = 0.7  # Confiance moyenne pour calcul simplifié
         
-        logger.info(f"📍 Location Score: {location_score:.3f} (mode simplifié)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"📍 Location Score: {location_score:.3f} (mode simplifié)")
         
         return ScoringResult(
             score=location_score,
@@ -704,17 +669,25 @@ class LocationScorer(BaseScorer):
         """Compare localisation candidat vs entreprise"""
         candidat_lower = loc_candidat.lower()
         entreprise_lower = loc_entreprise.lower()
-        
+        return self._compare_locations(
+            candidat_lower, frozenset(candidat_lower.split()),
+            entreprise_lower, frozenset(entreprise_lower.split())
+        )
+    
+    def _compare_compiled_locations(self, candidat: CompiledCandidate, entreprise: CompiledCompany) -> float:
+        return self._compare_locations(
+            candidat.location, candidat.location_words, entreprise.location, entreprise.location_words
+        )
+    
+    @staticmethod
+    def _compare_locations(candidat_lower: str, candidat_words: frozenset,
+                           entreprise_lower: str, entreprise_words: frozenset) -> float:
         # Match exact
         if candidat_lower == entreprise_lower:
             return 1.0
         
         # Match partiel (même ville/arrondissement)
-        candidat_words = set(candidat_lower.split())
-        entreprise_words = set(entreprise_lower.split())
-        
-        common_words = candidat_words.intersection(entreprise_words)
-        if common_words:
+        if not candidat_words.isdisjoint(entreprise_words):
             return 0.8
         
         # Cas spéciaux Paris
@@ -725,11 +698,19 @@ class LocationScorer(BaseScorer):
     
     def _estimate_distance_score(self, loc_candidat: str, loc_entreprise: str, max_km: int) -> float:
         """Estimation score distance (sans Google Maps)"""
-        if self._compare_cities(loc_candidat, loc_entreprise) >= 0.8:
+        return self._estimate_distance_from_city_score(
+            self._compare_cities(loc_candidat, loc_entreprise),
+            loc_candidat.lower(), loc_entreprise.lower(), max_km
+        )
+    
+    @staticmethod
+    def _estimate_distance_from_city_score(ville_score: float, candidat_lower: str,
+                                           entreprise_lower: str, max_km: int) -> float:
+        if ville_score >= 0.8:
             return 1.0  # Même zone
         
         # Heuristiques basiques
-        if 'paris' in loc_candidat.lower() and 'paris' in loc_entreprise.lower():
+        if 'paris' in candidat_lower and 'paris' in entreprise_lower:
             return 0.8  # Intra-Paris
         
         if max_km >= 50:
@@ -0,0 +1,319 @@
+"""
+🧩 Nextvision - Profils compilés partagés par les scorers
+
+Les scorers re-dérivaient à chaque paire les mêmes informations des profils
+Pydantic bruts (durées d'expérience, expérience requise, compétences en
+minuscules, timing en semaines...). Ces dérivations sont faites une seule fois :
+- CompiledCandidate / CompiledCompany : enregistrements immuables (__slots__)
+- Compétences compilées via SkillIndex (identifiants d'ensembles)
+- Champs V3.0 (timing, délais de recrutement) si le profil est étendu
+- Cache LRU borné indexé par l'empreinte canonique déjà calculée par le cache
+  de résultats ; sans empreinte, compilation directe (moins coûteuse qu'un
+  hachage du profil) et partage de l'enregistrement par l'appelant
+
+Author: NEXTEN Team
+Version: 1.0.0 - Compiled Profiles
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Optional, Tuple, Union
+
+from nextvision.models.bidirectional_models import (
+    BiDirectionalCandidateProfile, BiDirectionalCompanyProfile, NiveauExperience
+)
+from nextvision.models.extended_bidirectional_models_v3 import (
+    ExtendedCandidateProfileV3, ExtendedCompanyProfileV3
+)
+from nextvision.utils.skill_index import (
+    CompiledSkill, CompiledSkillProfile, SkillIndex, get_default_skill_index
+)
+
+CandidateProfile = Union[BiDirectionalCandidateProfile, ExtendedCandidateProfileV3]
+CompanyProfile = Union[BiDirectionalCompanyProfile, ExtendedCompanyProfileV3]
+
+_EXPERIENCE_RANGE_PATTERN = re.compile(r'(\d+)\s*ans?\s*-\s*(\d+)\s*ans?')
+_YEARS_PATTERN = re.compile(r'(\d+)\s*ans?')
+_MONTHS_PATTERN = re.compile(r'(\d+)\s*mois')
+
+_NIVEAU_YEARS = {
+    NiveauExperience.DEBUTANT: 1,
+    NiveauExperience.JUNIOR: 3,
+    NiveauExperience.CONFIRME: 7,
+    NiveauExperience.SENIOR: 12
+}
+_PROGRESSION_INDICATORS = ('senior', 'lead', 'chef', 'manager', 'directeur')
+
+
+# === PARSEURS (PARTAGÉS AVEC LES SCORERS) ===
+
+def parse_experience_requise(exp_requise: str) -> Tuple[int, int]:
+    """Parse format ChatGPT '5 ans - 10 ans' vers (5, 10)"""
+    try:
+        exp_lower = exp_requise.lower()
+        match = _EXPERIENCE_RANGE_PATTERN.search(exp_lower)
+        if match:
+            return int(match.group(1)), int(match.group(2))
+
+        # Fallback: un seul nombre → fourchette par défaut
+        single_match = _YEARS_PATTERN.search(exp_lower)
+        if single_match:
+            years = int(single_match.group(1))
+            return years, years + 2
+
+        return 2, 10
+    except Exception:
+        return 2, 10  # Fourchette large par défaut
+
+
+def parse_duree_experience(duree: str) -> int:
+    """Parse durée d'expérience vers années"""
+    try:
+        duree_lower = duree.lower()
+        if 'an' in duree_lower:
+            years_match = _YEARS_PATTERN.search(duree_lower)
+            if years_match:
+                return int(years_match.group(1))
+
+        if 'mois' in duree_lower:
+            months_match = _MONTHS_PATTERN.search(duree_lower)
+            if months_match:
+                return max(1, int(months_match.group(1)) // 12)
+
+        return 1  # Défaut 1 an
+    except Exception:
+        return 1
+
+
+def convert_timing_to_weeks(timing: str) -> int:
+    """🔄 Conversion timing de disponibilité vers semaines"""
+    timing_lower = timing.lower()
+
+    if "immédiat" in timing_lower or "immediate" in timing_lower:
+        return 0
+    if "1 mois" in timing_lower or "1mois" in timing_lower:
+        return 4
+    if "2 mois" in timing_lower or "2mois" in timing_lower:
+        return 8
+    if "3 mois" in timing_lower or "3mois" in timing_lower:
+        return 12
+
+    match = _MONTHS_PATTERN.search(timing_lower)
+    if match:
+        return int(match.group(1)) * 4
+    return 4  # Défaut 1 mois
+
+
+def parse_recruitment_delays(delays: str) -> int:
+    """📊 Délais de recrutement vers semaines"""
+    delays_lower = delays.lower()
+
+    if "immédiat" in delays_lower or "urgent" in delays_lower:
+        return 2
+    if "1 mois" in delays_lower or "1-2" in delays_lower:
+        return 6
+    if "2 mois" in delays_lower or "2-3" in delays_lower:
+        return 10
+    if "3 mois" in delays_lower or "flexible" in delays_lower:
+        return 16
+    return 8  # Défaut 2 mois
+
+
+# === ENREGISTREMENTS COMPILÉS ===
+
+@dataclass(frozen=True, slots=True)
+class CompiledExperience:
+    """Expérience détaillée normalisée"""
+    poste: str                      # minuscules
+    poste_words: FrozenSet[str]
+    entreprise: str                 # minuscules
+    competences: Tuple[str, ...]    # compétences acquises, minuscules
+    duree_years: int
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledCandidate:
+    """🧩 Caractéristiques d'un candidat dérivées une fois pour tous les scorers"""
+    key: Optional[str]
+    skills: CompiledSkillProfile
+    software: CompiledSkillProfile
+    preferred_sectors: Tuple[str, ...]
+    experiences: Tuple[CompiledExperience, ...]
+    experience_years: int
+    progression_score: float
+    experienced: bool
+    location: str
+    location_words: FrozenSet[str]
+    # V3.0 (None pour un profil V2.0)
+    timing_weeks: Optional[int]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledCompany:
+    """🧩 Caractéristiques d'une offre dérivées une fois pour tous les scorers"""
+    key: Optional[str]
+    required_skills: Tuple[CompiledSkill, ...]    # obligatoires + souhaitées
+    mandatory_skills: Tuple[CompiledSkill, ...]
+    mandatory_lower: Tuple[str, ...]
+    job_skills: Tuple[CompiledSkill, ...]         # compétences requises du poste (logiciels)
+    title: str                                    # minuscules
+    title_tokens: Tuple[str, ...]
+    title_words: FrozenSet[str]
+    sector: str                                   # minuscules
+    experience_min: int
+    experience_max: int
+    salary_min: int
+    salary_max: int
+    location: str
+    location_words: FrozenSet[str]
+    # V3.0 (None pour un profil V2.0)
+    recruitment_weeks: Optional[int]
+
+
+class ProfileCompiler:
+    """🧩 Compilation des profils, mise en cache par empreinte de contenu"""
+
+    def __init__(self, skill_index: Optional[SkillIndex] = None, max_entries: int = 4096):
+        self.skill_index = skill_index or get_default_skill_index()
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, Union[CompiledCandidate, CompiledCompany]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "uncached": 0}
+
+    # === COMPILATION AVEC CACHE ===
+
+    def compile_candidate(self, profile: CandidateProfile, key: Optional[str] = None) -> CompiledCandidate:
+        """Profil candidat compilé ; `key` = empreinte déjà calculée (voir `fingerprint`)"""
+        if key is None:
+            self.stats["uncached"] += 1
+            return self.build_candidate(profile)
+        return self._cached(f"c:{key}", profile, self.build_candidate)
+
+    def compile_company(self, profile: CompanyProfile, key: Optional[str] = None) -> CompiledCompany:
+        """Profil entreprise compilé ; `key` = empreinte déjà calculée"""
+        if key is None:
+            self.stats["uncached"] += 1
+            return self.build_company(profile)
+        return self._cached(f"j:{key}", profile, self.build_company)
+
+    def _cached(self, cache_key: str, profile, build):
+        with self._lock:
+            compiled = self._cache.get(cache_key)
+            if compiled is not None:
+                self._cache.move_to_end(cache_key)
+                self.stats["hits"] += 1
+                return compiled
+
+        compiled = build(profile, cache_key[2:])
+        with self._lock:
+            self.stats["misses"] += 1
+            self._cache[cache_key] = compiled
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+                self.stats["evictions"] += 1
+        return compiled
+
+    # === CONSTRUCTION (SANS CACHE) ===
+
+    def build_candidate(self, profile: CandidateProfile, key: Optional[str] = None) -> CompiledCandidate:
+        timing_weeks = None
+        if isinstance(profile, ExtendedCandidateProfileV3):
+            timing_weeks = convert_timing_to_weeks(profile.availability_timing.timing)
+            profile = profile.base_profile
+
+        experiences = tuple(
+            CompiledExperience(
+                poste=exp.poste.lower(),
+                poste_words=frozenset(exp.poste.lower().split()),
+                entreprise=exp.entreprise.lower(),
+                competences=tuple(comp.lower() for comp in exp.competences_acquises),
+                duree_years=parse_duree_experience(exp.duree)
+            )
+            for exp in profile.experiences_detaillees
+        )
+
+        # Années d'expérience : niveau déclaré, ajusté par les expériences détaillées
+        base_years = _NIVEAU_YEARS.get(profile.experience_globale, 3)
+        total_experience = sum(exp.duree_years for exp in experiences)
+        experience_years = min(total_experience, base_years + 2) if total_experience > 0 else base_years
+
+        # Progression de carrière (évolution des intitulés)
+        if len(experiences) < 2:
+            progression_score = 0.5
+        elif any(indicator in exp.poste for exp in experiences for indicator in _PROGRESSION_INDICATORS):
+            progression_score = 0.8
+        else:
+            progression_score = 0.5
+
+        location = profile.attentes.localisation_preferee.lower()
+        return CompiledCandidate(
+            key=key,
+            skills=self.skill_index.compile_profile(profile.competences.competences_techniques),
+            software=self.skill_index.compile_profile(profile.competences.logiciels_maitrise),
+            preferred_sectors=tuple(secteur.lower() for secteur in profile.attentes.secteurs_preferes),
+            experiences=experiences,
+            experience_years=experience_years,
+            progression_score=progression_score,
+            experienced=profile.experience_globale in (NiveauExperience.CONFIRME, NiveauExperience.SENIOR),
+            location=location,
+            location_words=frozenset(location.split()),
+            timing_weeks=timing_weeks
+        )
+
+    def build_company(self, profile: CompanyProfile, key: Optional[str] = None) -> CompiledCompany:
+        recruitment_weeks = None
+        if isinstance(profile, ExtendedCompanyProfileV3):
+            recruitment_weeks = parse_recruitment_delays(profile.recruitment_process.recruitment_delays)
+            profile = profile.base_profile
+
+        compile_skill = self.skill_index.compile_skill
+        exigences = profile.exigences
+        mandatory = tuple(compile_skill(skill) for skill in exigences.competences_obligatoires)
+        title = profile.poste.titre.lower()
+        experience_min, experience_max = parse_experience_requise(exigences.experience_requise)
+        location = profile.poste.localisation.lower()
+
+        return CompiledCompany(
+            key=key,
+            required_skills=mandatory + tuple(compile_skill(skill) for skill in exigences.competences_souhaitees),
+            mandatory_skills=mandatory,
+            mandatory_lower=tuple(skill.lower() for skill in exigences.competences_obligatoires),
+            job_skills=tuple(compile_skill(skill) for skill in profile.poste.competences_requises),
+            title=title,
+            title_tokens=tuple(title.split()),
+            title_words=frozenset(title.split()),
+            sector=profile.entreprise.secteur.lower(),
+            experience_min=experience_min,
+            experience_max=experience_max,
+            salary_min=profile.poste.salaire_min or 0,
+            salary_max=profile.poste.salaire_max or 999999,
+            location=location,
+            location_words=frozenset(location.split()),
+            recruitment_weeks=recruitment_weeks
+        )
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict:
+        total = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "size": len(self._cache),
+            "max_entries": self.max_entries,
+            "hit_rate_percent": round(self.stats["hits"] / max(1, total) * 100, 2)
+        }
+
+
+_default_compiler: Optional[ProfileCompiler] = None
+
+
+def get_default_profile_compiler() -> ProfileCompiler:
+    """Compilateur partagé (index de compétences par défaut)"""
+    global _default_compiler
+    if _default_compiler is None:
+        _default_compiler = ProfileCompiler()
+    return _default_compiler
@@ -0,0 +1,273 @@
+"""
+📄 Nextvision - Extraction de texte PDF/DOCX hors boucle d'événements
+
+L'extraction pdfplumber/PyPDF2/python-docx est purement CPU et pouvait bloquer
+le serveur plusieurs secondes sur un gros PDF :
+- Extraction dans un pool de processus (repli thread si le pool est indisponible)
+- Lecture page par page, arrêt dès que `max_chars` caractères sont extraits
+  (les prompts GPT n'utilisent que les 3000 premiers)
+- Cache LRU indexé par empreinte du fichier (+ limite de caractères)
+- Single-flight : un même fichier envoyé en parallèle n'est extrait qu'une fois
+
+Author: NEXTEN Team
+Version: 1.0.0 - Document Extraction Pool
+"""
+
+import asyncio
+import io
+import logging
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from nextvision.utils.fingerprint import digest
+from nextvision.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Longueur de contenu réellement envoyée aux prompts GPT
+GPT_PROMPT_MAX_CHARS = 3000
+
+PDF_EXTENSIONS = (".pdf",)
+WORD_EXTENSIONS = (".docx",)
+# Word 97-2003 : format binaire non lisible par python-docx
+LEGACY_WORD_EXTENSIONS = (".doc",)
+
+
+@dataclass(frozen=True)
+class ExtractedText:
+    """📄 Texte extrait d'un document"""
+    text: str
+    extractor: str                  # pdfplumber, pypdf2, python-docx, text, fallback
+    pages_read: int = 0
+    truncated: bool = False         # arrêt anticipé à max_chars
+    error: Optional[str] = None
+
+
+# === EXTRACTION (EXÉCUTÉE DANS LES WORKERS) ===
+
+def collect_pages(pages: Iterable[str], max_chars: Optional[int], separator: str = "\n") -> Tuple[str, int, bool]:
+    """Concatène des pages jusqu'à `max_chars` caractères : (texte, pages lues, tronqué)"""
+    parts = []
+    length = 0
+    pages_read = 0
+    for page_text in pages:
+        length += len(page_text) + (len(separator) if pages_read else 0)
+        pages_read += 1
+        parts.append(page_text)
+        if max_chars is not None and length >= max_chars:
+            return separator.join(parts)[:max_chars], pages_read, True
+    return separator.join(parts), pages_read, False
+
+
+def _iter_pdfplumber_pages(data: bytes):
+    import pdfplumber
+
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        for page in pdf.pages:
+            yield page.extract_text() or ""
+            # Libère les objets de la page déjà lue (gros PDF)
+            close = getattr(page, "close", None)
+            if close is not None:
+                close()
+
+
+def _iter_pypdf2_pages(data: bytes):
+    import PyPDF2
+
+    for page in PyPDF2.PdfReader(io.BytesIO(data)).pages:
+        yield page.extract_text() or ""
+
+
+def _iter_docx_paragraphs(data: bytes):
+    from docx import Document
+
+    for paragraph in Document(io.BytesIO(data)).paragraphs:
+        yield paragraph.text
+
+
+def decode_text(data: bytes) -> str:
+    """Décodage texte brut (UTF-8 puis latin-1)"""
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data.decode("latin-1")
+
+
+def extract_text_from_bytes(data: bytes, filename: str, max_chars: Optional[int] = GPT_PROMPT_MAX_CHARS) -> ExtractedText:
+    """🧮 Extraction synchrone (même code en ligne et dans les workers)"""
+    extension = Path(filename).suffix.lower()
+
+    if extension in PDF_EXTENSIONS:
+        sources = (("pdfplumber", _iter_pdfplumber_pages), ("pypdf2", _iter_pypdf2_pages))
+        separator = "\n"
+    elif extension in WORD_EXTENSIONS:
+        sources = (("python-docx", _iter_docx_paragraphs),)
+        separator = "\n"
+    elif extension in LEGACY_WORD_EXTENSIONS:
+        return ExtractedText("", "fallback", error=f"format {extension} non supporté (convertir en .docx)")
+    else:
+        text = decode_text(data)
+        truncated = max_chars is not None and len(text) > max_chars
+        return ExtractedText(text[:max_chars] if truncated else text, "text", 1, truncated)
+
+    errors = []
+    for extractor, iter_pages in sources:
+        try:
+            text, pages_read, truncated = collect_pages(iter_pages(data), max_chars, separator)
+            return ExtractedText(text, extractor, pages_read, truncated)
+        except ImportError:
+            errors.append(f"{extractor} non disponible")
+        except Exception as e:
+            errors.append(f"{extractor}: {e}")
+
+    return ExtractedText("", "fallback", error="; ".join(errors))
+
+
+# === CÔTÉ BOUCLE D'ÉVÉNEMENTS ===
+
+class DocumentTextExtractor:
+    """
+    📄 EXTRACTEUR DE TEXTE ASYNCHRONE
+    ==================================
+
+    Les PDF/DOCX sont extraits dans un pool de processus ; les fichiers texte
+    (ou documents plus petits que `offload_min_bytes`) restent en ligne.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        cache_max_entries: int = 256,
+        offload_min_bytes: int = 64 * 1024,
+        timeout_seconds: float = 30.0
+    ):
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.cache_max_entries = cache_max_entries
+        self.offload_min_bytes = offload_min_bytes
+        self.timeout_seconds = timeout_seconds
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._cache: "OrderedDict[str, ExtractedText]" = OrderedDict()
+        self._flights = SingleFlight()
+
+        self.stats = {
+            "extractions": 0,
+            "cache_hits": 0,
+            "coalesced": 0,
+            "offloaded": 0,
+            "inline": 0,
+            "truncated": 0,
+            "pool_errors": 0,
+            "timeouts": 0,
+            "total_time_ms": 0.0
+        }
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    @staticmethod
+    def cache_key(data: bytes, filename: str, max_chars: Optional[int]) -> str:
+        return f"{digest(data)}:{Path(filename).suffix.lower()}:{max_chars}"
+
+    async def extract(
+        self, data: bytes, filename: str, max_chars: Optional[int] = GPT_PROMPT_MAX_CHARS
+    ) -> ExtractedText:
+        """🚀 Texte d'un document (bytes) ; `max_chars=None` extrait tout le document"""
+        key = self.cache_key(data, filename, max_chars)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return cached
+
+        if key in self._flights:
+            self.stats["coalesced"] += 1
+        return await self._flights.do(key, lambda: self._extract_and_cache(key, data, filename, max_chars))
+
+    async def _extract_and_cache(self, key: str, data: bytes, filename: str, max_chars: Optional[int]) -> ExtractedText:
+        result = await self._extract_uncached(data, filename, max_chars)
+        # Les échecs ne sont pas mis en cache (bibliothèque installée entre-temps...)
+        if result.error is None:
+            self._cache[key] = result
+            while len(self._cache) > self.cache_max_entries:
+                self._cache.popitem(last=False)
+        return result
+
+    async def extract_file(
+        self, file_path: str, max_chars: Optional[int] = GPT_PROMPT_MAX_CHARS
+    ) -> ExtractedText:
+        """📂 Texte d'un fichier sur disque (lecture hors boucle)"""
+        data = await asyncio.to_thread(Path(file_path).read_bytes)
+        return await self.extract(data, file_path, max_chars)
+
+    async def _extract_uncached(self, data: bytes, filename: str, max_chars: Optional[int]) -> ExtractedText:
+        start_time = time.time()
+        self.stats["extractions"] += 1
+        loop = asyncio.get_running_loop()
+        extension = Path(filename).suffix.lower()
+
+        if extension not in PDF_EXTENSIONS + WORD_EXTENSIONS or len(data) < self.offload_min_bytes:
+            self.stats["inline"] += 1
+            result = extract_text_from_bytes(data, filename, max_chars)
+        else:
+            self.stats["offloaded"] += 1
+            try:
+                result = await asyncio.wait_for(
+                    loop.run_in_executor(self._get_executor(), extract_text_from_bytes, data, filename, max_chars),
+                    timeout=self.timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                self.stats["timeouts"] += 1
+                logger.warning(f"⏰ Extraction {filename} > {self.timeout_seconds}s - abandon")
+                result = ExtractedText("", "fallback", error="timeout")
+            except BrokenProcessPool as e:
+                # Pool inutilisable (worker tué...) : recréé au prochain appel, extraction en thread
+                self.stats["pool_errors"] += 1
+                logger.warning(f"⚠️ Pool d'extraction indisponible: {e} - repli thread")
+                self._executor = None
+                result = await asyncio.to_thread(extract_text_from_bytes, data, filename, max_chars)
+
+        if result.truncated:
+            self.stats["truncated"] += 1
+        if result.error:
+            logger.warning(f"⚠️ Extraction {filename} impossible: {result.error}")
+        self.stats["total_time_ms"] += (time.time() - start_time) * 1000
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """📊 Statistiques de l'extracteur"""
+        lookups = self.stats["extractions"] + self.stats["cache_hits"] + self.stats["coalesced"]
+        return {
+            **self.stats,
+            "max_workers": self.max_workers,
+            "cache_size": len(self._cache),
+            "started": self._executor is not None,
+            "hit_rate": (lookups - self.stats["extractions"]) / max(lookups, 1),
+            "average_extraction_ms": self.stats["total_time_ms"] / max(self.stats["extractions"], 1)
+        }
+
+    def shutdown(self, wait: bool = True):
+        """🔌 Arrêt des processus workers"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+_default_extractor: Optional[DocumentTextExtractor] = None
+
+
+def get_document_extractor() -> DocumentTextExtractor:
+    """Extracteur partagé (pool et cache communs à tous les endpoints)"""
+    global _default_extractor
+    if _default_extractor is None:
+        _default_extractor = DocumentTextExtractor()
+    return _default_extractor
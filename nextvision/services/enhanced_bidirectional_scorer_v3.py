@@ -12,9 +12,11 @@ Version: 3.0.0 - Enhanced with new scorers
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import asyncio
+import heapq
+import inspect
 
 # Import des scorers existants V3.0
 from nextvision.services.scorers_v3 import (
@@ -44,8 +46,20 @@ from nextvision.services.bidirectional_scorer import (
     ScoringResult
 )
 
+# Exécution des composants CPU (en ligne ou pool de processus)
+from nextvision.services.scoring_process_pool import (
+    ScoringProcessPool,
+    compute_cpu_component_scores,
+    create_fallback_score_result
+)
+
 logger = logging.getLogger(__name__)
 
+# Composants coûteux (I/O Google Maps) différés en classement top-k ;
+# leur score est majoré par 1.0 tant qu'il n'est pas calculé.
+# Motivations : score fixe (pas encore de scorer branché), donc déjà connu.
+EXPENSIVE_COMPONENTS: Tuple[str, ...] = ("location_transport",)
+
 class EnhancedBidirectionalScorerV3:
     """
     🎯 Scorer Bidirectionnel V3.0 Enhanced
@@ -55,9 +69,19 @@ class EnhancedBidirectionalScorerV3:
     - V3.0 : Timing, Contract, Environment (nouveaux)
     
     Performance target : <175ms (vs 150ms V2.0)
+    
+    Modes d'exécution des composants CPU :
+    - "inline" : sur la boucle d'événements (défaut)
+    - "process" : pool de processus, location/transport restant sur la boucle
     """
     
-    def __init__(self, google_maps_service=None, transport_calculator=None):
+    def __init__(
+        self,
+        google_maps_service=None,
+        transport_calculator=None,
+        execution_mode: str = "inline",
+        process_pool: Optional[ScoringProcessPool] = None
+    ):
         self.name = "EnhancedBidirectionalScorerV3"
         self.version = "3.0.0"
         
@@ -74,12 +98,23 @@ class EnhancedBidirectionalScorerV3:
         self.contract_types_scorer = ContractTypesScorer()
         self.work_environment_scorer = WorkEnvironmentScorer()
         
+        # Backend d'exécution des scorers CPU
+        if execution_mode not in ("inline", "process"):
+            raise ValueError(f"Mode d'exécution inconnu: {execution_mode}")
+        self.execution_mode = execution_mode
+        self.process_pool = process_pool
+        if execution_mode == "process" and self.process_pool is None:
+            self.process_pool = ScoringProcessPool()
+        
         # Configuration performance
         self.performance_config = {
             "target_time_ms": 175,
             "parallel_execution": True,
             "timeout_ms": 5000,
-            "fallback_enabled": True
+            "fallback_enabled": True,
+            "execution_mode": execution_mode,
+            "process_min_batch_size": 64,   # En dessous : coût IPC > gain
+            "location_concurrency": 16
         }
         
         # Métriques globales
@@ -90,6 +125,9 @@ class EnhancedBidirectionalScorerV3:
             "component_performance": {},
             "target_achievements": 0
         }
+        
+        # Classement top-k avec élagage par borne supérieure
+        self.ranking_stats = self._new_ranking_stats()
     
     async def calculate_enhanced_bidirectional_score(
         self,
@@ -124,50 +162,7 @@ class EnhancedBidirectionalScorerV3:
                     candidate, company, request
                 )
             
-            # 2. Détermination poids adaptatifs
-            applied_weights = self._determine_adaptive_weights(
-                candidate, company, request
-            )
-            
-            # 3. Calcul score final pondéré
-            final_score = self._calculate_weighted_final_score(
-                component_scores, applied_weights
-            )
-            
-            # 4. Évaluation niveau compatibilité
-            compatibility_level = self._evaluate_compatibility_level(final_score)
-            
-            # 5. Génération recommandations enrichies
-            recommendations = self._generate_enhanced_recommendations(
-                component_scores, applied_weights, candidate, company
-            )
-            
-            # 6. Analyse exploitation questionnaire
-            questionnaire_analysis = self._analyze_questionnaire_exploitation(
-                candidate, company, component_scores
-            )
-            
-            # 7. Monitoring performance
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
-            performance_monitoring = self._create_performance_monitoring(
-                processing_time, component_scores, request
-            )
-            
-            # 8. Construction réponse V3.0
-            response = self._build_enhanced_response(
-                final_score, compatibility_level, component_scores, applied_weights,
-                recommendations, questionnaire_analysis, performance_monitoring, request
-            )
-            
-            # 9. Mise à jour statistiques
-            self._update_global_stats(processing_time, True)
-            
-            logger.info(
-                f"✅ Enhanced V3.0 terminé: {final_score:.3f} "
-                f"({compatibility_level}, {processing_time:.1f}ms)"
-            )
-            
-            return response
+            return self._finalize_response(request, component_scores, start_time)
             
         except Exception as e:
             logger.error(f"❌ Erreur Enhanced V3.0: {e}")
@@ -178,6 +173,255 @@ class EnhancedBidirectionalScorerV3:
             
             return self._create_fallback_response(request, str(e), processing_time)
     
+    async def calculate_enhanced_bidirectional_scores_batch(
+        self,
+        requests: List[ExtendedMatchingRequestV3]
+    ) -> List[ExtendedMatchingResponseV3]:
+        """
+        📦 Calcul V3.0 Enhanced d'un lot de requêtes
+        
+        En mode "process" (et au-delà de process_min_batch_size), les composants
+        CPU de tout le lot partent dans le pool de processus pendant que les
+        scores location/transport sont calculés sur la boucle d'événements.
+        
+        Returns:
+            Réponses dans l'ordre des requêtes
+        """
+        
+        if (
+            self.execution_mode != "process"
+            or len(requests) < self.performance_config["process_min_batch_size"]
+        ):
+            return [await self.calculate_enhanced_bidirectional_score(request) for request in requests]
+        
+        start_time = datetime.now()
+        logger.info(f"📦 Lot Enhanced V3.0: {len(requests)} paires (pool de processus)")
+        
+        cpu_task = asyncio.ensure_future(
+            self.process_pool.score_pairs([(request.candidate, request.company) for request in requests])
+        )
+        
+        # Location/transport par tranches : la boucle reste disponible entre deux tranches
+        slice_size = self.performance_config["location_concurrency"]
+        location_results = []
+        for start in range(0, len(requests), slice_size):
+            location_results.extend(await asyncio.gather(*[
+                self._safe_score_calculation(
+                    "location_transport",
+                    lambda request=request: self._calculate_location_score(
+                        request.candidate, request.company, request.use_google_maps_intelligence
+                    )
+                )
+                for request in requests[start:start + slice_size]
+            ]))
+        
+        try:
+            cpu_results = await cpu_task
+        except Exception as e:
+            logger.error(f"❌ Erreur pool de processus: {e} - calcul en ligne")
+            cpu_results = [
+                compute_cpu_component_scores(self, request.candidate, request.company)
+                for request in requests
+            ]
+        
+        # Temps amorti par paire (les composants ont été calculés ensemble)
+        amortized_time = (datetime.now() - start_time).total_seconds() * 1000 / len(requests)
+        
+        responses = []
+        for index, (request, cpu_result, location_result) in enumerate(zip(requests, cpu_results, location_results)):
+            if index and index % slice_size == 0:
+                await asyncio.sleep(0)
+            self.global_stats["total_calculations"] += 1
+            try:
+                component_scores = self._assemble_component_scores(cpu_result + [location_result])
+                responses.append(self._finalize_response(
+                    request, component_scores, start_time, processing_time=amortized_time
+                ))
+            except Exception as e:
+                logger.error(f"❌ Erreur Enhanced V3.0: {e}")
+                self._update_global_stats(amortized_time, False)
+                responses.append(self._create_fallback_response(request, str(e), amortized_time))
+        
+        return responses
+    
+    async def rank_companies_top_k(
+        self,
+        candidate: ExtendedCandidateProfileV3,
+        companies: List[ExtendedCompanyProfileV3],
+        top_k: int = 20,
+        use_google_maps_intelligence: bool = True,
+        use_adaptive_weighting: bool = True
+    ) -> List[Tuple[int, ExtendedMatchingResponseV3]]:
+        """
+        🏆 Classement des k meilleures offres pour un candidat (arrêt anticipé)
+        
+        Les composants CPU sont calculés pour toutes les paires ; les composants
+        coûteux (EXPENSIVE_COMPONENTS) sont majorés par 1.0, ce qui donne une
+        borne supérieure du score final pondéré. Les paires sont évaluées par
+        borne décroissante et le calcul s'arrête dès qu'une borne ne peut plus
+        dépasser le k-ième meilleur score : même top-k qu'un calcul complet.
+        
+        Returns:
+            [(index de l'offre, réponse V3.0)] par score décroissant
+        """
+        
+        if not companies or top_k <= 0:
+            return []
+        
+        start_time = datetime.now()
+        request_template = ExtendedMatchingRequestV3(
+            candidate=candidate,
+            company=companies[0],
+            use_adaptive_weighting=use_adaptive_weighting,
+            use_google_maps_intelligence=use_google_maps_intelligence
+        )
+        # Poids adaptatifs : ne dépendent que du candidat et de la requête
+        weights = self._determine_adaptive_weights(candidate, companies[0], request_template)
+        
+        # 1. Composants CPU de toutes les paires (candidat compilé une fois)
+        compiler = self.semantic_scorer.profile_compiler
+        compiled_candidate = compiler.build_candidate(candidate)
+        cpu_results = []
+        bounds = []
+        for company in companies:
+            cpu_result = compute_cpu_component_scores(
+                self, candidate, company, compiled_candidate, compiler.build_company(company)
+            )
+            cpu_results.append(cpu_result)
+            upper_bound_scores = self._assemble_component_scores(
+                cpu_result + [(component, {"final_score": 1.0}) for component in EXPENSIVE_COMPONENTS]
+            )
+            bounds.append(self._calculate_weighted_final_score(upper_bound_scores, weights))
+        
+        # 2. Composants coûteux par borne décroissante, par tranches concurrentes
+        order = sorted(range(len(companies)), key=lambda index: -bounds[index])
+        slice_size = self.performance_config["location_concurrency"]
+        best: List[Tuple[float, int]] = []     # tas min (score, -index) des k meilleurs
+        component_scores: Dict[int, ExtendedComponentScoresV3] = {}
+        evaluated = 0
+        
+        while evaluated < len(order):
+            threshold = best[0][0] if len(best) >= top_k else None
+            batch = []
+            for index in order[evaluated:evaluated + slice_size]:
+                if threshold is not None and bounds[index] <= threshold:
+                    break
+                batch.append(index)
+            if not batch:
+                break
+            evaluated += len(batch)
+            
+            location_results = await asyncio.gather(*[
+                self._safe_score_calculation(
+                    "location_transport",
+                    lambda index=index: self._calculate_location_score(
+                        candidate, companies[index], use_google_maps_intelligence
+                    )
+                )
+                for index in batch
+            ])
+            
+            for index, location_result in zip(batch, location_results):
+                scores = self._assemble_component_scores(cpu_results[index] + [location_result])
+                component_scores[index] = scores
+                entry = (self._calculate_weighted_final_score(scores, weights), -index)
+                if len(best) < top_k:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+        
+        pruned = len(companies) - evaluated
+        self.ranking_stats["rankings"] += 1
+        self.ranking_stats["pairs_scored"] += len(companies)
+        self.ranking_stats["expensive_evaluations"] += evaluated * len(EXPENSIVE_COMPONENTS)
+        self.ranking_stats["expensive_pruned"] += pruned * len(EXPENSIVE_COMPONENTS)
+        
+        # 3. Réponses complètes uniquement pour le top-k
+        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        amortized_time = processing_time / len(companies)
+        ranking = []
+        for _, negative_index in sorted(best, reverse=True):
+            index = -negative_index
+            self.global_stats["total_calculations"] += 1
+            ranking.append((index, self._finalize_response(
+                request_template.model_copy(update={"company": companies[index]}),
+                component_scores[index], start_time, processing_time=amortized_time
+            )))
+        
+        logger.info(
+            f"🏆 Top-{top_k} V3.0: {len(companies)} offres, "
+            f"{evaluated} évaluations coûteuses, {pruned} élaguées ({processing_time:.1f}ms)"
+        )
+        
+        return ranking
+    
+    @staticmethod
+    def _new_ranking_stats() -> Dict[str, int]:
+        return {
+            "rankings": 0,
+            "pairs_scored": 0,
+            "expensive_evaluations": 0,
+            "expensive_pruned": 0
+        }
+    
+    def _finalize_response(
+        self,
+        request: ExtendedMatchingRequestV3,
+        component_scores: ExtendedComponentScoresV3,
+        start_time: datetime,
+        processing_time: Optional[float] = None
+    ) -> ExtendedMatchingResponseV3:
+        """🏁 Pondération, recommandations et construction de la réponse"""
+        
+        candidate = request.candidate
+        company = request.company
+        
+        # 2. Détermination poids adaptatifs
+        applied_weights = self._determine_adaptive_weights(
+            candidate, company, request
+        )
+        
+        # 3. Calcul score final pondéré
+        final_score = self._calculate_weighted_final_score(
+            component_scores, applied_weights
+        )
+        
+        # 4. Évaluation niveau compatibilité
+        compatibility_level = self._evaluate_compatibility_level(final_score)
+        
+        # 5. Génération recommandations enrichies
+        recommendations = self._generate_enhanced_recommendations(
+            component_scores, applied_weights, candidate, company
+        )
+        
+        # 6. Analyse exploitation questionnaire
+        questionnaire_analysis = self._analyze_questionnaire_exploitation(
+            candidate, company, component_scores
+        )
+        
+        # 7. Monitoring performance
+        if processing_time is None:
+            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        performance_monitoring = self._create_performance_monitoring(
+            processing_time, component_scores, request
+        )
+        
+        # 8. Construction réponse V3.0
+        response = self._build_enhanced_response(
+            final_score, compatibility_level, component_scores, applied_weights,
+            recommendations, questionnaire_analysis, performance_monitoring, request
+        )
+        
+        # 9. Mise à jour statistiques
+        self._update_global_stats(processing_time, True)
+        
+        logger.info(
+            f"✅ Enhanced V3.0 terminé: {final_score:.3f} "
+            f"({compatibility_level}, {processing_time:.1f}ms)"
+        )
+        
+        return response
+    
     async def _calculate_scores_parallel(
         self,
         candidate: ExtendedCandidateProfileV3,
@@ -188,68 +432,72 @@ class EnhancedBidirectionalScorerV3:
         
         logger.debug("🔄 Calcul scores parallèle V3.0")
         
-        # Tâches parallèles avec timeout
+        # Composants CPU : pool de processus ou boucle d'événements
+        if self.execution_mode == "process":
+            cpu_task = self.process_pool.score_pairs([(candidate, company)])
+        else:
+            cpu_task = self._calculate_cpu_scores_inline(candidate, company)
+        
+        # Location/transport (I/O) reste sur la boucle
         tasks = [
-            self._safe_score_calculation(
-                "semantic", 
-                lambda: self.semantic_scorer.calculate_score(
-                    candidate.base_profile, company.base_profile
-                )
-            ),
-            self._safe_score_calculation(
-                "salary",
-                lambda: self.salary_scorer.calculate_score(
-                    candidate.base_profile, company.base_profile
-                )
-            ),
-            self._safe_score_calculation(
-                "experience",
-                lambda: self.experience_scorer.calculate_score(
-                    candidate.base_profile, company.base_profile
-                )
-            ),
+            cpu_task,
             self._safe_score_calculation(
                 "location_transport",
-                lambda: self.location_transport_scorer.calculate_location_transport_score_v3(
-                    candidate.base_profile.attentes.localisation_preferee,
-                    company.base_profile.poste.localisation,
-                    candidate.transport_preferences.transport_methods or ["vehicle", "public-transport"],
-                    {"vehicle": candidate.transport_preferences.max_travel_time, 
-                     "public-transport": candidate.transport_preferences.max_travel_time}
-                )
-            ),
-            self._safe_score_calculation(
-                "availability_timing",
-                lambda: self.availability_timing_scorer.calculate_availability_timing_score(
-                    candidate, company
-                )
-            ),
-            self._safe_score_calculation(
-                "contract_types",
-                lambda: self.contract_types_scorer.calculate_contract_types_score(
-                    candidate, company
-                )
-            ),
-            self._safe_score_calculation(
-                "work_environment",
-                lambda: self.work_environment_scorer.calculate_work_environment_score(
-                    candidate, company
-                )
+                lambda: self._calculate_location_score(candidate, company)
             )
         ]
         
         # Exécution avec timeout global
         try:
-            results = await asyncio.wait_for(
+            cpu_results, location_result = await asyncio.wait_for(
                 asyncio.gather(*tasks),
                 timeout=self.performance_config["timeout_ms"] / 1000
             )
         except asyncio.TimeoutError:
             logger.warning("⏰ Timeout calcul parallèle - fallback séquentiel")
             return await self._calculate_scores_sequential(candidate, company, request)
+        except Exception as e:
+            logger.error(f"❌ Erreur calcul parallèle: {e} - fallback séquentiel")
+            return await self._calculate_scores_sequential(candidate, company, request)
+        
+        if self.execution_mode == "process":
+            cpu_results = cpu_results[0]
         
         # Assemblage scores
-        return self._assemble_component_scores(results)
+        return self._assemble_component_scores(cpu_results + [location_result])
+    
+    async def _calculate_cpu_scores_inline(
+        self,
+        candidate: ExtendedCandidateProfileV3,
+        company: ExtendedCompanyProfileV3
+    ) -> List[tuple]:
+        """🧮 Composants CPU calculés sur la boucle d'événements"""
+        return compute_cpu_component_scores(self, candidate, company)
+    
+    def _calculate_location_score(
+        self,
+        candidate: ExtendedCandidateProfileV3,
+        company: ExtendedCompanyProfileV3,
+        use_google_maps_intelligence: bool = True
+    ):
+        """🗺️ Coroutine score location/transport (seul composant I/O)"""
+        
+        if use_google_maps_intelligence:
+            transport_methods = candidate.transport_preferences.transport_methods or ["vehicle", "public-transport"]
+            max_times = {
+                "vehicle": candidate.transport_preferences.max_travel_time,
+                "public-transport": candidate.transport_preferences.max_travel_time
+            }
+        else:
+            transport_methods = candidate.transport_preferences.transport_methods or ["vehicle"]
+            max_times = {"vehicle": candidate.transport_preferences.max_travel_time}
+        
+        return self.location_transport_scorer.calculate_location_transport_score_v3(
+            candidate.base_profile.attentes.localisation_preferee,
+            company.base_profile.poste.localisation,
+            transport_methods,
+            max_times
+        )
     
     async def _calculate_scores_sequential(
         self,
@@ -345,10 +593,9 @@ class EnhancedBidirectionalScorerV3:
         """🛡️ Calcul sécurisé avec gestion erreurs"""
         
         try:
-            if asyncio.iscoroutinefunction(calculation_func):
-                result = await calculation_func()
-            else:
-                result = calculation_func()
+            result = calculation_func()
+            if inspect.isawaitable(result):
+                result = await result
             return (component_name, result)
         except Exception as e:
             logger.error(f"Erreur calcul {component_name}: {e}")
@@ -748,16 +995,7 @@ class EnhancedBidirectionalScorerV3:
     
     def _create_fallback_score_result(self, component_name: str, score: float) -> dict:
         """🛡️ Création résultat score fallback"""
-        
-        return {
-            "final_score": score,
-            "score_breakdown": {f"{component_name}_score": score},
-            "explanations": [f"⚠️ Mode dégradé - {component_name}"],
-            "recommendations": ["🔧 Vérification manuelle recommandée"],
-            "calculated_at": datetime.now().isoformat(),
-            "version": "3.0.0-fallback",
-            "error": f"Erreur calcul {component_name}"
-        }
+        return create_fallback_score_result(component_name, score)
     
     def _update_global_stats(self, processing_time: float, success: bool):
         """📊 Mise à jour statistiques globales"""
@@ -799,9 +1037,21 @@ class EnhancedBidirectionalScorerV3:
                 "contract": self.contract_types_scorer.get_performance_stats(),
                 "environment": self.work_environment_scorer.get_performance_stats()
             },
-            "configuration": self.performance_config
+            "top_k_ranking": {
+                **self.ranking_stats,
+                "pruned_rate": self.ranking_stats["expensive_pruned"] / max(
+                    1, self.ranking_stats["expensive_evaluations"] + self.ranking_stats["expensive_pruned"]
+                )
+            },
+            "configuration": self.performance_config,
+            "process_pool": self.process_pool.get_stats() if self.process_pool else None
         }
     
+    def close(self):
+        """🔌 Arrêt du pool de processus (mode "process")"""
+        if self.process_pool is not None:
+            self.process_pool.shutdown()
+    
     def reset_stats(self):
         """🔄 Reset statistiques"""
         self.global_stats = {
@@ -811,6 +1061,7 @@ class EnhancedBidirectionalScorerV3:
             "component_performance": {},
             "target_achievements": 0
         }
+        self.ranking_stats = self._new_ranking_stats()
         
         # Reset stats des scorers individuels
         self.availability_timing_scorer.reset_stats()
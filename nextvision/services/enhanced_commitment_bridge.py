@@ -38,6 +38,7 @@ from nextvision.adapters.chatgpt_commitment_adapter import (
     CommitmentNextvisionBridge as BasicBridge,
     EnhancedParserV4Output, ChatGPTCommitmentOutput
 )
+from nextvision.utils.fingerprint import fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -732,10 +733,8 @@ class EnhancedCommitmentBridge:
     
     def _generate_cache_key(self, data_type: str, main_data: Dict, 
                           questionnaire_data: Optional[Dict]) -> str:
-        """Génère clé de cache unique"""
-        main_hash = hash(str(sorted(main_data.items())))
-        quest_hash = hash(str(sorted(questionnaire_data.items()))) if questionnaire_data else 0
-        return f"{data_type}_{main_hash}_{quest_hash}"
+        """Génère clé de cache unique (stable entre workers et redémarrages)"""
+        return f"{data_type}_{fingerprint(main_data, questionnaire_data or None)}"
     
     def _is_cache_valid(self, timestamp: datetime) -> bool:
         """Vérifie validité du cache"""
@@ -0,0 +1,319 @@
+"""
+🗄️ Nextvision - Store de cache géographique partagé (géocodage + itinéraires)
+
+Cache multi-niveaux pour GoogleMapsService :
+- Niveau 1 : LRU en mémoire (borné, par processus)
+- Niveau 2 : Redis via IntelligentRedisCache (partagé entre workers)
+- Niveau 3 : SQLite sur disque (persistant, utilisable hors ligne)
+- Cache négatif pour les adresses introuvables
+- Expiration absolue stockée avec la valeur : la remontée vers un niveau
+  supérieur conserve le TTL restant
+
+Author: NEXTEN Team
+Version: 1.0.0 - Shared Geo Cache
+"""
+
+import asyncio
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.transport_models import GeocodeResult, TransportRoute
+
+logger = logging.getLogger(__name__)
+
+# Marqueur de cache négatif (adresse introuvable)
+GEOCODE_NOT_FOUND = "__geocode_not_found__"
+
+# TTL de remontée quand l'expiration d'origine est inconnue (entrées sans expiration)
+UNKNOWN_EXPIRY_PROMOTION_TTL = 3600
+
+
+class GeoCacheBackend:
+    """Interface d'un niveau de cache géographique"""
+
+    name = "backend"
+    # True si le niveau conserve les objets Python tels quels (pas de sérialisation)
+    stores_objects = False
+
+    async def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    async def get_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """(valeur, expiration absolue) ; par défaut l'expiration est portée par la valeur encodée"""
+        raw = await self.get(key)
+        return None if raw is None else (raw, None)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int):
+        raise NotImplementedError
+
+    async def delete(self, key: str):
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict:
+        return {"name": self.name}
+
+
+class MemoryLRUBackend(GeoCacheBackend):
+    """💾 LRU en mémoire avec TTL par entrée"""
+
+    name = "memory"
+    stores_objects = True
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.evictions = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = await self.get_entry(key)
+        return None if entry is None else entry[0]
+
+    async def get_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, value: Any, ttl_seconds: int):
+        self._entries[key] = (value, time.time() + ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, key: str):
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict:
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions
+        }
+
+
+class RedisGeoBackend(GeoCacheBackend):
+    """🔴 Niveau Redis partagé via IntelligentRedisCache"""
+
+    name = "redis"
+
+    def __init__(self, redis_cache):
+        # Instance de nextvision.cache.IntelligentRedisCache (injectée)
+        self.redis_cache = redis_cache
+
+    @staticmethod
+    def _redis_key(key: str) -> str:
+        # Format CacheKey : nextvision:<namespace>:<version>:<identifier>
+        namespace = "geocoding" if key.startswith("geocode_") else "transport"
+        return f"nextvision:{namespace}:v1:{key}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self.redis_cache.get(self._redis_key(key))
+
+    async def set(self, key: str, value: Any, ttl_seconds: int):
+        await self.redis_cache.set(self._redis_key(key), value, ttl_seconds)
+
+    async def delete(self, key: str):
+        await self.redis_cache.delete(self._redis_key(key))
+
+    def get_stats(self) -> Dict:
+        return {"name": self.name, "connected": getattr(self.redis_cache, "is_connected", False)}
+
+
+class SQLiteGeoBackend(GeoCacheBackend):
+    """💽 Niveau persistant SQLite (exécuté hors de la boucle d'événements)"""
+
+    name = "sqlite"
+
+    def __init__(self, db_path: str, purge_every: int = 1000):
+        self.db_path = db_path
+        self.purge_every = purge_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS geo_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def _get_sync(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM geo_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set_sync(self, key: str, value: str, ttl_seconds: int):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geo_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl_seconds)
+            )
+            self._writes += 1
+            if self._writes % self.purge_every == 0:
+                self._conn.execute("DELETE FROM geo_cache WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+
+    def _delete_sync(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM geo_cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int):
+        await asyncio.to_thread(self._set_sync, key, value, ttl_seconds)
+
+    async def delete(self, key: str):
+        await asyncio.to_thread(self._delete_sync, key)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM geo_cache").fetchone()[0]
+        return {"name": self.name, "path": self.db_path, "size": size}
+
+
+class GeoCacheStore:
+    """🗄️ Cache géographique multi-niveaux (lecture en cascade, écriture sur tous les niveaux)"""
+
+    def __init__(self, tiers: Optional[List[GeoCacheBackend]] = None):
+        self.tiers = tiers or [MemoryLRUBackend()]
+        self.stats = {"hits": 0, "misses": 0, "negative_hits": 0, "errors": 0}
+        self.tier_hits = {tier.name: 0 for tier in self.tiers}
+
+    # === SÉRIALISATION ===
+
+    @staticmethod
+    def _encode(value: Any, expires_at: Optional[float] = None) -> str:
+        if value == GEOCODE_NOT_FOUND:
+            payload = {"kind": "not_found"}
+        else:
+            kind = "geocode" if isinstance(value, GeocodeResult) else "route"
+            payload = {"kind": kind, "data": value.model_dump(mode="json")}
+        if expires_at is not None:
+            payload["expires_at"] = expires_at
+        return json.dumps(payload)
+
+    @staticmethod
+    def _decode(raw: Any) -> Tuple[Any, Optional[float]]:
+        """(valeur, expiration absolue ou None si absente)"""
+        if isinstance(raw, bytes):
+            raw = raw.decode()
+        payload = json.loads(raw)
+        expires_at = payload.get("expires_at")
+        if payload["kind"] == "not_found":
+            return GEOCODE_NOT_FOUND, expires_at
+        if payload["kind"] == "geocode":
+            return GeocodeResult.model_validate(payload["data"]), expires_at
+        return TransportRoute.model_validate(payload["data"]), expires_at
+
+    # === ACCÈS ===
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Lecture en cascade avec remontée dans les niveaux supérieurs"""
+        for level, tier in enumerate(self.tiers):
+            try:
+                entry = await tier.get_entry(key)
+                if entry is None:
+                    continue
+                value, expires_at = entry if tier.stores_objects else self._decode(entry[0])
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Erreur cache géo ({tier.name}): {e}")
+                continue
+
+            if expires_at is None:
+                expires_at = time.time() + UNKNOWN_EXPIRY_PROMOTION_TTL
+            elif expires_at <= time.time():
+                # Niveau dont le TTL natif dépasse l'expiration d'origine
+                continue
+
+            self.tier_hits[tier.name] += 1
+            if value == GEOCODE_NOT_FOUND:
+                self.stats["negative_hits"] += 1
+            else:
+                self.stats["hits"] += 1
+
+            # Remontée vers les niveaux plus rapides avec le TTL restant
+            for upper in self.tiers[:level]:
+                await self._safe_set(upper, key, value, expires_at)
+            return value
+
+        self.stats["misses"] += 1
+        return None
+
+    async def set(self, key: str, value: Any, ttl_seconds: int):
+        """Écriture sur tous les niveaux"""
+        expires_at = time.time() + ttl_seconds
+        for tier in self.tiers:
+            await self._safe_set(tier, key, value, expires_at)
+
+    async def set_not_found(self, key: str, ttl_seconds: int):
+        """Cache négatif pour une adresse introuvable"""
+        await self.set(key, GEOCODE_NOT_FOUND, ttl_seconds)
+
+    async def delete(self, key: str):
+        for tier in self.tiers:
+            try:
+                await tier.delete(key)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Erreur suppression cache géo ({tier.name}): {e}")
+
+    async def _safe_set(self, tier: GeoCacheBackend, key: str, value: Any, expires_at: float):
+        ttl_seconds = expires_at - time.time()
+        if ttl_seconds <= 0:
+            return
+        try:
+            if tier.stores_objects:
+                await tier.set(key, value, ttl_seconds)
+            else:
+                # TTL natif arrondi à la seconde supérieure ; l'expiration exacte voyage avec la valeur
+                await tier.set(key, self._encode(value, expires_at), math.ceil(ttl_seconds))
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Erreur écriture cache géo ({tier.name}): {e}")
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            "tier_hits": dict(self.tier_hits),
+            "tiers": [tier.get_stats() for tier in self.tiers]
+        }
+
+
+def build_geo_cache_store(
+    memory_entries: int = 10000,
+    redis_cache=None,
+    sqlite_path: Optional[str] = None
+) -> GeoCacheStore:
+    """🏭 Construit un store mémoire + Redis (optionnel) + SQLite (optionnel)"""
+    tiers: List[GeoCacheBackend] = [MemoryLRUBackend(memory_entries)]
+    if redis_cache is not None:
+        tiers.append(RedisGeoBackend(redis_cache))
+    if sqlite_path:
+        tiers.append(SQLiteGeoBackend(sqlite_path))
+    return GeoCacheStore(tiers)
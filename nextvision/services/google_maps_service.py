@@ -8,9 +8,7 @@ Version: 2.0.0 - Google Maps Intelligence
 
 import asyncio
 import aiohttp
-import json
-import hashlib
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 from urllib.parse import urlencode
@@ -19,20 +17,30 @@ from ..models.transport_models import (
     GeocodeResult, GeocodeQuality, TravelMode, TransportRoute, 
     TrafficCondition, RouteStep
 )
+from .geo_cache_store import GeoCacheStore, GEOCODE_NOT_FOUND
+from ..utils.fingerprint import fingerprint, fingerprint_text
+from ..utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+class GeocodeNotFoundError(Exception):
+    """📍 Adresse inconnue de l'API (ZERO_RESULTS) - candidate au cache négatif"""
+    pass
+
 class GoogleMapsService:
     """🗺️ Service Google Maps avec cache intelligent et rate limiting"""
     
-    def __init__(self, api_key: str, cache_duration_hours: int = 24):
+    def __init__(self, api_key: str, cache_duration_hours: int = 24,
+                 cache_store: Optional[GeoCacheStore] = None,
+                 negative_cache_minutes: int = 60,
+                 base_url: str = "https://maps.googleapis.com/maps/api"):
         self.api_key = api_key
         self.cache_duration_hours = cache_duration_hours
-        self.base_url = "https://maps.googleapis.com/maps/api"
+        self.base_url = base_url
         
-        # Cache en mémoire (TODO: Redis en production)
-        self._geocode_cache: Dict[str, GeocodeResult] = {}
-        self._directions_cache: Dict[str, TransportRoute] = {}
+        # Cache multi-niveaux (mémoire LRU + Redis/SQLite optionnels, partageable)
+        self.cache_store = cache_store or GeoCacheStore()
+        self.negative_cache_minutes = negative_cache_minutes
         
         # Rate limiting
         self.requests_per_day = 25000  # Limite Google Maps API
@@ -43,18 +51,55 @@ class GoogleMapsService:
         self.circuit_breaker_failures = 0
         self.circuit_breaker_threshold = 5
         self.circuit_breaker_reset_time = None
+        
+        # Distance Matrix (batch)
+        self.distance_matrix_max_destinations = 25  # 1 origine x 25 destinations par requête
+        self.batch_max_concurrency = 5
+        self.batch_stats = {
+            "matrix_requests": 0,
+            "matrix_elements": 0,
+            "matrix_cache_hits": 0,
+            "api_calls_saved": 0
+        }
+        
+        # Single-flight : appels concurrents sur une même clé de cache → un seul
+        # calcul (lecture cache mémoire/Redis comprise), résultat partagé
+        self._flights = SingleFlight()
+        self.coalescing_stats = {
+            "geocode_coalesced": 0,
+            "route_coalesced": 0
+        }
     
-    async def geocode_address(self, address: str, force_refresh: bool = False) -> GeocodeResult:
-        """📍 Géocode une adresse avec cache intelligent"""
+    async def geocode_address(
+        self, address: str, force_refresh: bool = False, coalesce: bool = True
+    ) -> GeocodeResult:
+        """
+        📍 Géocode une adresse avec cache intelligent
+        
+        `coalesce=False` (requête hedgée) : appel dédié, sans rejoindre un calcul en cours
+        """
         
         # Normalisation de l'adresse pour le cache
         normalized_address = self._normalize_address(address)
-        cache_key = f"geocode_{hashlib.md5(normalized_address.encode()).hexdigest()}"
+        cache_key = f"geocode_{fingerprint_text(normalized_address)}"
         
-        # Vérification cache
-        if not force_refresh and cache_key in self._geocode_cache:
-            cached_result = self._geocode_cache[cache_key]
-            if self._is_cache_valid(cached_result.cached_at):
+        # Un rafraîchissement forcé ne rejoint pas un calcul en cours
+        if force_refresh or not coalesce:
+            return await self._geocode(address, normalized_address, cache_key, force_refresh)
+        return await self._single_flight(
+            "geocode", cache_key, lambda: self._geocode(address, normalized_address, cache_key, force_refresh)
+        )
+    
+    async def _geocode(
+        self, address: str, normalized_address: str, cache_key: str, force_refresh: bool
+    ) -> GeocodeResult:
+        # Vérification cache (y compris cache négatif)
+        if not force_refresh:
+            cached_result = await self.cache_store.get(cache_key)
+            if cached_result == GEOCODE_NOT_FOUND:
+                logger.debug(f"Cache négatif pour géocodage: {address}")
+                return self._create_fallback_geocode(address)
+            if cached_result is not None and self._is_cache_valid(cached_result.cached_at):
                 logger.debug(f"Cache hit pour géocodage: {address}")
                 return cached_result
         
@@ -68,7 +113,7 @@ class GoogleMapsService:
             geocode_result = await self._call_geocoding_api(normalized_address)
             
             # Mise en cache
-            self._geocode_cache[cache_key] = geocode_result
+            await self.cache_store.set(cache_key, geocode_result, self.cache_duration_hours * 3600)
             
             # Reset circuit breaker si succès
             self.circuit_breaker_failures = 0
@@ -76,6 +121,12 @@ class GoogleMapsService:
             logger.info(f"Géocodage réussi: {address} → {geocode_result.formatted_address}")
             return geocode_result
             
+        except GeocodeNotFoundError as e:
+            # Adresse inconnue : cache négatif, pas d'impact sur le circuit breaker
+            logger.warning(f"Adresse introuvable {address}: {e}")
+            await self.cache_store.set_not_found(cache_key, self.negative_cache_minutes * 60)
+            return self._create_fallback_geocode(address)
+            
         except Exception as e:
             logger.error(f"Erreur géocodage {address}: {e}")
             self._handle_api_failure()
@@ -88,18 +139,36 @@ class GoogleMapsService:
         origin: GeocodeResult, 
         destination: GeocodeResult,
         travel_mode: TravelMode,
-        departure_time: Optional[datetime] = None
+        departure_time: Optional[datetime] = None,
+        coalesce: bool = True
     ) -> TransportRoute:
-        """🛣️ Calcule un itinéraire avec gestion trafic"""
+        """
+        🛣️ Calcule un itinéraire avec gestion trafic
         
-        cache_key = self._create_route_cache_key(origin, destination, travel_mode, departure_time)
+        `coalesce=False` (requête hedgée) : appel dédié, sans rejoindre un calcul en cours
+        """
         
+        cache_key = self._create_route_cache_key(origin, destination, travel_mode, departure_time)
+        if not coalesce:
+            return await self._calculate_route(cache_key, origin, destination, travel_mode, departure_time)
+        return await self._single_flight(
+            "route", cache_key,
+            lambda: self._calculate_route(cache_key, origin, destination, travel_mode, departure_time)
+        )
+    
+    async def _calculate_route(
+        self,
+        cache_key: str,
+        origin: GeocodeResult,
+        destination: GeocodeResult,
+        travel_mode: TravelMode,
+        departure_time: Optional[datetime]
+    ) -> TransportRoute:
         # Vérification cache (plus court pour les itinéraires - 1h)
-        if cache_key in self._directions_cache:
-            cached_route = self._directions_cache[cache_key]
-            if self._is_route_cache_valid(cached_route.calculated_at):
-                logger.debug(f"Cache hit pour itinéraire: {travel_mode.value}")
-                return cached_route
+        cached_route = await self.cache_store.get(cache_key)
+        if cached_route is not None and self._is_route_cache_valid(cached_route.calculated_at):
+            logger.debug(f"Cache hit pour itinéraire: {travel_mode.value}")
+            return cached_route
         
         # Vérification circuit breaker
         if self._is_circuit_breaker_open():
@@ -111,7 +180,7 @@ class GoogleMapsService:
             route = await self._call_directions_api(origin, destination, travel_mode, departure_time)
             
             # Mise en cache
-            self._directions_cache[cache_key] = route
+            await self.cache_store.set(cache_key, route, 3600)
             
             # Reset circuit breaker
             self.circuit_breaker_failures = 0
@@ -126,53 +195,168 @@ class GoogleMapsService:
             # Fallback
             return self._create_fallback_route(origin, destination, travel_mode)
     
+    async def _single_flight(self, kind: str, cache_key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """🔀 Les appelants concurrents d'une même clé attendent le calcul du premier"""
+        if cache_key in self._flights:
+            self.coalescing_stats[f"{kind}_coalesced"] += 1
+        return await self._flights.do(cache_key, compute)
+    
     async def batch_calculate_routes(
         self,
         origin: GeocodeResult,
         destinations: List[GeocodeResult], 
-        travel_modes: List[TravelMode]
+        travel_modes: List[TravelMode],
+        departure_time: Optional[datetime] = None
     ) -> Dict[str, Dict[TravelMode, TransportRoute]]:
-        """🚀 Calcul batch optimisé pour performance"""
-        
-        results = {}
+        """🚀 Calcul batch via Distance Matrix (1 origine x 25 destinations par mode)"""
+        
+        results: Dict[str, Dict[TravelMode, TransportRoute]] = {}
+        semaphore = asyncio.Semaphore(self.batch_max_concurrency)
+        chunk_tasks = []
+        
+        for travel_mode in travel_modes:
+            # 1. Paires déjà en cache
+            uncached = []
+            for destination in destinations:
+                cache_key = self._create_route_cache_key(origin, destination, travel_mode, departure_time)
+                cached_route = await self.cache_store.get(cache_key)
+                if cached_route is not None and self._is_route_cache_valid(cached_route.calculated_at):
+                    results.setdefault(destination.formatted_address, {})[travel_mode] = cached_route
+                    self.batch_stats["matrix_cache_hits"] += 1
+                else:
+                    uncached.append(destination)
+            
+            # 2. Une requête Distance Matrix par lot de destinations
+            for i in range(0, len(uncached), self.distance_matrix_max_destinations):
+                chunk = uncached[i:i + self.distance_matrix_max_destinations]
+                chunk_tasks.append(
+                    self._calculate_matrix_chunk(origin, chunk, travel_mode, departure_time, semaphore)
+                )
         
-        # Grouper les requêtes par lots pour respecter les limites API
-        batch_size = 10  # Google Distance Matrix limite
+        for chunk_routes in await asyncio.gather(*chunk_tasks):
+            for route in chunk_routes:
+                results.setdefault(route.destination.formatted_address, {})[route.travel_mode] = route
         
-        for i in range(0, len(destinations), batch_size):
-            batch_destinations = destinations[i:i + batch_size]
-            
-            # Appels parallèles pour différents modes de transport
-            tasks = []
-            for travel_mode in travel_modes:
-                for destination in batch_destinations:
-                    task = self.calculate_route(origin, destination, travel_mode)
-                    tasks.append((destination.formatted_address, travel_mode, task))
-            
-            # Exécution parallèle avec limite de concurrence
-            semaphore = asyncio.Semaphore(5)  # Max 5 requêtes simultanées
-            
-            async def execute_with_semaphore(dest_key, mode, task):
-                async with semaphore:
-                    return dest_key, mode, await task
+        return results
+    
+    async def _calculate_matrix_chunk(
+        self,
+        origin: GeocodeResult,
+        destinations: List[GeocodeResult],
+        travel_mode: TravelMode,
+        departure_time: Optional[datetime],
+        semaphore: asyncio.Semaphore
+    ) -> List[TransportRoute]:
+        """📦 Un lot Distance Matrix, repli sur le calcul unitaire en cas d'échec"""
+        
+        async with semaphore:
+            if self._is_circuit_breaker_open():
+                logger.warning("Circuit breaker ouvert - batch en mode dégradé")
+                return [self._create_fallback_route(origin, dest, travel_mode) for dest in destinations]
             
-            batch_results = await asyncio.gather(*[
-                execute_with_semaphore(dest_key, mode, task) 
-                for dest_key, mode, task in tasks
-            ], return_exceptions=True)
+            try:
+                routes = await self._call_distance_matrix_api(origin, destinations, travel_mode, departure_time)
+                self.circuit_breaker_failures = 0
+            except Exception as e:
+                logger.error(f"Erreur Distance Matrix ({travel_mode.value}): {e}")
+                self._handle_api_failure()
+                # Repli : chemin unitaire (Directions API / fallback)
+                return [
+                    await self.calculate_route(origin, dest, travel_mode, departure_time)
+                    for dest in destinations
+                ]
+        
+        self.batch_stats["matrix_requests"] += 1
+        self.batch_stats["matrix_elements"] += len(destinations)
+        self.batch_stats["api_calls_saved"] += len(destinations) - 1
+        
+        chunk_routes = []
+        for destination, route in zip(destinations, routes):
+            if route is None:
+                # Élément sans itinéraire (NOT_FOUND / ZERO_RESULTS)
+                chunk_routes.append(self._create_fallback_route(origin, destination, travel_mode))
+                continue
             
-            # Traitement des résultats
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    logger.error(f"Erreur batch: {result}")
-                    continue
-                    
-                dest_key, mode, route = result
-                if dest_key not in results:
-                    results[dest_key] = {}
-                results[dest_key][mode] = route
+            cache_key = self._create_route_cache_key(origin, destination, travel_mode, departure_time)
+            await self.cache_store.set(cache_key, route, 3600)
+            chunk_routes.append(route)
         
-        return results
+        return chunk_routes
+    
+    async def _call_distance_matrix_api(
+        self,
+        origin: GeocodeResult,
+        destinations: List[GeocodeResult],
+        travel_mode: TravelMode,
+        departure_time: Optional[datetime] = None
+    ) -> List[Optional[TransportRoute]]:
+        """🧮 Appel API Distance Matrix Google Maps (1 origine x N destinations)"""
+        
+        params = {
+            'origins': f"{origin.latitude},{origin.longitude}",
+            'destinations': "|".join(f"{dest.latitude},{dest.longitude}" for dest in destinations),
+            'mode': travel_mode.value,
+            'key': self.api_key,
+            'language': 'fr',
+            'region': 'fr',
+            'units': 'metric'
+        }
+        
+        if travel_mode in [TravelMode.DRIVING, TravelMode.TRANSIT]:
+            params['departure_time'] = int(departure_time.timestamp()) if departure_time else 'now'
+            if travel_mode == TravelMode.DRIVING:
+                params['traffic_model'] = 'best_guess'
+        
+        url = f"{self.base_url}/distancematrix/json?" + urlencode(params)
+        
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                self._increment_usage()
+                
+                if response.status != 200:
+                    raise Exception(f"HTTP {response.status}: {await response.text()}")
+                
+                data = await response.json()
+                
+                if data['status'] != 'OK':
+                    raise Exception(f"Distance Matrix failed: {data['status']}")
+                
+                elements = data['rows'][0]['elements']
+                if len(elements) != len(destinations):
+                    raise Exception(f"Distance Matrix: {len(elements)} éléments pour {len(destinations)} destinations")
+                
+                now = datetime.now()
+                routes: List[Optional[TransportRoute]] = []
+                
+                for destination, element in zip(destinations, elements):
+                    if element.get('status') != 'OK':
+                        routes.append(None)
+                        continue
+                    
+                    traffic = None
+                    if 'duration_in_traffic' in element:
+                        normal_duration = element['duration']['value']
+                        traffic_duration = element['duration_in_traffic']['value']
+                        traffic = TrafficCondition(
+                            duration_in_traffic_seconds=traffic_duration,
+                            traffic_factor=traffic_duration / max(normal_duration, 1),
+                            rush_hour=self._is_rush_hour(departure_time)
+                        )
+                    
+                    routes.append(TransportRoute(
+                        origin=origin,
+                        destination=destination,
+                        travel_mode=travel_mode,
+                        distance_meters=element['distance']['value'],
+                        duration_seconds=element['duration']['value'],
+                        traffic=traffic,
+                        steps=[],  # Distance Matrix ne fournit pas le détail des étapes
+                        polyline="",
+                        calculated_at=now,
+                        cached_until=now + timedelta(hours=1)
+                    ))
+                
+                return routes
     
     async def _call_geocoding_api(self, address: str) -> GeocodeResult:
         """📍 Appel API Geocoding Google Maps"""
@@ -195,11 +379,14 @@ class GoogleMapsService:
                 
                 data = await response.json()
                 
+                if data['status'] == 'ZERO_RESULTS':
+                    raise GeocodeNotFoundError("Aucun résultat trouvé")
+                
                 if data['status'] != 'OK':
                     raise Exception(f"Geocoding failed: {data['status']}")
                 
                 if not data['results']:
-                    raise Exception("Aucun résultat trouvé")
+                    raise GeocodeNotFoundError("Aucun résultat trouvé")
                 
                 # Parse premier résultat
                 result = data['results'][0]
@@ -349,16 +536,14 @@ class GoogleMapsService:
         key_parts = [
             f"{origin.latitude:.6f},{origin.longitude:.6f}",
             f"{destination.latitude:.6f},{destination.longitude:.6f}",
-            travel_mode.value
+            travel_mode
         ]
         
         # Arrondir departure_time à l'heure pour cache plus efficace
         if departure_time:
-            hour_rounded = departure_time.replace(minute=0, second=0, microsecond=0)
-            key_parts.append(hour_rounded.isoformat())
+            key_parts.append(departure_time.replace(minute=0, second=0, microsecond=0))
         
-        combined = "_".join(key_parts)
-        return hashlib.md5(combined.encode()).hexdigest()
+        return f"route_{fingerprint(*key_parts)}"
     
     def _is_cache_valid(self, cached_at: datetime) -> bool:
         """⏰ Vérifie validité cache géocodage (24h)"""
@@ -481,8 +666,9 @@ class GoogleMapsService:
     def get_cache_stats(self) -> Dict:
         """📊 Statistiques cache pour monitoring"""
         return {
-            "geocode_cache_size": len(self._geocode_cache),
-            "directions_cache_size": len(self._directions_cache),
+            "cache_store": self.cache_store.get_stats(),
+            "distance_matrix": dict(self.batch_stats),
+            "coalescing": {**self.coalescing_stats, "inflight": len(self._flights)},
             "daily_usage": self.daily_usage,
             "daily_limit": self.requests_per_day,
             "usage_percentage": (self.daily_usage / self.requests_per_day) * 100,
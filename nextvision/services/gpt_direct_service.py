@@ -7,6 +7,7 @@ Service unifié pour parsing GPT Direct avec OpenAI
 - ✅ Parsing Job Direct avec GPT-4  
 - ✅ Fallbacks intelligents
 - ✅ Performance optimisée < 2000ms
+- ✅ Appels OpenAI asynchrones (pool borné, timeouts, quotas)
 
 Author: NEXTEN Team
 Version: 3.2.1
@@ -20,7 +21,10 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from datetime import datetime
 import os
-import openai
+
+from .document_extraction import GPT_PROMPT_MAX_CHARS
+from .openai_client_pool import OpenAIClientPool
+from ..utils.parse_cache import ParseCache, get_parse_cache, prompt_version
 
 # Configuration logging
 logger = logging.getLogger(__name__)
@@ -57,6 +61,52 @@ class JobData:
     salary_range: Dict[str, int]
     remote_policy: str
 
+# === PROMPTS D'EXTRACTION (versionnés dans les clés du cache de parsing) ===
+
+CV_SYSTEM_PROMPT = "Tu es un expert en extraction de données CV. Réponds uniquement en JSON valide."
+
+CV_EXTRACTION_PROMPT = """
+            Extrait les informations suivantes du CV en format JSON strict :
+            {
+                "name": "Prénom Nom",
+                "email": "email@example.com", 
+                "phone": "numéro",
+                "skills": ["compétence1", "compétence2"],
+                "years_of_experience": 5,
+                "education": "formation principale",
+                "job_titles": ["poste1", "poste2"],
+                "companies": ["entreprise1", "entreprise2"],
+                "location": "ville, pays",
+                "summary": "résumé professionnel",
+                "objective": "objectif professionnel",
+                "languages": ["langue1", "langue2"],
+                "certifications": ["cert1", "cert2"]
+            }
+            
+            CV à analyser :
+            """
+
+JOB_SYSTEM_PROMPT = "Tu es un expert en extraction de données d'offres d'emploi. Réponds uniquement en JSON valide."
+
+JOB_EXTRACTION_PROMPT = """
+            Extrait les informations suivantes de l'offre d'emploi en format JSON strict :
+            {
+                "title": "Titre du poste",
+                "company": "Nom entreprise",
+                "location": "ville, pays",
+                "contract_type": "CDI/CDD/Stage/Freelance",
+                "required_skills": ["compétence1", "compétence2"],
+                "preferred_skills": ["compétence optionnelle"],
+                "responsibilities": ["responsabilité1", "responsabilité2"],
+                "requirements": ["exigence1", "exigence2"],
+                "benefits": ["avantage1", "avantage2"],
+                "salary_range": {"min": 45000, "max": 55000},
+                "remote_policy": "Sur site/Hybride/Remote"
+            }
+            
+            Offre d'emploi à analyser :
+            """
+
 class GPTDirectService:
     """
     🚀 SERVICE GPT DIRECT UNIFIÉ
@@ -69,16 +119,50 @@ class GPTDirectService:
     - ✅ Performance < 2000ms objectif
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client_pool: Optional[OpenAIClientPool] = None,
+        base_url: Optional[str] = None,
+        cv_parse_cache: Optional[ParseCache] = None,
+        job_parse_cache: Optional[ParseCache] = None
+    ):
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
         # Configuration OpenAI
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if self.api_key:
-            openai.api_key = self.api_key
-            self.logger.info("✅ OpenAI API key configured")
+        self.client_pool = client_pool
+        
+        if self.client_pool is None and self.api_key:
+            self.client_pool = OpenAIClientPool(
+                api_key=self.api_key,
+                base_url=base_url or os.getenv("OPENAI_BASE_URL"),
+                max_concurrency=int(os.getenv("OPENAI_MAX_CONCURRENCY", "8")),
+                request_timeout=float(os.getenv("OPENAI_REQUEST_TIMEOUT", "30")),
+                requests_per_minute=int(os.getenv("OPENAI_RPM_LIMIT", "500")),
+                tokens_per_minute=int(os.getenv("OPENAI_TPM_LIMIT", "40000"))
+            )
+        
+        if self.client_pool is not None:
+            self.logger.info("✅ OpenAI async client pool configured")
         else:
             self.logger.warning("⚠️ No OpenAI API key found, fallback mode only")
+        
+        # Cache de parsing adressé par contenu (clé = texte normalisé + version prompt/modèle)
+        model = self.client_pool.model if self.client_pool is not None else "gpt-4"
+        self.cv_parse_cache = cv_parse_cache or get_parse_cache(
+            "cv_direct", prompt_version("3.2.1", model, CV_SYSTEM_PROMPT, CV_EXTRACTION_PROMPT), CVData
+        )
+        self.job_parse_cache = job_parse_cache or get_parse_cache(
+            "job_direct", prompt_version("3.2.1", model, JOB_SYSTEM_PROMPT, JOB_EXTRACTION_PROMPT), JobData
+        )
+    
+    def invalidate_parse_cache(self, all_versions: bool = False) -> Dict[str, int]:
+        """🧹 Invalidation du cache de parsing (après modification des prompts)"""
+        return {
+            "cv": self.cv_parse_cache.invalidate(all_versions=all_versions),
+            "job": self.job_parse_cache.invalidate(all_versions=all_versions)
+        }
     
     async def parse_cv_direct(self, cv_content: str) -> CVData:
         """
@@ -90,58 +174,12 @@ class GPTDirectService:
         start_time = time.time()
         
         try:
-            if not self.api_key:
+            if self.client_pool is None:
                 self.logger.info("📄 No API key, using fallback CV parsing")
                 return self._create_fallback_cv_data(cv_content)
             
-            # === GPT-4 EXTRACTION RÉELLE ===
-            prompt = """
-            Extrait les informations suivantes du CV en format JSON strict :
-            {
-                "name": "Prénom Nom",
-                "email": "email@example.com", 
-                "phone": "numéro",
-                "skills": ["compétence1", "compétence2"],
-                "years_of_experience": 5,
-                "education": "formation principale",
-                "job_titles": ["poste1", "poste2"],
-                "companies": ["entreprise1", "entreprise2"],
-                "location": "ville, pays",
-                "summary": "résumé professionnel",
-                "objective": "objectif professionnel",
-                "languages": ["langue1", "langue2"],
-                "certifications": ["cert1", "cert2"]
-            }
-            
-            CV à analyser :
-            """ + cv_content[:3000]  # Limite pour éviter token overflow
-            
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "Tu es un expert en extraction de données CV. Réponds uniquement en JSON valide."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=1000
-            )
-            
-            # Parse réponse GPT
-            gpt_response = response.choices[0].message.content.strip()
-            
-            # Nettoyage réponse (enlever markdown si présent)
-            if gpt_response.startswith("```json"):
-                gpt_response = gpt_response[7:-3]
-            elif gpt_response.startswith("```"):
-                gpt_response = gpt_response[3:-3]
-            
-            cv_data_dict = json.loads(gpt_response)
-            
-            # Validation et nettoyage
-            cv_data_dict = self._validate_cv_data(cv_data_dict)
-            
-            # Création CVData
-            cv_data = CVData(**cv_data_dict)
+            # === GPT-4 EXTRACTION (cache de parsing + single-flight) ===
+            cv_data = await self.cv_parse_cache.aget_or_parse(cv_content, self._parse_cv_with_gpt)
             
             processing_time = (time.time() - start_time) * 1000
             self.logger.info(f"✅ CV GPT parsing completed in {processing_time:.2f}ms: {cv_data.name}")
@@ -163,56 +201,12 @@ class GPTDirectService:
         start_time = time.time()
         
         try:
-            if not self.api_key:
+            if self.client_pool is None:
                 self.logger.info("💼 No API key, using fallback job parsing")
                 return self._create_fallback_job_data(job_content)
             
-            # === GPT-4 EXTRACTION RÉELLE ===
-            prompt = """
-            Extrait les informations suivantes de l'offre d'emploi en format JSON strict :
-            {
-                "title": "Titre du poste",
-                "company": "Nom entreprise",
-                "location": "ville, pays",
-                "contract_type": "CDI/CDD/Stage/Freelance",
-                "required_skills": ["compétence1", "compétence2"],
-                "preferred_skills": ["compétence optionnelle"],
-                "responsibilities": ["responsabilité1", "responsabilité2"],
-                "requirements": ["exigence1", "exigence2"],
-                "benefits": ["avantage1", "avantage2"],
-                "salary_range": {"min": 45000, "max": 55000},
-                "remote_policy": "Sur site/Hybride/Remote"
-            }
-            
-            Offre d'emploi à analyser :
-            """ + job_content[:3000]  # Limite pour éviter token overflow
-            
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "Tu es un expert en extraction de données d'offres d'emploi. Réponds uniquement en JSON valide."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=1000
-            )
-            
-            # Parse réponse GPT
-            gpt_response = response.choices[0].message.content.strip()
-            
-            # Nettoyage réponse (enlever markdown si présent)
-            if gpt_response.startswith("```json"):
-                gpt_response = gpt_response[7:-3]
-            elif gpt_response.startswith("```"):
-                gpt_response = gpt_response[3:-3]
-            
-            job_data_dict = json.loads(gpt_response)
-            
-            # Validation et nettoyage
-            job_data_dict = self._validate_job_data(job_data_dict)
-            
-            # Création JobData
-            job_data = JobData(**job_data_dict)
+            # === GPT-4 EXTRACTION (cache de parsing + single-flight) ===
+            job_data = await self.job_parse_cache.aget_or_parse(job_content, self._parse_job_with_gpt)
             
             processing_time = (time.time() - start_time) * 1000
             self.logger.info(f"✅ Job GPT parsing completed in {processing_time:.2f}ms: {job_data.title}")
@@ -224,6 +218,42 @@ class GPTDirectService:
             self.logger.warning(f"⚠️ GPT Job parsing failed ({processing_time:.2f}ms): {e}")
             return self._create_fallback_job_data(job_content)
     
+    async def _parse_cv_with_gpt(self, cv_content: str) -> CVData:
+        """📄 Extraction GPT d'un CV (lève une exception en cas d'échec : rien n'est mis en cache)"""
+        prompt = CV_EXTRACTION_PROMPT + cv_content[:GPT_PROMPT_MAX_CHARS]  # Limite pour éviter token overflow
+        cv_data_dict = await self._complete_json(CV_SYSTEM_PROMPT, prompt)
+        
+        # Validation et nettoyage
+        return CVData(**self._validate_cv_data(cv_data_dict))
+    
+    async def _parse_job_with_gpt(self, job_content: str) -> JobData:
+        """💼 Extraction GPT d'une offre (lève une exception en cas d'échec : rien n'est mis en cache)"""
+        prompt = JOB_EXTRACTION_PROMPT + job_content[:GPT_PROMPT_MAX_CHARS]  # Limite pour éviter token overflow
+        job_data_dict = await self._complete_json(JOB_SYSTEM_PROMPT, prompt)
+        
+        # Validation et nettoyage
+        return JobData(**self._validate_job_data(job_data_dict))
+    
+    async def _complete_json(self, system_prompt: str, prompt: str) -> Dict[str, Any]:
+        """🤖 Appel GPT asynchrone via le pool et décodage de la réponse JSON"""
+        gpt_response = await self.client_pool.chat_completion(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.1,
+            max_tokens=1000
+        )
+        gpt_response = gpt_response.strip()
+        
+        # Nettoyage réponse (enlever markdown si présent)
+        if gpt_response.startswith("```json"):
+            gpt_response = gpt_response[7:-3]
+        elif gpt_response.startswith("```"):
+            gpt_response = gpt_response[3:-3]
+        
+        return json.loads(gpt_response)
+    
     def _validate_cv_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """🛡️ Validation et nettoyage données CV"""
         defaults = {
@@ -365,6 +395,11 @@ def get_gpt_service_status() -> Dict[str, Any]:
         "service": "GPT Direct Service",
         "version": "3.2.1",
         "api_key_configured": service.api_key is not None,
+        "client_pool": service.client_pool.get_stats() if service.client_pool else None,
+        "parse_cache": {
+            "cv": service.cv_parse_cache.get_stats(),
+            "job": service.job_parse_cache.get_stats()
+        },
         "timestamp": datetime.now().isoformat(),
         "fallback_available": True
     }
@@ -14,6 +14,8 @@ from typing import Dict, List, Tuple, Optional
 from enum import Enum
 from dataclasses import dataclass
 
+from nextvision.utils.text_signals import TextSignalMatcher, TextSignals, get_text_signal_matcher
+
 class HierarchicalLevel(Enum):
     """Niveaux hiérarchiques standardisés"""
     EXECUTIVE = 5    # PDG, DG, DAF, DRH
@@ -146,6 +148,22 @@ class HierarchicalDetector:
             r'salaire\s*:?\s*(\d+)(?:\s*000)?\s*€?',
             r'rémunération\s*:?\s*(\d+)(?:\s*000)?\s*€?'
         ]
+        
+        self.management_keywords = [
+            'encadrement', 'management', 'équipe', 'supervision', 'pilotage',
+            'coordination', 'formation', 'recrutement', 'évaluation',
+            'budget', 'planning', 'objectifs', 'reporting'
+        ]
+    
+    def _get_signal_matcher(self) -> TextSignalMatcher:
+        """Matcher compilé pour tous les niveaux (recompilé si les patterns ont été étendus)"""
+        keywords = {'management': self.management_keywords}
+        patterns = {}
+        for level, level_patterns in self.level_patterns.items():
+            patterns[f'{level.name}:titles'] = level_patterns.get('titles', [])
+            keywords[f'{level.name}:keywords'] = level_patterns.get('keywords', [])
+            keywords[f'{level.name}:responsibilities'] = level_patterns.get('responsibilities', [])
+        return get_text_signal_matcher(keywords, patterns, re.IGNORECASE)
 
     def detect_hierarchical_level(self, text: str, is_job_posting: bool = False) -> HierarchicalMatch:
         """
@@ -163,8 +181,11 @@ class HierarchicalDetector:
         highest_confidence = 0.0
         matched_keywords = []
         
+        # Un seul passage sur le texte pour tous les niveaux
+        signals = self._get_signal_matcher().scan(text_lower)
+        
         for level, patterns in self.level_patterns.items():
-            confidence, keywords = self._calculate_level_confidence(text_lower, patterns)
+            confidence, keywords = self._calculate_level_confidence(signals, level, patterns)
             
             if confidence > highest_confidence:
                 highest_confidence = confidence
@@ -178,7 +199,7 @@ class HierarchicalDetector:
         salary_range = self._extract_salary_range(text_lower)
         
         # Détection des indicateurs de management
-        management_indicators = self._detect_management_indicators(text_lower)
+        management_indicators = list(signals.found('management'))
         
         # Ajustement du niveau basé sur l'expérience (SEULEMENT pour les CV, pas les fiches de poste)
         if best_match and years_exp and not is_job_posting:
@@ -194,40 +215,32 @@ class HierarchicalDetector:
             keywords_found=matched_keywords
         )
     
-    def _calculate_level_confidence(self, text: str, patterns: Dict) -> Tuple[float, List[str]]:
+    def _calculate_level_confidence(self, signals: TextSignals, level: HierarchicalLevel,
+                                    patterns: Dict) -> Tuple[float, List[str]]:
         """Calcule le score de confiance pour un niveau donné"""
         total_score = 0.0
         found_keywords = []
         
         # Vérification des titres (poids: 0.6 - plus important)
-        title_matches = 0
-        for title_pattern in patterns.get('titles', []):
-            if re.search(title_pattern, text, re.IGNORECASE):
-                title_matches += 1
-                found_keywords.append(title_pattern)
+        titles = signals.found(f'{level.name}:titles')
+        found_keywords.extend(titles)
         
-        if patterns.get('titles') and title_matches > 0:
+        if patterns.get('titles') and titles:
             total_score += 0.6
         
         # Vérification des mots-clés (poids: 0.25)
-        keyword_score = 0
-        for keyword in patterns.get('keywords', []):
-            if keyword in text:
-                keyword_score += 1
-                found_keywords.append(keyword)
+        keywords = signals.found(f'{level.name}:keywords')
+        found_keywords.extend(keywords)
         
         if patterns.get('keywords'):
-            total_score += (keyword_score / len(patterns['keywords'])) * 0.25
+            total_score += (len(keywords) / len(patterns['keywords'])) * 0.25
         
         # Vérification des responsabilités (poids: 0.15)
-        resp_score = 0
-        for resp in patterns.get('responsibilities', []):
-            if resp in text:
-                resp_score += 1
-                found_keywords.append(resp)
+        responsibilities = signals.found(f'{level.name}:responsibilities')
+        found_keywords.extend(responsibilities)
         
         if patterns.get('responsibilities'):
-            total_score += (resp_score / len(patterns['responsibilities'])) * 0.15
+            total_score += (len(responsibilities) / len(patterns['responsibilities'])) * 0.15
         
         return min(total_score, 1.0), found_keywords
     
@@ -261,18 +274,7 @@ class HierarchicalDetector:
     
     def _detect_management_indicators(self, text: str) -> List[str]:
         """Détecte les indicateurs de management"""
-        management_keywords = [
-            'encadrement', 'management', 'équipe', 'supervision', 'pilotage',
-            'coordination', 'formation', 'recrutement', 'évaluation',
-            'budget', 'planning', 'objectifs', 'reporting'
-        ]
-        
-        found_indicators = []
-        for keyword in management_keywords:
-            if keyword in text:
-                found_indicators.append(keyword)
-        
-        return found_indicators
+        return [keyword for keyword in self.management_keywords if keyword in text]
     
     def _adjust_level_by_experience(self, base_level: HierarchicalLevel, years: int) -> HierarchicalLevel:
         """Ajuste le niveau en fonction de l'expérience (uniquement pour les CV)"""
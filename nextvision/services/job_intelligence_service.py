@@ -6,16 +6,24 @@ Performance optimisée pour l'intégration NEXTVISION
 """
 
 from typing import Dict, List, Any, Optional, Tuple
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 import asyncio
 import json
-import hashlib
+import time
 
 from nextvision.services.gpt_direct_service import JobData, CVData
+from nextvision.utils.parse_cache import ParseCache, get_parse_cache, normalize_document_text, prompt_version
+from nextvision.utils.text_signals import TextSignals, get_text_signal_matcher
+
+# À incrémenter si les règles d'analyse changent (les listes de mots-clés sont
+# déjà incluses dans la version du cache)
+JOB_INTELLIGENCE_VERSION = "1.1"
 
 
 class JobIntelligenceSignals(BaseModel):
-    """Signaux d'intelligence extraits du job pour enrichir le matching"""
+    """Signaux d'intelligence extraits du job pour enrichir le matching (figés : partagés via le cache)"""
+    
+    model_config = ConfigDict(frozen=True)
     
     # Signaux culturels
     culture_type: str = "standard"  # startup, corporate, scale-up, traditional
@@ -24,7 +32,7 @@ class JobIntelligenceSignals(BaseModel):
     
     # Signaux d'évolution
     growth_potential: float = 0.5  # 0-1
-    learning_opportunities: List[str] = []
+    learning_opportunities: Tuple[str, ...] = ()
     leadership_potential: float = 0.5  # 0-1
     
     # Signaux de flexibilité
@@ -42,9 +50,7 @@ class JobIntelligenceService:
     Service d'analyse intelligente des jobs pour enrichir le scoring motivationnel
     """
     
-    def __init__(self):
-        self.analysis_cache: Dict[str, JobIntelligenceSignals] = {}
-        
+    def __init__(self, analysis_cache: Optional[ParseCache] = None):
         # Patterns pré-définis pour analyse rapide
         self.culture_patterns = {
             "startup": [
@@ -71,6 +77,66 @@ class JobIntelligenceService:
             "télétravail", "remote", "hybride", "flexible", "autonomie",
             "horaires", "souplesse", "work-life", "balance", "congés"
         ]
+        
+        self.innovation_keywords = [
+            "innovation", "ia", "ai", "machine learning", "r&d", "recherche",
+            "cutting-edge", "disruptif", "transformation", "digital", "tech"
+        ]
+        
+        self.team_size_indicators = {
+            "small": ["startup", "small team", "petite équipe", "agile"],
+            "large": ["multinational", "groupe", "enterprise", "siège"]
+        }
+        
+        self.learning_keywords = {
+            "formation": "Formation continue",
+            "certification": "Certifications",
+            "mentoring": "Mentoring",
+            "coaching": "Coaching",
+            "expertise": "Développement expertise",
+            "technologies": "Nouvelles technologies",
+            "projets": "Projets innovants"
+        }
+        
+        self.leadership_keywords = [
+            "management", "équipe", "responsabilités", "leadership",
+            "encadrement", "coordination", "pilotage", "direction"
+        ]
+        
+        self.remote_keywords = ["télétravail", "remote", "hybride", "distance"]
+        self.full_remote_keywords = ["100% télétravail", "full remote"]
+        
+        self.balance_keywords = [
+            "work-life", "équilibre", "congés", "vacances", "souplesse",
+            "horaires flexibles", "rtt", "temps partiel"
+        ]
+        
+        self.autonomy_keywords = [
+            "autonomie", "indépendant", "initiative", "créativité",
+            "liberté", "flexible", "self-managed"
+        ]
+        
+        # Toutes les listes compilées en un seul matcher : un passage par offre
+        self.signal_matcher = get_text_signal_matcher({
+            **{f"culture:{culture}": patterns for culture, patterns in self.culture_patterns.items()},
+            "innovation": self.innovation_keywords,
+            **{f"team:{size}": indicators for size, indicators in self.team_size_indicators.items()},
+            "growth": self.growth_indicators,
+            "learning": list(self.learning_keywords),
+            "leadership": self.leadership_keywords,
+            "remote": self.remote_keywords,
+            "remote:full": self.full_remote_keywords,
+            "balance": self.balance_keywords,
+            "autonomy": self.autonomy_keywords
+        })
+        
+        # Cache par empreinte du texte de l'offre : L1 LRU borné avec TTL,
+        # L2 Redis/SQLite optionnel, single-flight (une analyse par offre)
+        self.analysis_cache = analysis_cache or get_parse_cache(
+            "job_intelligence",
+            prompt_version(JOB_INTELLIGENCE_VERSION, self.signal_matcher.keywords, self.learning_keywords),
+            JobIntelligenceSignals
+        )
     
     async def analyze_job_intelligence(
         self,
@@ -82,52 +148,56 @@ class JobIntelligenceService:
         
         Args:
             job_data: Données du job à analyser
-            cache_key: Clé de cache pour optimisation
+            cache_key: Conservé pour compatibilité (la clé est toujours
+                l'empreinte du contenu, cf. get_cache_key)
             
         Returns:
-            Signaux d'intelligence extraits
+            Signaux d'intelligence extraits (instance figée, partagée par le cache)
         """
-        import time
         start_time = time.perf_counter()
+        full_text = self._get_analysis_text(job_data)
         
-        # Vérification cache
-        if cache_key and cache_key in self.analysis_cache:
-            cached_result = self.analysis_cache[cache_key]
-            cached_result.processing_time_ms = (time.perf_counter() - start_time) * 1000
-            return cached_result
+        async def analyze(text: str) -> JobIntelligenceSignals:
+            return self._analyze_text(text)
         
-        # Extraction du texte complet
-        full_text = self._extract_full_job_text(job_data).lower()
+        signals = await self.analysis_cache.aget_or_parse(full_text, analyze)
         
-        # Analyse des signaux
-        signals = JobIntelligenceSignals()
-        
-        # 1. Analyse culturelle
-        signals.culture_type = self._analyze_culture_type(full_text)
-        signals.innovation_level = self._analyze_innovation_level(full_text)
-        signals.team_size_indication = self._analyze_team_size(full_text)
+        # Temps de traitement de cet appel (l'instance en cache n'est jamais modifiée)
+        return signals.model_copy(update={"processing_time_ms": (time.perf_counter() - start_time) * 1000})
+    
+    def _get_analysis_text(self, job_data: JobData) -> str:
+        """Texte analysé (normalisé, minuscules) : seule entrée de l'analyse"""
+        return normalize_document_text(self._extract_full_job_text(job_data)).lower()
+    
+    def _analyze_text(self, full_text: str) -> JobIntelligenceSignals:
+        """Analyse d'un texte normalisé"""
+        start_time = time.perf_counter()
         
-        # 2. Analyse d'évolution
-        signals.growth_potential = self._analyze_growth_potential(full_text)
-        signals.learning_opportunities = self._extract_learning_opportunities(full_text)
-        signals.leadership_potential = self._analyze_leadership_potential(full_text)
+        # Un seul passage sur le texte pour toutes les listes de mots-clés
+        hits = self.signal_matcher.scan(full_text)
         
-        # 3. Analyse de flexibilité
-        signals.remote_flexibility = self._analyze_remote_flexibility(full_text)
-        signals.work_life_balance = self._analyze_work_life_balance(full_text)
-        signals.autonomy_level = self._analyze_autonomy_level(full_text)
+        signals = JobIntelligenceSignals(
+            # 1. Analyse culturelle
+            culture_type=self._analyze_culture_type(hits),
+            innovation_level=self._analyze_innovation_level(hits),
+            team_size_indication=self._analyze_team_size(hits),
+            
+            # 2. Analyse d'évolution
+            growth_potential=self._analyze_growth_potential(hits),
+            learning_opportunities=self._extract_learning_opportunities(hits),
+            leadership_potential=self._analyze_leadership_potential(hits),
+            
+            # 3. Analyse de flexibilité
+            remote_flexibility=self._analyze_remote_flexibility(hits),
+            work_life_balance=self._analyze_work_life_balance(hits),
+            autonomy_level=self._analyze_autonomy_level(hits)
+        )
         
         # 4. Score de confiance
-        signals.confidence_score = self._calculate_confidence_score(full_text, signals)
-        
-        # Temps de traitement
-        signals.processing_time_ms = (time.perf_counter() - start_time) * 1000
-        
-        # Cache pour optimisation
-        if cache_key:
-            self.analysis_cache[cache_key] = signals
-        
-        return signals
+        return signals.model_copy(update={
+            "confidence_score": self._calculate_confidence_score(full_text, signals),
+            "processing_time_ms": (time.perf_counter() - start_time) * 1000
+        })
     
     def _extract_full_job_text(self, job_data: JobData) -> str:
         """Extrait tout le texte disponible du job"""
@@ -148,13 +218,9 @@ class JobIntelligenceService:
         
         return " ".join(text_parts)
     
-    def _analyze_culture_type(self, text: str) -> str:
+    def _analyze_culture_type(self, hits: TextSignals) -> str:
         """Détermine le type de culture d'entreprise"""
-        scores = {}
-        
-        for culture, patterns in self.culture_patterns.items():
-            score = sum(1 for pattern in patterns if pattern in text)
-            scores[culture] = score
+        scores = {culture: hits.count(f"culture:{culture}") for culture in self.culture_patterns}
         
         if scores["startup"] > scores.get("corporate", 0):
             return "startup"
@@ -165,14 +231,9 @@ class JobIntelligenceService:
         else:
             return "standard"
     
-    def _analyze_innovation_level(self, text: str) -> str:
+    def _analyze_innovation_level(self, hits: TextSignals) -> str:
         """Évalue le niveau d'innovation"""
-        innovation_keywords = [
-            "innovation", "ia", "ai", "machine learning", "r&d", "recherche",
-            "cutting-edge", "disruptif", "transformation", "digital", "tech"
-        ]
-        
-        count = sum(1 for keyword in innovation_keywords if keyword in text)
+        count = hits.count("innovation")
         
         if count >= 4:
             return "cutting-edge"
@@ -183,13 +244,10 @@ class JobIntelligenceService:
         else:
             return "low"
     
-    def _analyze_team_size(self, text: str) -> str:
+    def _analyze_team_size(self, hits: TextSignals) -> str:
         """Estime la taille de l'équipe"""
-        small_indicators = ["startup", "small team", "petite équipe", "agile"]
-        large_indicators = ["multinational", "groupe", "enterprise", "siège"]
-        
-        small_count = sum(1 for indicator in small_indicators if indicator in text)
-        large_count = sum(1 for indicator in large_indicators if indicator in text)
+        small_count = hits.count("team:small")
+        large_count = hits.count("team:large")
         
         if large_count > small_count:
             return "large"
@@ -198,73 +256,35 @@ class JobIntelligenceService:
         else:
             return "medium"
     
-    def _analyze_growth_potential(self, text: str) -> float:
+    def _analyze_growth_potential(self, hits: TextSignals) -> float:
         """Calcule le potentiel d'évolution (0-1)"""
-        count = sum(1 for indicator in self.growth_indicators if indicator in text)
-        return min(count / len(self.growth_indicators) * 2, 1.0)
+        return min(hits.count("growth") / len(self.growth_indicators) * 2, 1.0)
     
-    def _extract_learning_opportunities(self, text: str) -> List[str]:
+    def _extract_learning_opportunities(self, hits: TextSignals) -> List[str]:
         """Extrait les opportunités d'apprentissage"""
-        opportunities = []
-        
-        learning_keywords = {
-            "formation": "Formation continue",
-            "certification": "Certifications",
-            "mentoring": "Mentoring",
-            "coaching": "Coaching",
-            "expertise": "Développement expertise",
-            "technologies": "Nouvelles technologies",
-            "projets": "Projets innovants"
-        }
-        
-        for keyword, opportunity in learning_keywords.items():
-            if keyword in text:
-                opportunities.append(opportunity)
-        
-        return opportunities
+        return [self.learning_keywords[keyword] for keyword in hits.found("learning")]
     
-    def _analyze_leadership_potential(self, text: str) -> float:
+    def _analyze_leadership_potential(self, hits: TextSignals) -> float:
         """Évalue le potentiel de leadership (0-1)"""
-        leadership_keywords = [
-            "management", "équipe", "responsabilités", "leadership",
-            "encadrement", "coordination", "pilotage", "direction"
-        ]
-        
-        count = sum(1 for keyword in leadership_keywords if keyword in text)
-        return min(count / len(leadership_keywords) * 2, 1.0)
+        return min(hits.count("leadership") / len(self.leadership_keywords) * 2, 1.0)
     
-    def _analyze_remote_flexibility(self, text: str) -> float:
+    def _analyze_remote_flexibility(self, hits: TextSignals) -> float:
         """Évalue la flexibilité télétravail (0-1)"""
-        remote_keywords = ["télétravail", "remote", "hybride", "distance"]
-        count = sum(1 for keyword in remote_keywords if keyword in text)
-        
         # Boost si explicitement mentionné
-        if "100% télétravail" in text or "full remote" in text:
+        if hits.count("remote:full"):
             return 1.0
-        elif count > 0:
+        elif hits.count("remote") > 0:
             return 0.7
         else:
             return 0.3
     
-    def _analyze_work_life_balance(self, text: str) -> float:
+    def _analyze_work_life_balance(self, hits: TextSignals) -> float:
         """Évalue l'équilibre vie-travail (0-1)"""
-        balance_keywords = [
-            "work-life", "équilibre", "congés", "vacances", "souplesse",
-            "horaires flexibles", "rtt", "temps partiel"
-        ]
-        
-        count = sum(1 for keyword in balance_keywords if keyword in text)
-        return min(count / len(balance_keywords) * 3, 1.0)
+        return min(hits.count("balance") / len(self.balance_keywords) * 3, 1.0)
     
-    def _analyze_autonomy_level(self, text: str) -> float:
+    def _analyze_autonomy_level(self, hits: TextSignals) -> float:
         """Évalue le niveau d'autonomie (0-1)"""
-        autonomy_keywords = [
-            "autonomie", "indépendant", "initiative", "créativité",
-            "liberté", "flexible", "self-managed"
-        ]
-        
-        count = sum(1 for keyword in autonomy_keywords if keyword in text)
-        return min(count / len(autonomy_keywords) * 2, 1.0)
+        return min(hits.count("autonomy") / len(self.autonomy_keywords) * 2, 1.0)
     
     def _calculate_confidence_score(
         self,
@@ -288,13 +308,16 @@ class JobIntelligenceService:
         return (text_length_factor + signals_factor) / 2
     
     def get_cache_key(self, job_data: JobData) -> str:
-        """Génère une clé de cache unique pour le job"""
-        job_text = self._extract_full_job_text(job_data)
-        return hashlib.md5(job_text.encode()).hexdigest()[:16]
+        """Clé de cache du job : empreinte de son contenu (+ version de l'analyse)"""
+        return self.analysis_cache.compute_key(self._get_analysis_text(job_data))
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Statistiques du cache d'analyse"""
+        return self.analysis_cache.get_stats()
     
     def clear_cache(self):
-        """Vide le cache pour libérer la mémoire"""
-        self.analysis_cache.clear()
+        """Vide le cache mémoire pour libérer la mémoire (niveau 2 partagé conservé)"""
+        self.analysis_cache.clear_l1()
 
 
 # Instance globale pour réutilisation
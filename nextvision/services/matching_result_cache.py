@@ -0,0 +1,254 @@
+"""
+🗄️ Nextvision - Cache de résultats du matching bidirectionnel
+
+Cache borné et partagé pour BiDirectionalMatcher :
+- Niveau partagé : CacheManager.matching_cache (mémoire L1 + Redis) si injecté
+- Sinon LRU local borné avec TTL (par processus)
+- Réponses stockées en JSON compressé (zlib)
+- Clés : identité des profils + empreinte de leur contenu ; les entrées d'un
+  profil modifié sont invalidées
+- Taux de hit par endpoint
+
+Author: NEXTEN Team
+Version: 1.0.0 - Shared Matching Cache
+"""
+
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import nextvision_logging as logging
+
+from nextvision.models.bidirectional_models import (
+    BiDirectionalCandidateProfile, BiDirectionalCompanyProfile,
+    BiDirectionalMatchingRequest, BiDirectionalMatchingResponse
+)
+from nextvision.utils.fingerprint import digest, fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Aligné sur TTLPolicy.MEDIUM (namespace "matching" de CacheManager)
+MATCHING_CACHE_TTL = 1800
+
+# Options de requête qui ne changent pas le résultat
+_NON_SCORING_FIELDS = {"candidat", "entreprise", "force_adaptive_weighting", "matching_id", "timestamp"}
+
+
+def encode_response(response: BiDirectionalMatchingResponse) -> bytes:
+    """JSON compressé (≈ 4x plus compact que pickle sur une réponse complète)"""
+    return zlib.compress(response.model_dump_json().encode(), 6)
+
+
+def decode_response(raw: bytes) -> BiDirectionalMatchingResponse:
+    return BiDirectionalMatchingResponse.model_validate_json(zlib.decompress(raw))
+
+
+def candidate_identity(candidat: BiDirectionalCandidateProfile) -> str:
+    """Identifiant stable d'un candidat (indépendant du contenu du profil)"""
+    info = candidat.personal_info
+    identity = info.email.strip().lower() or f"{info.firstName} {info.lastName}".lower()
+    return digest(identity.encode())
+
+
+def company_identity(entreprise: BiDirectionalCompanyProfile) -> str:
+    """Identifiant stable d'une offre (entreprise + intitulé, lieu et contrat du poste)
+
+    Pas d'identifiant d'offre dans le profil : lieu et contrat distinguent les
+    offres d'un même intitulé, sans quoi elles s'invalident mutuellement.
+    """
+    poste = entreprise.poste
+    identity = "|".join([
+        entreprise.entreprise.nom, poste.titre, poste.localisation,
+        getattr(poste.type_contrat, "value", str(poste.type_contrat))
+    ]).strip().lower()
+    return digest(identity.encode())
+
+
+class LocalMatchingCache:
+    """💾 LRU local borné avec TTL (même interface que CacheManager pour le matching)"""
+
+    def __init__(self, max_entries: int = 2048, ttl_seconds: int = MATCHING_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[Any, float]]" = OrderedDict()
+        self.evictions = 0
+
+    async def matching_cache(
+        self,
+        candidate_id: str,
+        job_id: str,
+        matching_func: Callable,
+        context: Optional[Dict[str, Any]] = None,
+        encode: Optional[Callable[[Any], bytes]] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
+        force_refresh: bool = False
+    ) -> Any:
+        context = context or {}
+        key = (candidate_id, job_id, fingerprint(context))
+
+        entry = None if force_refresh else self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                return decode(value) if decode else value
+            del self._entries[key]
+
+        result = await matching_func(candidate_id, job_id, **context)
+        self._entries[key] = (encode(result) if encode else result, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    async def invalidate_matching(self, candidate_id: Optional[str] = None, job_id: Optional[str] = None) -> int:
+        if candidate_id is None and job_id is None:
+            return 0
+        stale = [
+            key for key in self._entries
+            if (candidate_id is None or key[0] == candidate_id) and (job_id is None or key[1] == job_id)
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict:
+        return {
+            "backend": "local",
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "ttl_seconds": self.ttl_seconds
+        }
+
+
+class MatchingResultCache:
+    """🎯 Cache des réponses de matching (local ou partagé via CacheManager)"""
+
+    def __init__(
+        self,
+        cache_manager=None,
+        max_local_entries: int = 2048,
+        ttl_seconds: int = MATCHING_CACHE_TTL,
+        max_tracked_profiles: int = 10000
+    ):
+        # Instance de nextvision.cache.CacheManager (injectée), sinon LRU local
+        self.backend = cache_manager if cache_manager is not None else LocalMatchingCache(
+            max_local_entries, ttl_seconds
+        )
+        self.max_tracked_profiles = max_tracked_profiles
+
+        # Dernière empreinte de contenu vue par profil (détection des modifications)
+        self._profile_versions: "OrderedDict[str, str]" = OrderedDict()
+
+        self.endpoint_stats: Dict[str, Dict[str, int]] = {}
+        self.stats = {"invalidations": 0, "invalidated_entries": 0}
+
+    async def get_or_compute(
+        self,
+        request: BiDirectionalMatchingRequest,
+        compute: Callable[[str, str], Awaitable[BiDirectionalMatchingResponse]],
+        endpoint: str = "default",
+        force_refresh: bool = False
+    ) -> Tuple[BiDirectionalMatchingResponse, bool]:
+        """Retourne (réponse, hit) ; `compute(empreinte candidat, empreinte offre)` n'est appelé qu'en cas de miss"""
+        candidate_id = candidate_identity(request.candidat)
+        job_id = company_identity(request.entreprise)
+        candidate_version = fingerprint(request.candidat)
+        job_version = fingerprint(request.entreprise)
+
+        await self._track_version(f"c{candidate_id}", candidate_version, candidate_id=candidate_id)
+        await self._track_version(f"j{job_id}", job_version, job_id=job_id)
+
+        computed = False
+
+        async def matching_func(*_args, **_context):
+            nonlocal computed
+            computed = True
+            return await compute(candidate_version, job_version)
+
+        context = {
+            "candidat": candidate_version,
+            "entreprise": job_version,
+            "options": request.model_dump(mode="json", exclude=_NON_SCORING_FIELDS)
+        }
+        response = await self.backend.matching_cache(
+            candidate_id, job_id, matching_func, context,
+            encode=encode_response, decode=decode_response, force_refresh=force_refresh
+        )
+
+        counters = self.endpoint_stats.setdefault(endpoint, {"hits": 0, "misses": 0})
+        counters["misses" if computed else "hits"] += 1
+        return response, not computed
+
+    async def _track_version(self, profile_key: str, version: str, **invalidate_kwargs):
+        """Invalide les résultats d'un profil dont le contenu a changé"""
+        previous = self._profile_versions.get(profile_key)
+        self._profile_versions[profile_key] = version
+        self._profile_versions.move_to_end(profile_key)
+        if len(self._profile_versions) > self.max_tracked_profiles:
+            self._profile_versions.popitem(last=False)
+
+        if previous is not None and previous != version:
+            await self._invalidate(**invalidate_kwargs)
+
+    async def _invalidate(self, candidate_id: Optional[str] = None, job_id: Optional[str] = None) -> int:
+        try:
+            removed = await self.backend.invalidate_matching(candidate_id=candidate_id, job_id=job_id)
+        except Exception as e:
+            logger.warning(f"⚠️ Invalidation cache matching impossible: {e}")
+            return 0
+        self.stats["invalidations"] += 1
+        self.stats["invalidated_entries"] += removed
+        logger.debug(f"🧹 Profil modifié : {removed} résultats de matching invalidés")
+        return removed
+
+    async def invalidate_candidate(self, candidat: BiDirectionalCandidateProfile) -> int:
+        """🧹 Invalide tous les résultats d'un candidat (ex: profil mis à jour)"""
+        return await self._invalidate(candidate_id=candidate_identity(candidat))
+
+    async def invalidate_company(self, entreprise: BiDirectionalCompanyProfile) -> int:
+        """🧹 Invalide tous les résultats d'une offre"""
+        return await self._invalidate(job_id=company_identity(entreprise))
+
+    def clear(self):
+        """Vide le cache local et les compteurs (le niveau partagé expire par TTL)"""
+        if isinstance(self.backend, LocalMatchingCache):
+            self.backend.clear()
+        self._profile_versions.clear()
+        self.endpoint_stats.clear()
+
+    @property
+    def size(self) -> int:
+        if isinstance(self.backend, LocalMatchingCache):
+            return len(self.backend)
+        memory_cache = getattr(self.backend.cache, "memory_cache", None)
+        return len(memory_cache.namespaces.get("matching", {})) if memory_cache else 0
+
+    def get_stats(self) -> Dict:
+        endpoints = {}
+        for endpoint, counters in self.endpoint_stats.items():
+            total = counters["hits"] + counters["misses"]
+            endpoints[endpoint] = {
+                **counters,
+                "hit_rate_percent": round(counters["hits"] / max(1, total) * 100, 2)
+            }
+        backend_stats = (
+            self.backend.get_stats() if isinstance(self.backend, LocalMatchingCache)
+            else {"backend": "cache_manager", "redis_connected": getattr(self.backend.cache, "is_connected", False)}
+        )
+        return {
+            **backend_stats,
+            "size": self.size,
+            "tracked_profiles": len(self._profile_versions),
+            **self.stats,
+            "endpoints": endpoints
+        }
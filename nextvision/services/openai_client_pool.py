@@ -0,0 +1,183 @@
+"""
+🤖 Nextvision - Pool client OpenAI asynchrone
+==============================================
+
+Accès non bloquant à l'API Chat Completions pour les services GPT :
+- ✅ Client AsyncOpenAI partagé (pool de connexions HTTP unique)
+- ✅ Concurrence bornée par sémaphore
+- ✅ Timeout par requête
+- ✅ Token buckets sur les requêtes/minute et les tokens/minute
+
+Author: NEXTEN Team
+Version: 1.0.0 - Async OpenAI Pool
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+import openai
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """🪣 Token bucket asynchrone (capacité rechargée en continu)"""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.total_wait_seconds = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+        self._updated_at = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Consomme `amount` unités, attend si nécessaire. Retourne l'attente (s)"""
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            wait = 0.0
+            if self._tokens < amount:
+                wait = (amount - self._tokens) / self.rate_per_second
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= amount
+            self.total_wait_seconds += wait
+            return wait
+
+    def refund(self, amount: float):
+        """Restitue des unités réservées mais non consommées (estimation trop haute)"""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + max(amount, 0.0))
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+
+class OpenAIClientPool:
+    """
+    🤖 POOL CLIENT OPENAI ASYNCHRONE
+    =================================
+
+    Toutes les requêtes GPT passent par ce pool : elles ne bloquent jamais
+    la boucle d'événements et respectent les quotas OpenAI du compte.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        model: str = "gpt-4",
+        max_concurrency: int = 8,
+        request_timeout: float = 30.0,
+        requests_per_minute: int = 500,
+        tokens_per_minute: int = 40000
+    ):
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.request_timeout = request_timeout
+
+        # Retries gérés par l'appelant (fallbacks) : pas de retry implicite du SDK
+        self._client = openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=request_timeout,
+            max_retries=0
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+
+        self._in_flight = 0
+        self.stats = {
+            "requests": 0,
+            "successes": 0,
+            "timeouts": 0,
+            "errors": 0,
+            "tokens_used": 0,
+            "peak_concurrency": 0,
+            "total_latency_ms": 0.0
+        }
+
+    @staticmethod
+    def estimate_tokens(messages: List[Dict[str, str]], max_tokens: int) -> int:
+        """Estimation grossière (≈ 4 caractères par token) + réponse maximale"""
+        prompt_chars = sum(len(message.get("content", "")) for message in messages)
+        return prompt_chars // 4 + max_tokens
+
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        model: Optional[str] = None
+    ) -> str:
+        """💬 Requête Chat Completions bornée (concurrence, quotas, timeout)"""
+
+        estimated_tokens = self.estimate_tokens(messages, max_tokens)
+        await self.request_bucket.acquire(1)
+        await self.token_bucket.acquire(estimated_tokens)
+
+        async with self._semaphore:
+            self._in_flight += 1
+            self.stats["requests"] += 1
+            self.stats["peak_concurrency"] = max(self.stats["peak_concurrency"], self._in_flight)
+            start_time = time.time()
+
+            try:
+                response = await asyncio.wait_for(
+                    self._client.chat.completions.create(
+                        model=model or self.model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens
+                    ),
+                    timeout=self.request_timeout
+                )
+            except asyncio.TimeoutError:
+                self.stats["timeouts"] += 1
+                self.token_bucket.refund(estimated_tokens)
+                raise
+            except Exception:
+                # Réservation restituée : les échecs ne drainent pas le quota des appels réussis
+                self.stats["errors"] += 1
+                self.token_bucket.refund(estimated_tokens)
+                raise
+            finally:
+                self._in_flight -= 1
+                self.stats["total_latency_ms"] += (time.time() - start_time) * 1000
+
+        # Ajustement du quota tokens sur la consommation réelle
+        usage = getattr(response, "usage", None)
+        if usage is not None and usage.total_tokens:
+            self.token_bucket.refund(estimated_tokens - usage.total_tokens)
+            self.stats["tokens_used"] += usage.total_tokens
+
+        self.stats["successes"] += 1
+        return response.choices[0].message.content or ""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """📊 Statistiques du pool"""
+        return {
+            **self.stats,
+            "average_latency_ms": self.stats["total_latency_ms"] / max(self.stats["requests"], 1),
+            "in_flight": self._in_flight,
+            "max_concurrency": self.max_concurrency,
+            "request_timeout": self.request_timeout,
+            "rate_limit_wait_seconds": (
+                self.request_bucket.total_wait_seconds + self.token_bucket.total_wait_seconds
+            )
+        }
+
+    async def close(self):
+        """🔌 Ferme les connexions HTTP du client"""
+        await self._client.close()
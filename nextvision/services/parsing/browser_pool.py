@@ -0,0 +1,335 @@
+"""
+🎭 Nextvision - Pool de contextes Playwright préchauffés (Commitment- parser)
+
+Chaque parsing réel lançait un Chromium neuf puis attendait des délais fixes
+(2 à 3 s) avant de lire le résultat :
+- Un seul navigateur, N contextes par page de parser, page déjà chargée
+- Attente événementielle : localStorage.setItem des clés de résultat est
+  relayé vers Python (plus de wait_for_timeout fixe)
+- Réinitialisation (clés effacées + rechargement) en arrière-plan après usage
+- Recyclage des contextes après `max_uses` parsings ou en cas d'erreur
+- Métriques de pool (attentes, démarrages à froid, recyclages, timeouts)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Warm Browser Pool
+"""
+
+import asyncio
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Clés localStorage écrites par les parsers Commitment-
+RESULT_KEYS: Tuple[str, ...] = ("lastCVParseResult", "lastJobParseResult")
+
+_RESULT_BINDING = "__nextvisionParseResult"
+
+# Relai de localStorage.setItem vers Python pour les clés de résultat
+_RESULT_HOOK_SCRIPT = """
+(() => {
+    const keys = %s;
+    const setItem = Storage.prototype.setItem;
+    Storage.prototype.setItem = function (key, value) {
+        setItem.apply(this, arguments);
+        if (keys.includes(key) && window.%s) {
+            window.%s(key, String(value));
+        }
+    };
+})();
+"""
+
+_CLEAR_RESULTS_SCRIPT = "keys => keys.forEach(key => localStorage.removeItem(key))"
+_READ_RESULTS_SCRIPT = """
+keys => {
+    for (const key of keys) {
+        const value = localStorage.getItem(key);
+        if (value !== null) return [key, value];
+    }
+    return null;
+}
+"""
+
+
+class PooledPage:
+    """🎭 Contexte navigateur + page de parser chargée"""
+
+    def __init__(self, url: str, context: Any, page: Any):
+        self.url = url
+        self.context = context
+        self.page = page
+        self.uses = 0
+        self._waiter: Optional[asyncio.Future] = None
+
+    def arm(self) -> asyncio.Future:
+        """Prépare l'attente du prochain résultat (avant l'action qui le déclenche)"""
+        self._waiter = asyncio.get_running_loop().create_future()
+        return self._waiter
+
+    def _on_result(self, key: str, value: str):
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result((key, value))
+
+
+class BrowserContextPool:
+    """
+    🎭 POOL DE CONTEXTES PLAYWRIGHT
+    ================================
+
+    `size` contextes au plus par URL de parser, partagés par toutes les
+    requêtes ; `acquire(url)` fournit une page chargée et prête.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_uses: int = 50,
+        acquire_timeout_seconds: float = 30.0,
+        page_timeout_seconds: float = 30.0,
+        result_keys: Sequence[str] = RESULT_KEYS,
+        browser_launcher: Optional[Callable[[], Awaitable[Any]]] = None
+    ):
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.acquire_timeout_seconds = acquire_timeout_seconds
+        self.page_timeout_seconds = page_timeout_seconds
+        self.result_keys = list(result_keys)
+        self._browser_launcher = browser_launcher or self._launch_chromium
+
+        self._playwright = None
+        self._browser = None
+        self._browser_lock = asyncio.Lock()
+        self._idle: Dict[str, asyncio.Queue] = {}
+        self._created: Dict[str, int] = {}
+        self._background: set = set()
+        self._closed = False
+
+        self.stats = {
+            "acquisitions": 0,
+            "warm_hits": 0,
+            "cold_starts": 0,
+            "waits": 0,
+            "contexts_created": 0,
+            "contexts_recycled": 0,
+            "contexts_discarded": 0,
+            "browser_launches": 0,
+            "results": 0,
+            "result_timeouts": 0,
+            "total_acquire_ms": 0.0,
+            "total_result_wait_ms": 0.0
+        }
+
+    # === NAVIGATEUR ===
+
+    async def _launch_chromium(self):
+        if not PLAYWRIGHT_AVAILABLE:
+            raise RuntimeError("Playwright non disponible")
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        return await self._playwright.chromium.launch(
+            headless=True,
+            args=['--no-sandbox', '--disable-setuid-sandbox']
+        )
+
+    async def _get_browser(self):
+        async with self._browser_lock:
+            if self._browser is not None and not self._browser.is_connected():
+                # Navigateur tombé : tous les contextes associés sont perdus
+                logger.warning("⚠️ Navigateur Playwright déconnecté - relance")
+                self._browser = None
+                self._idle.clear()
+                self._created.clear()
+            if self._browser is None:
+                self._browser = await self._browser_launcher()
+                self.stats["browser_launches"] += 1
+                logger.info("🎭 Navigateur Playwright lancé (pool)")
+            return self._browser
+
+    # === CONTEXTES ===
+
+    async def _create(self, url: str) -> PooledPage:
+        browser = await self._get_browser()
+        context = await browser.new_context()
+        try:
+            await context.add_init_script(
+                _RESULT_HOOK_SCRIPT % (json.dumps(self.result_keys), _RESULT_BINDING, _RESULT_BINDING)
+            )
+            page = await context.new_page()
+            slot = PooledPage(url, context, page)
+            await page.expose_function(_RESULT_BINDING, slot._on_result)
+            await page.goto(url, timeout=self.page_timeout_seconds * 1000)
+            await page.wait_for_selector('body', timeout=self.page_timeout_seconds * 1000)
+        except BaseException:
+            await self._close_context(context)
+            raise
+        self.stats["contexts_created"] += 1
+        return slot
+
+    @staticmethod
+    async def _close_context(context: Any):
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"Fermeture contexte Playwright: {e}")
+
+    async def start(self, urls: Sequence[str]):
+        """🔥 Préchauffage : `size` pages chargées par URL"""
+        for url in urls:
+            self._idle.setdefault(url, asyncio.Queue())
+            missing = self.size - self._created.get(url, 0)
+            if missing <= 0:
+                continue
+            self._created[url] = self._created.get(url, 0) + missing
+            results = await asyncio.gather(*[self._create(url) for _ in range(missing)], return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    self._created[url] -= 1
+                    logger.warning(f"⚠️ Préchauffage {url} échoué: {result}")
+                else:
+                    self._idle[url].put_nowait(result)
+        logger.info(f"🔥 Pool Playwright préchauffé: {self._created}")
+
+    async def _acquire(self, url: str) -> PooledPage:
+        idle = self._idle.setdefault(url, asyncio.Queue())
+        if not idle.empty():
+            self.stats["warm_hits"] += 1
+            return idle.get_nowait()
+
+        if self._created.get(url, 0) < self.size:
+            self._created[url] = self._created.get(url, 0) + 1
+            self.stats["cold_starts"] += 1
+            try:
+                return await self._create(url)
+            except BaseException:
+                self._created[url] -= 1
+                raise
+
+        self.stats["waits"] += 1
+        return await asyncio.wait_for(idle.get(), timeout=self.acquire_timeout_seconds)
+
+    @asynccontextmanager
+    async def acquire(self, url: str):
+        """📄 Page de parser prête ; rendue au pool (réinitialisée) en sortie"""
+        if self._closed:
+            raise RuntimeError("Pool Playwright fermé")
+
+        start_time = time.time()
+        slot = await self._acquire(url)
+        self.stats["acquisitions"] += 1
+        self.stats["total_acquire_ms"] += (time.time() - start_time) * 1000
+
+        failed = False
+        try:
+            yield slot
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            slot.uses += 1
+            slot._waiter = None
+            self._spawn(self._release(slot, discard=failed))
+
+    def _spawn(self, coroutine):
+        task = asyncio.ensure_future(coroutine)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _release(self, slot: PooledPage, discard: bool):
+        """Réinitialisation hors chemin critique (ou recyclage du contexte)"""
+        if not discard and not self._closed and slot.uses < self.max_uses:
+            try:
+                await slot.page.evaluate(_CLEAR_RESULTS_SCRIPT, self.result_keys)
+                await slot.page.reload(timeout=self.page_timeout_seconds * 1000)
+                self._idle.setdefault(slot.url, asyncio.Queue()).put_nowait(slot)
+                return
+            except Exception as e:
+                logger.warning(f"⚠️ Réinitialisation page {slot.url} échouée: {e}")
+                discard = True
+
+        await self._close_context(slot.context)
+        self._created[slot.url] = max(0, self._created.get(slot.url, 0) - 1)
+        self.stats["contexts_discarded" if discard else "contexts_recycled"] += 1
+        if self._closed:
+            return
+
+        # Remplacement préchauffé du contexte recyclé
+        try:
+            self._created[slot.url] = self._created.get(slot.url, 0) + 1
+            replacement = await self._create(slot.url)
+            self._idle.setdefault(slot.url, asyncio.Queue()).put_nowait(replacement)
+        except Exception as e:
+            self._created[slot.url] -= 1
+            logger.warning(f"⚠️ Remplacement contexte {slot.url} échoué: {e}")
+
+    # === RÉSULTATS ===
+
+    async def wait_for_result(self, slot: PooledPage, waiter: asyncio.Future,
+                              timeout_seconds: float) -> Optional[Any]:
+        """⏱️ Attend l'écriture d'une clé de résultat (JSON décodé), None si timeout"""
+        start_time = time.time()
+        try:
+            _, raw = await asyncio.wait_for(asyncio.shield(waiter), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            # Dernière lecture directe (écriture hors setItem, ex. localStorage[key] = ...)
+            found = await slot.page.evaluate(_READ_RESULTS_SCRIPT, self.result_keys)
+            if not found:
+                self.stats["result_timeouts"] += 1
+                return None
+            _, raw = found
+        finally:
+            self.stats["total_result_wait_ms"] += (time.time() - start_time) * 1000
+
+        self.stats["results"] += 1
+        return json.loads(raw)
+
+    # === ÉTAT ===
+
+    def get_stats(self) -> Dict[str, Any]:
+        """📊 Métriques du pool"""
+        acquisitions = max(self.stats["acquisitions"], 1)
+        return {
+            **self.stats,
+            "size_per_url": self.size,
+            "max_uses": self.max_uses,
+            "contexts": dict(self._created),
+            "idle": {url: queue.qsize() for url, queue in self._idle.items()},
+            "warm_hit_rate": self.stats["warm_hits"] / acquisitions,
+            "average_acquire_ms": self.stats["total_acquire_ms"] / acquisitions,
+            "average_result_wait_ms": self.stats["total_result_wait_ms"] / max(
+                self.stats["results"] + self.stats["result_timeouts"], 1
+            )
+        }
+
+    async def close(self):
+        """🔌 Fermeture des contextes, du navigateur et de Playwright"""
+        self._closed = True
+        for task in list(self._background):
+            task.cancel()
+        await asyncio.gather(*self._background, return_exceptions=True)
+
+        contexts: List[Any] = []
+        for queue in self._idle.values():
+            while not queue.empty():
+                contexts.append(queue.get_nowait().context)
+        await asyncio.gather(*[self._close_context(context) for context in contexts])
+        self._idle.clear()
+        self._created.clear()
+
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.debug(f"Fermeture navigateur Playwright: {e}")
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
@@ -16,7 +16,7 @@ import asyncio
 import json
 import nextvision_logging as logging
 import time
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Union, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict, field
 from enum import Enum
@@ -25,13 +25,6 @@ import re
 import os
 from pathlib import Path
 
-# Playwright pour automation web (optionnel)
-try:
-    from playwright.async_api import async_playwright, Browser, Page
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
-
 # Beautiful Soup pour parsing HTML
 try:
     from bs4 import BeautifulSoup
@@ -39,8 +32,14 @@ try:
 except ImportError:
     BEAUTIFULSOUP_AVAILABLE = False
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 # Imports Nextvision
 from nextvision.utils.file_utils import FileUtils
+from nextvision.services.document_extraction import get_document_extractor
+# Playwright pour automation web (optionnel, géré par le pool)
+from nextvision.services.parsing.browser_pool import PLAYWRIGHT_AVAILABLE, BrowserContextPool
 from nextvision.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -134,13 +133,20 @@ class CommitmentParsingBridge:
             'enable_real_parsing': True,
             'fallback_on_error': True,
             'max_retries': 3,
-            'retry_delay_seconds': 2
+            'retry_delay_seconds': 2,
+            # Pool de pages préchauffées (par URL de parser)
+            'browser_pool_size': 2,
+            'browser_context_max_uses': 50
         }
         
         # État du bridge
-        self.browser: Optional[Browser] = None
+        self.browser_pool: Optional[BrowserContextPool] = None
+        # Un seul démarrage du pool pour les premiers appels concurrents
+        self._browser_pool_lock = asyncio.Lock()
         self.stats = CommitmentBridgeStats()
         self.file_utils = FileUtils()
+        # Extraction PDF/DOCX hors boucle d'événements (pool de processus + cache partagés)
+        self.document_extractor = get_document_extractor()
         
         # Cache de sessions
         self.session_cache = {}
@@ -292,30 +298,23 @@ class CommitmentParsingBridge:
         """Parsing réel via Commitment- avec Playwright"""
         
         try:
-            # Initialisation browser si nécessaire
-            if not self.browser:
-                await self._init_browser()
-            
-            # Création page
-            page = await self.browser.new_page()
+            pool = await self._get_browser_pool()
+            parser_url = self.commitment_config['cv_parser_url'] if data_type == "cv" else self.commitment_config['job_parser_url']
             
-            try:
-                # Navigation vers parser
-                parser_url = self.commitment_config['cv_parser_url'] if data_type == "cv" else self.commitment_config['job_parser_url']
-                await page.goto(parser_url, timeout=self.timeout_seconds * 1000)
+            # Page de parser déjà chargée (rendue au pool en sortie)
+            async with pool.acquire(parser_url) as slot:
+                page = slot.page
+                waiter = slot.arm()
                 
-                # Attente chargement
-                await page.wait_for_selector('body', timeout=10000)
-                
-                # Upload fichier si CV
+                # Upload fichier si CV, puis attente de l'écriture du résultat
+                # dans localStorage (sans délai fixe)
+                parsing_data = None
                 if data_type == "cv":
                     await self._upload_cv_file(page, file_path)
+                    parsing_data = await pool.wait_for_result(slot, waiter, self.timeout_seconds)
                 
-                # Attente parsing
-                await page.wait_for_timeout(3000)
-                
-                # Récupération résultats
-                parsing_data = await self._extract_commitment_results(page)
+                if not parsing_data:
+                    parsing_data = await self._extract_commitment_results(page)
                 
                 if parsing_data:
                     result.extracted_data = parsing_data
@@ -335,9 +334,6 @@ class CommitmentParsingBridge:
                 else:
                     raise Exception("Aucune donnée extraite par Commitment-")
                 
-            finally:
-                await page.close()
-                
         except Exception as e:
             logger.error(f"❌ Erreur parsing réel Commitment-: {e}")
             result.errors.append(f"Commitment- real parsing failed: {e}")
@@ -466,20 +462,34 @@ class CommitmentParsingBridge:
     # === MÉTHODES UTILITAIRES ===
     
     async def _init_browser(self):
-        """Initialise le browser Playwright"""
+        """Initialise le pool Playwright et préchauffe les pages des parsers"""
         
         if not PLAYWRIGHT_AVAILABLE:
             raise Exception("Playwright non disponible")
         
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-setuid-sandbox']
+        pool = BrowserContextPool(
+            size=self.commitment_config['browser_pool_size'],
+            max_uses=self.commitment_config['browser_context_max_uses'],
+            acquire_timeout_seconds=self.timeout_seconds,
+            page_timeout_seconds=self.timeout_seconds
         )
-        
-        logger.info("🎭 Browser Playwright initialisé")
-    
-    async def _upload_cv_file(self, page: Page, file_path: str):
+        await pool.start([
+            self.commitment_config['cv_parser_url'],
+            self.commitment_config['job_parser_url']
+        ])
+        # Publié une fois démarré : jamais de pool à moitié initialisé
+        self.browser_pool = pool
+        
+        logger.info("🎭 Pool Playwright initialisé")
+    
+    async def _get_browser_pool(self) -> BrowserContextPool:
+        if self.browser_pool is None:
+            async with self._browser_pool_lock:
+                if self.browser_pool is None:
+                    await self._init_browser()
+        return self.browser_pool
+    
+    async def _upload_cv_file(self, page: "Page", file_path: str):
         """Upload un fichier CV sur la page Commitment-"""
         
         # Recherche input file
@@ -487,11 +497,10 @@ class CommitmentParsingBridge:
         
         if file_input:
             await file_input.set_input_files(file_path)
-            await page.wait_for_timeout(2000)  # Attente upload
         else:
             raise Exception("Input file non trouvé sur la page")
     
-    async def _extract_commitment_results(self, page: Page) -> Optional[Dict]:
+    async def _extract_commitment_results(self, page: "Page") -> Optional[Dict]:
         """Extrait les résultats du parsing Commitment-"""
         
         try:
@@ -537,23 +546,15 @@ class CommitmentParsingBridge:
             return ""
     
     async def _extract_pdf_content(self, file_path: str) -> str:
-        """Extrait contenu PDF"""
+        """Extrait contenu PDF (texte complet : les patterns parcourent tout le document)"""
         
         try:
-            # Tentative avec PyPDF2
-            import PyPDF2
-            
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
-                
-                return text
+            extracted = await self.document_extractor.extract_file(file_path, max_chars=None)
+            if extracted.error:
+                logger.warning(f"Extraction PDF indisponible ({extracted.error}), utilisation fallback")
+                return await self._extract_text_content(file_path)
+            return extracted.text
                 
-        except ImportError:
-            logger.warning("PyPDF2 non disponible, utilisation fallback")
-            return await self._extract_text_content(file_path)
         except Exception as e:
             logger.error(f"❌ Erreur extraction PDF: {e}")
             return ""
@@ -576,19 +577,11 @@ class CommitmentParsingBridge:
         """Extrait contenu Word"""
         
         try:
-            # Tentative avec python-docx
-            from docx import Document
-            
-            doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            
-            return text
+            extracted = await self.document_extractor.extract_file(file_path, max_chars=None)
+            if extracted.error:
+                logger.warning(f"python-docx non disponible ({extracted.error})")
+            return extracted.text
             
-        except ImportError:
-            logger.warning("python-docx non disponible")
-            return ""
         except Exception as e:
             logger.error(f"❌ Erreur extraction Word: {e}")
             return ""
@@ -778,24 +771,23 @@ class CommitmentParsingBridge:
         """Parsing job description avec Commitment- réel"""
         
         try:
-            # Initialisation browser
-            if not self.browser:
-                await self._init_browser()
-            
-            page = await self.browser.new_page()
+            pool = await self._get_browser_pool()
             
-            try:
-                # Navigation vers job parser
-                await page.goto(self.commitment_config['job_parser_url'], timeout=self.timeout_seconds * 1000)
+            async with pool.acquire(self.commitment_config['job_parser_url']) as slot:
+                page = slot.page
+                waiter = slot.arm()
                 
                 # Insertion texte
                 textarea = await page.query_selector('textarea')
                 if textarea:
                     await textarea.fill(job_text)
-                    await page.wait_for_timeout(2000)
+                    parsing_data = await pool.wait_for_result(slot, waiter, self.timeout_seconds)
+                else:
+                    parsing_data = None
                 
                 # Récupération résultats
-                parsing_data = await self._extract_commitment_results(page)
+                if not parsing_data:
+                    parsing_data = await self._extract_commitment_results(page)
                 
                 if parsing_data:
                     result.extracted_data = parsing_data
@@ -806,9 +798,6 @@ class CommitmentParsingBridge:
                 else:
                     raise Exception("Aucune donnée extraite")
                 
-            finally:
-                await page.close()
-                
         except Exception as e:
             logger.error(f"❌ Erreur parsing job réel: {e}")
             result.errors.append(f"Job real parsing failed: {e}")
@@ -902,6 +891,7 @@ class CommitmentParsingBridge:
             "avg_confidence": round(self.stats.avg_extraction_confidence, 2),
             "fallback_usage": self.stats.fallback_used,
             "playwright_available": self.enable_playwright,
+            "browser_pool": self.browser_pool.get_stats() if self.browser_pool else None,
             "last_success": self.stats.last_success.isoformat() if self.stats.last_success else None,
             "last_error": self.stats.last_error.isoformat() if self.stats.last_error else None
         }
@@ -914,9 +904,9 @@ class CommitmentParsingBridge:
     async def close(self):
         """Ferme le bridge et libère les ressources"""
         
-        if self.browser:
-            await self.browser.close()
-            self.browser = None
+        if self.browser_pool:
+            await self.browser_pool.close()
+            self.browser_pool = None
         
         logger.info("🔒 CommitmentParsingBridge fermé")
 
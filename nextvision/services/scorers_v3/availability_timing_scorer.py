@@ -23,6 +23,9 @@ from nextvision.models.extended_bidirectional_models_v3 import (
     CandidateStatusType,
     UrgenceRecrutement
 )
+from nextvision.services.compiled_profiles import (
+    CompiledCandidate, CompiledCompany, convert_timing_to_weeks, parse_recruitment_delays
+)
 
 logger = logging.getLogger(__name__)
 
@@ -67,7 +70,7 @@ class AvailabilityTimingScorer:
                 UrgenceRecrutement.CRITIQUE: 2,    # Max 2 semaines
                 UrgenceRecrutement.URGENT: 6,      # Max 6 semaines
                 UrgenceRecrutement.NORMAL: 12,     # Max 12 semaines
-                UrgenceRecrutement.FLEXIBLE: 24    # Max 24 semaines
+                UrgenceRecrutement.LONG_TERME: 24   # Max 24 semaines
             }
         }
         
@@ -83,7 +86,9 @@ class AvailabilityTimingScorer:
         self,
         candidate: ExtendedCandidateProfileV3,
         company: ExtendedCompanyProfileV3,
-        context: Optional[Dict] = None
+        context: Optional[Dict] = None,
+        compiled_candidate: Optional[CompiledCandidate] = None,
+        compiled_company: Optional[CompiledCompany] = None
     ) -> Dict[str, Any]:
         """
         🎯 Calcule score timing disponibilité vs urgence
@@ -92,6 +97,8 @@ class AvailabilityTimingScorer:
             candidate: Profil candidat V3.0
             company: Profil entreprise V3.0
             context: Contexte additionnel
+            compiled_candidate: Profil candidat compilé (timing déjà converti)
+            compiled_company: Profil entreprise compilé (délais déjà parsés)
             
         Returns:
             Score timing avec détails et recommandations
@@ -102,10 +109,14 @@ class AvailabilityTimingScorer:
         
         try:
             # 1. Extraction données timing candidat
-            candidate_timing = self._extract_candidate_timing(candidate)
+            candidate_timing = self._extract_candidate_timing(
+                candidate, compiled_candidate.timing_weeks if compiled_candidate else None
+            )
             
             # 2. Extraction données urgence entreprise
-            company_urgency = self._extract_company_urgency(company)
+            company_urgency = self._extract_company_urgency(
+                company, compiled_company.recruitment_weeks if compiled_company else None
+            )
             
             # 3. Calcul compatibilité timing de base
             base_compatibility = self._calculate_base_timing_compatibility(
@@ -158,14 +169,15 @@ class AvailabilityTimingScorer:
             logger.error(f"❌ Erreur AvailabilityTimingScorer: {e}")
             return self._create_fallback_score(candidate, company, str(e))
     
-    def _extract_candidate_timing(self, candidate: ExtendedCandidateProfileV3) -> Dict[str, Any]:
+    def _extract_candidate_timing(self, candidate: ExtendedCandidateProfileV3,
+                                  timing_weeks: Optional[int] = None) -> Dict[str, Any]:
         """📊 Extraction données timing candidat"""
         
         availability = candidate.availability_timing
-        base_profile = candidate.base_profile
         
-        # Conversion timing vers semaines
-        timing_weeks = self._convert_timing_to_weeks(availability.timing)
+        # Conversion timing vers semaines (sauf si déjà compilée)
+        if timing_weeks is None:
+            timing_weeks = self._convert_timing_to_weeks(availability.timing)
         
         # Détection préavis si en poste
         notice_weeks = 0
@@ -187,16 +199,18 @@ class AvailabilityTimingScorer:
             "listening_reasons": availability.listening_reasons
         }
     
-    def _extract_company_urgency(self, company: ExtendedCompanyProfileV3) -> Dict[str, Any]:
+    def _extract_company_urgency(self, company: ExtendedCompanyProfileV3,
+                                 recruitment_weeks: Optional[int] = None) -> Dict[str, Any]:
         """🏢 Extraction données urgence entreprise"""
         
         base_profile = company.base_profile
         recruitment_process = company.recruitment_process
         
-        # Parsing délais de recrutement
-        recruitment_weeks = self._parse_recruitment_delays(
-            recruitment_process.recruitment_delays
-        )
+        # Parsing délais de recrutement (sauf si déjà compilé)
+        if recruitment_weeks is None:
+            recruitment_weeks = self._parse_recruitment_delays(
+                recruitment_process.recruitment_delays
+            )
         
         # Évaluation gestion préavis
         notice_tolerance = self._evaluate_notice_tolerance(
@@ -533,40 +547,11 @@ class AvailabilityTimingScorer:
     
     def _convert_timing_to_weeks(self, timing: str) -> int:
         """🔄 Conversion timing vers semaines"""
-        
-        timing_lower = timing.lower()
-        
-        if "immédiat" in timing_lower or "immediate" in timing_lower:
-            return 0
-        elif "1 mois" in timing_lower or "1mois" in timing_lower:
-            return 4
-        elif "2 mois" in timing_lower or "2mois" in timing_lower:
-            return 8
-        elif "3 mois" in timing_lower or "3mois" in timing_lower:
-            return 12
-        else:
-            # Tentative extraction numérique
-            import re
-            match = re.search(r'(\d+)\s*mois', timing_lower)
-            if match:
-                return int(match.group(1)) * 4
-            return 4  # Défaut 1 mois
+        return convert_timing_to_weeks(timing)
     
     def _parse_recruitment_delays(self, delays: str) -> int:
         """📊 Parsing délais recrutement"""
-        
-        delays_lower = delays.lower()
-        
-        if "immédiat" in delays_lower or "urgent" in delays_lower:
-            return 2
-        elif "1 mois" in delays_lower or "1-2" in delays_lower:
-            return 6
-        elif "2 mois" in delays_lower or "2-3" in delays_lower:
-            return 10
-        elif "3 mois" in delays_lower or "flexible" in delays_lower:
-            return 16
-        else:
-            return 8  # Défaut 2 mois
+        return parse_recruitment_delays(delays)
     
     def _evaluate_candidate_flexibility(self, availability) -> float:
         """🔄 Évaluation flexibilité candidat"""
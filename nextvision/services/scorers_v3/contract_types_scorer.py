@@ -67,7 +67,7 @@ class ContractTypesScorer:
                 TypeContrat.CDI: 1.0,
                 TypeContrat.CDD: 0.7,
                 TypeContrat.FREELANCE: 0.6,
-                TypeContrat.INTERIM: 0.5,
+                TypeContrat.ALTERNANCE: 0.5,
                 TypeContrat.STAGE: 0.3
             }
         }
@@ -14,7 +14,6 @@ import asyncio
 import nextvision_logging as logging
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
-import hashlib
 
 # IMPORTS ABSOLUS (CORRIGÉS OPTION 1)
 from nextvision.services.google_maps_service import GoogleMapsService
@@ -23,6 +22,7 @@ from nextvision.models.transport_models import (
     TravelMode, TransportRoute, GeocodeResult, 
     TransportCompatibility, LocationScore
 )
+from nextvision.utils.fingerprint import fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -675,18 +675,12 @@ class LocationTransportScorerV3:
         """🔑 Génération clé cache optimisée"""
         
         # Normalisation pour cache cohérent
-        normalized_methods = sorted(transport_methods)
-        normalized_times = sorted(travel_times.items())
-        
-        key_components = [
+        return fingerprint(
             candidat_address.lower().strip(),
             entreprise_address.lower().strip(),
-            "|".join(normalized_methods),
-            "|".join(f"{k}:{v}" for k, v in normalized_times)
-        ]
-        
-        combined_key = "::".join(key_components)
-        return hashlib.md5(combined_key.encode()).hexdigest()
+            set(transport_methods),
+            travel_times
+        )
     
     def _is_cache_valid(self, calculated_at: str) -> bool:
         """⏰ Vérification validité cache (2h pour itinéraires)"""
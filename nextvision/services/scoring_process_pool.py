@@ -0,0 +1,282 @@
+"""
+⚙️ Nextvision V3.0 - Pool de processus pour les scorers CPU
+
+Exécution hors boucle d'événements des composants de scoring purement CPU
+(semantic, salary, experience, timing, contract, environment) :
+- Snapshots de profils picklables (dict JSON Pydantic complet, sans perte)
+- Envoi par lots de paires : chaque profil n'est sérialisé qu'une fois par lot
+- Scorers instanciés une seule fois par processus worker
+- Location/transport (I/O Google Maps) reste sur la boucle d'événements
+
+Author: NEXTEN Team
+Version: 1.0.0 - Process Pool Scoring
+"""
+
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from nextvision.models.extended_bidirectional_models_v3 import (
+    ExtendedCandidateProfileV3,
+    ExtendedCompanyProfileV3
+)
+from nextvision.services.compiled_profiles import CompiledCandidate, CompiledCompany
+
+logger = logging.getLogger(__name__)
+
+# Composants CPU : nom → (attribut du scorer, méthode, profils V2.0 de base ?)
+CPU_COMPONENTS: Tuple[Tuple[str, str, str, bool], ...] = (
+    ("semantic", "semantic_scorer", "calculate_score", True),
+    ("salary", "salary_scorer", "calculate_score", True),
+    ("experience", "experience_scorer", "calculate_score", True),
+    ("availability_timing", "availability_timing_scorer", "calculate_availability_timing_score", False),
+    ("contract_types", "contract_types_scorer", "calculate_contract_types_score", False),
+    ("work_environment", "work_environment_scorer", "calculate_work_environment_score", False)
+)
+
+# Score de repli par composant (identique au calcul séquentiel)
+CPU_FALLBACK_SCORES: Dict[str, float] = {
+    "semantic": 0.5,
+    "salary": 0.6,
+    "experience": 0.7,
+    "availability_timing": 0.6,
+    "contract_types": 0.6,
+    "work_environment": 0.7
+}
+
+
+def create_fallback_score_result(component_name: str, score: float) -> dict:
+    """🛡️ Création résultat score fallback"""
+
+    return {
+        "final_score": score,
+        "score_breakdown": {f"{component_name}_score": score},
+        "explanations": [f"⚠️ Mode dégradé - {component_name}"],
+        "recommendations": ["🔧 Vérification manuelle recommandée"],
+        "calculated_at": datetime.now().isoformat(),
+        "version": "3.0.0-fallback",
+        "error": f"Erreur calcul {component_name}"
+    }
+
+
+def compute_cpu_component_scores(
+    scorers: Any,
+    candidate: ExtendedCandidateProfileV3,
+    company: ExtendedCompanyProfileV3,
+    compiled_candidate: Optional[CompiledCandidate] = None,
+    compiled_company: Optional[CompiledCompany] = None
+) -> List[tuple]:
+    """🧮 Calcul des composants CPU d'une paire (même code en ligne et dans les workers)
+    
+    La paire est compilée une fois (compilateur du scorer sémantique) puis
+    partagée par les composants qui savent l'exploiter.
+    """
+
+    compiler = scorers.semantic_scorer.profile_compiler
+    try:
+        if compiled_candidate is None:
+            compiled_candidate = compiler.compile_candidate(candidate)
+        if compiled_company is None:
+            compiled_company = compiler.compile_company(company)
+    except Exception as e:
+        # Chaque scorer recompile lui-même depuis les profils bruts
+        logger.warning(f"⚠️ Compilation profils impossible: {e}")
+        compiled_candidate = compiled_company = None
+
+    results = []
+    for component_name, scorer_attr, method_name, uses_base_profile in CPU_COMPONENTS:
+        scorer_method = getattr(getattr(scorers, scorer_attr), method_name)
+        try:
+            if uses_base_profile:
+                result = scorer_method(
+                    candidate.base_profile, company.base_profile, compiled_candidate, compiled_company
+                )
+            elif component_name == "availability_timing":
+                result = scorer_method(
+                    candidate, company,
+                    compiled_candidate=compiled_candidate, compiled_company=compiled_company
+                )
+            else:
+                result = scorer_method(candidate, company)
+        except Exception as e:
+            logger.error(f"Erreur calcul {component_name}: {e}")
+            result = create_fallback_score_result(component_name, CPU_FALLBACK_SCORES[component_name])
+        results.append((component_name, result))
+    return results
+
+
+# === SNAPSHOTS ===
+
+def snapshot_profile(profile: Any) -> Dict[str, Any]:
+    """📦 Snapshot JSON complet du profil (les défauts modifiés sur place sont conservés)"""
+    return profile.model_dump(mode="json")
+
+
+# === CÔTÉ WORKER ===
+
+class _WorkerScorers:
+    """Scorers CPU d'un processus worker (créés une seule fois)"""
+
+    def __init__(self):
+        from nextvision.services.bidirectional_scorer import (
+            SemanticScorer, SalaryScorer, ExperienceScorer
+        )
+        from nextvision.services.scorers_v3 import (
+            AvailabilityTimingScorer, ContractTypesScorer, WorkEnvironmentScorer
+        )
+
+        self.semantic_scorer = SemanticScorer(weight=0.24)
+        self.salary_scorer = SalaryScorer(weight=0.19)
+        self.experience_scorer = ExperienceScorer(weight=0.14)
+        self.availability_timing_scorer = AvailabilityTimingScorer()
+        self.contract_types_scorer = ContractTypesScorer()
+        self.work_environment_scorer = WorkEnvironmentScorer()
+
+
+_worker_scorers: Optional[_WorkerScorers] = None
+
+
+def _init_worker():
+    global _worker_scorers
+    _worker_scorers = _WorkerScorers()
+
+
+def _score_chunk(
+    candidate_snapshots: Dict[int, Dict[str, Any]],
+    company_snapshots: Dict[int, Dict[str, Any]],
+    pairs: List[Tuple[int, int]]
+) -> List[List[tuple]]:
+    """Worker : reconstruit et compile chaque profil une fois puis score les paires du lot"""
+
+    global _worker_scorers
+    if _worker_scorers is None:
+        _init_worker()
+
+    candidates = {
+        index: ExtendedCandidateProfileV3.model_validate(snapshot)
+        for index, snapshot in candidate_snapshots.items()
+    }
+    companies = {
+        index: ExtendedCompanyProfileV3.model_validate(snapshot)
+        for index, snapshot in company_snapshots.items()
+    }
+
+    # Profils uniques du lot compilés une fois
+    compiler = _worker_scorers.semantic_scorer.profile_compiler
+    compiled_candidates = {index: compiler.build_candidate(profile) for index, profile in candidates.items()}
+    compiled_companies = {index: compiler.build_company(profile) for index, profile in companies.items()}
+
+    return [
+        compute_cpu_component_scores(
+            _worker_scorers, candidates[c_index], companies[e_index],
+            compiled_candidates[c_index], compiled_companies[e_index]
+        )
+        for c_index, e_index in pairs
+    ]
+
+
+# === CÔTÉ BOUCLE D'ÉVÉNEMENTS ===
+
+class ScoringProcessPool:
+    """
+    ⚙️ POOL DE PROCESSUS DE SCORING
+    ================================
+
+    Répartit les composants CPU de grands lots de paires candidat × entreprise
+    sur plusieurs processus sans bloquer la boucle d'événements.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = 256):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        self.stats = {
+            "batches": 0,
+            "chunks": 0,
+            "pairs": 0,
+            "total_time_ms": 0.0
+        }
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker
+            )
+        return self._executor
+
+    def _build_chunks(
+        self,
+        pairs: Sequence[Tuple[ExtendedCandidateProfileV3, ExtendedCompanyProfileV3]]
+    ) -> List[tuple]:
+        """Découpe en lots ; un profil partagé par plusieurs paires n'est snapshoté qu'une fois"""
+
+        snapshots: Dict[int, Dict[str, Any]] = {}
+        profile_indexes: Dict[int, int] = {}
+
+        def index_of(profile) -> int:
+            key = id(profile)
+            if key not in profile_indexes:
+                profile_indexes[key] = len(profile_indexes)
+                snapshots[profile_indexes[key]] = snapshot_profile(profile)
+            return profile_indexes[key]
+
+        chunks = []
+        for start in range(0, len(pairs), self.chunk_size):
+            chunk_pairs = []
+            candidate_snapshots: Dict[int, Dict[str, Any]] = {}
+            company_snapshots: Dict[int, Dict[str, Any]] = {}
+            for candidate, company in pairs[start:start + self.chunk_size]:
+                c_index, e_index = index_of(candidate), index_of(company)
+                candidate_snapshots[c_index] = snapshots[c_index]
+                company_snapshots[e_index] = snapshots[e_index]
+                chunk_pairs.append((c_index, e_index))
+            chunks.append((candidate_snapshots, company_snapshots, chunk_pairs))
+        return chunks
+
+    async def score_pairs(
+        self,
+        pairs: Sequence[Tuple[ExtendedCandidateProfileV3, ExtendedCompanyProfileV3]]
+    ) -> List[List[tuple]]:
+        """🚀 Composants CPU de toutes les paires, dans l'ordre d'entrée"""
+
+        if not pairs:
+            return []
+
+        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+
+        chunks = self._build_chunks(pairs)
+        chunk_results = await asyncio.gather(*[
+            loop.run_in_executor(executor, _score_chunk, *chunk)
+            for chunk in chunks
+        ])
+
+        self.stats["batches"] += 1
+        self.stats["chunks"] += len(chunks)
+        self.stats["pairs"] += len(pairs)
+        self.stats["total_time_ms"] += (time.time() - start_time) * 1000
+
+        return [pair_result for chunk_result in chunk_results for pair_result in chunk_result]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """📊 Statistiques du pool"""
+        return {
+            **self.stats,
+            "max_workers": self.max_workers,
+            "chunk_size": self.chunk_size,
+            "started": self._executor is not None,
+            "average_pair_time_ms": self.stats["total_time_ms"] / max(self.stats["pairs"], 1)
+        }
+
+    def shutdown(self, wait: bool = True):
+        """🔌 Arrêt des processus workers"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
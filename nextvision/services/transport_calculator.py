@@ -11,15 +11,40 @@ import logging
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from .google_maps_service import GoogleMapsService
 from ..models.transport_models import (
     TravelMode, TransportCompatibility, TransportRoute, LocationScore,
-    GeocodeResult, ConfigTransport
+    GeocodeResult, GeocodeQuality, ConfigTransport
 )
 from ..models.questionnaire_advanced import TransportPreferences, MoyenTransport
+from ..utils.google_maps_helpers import GoogleMapsHelpers
+from ..utils.fingerprint import fingerprint
 
 logger = logging.getLogger(__name__)
 
+# Mapping préférences → modes Google Maps
+TRANSPORT_MODE_MAPPING = {
+    MoyenTransport.VOITURE: TravelMode.DRIVING,
+    MoyenTransport.TRANSPORT_COMMUN: TravelMode.TRANSIT,
+    MoyenTransport.VELO: TravelMode.BICYCLING,
+    MoyenTransport.MARCHE: TravelMode.WALKING,
+    MoyenTransport.MOTO: TravelMode.DRIVING,
+    MoyenTransport.COVOITURAGE: TravelMode.DRIVING
+}
+
+# Vitesses moyennes maximales à vol d'oiseau (km/h) par mode.
+# Bornes hautes volontairement larges (autoroute à 130 km/h, TGV type
+# Paris–Lille) : un job hors du rayon atteignable ne peut respecter le
+# temps max, quel que soit l'itinéraire réel.
+MAX_CROW_FLY_SPEED_KMH = {
+    TravelMode.DRIVING: 130,
+    TravelMode.TRANSIT: 300,
+    TravelMode.BICYCLING: 30,
+    TravelMode.WALKING: 7
+}
+
 class TransportCalculator:
     """🧮 Calculateur transport intelligent avec optimisations"""
     
@@ -34,6 +59,9 @@ class TransportCalculator:
         self.calculation_count = 0
         self.cache_hits = 0
         self.total_calculation_time = 0.0
+        
+        # Décisions par étape du pré-filtrage (cumul + dernier batch)
+        self.stage_counts = self._empty_stage_counts()
     
     async def calculate_transport_compatibility(
         self,
@@ -110,11 +138,20 @@ class TransportCalculator:
         self,
         candidat_config: ConfigTransport,
         job_addresses: List[str],
-        max_concurrent: int = 5
+        max_concurrent: int = 5,
+        distance_pre_filter: bool = True,
+        stage_counts: Optional[Dict[str, int]] = None
     ) -> Dict[str, TransportCompatibility]:
-        """🚀 Calcul batch optimisé pour multiple jobs"""
+        """🚀 Calcul batch optimisé pour multiple jobs
+        
+        Étapes : géocodage → pré-filtre distance (haversine vectorisé,
+        sans appel API) → calcul des itinéraires pour les jobs restants.
+        Les décisions par étape de cet appel sont ajoutées à `stage_counts`.
+        """
         
         logger.info(f"Calcul batch: {len(job_addresses)} jobs, max_concurrent={max_concurrent}")
+        stages = self._empty_stage_counts()
+        stages["received"] = len(job_addresses)
         
         # Géocodage candidat une seule fois
         candidat_location = await self._ensure_candidat_geocoded(candidat_config)
@@ -135,13 +172,29 @@ class TransportCalculator:
             geocode_with_semaphore(task) for task in job_geocode_tasks
         ], return_exceptions=True)
         
+        geocoded_jobs: Dict[str, GeocodeResult] = {}
+        for job_addr, job_location in zip(job_addresses, job_locations):
+            if isinstance(job_location, Exception):
+                logger.error(f"Erreur géocodage {job_addr}: {job_location}")
+                stages["geocoding_failed"] += 1
+                continue
+            geocoded_jobs[job_addr] = job_location
+        
+        # Pré-filtre distance : exclut les jobs hors d'atteinte avant tout routage
+        results: Dict[str, TransportCompatibility] = {}
+        if distance_pre_filter:
+            distance_rejected = self.distance_pre_filter(
+                candidat_config, candidat_location, geocoded_jobs
+            )
+            results.update(distance_rejected)
+            stages["rejected_by_distance"] = len(distance_rejected)
+        
         # Calcul compatibilité pour chaque job
         compatibility_tasks = []
         valid_jobs = []
         
-        for i, (job_addr, job_location) in enumerate(zip(job_addresses, job_locations)):
-            if isinstance(job_location, Exception):
-                logger.error(f"Erreur géocodage {job_addr}: {job_location}")
+        for job_addr, job_location in geocoded_jobs.items():
+            if job_addr in results:
                 continue
                 
             valid_jobs.append(job_addr)
@@ -162,7 +215,7 @@ class TransportCalculator:
         ], return_exceptions=True)
         
         # Assemblage résultats
-        results = {}
+        stages["routed"] = len(valid_jobs)
         for job_addr, compatibility in zip(valid_jobs, compatibilities):
             if isinstance(compatibility, Exception):
                 logger.error(f"Erreur compatibilité {job_addr}: {compatibility}")
@@ -170,10 +223,109 @@ class TransportCalculator:
                 results[job_addr] = self._create_fallback_compatibility(candidat_config, job_addr)
             else:
                 results[job_addr] = compatibility
+            
+            if results[job_addr].is_compatible:
+                stages["compatible"] += 1
+            else:
+                stages["rejected_by_routing"] += 1
         
-        logger.info(f"Batch terminé: {len(results)}/{len(job_addresses)} jobs traités")
+        self._record_stage_counts(stages)
+        if stage_counts is not None:
+            for stage, count in stages.items():
+                stage_counts[stage] = stage_counts.get(stage, 0) + count
+        
+        logger.info(
+            f"Batch terminé: {len(results)}/{len(job_addresses)} jobs traités "
+            f"({stages['rejected_by_distance']} exclus par distance, "
+            f"{stages['routed']} routés)"
+        )
         return results
     
+    def get_reachable_radius_km(self, candidat_config: ConfigTransport) -> Dict[TravelMode, float]:
+        """🎯 Rayon maximal atteignable (km) par mode, d'après les temps max du candidat"""
+        
+        preferences = candidat_config.transport_preferences
+        radii: Dict[TravelMode, float] = {}
+        
+        for transport_pref in preferences.moyens_selectionnes:
+            travel_mode = TRANSPORT_MODE_MAPPING.get(transport_pref, TravelMode.DRIVING)
+            # Même clé et même défaut que TransportCompatibility.evaluate_compatibility
+            time_limit = preferences.temps_max.get(
+                transport_pref.value.lower().replace(" ", "_"), 60
+            )
+            radius = MAX_CROW_FLY_SPEED_KMH.get(travel_mode, MAX_CROW_FLY_SPEED_KMH[TravelMode.DRIVING]) * time_limit / 60
+            radii[travel_mode] = max(radii.get(travel_mode, 0.0), radius)
+        
+        return radii
+    
+    def distance_pre_filter(
+        self,
+        candidat_config: ConfigTransport,
+        candidat_location: GeocodeResult,
+        job_locations: Dict[str, GeocodeResult]
+    ) -> Dict[str, TransportCompatibility]:
+        """📏 Pré-filtre haversine vectorisé : retourne les jobs impossibles à atteindre
+        
+        Un job est rejeté si sa distance à vol d'oiseau dépasse le rayon
+        atteignable pour chacun des modes du candidat. Les localisations en
+        échec de géocodage ne sont jamais rejetées à cette étape.
+        """
+        
+        radii = self.get_reachable_radius_km(candidat_config)
+        if not radii or not job_locations or candidat_location.quality == GeocodeQuality.FAILED:
+            return {}
+        
+        addresses = [
+            addr for addr, location in job_locations.items()
+            if location.quality != GeocodeQuality.FAILED
+        ]
+        if not addresses:
+            return {}
+        
+        distances = GoogleMapsHelpers.calculate_haversine_distances(
+            candidat_location.latitude,
+            candidat_location.longitude,
+            [job_locations[addr].latitude for addr in addresses],
+            [job_locations[addr].longitude for addr in addresses]
+        )
+        max_radius = max(radii.values())
+        
+        rejected = {}
+        for index in np.flatnonzero(distances > max_radius):
+            job_addr = addresses[index]
+            distance_km = float(distances[index])
+            rejected[job_addr] = TransportCompatibility(
+                candidat_preferences=candidat_config.transport_preferences,
+                job_location=job_locations[job_addr],
+                candidat_location=candidat_location,
+                routes={},
+                compatible_modes=[],
+                compatibility_score=0.0,
+                rejection_reasons=[
+                    f"{travel_mode.value}: {distance_km:.1f}km à vol d'oiseau > "
+                    f"{radius:.1f}km atteignables"
+                    for travel_mode, radius in radii.items()
+                ]
+            )
+        
+        return rejected
+    
+    @staticmethod
+    def _empty_stage_counts() -> Dict[str, int]:
+        return {
+            "received": 0,
+            "geocoding_failed": 0,
+            "rejected_by_distance": 0,
+            "routed": 0,
+            "rejected_by_routing": 0,
+            "compatible": 0
+        }
+    
+    def _record_stage_counts(self, stages: Dict[str, int]):
+        # Cumul global uniquement : les décomptes d'un appel restent locaux à cet appel
+        for stage, count in stages.items():
+            self.stage_counts[stage] += count
+    
     async def calculate_location_score(
         self, 
         compatibility: TransportCompatibility
@@ -210,8 +362,9 @@ class TransportCalculator:
         logger.info(f"PRE-FILTERING: {len(job_addresses)} jobs, strict_mode={strict_mode}")
         
         # Calcul batch compatibilités
+        stages: Dict[str, int] = {}
         compatibilities = await self.batch_calculate_job_compatibility(
-            candidat_config, job_addresses
+            candidat_config, job_addresses, stage_counts=stages
         )
         
         compatible_jobs = []
@@ -233,13 +386,15 @@ class TransportCalculator:
                     rejection_reasons[job_addr] = "Aucun mode de transport compatible"
         
         # Statistiques
-        exclusion_rate = len(incompatible_jobs) / len(job_addresses) * 100
+        exclusion_rate = len(incompatible_jobs) / max(len(job_addresses), 1) * 100
         
         logger.info(
             f"PRE-FILTERING terminé: "
             f"{len(compatible_jobs)} compatibles, "
             f"{len(incompatible_jobs)} exclus "
-            f"(taux exclusion: {exclusion_rate:.1f}%)"
+            f"(taux exclusion: {exclusion_rate:.1f}%, "
+            f"distance: {stages['rejected_by_distance']}, "
+            f"routage: {stages['rejected_by_routing']})"
         )
         
         return compatible_jobs, incompatible_jobs, rejection_reasons
@@ -271,22 +426,12 @@ class TransportCalculator:
         
         routes = {}
         
-        # Mapping préférences → modes Google Maps
-        mode_mapping = {
-            MoyenTransport.VOITURE: TravelMode.DRIVING,
-            MoyenTransport.TRANSPORT_COMMUN: TravelMode.TRANSIT,
-            MoyenTransport.VELO: TravelMode.BICYCLING,
-            MoyenTransport.MARCHE: TravelMode.WALKING,
-            MoyenTransport.MOTO: TravelMode.DRIVING,
-            MoyenTransport.COVOITURAGE: TravelMode.DRIVING
-        }
-        
         # Calcul parallèle des itinéraires
         tasks = []
         travel_modes = []
         
         for transport_pref in transport_preferences.moyens_selectionnes:
-            travel_mode = mode_mapping.get(transport_pref, TravelMode.DRIVING)
+            travel_mode = TRANSPORT_MODE_MAPPING.get(transport_pref, TravelMode.DRIVING)
             travel_modes.append(travel_mode)
             
             task = self.google_maps_service.calculate_route(
@@ -388,17 +533,12 @@ class TransportCalculator:
     ) -> str:
         """🔑 Clé cache compatibilité"""
         
-        import hashlib
-        
-        key_parts = [
+        return fingerprint(
             f"{candidat_location.latitude:.6f},{candidat_location.longitude:.6f}",
             f"{job_location.latitude:.6f},{job_location.longitude:.6f}",
-            "_".join(sorted([m.value for m in transport_preferences.moyens_selectionnes])),
-            str(hash(frozenset(transport_preferences.temps_max.items())))
-        ]
-        
-        combined = "_".join(key_parts)
-        return hashlib.md5(combined.encode()).hexdigest()
+            set(transport_preferences.moyens_selectionnes),
+            transport_preferences.temps_max
+        )
     
     def _create_fallback_compatibility(
         self, 
@@ -457,7 +597,8 @@ class TransportCalculator:
             "cache_hit_rate_percent": cache_hit_rate,
             "average_calculation_time_seconds": avg_calc_time,
             "total_calculation_time_seconds": self.total_calculation_time,
-            "compatibility_cache_size": len(self._compatibility_cache)
+            "compatibility_cache_size": len(self._compatibility_cache),
+            "pre_filter_stages": dict(self.stage_counts)
         }
     
     def clear_cache(self):
@@ -11,5 +11,6 @@ from nextvision.logging.structured_logging import (
     LogLevel, LogComponent, LogContext, StructuredFormatter,
     get_structured_logger, setup_production_logging,
     log_context, log_operation, get_request_tracker,
-    LogAnalytics, get_log_analytics
+    LogAnalytics, get_log_analytics,
+    AsyncLogPipeline, SamplingFilter, shutdown_logging, get_logging_stats
 )
@@ -0,0 +1,164 @@
+"""
+🔑 Nextvision - Empreintes canoniques pour les clés de cache
+
+Clés identiques d'un processus à l'autre et d'un redémarrage à l'autre
+(contrairement à hash(), salé par processus) :
+- Forme canonique : clés de dict triées, ensembles triés, enums → valeur,
+  dates ISO, flottants typés (exacts, distincts des chaînes), modèles
+  Pydantic / dataclasses aplatis (même forme que leur dict)
+- Champs volatils (horodatages de création) exclus par défaut
+- Digest rapide blake2b 64 bits, préfixé par la version du schéma d'empreinte
+
+Author: NEXTEN Team
+Version: 1.0.0 - Canonical Fingerprints
+"""
+
+import dataclasses
+import hashlib
+import json
+import typing
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional, Union
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# À incrémenter si la forme canonique change (invalide toutes les clés)
+FINGERPRINT_VERSION = "fp2"
+
+# Horodatages posés à la construction des objets : ne décrivent pas le contenu
+VOLATILE_FIELDS: FrozenSet[str] = frozenset({"parsed_at", "last_updated", "timestamp", "calculated_at"})
+
+_DIGEST_SIZE = 8
+
+# Étiquette des flottants non entiers : [FLOAT_TAG, float.hex()]
+FLOAT_TAG = "__float__"
+
+
+def canonicalize(value: Any, exclude: FrozenSet[str] = VOLATILE_FIELDS) -> Any:
+    """🧹 Forme canonique JSON-compatible (indépendante de l'ordre d'insertion)"""
+
+    # Types JSON natifs d'abord (cas de loin le plus fréquent)
+    value_type = type(value)
+    if value_type is str or value_type is int or value_type is bool or value is None:
+        return value
+    if value_type is dict and all(type(key) is str for key in value):
+        return {
+            key: canonicalize(item, exclude)
+            for key, item in value.items()
+            if key not in exclude
+        }
+    if value_type is list or value_type is tuple:
+        return [canonicalize(item, exclude) for item in value]
+    if value_type is float:
+        return _canonicalize_float(value)
+
+    if isinstance(value, Enum):
+        return canonicalize(value.value, exclude)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return _canonicalize_mapping(value, exclude)
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(item, exclude) for item in value]
+    if isinstance(value, (set, frozenset)):
+        items = [canonicalize(item, exclude) for item in value]
+        return sorted(items, key=lambda item: json.dumps(item, sort_keys=True))
+    if isinstance(value, BaseModel):
+        # Dump Python puis même forme canonique qu'un dict (flottants typés, NaN/inf compris)
+        return canonicalize(value.model_dump(exclude=_volatile_exclude(type(value), exclude)), exclude)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return canonicalize(dataclasses.asdict(value), exclude)
+    if isinstance(value, bool):
+        return bool(value)
+    if isinstance(value, (int, str)):
+        return int(value) if isinstance(value, int) else str(value)
+    if isinstance(value, float):
+        return canonicalize(float(value), exclude)
+    if isinstance(value, bytes):
+        return value.hex()
+    return str(value)
+
+
+def _canonicalize_float(value: float) -> Any:
+    """45000.0 ≡ 45000 ; sinon forme typée exacte (jamais confondue avec une chaîne,
+    identique quel que soit l'encodeur JSON, NaN/inf compris)"""
+    if value.is_integer():
+        return int(value)
+    return [FLOAT_TAG, value.hex()]
+
+
+def _model_types(annotation: Any) -> list:
+    """Modèles Pydantic contenus dans une annotation (Optional, List, Dict...)"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return [annotation]
+    return [model for arg in typing.get_args(annotation) for model in _model_types(arg)]
+
+
+@lru_cache(maxsize=None)
+def _volatile_exclude(model_type: type, exclude: FrozenSet[str]) -> Optional[Dict[str, Any]]:
+    """Spécification `exclude` Pydantic des champs volatils, à toute profondeur (calculée une fois par classe)"""
+    spec: Dict[str, Any] = {}
+    for name, field_info in model_type.model_fields.items():
+        if name in exclude:
+            spec[name] = True
+            continue
+        annotation = field_info.annotation
+        nested_specs = [
+            nested for nested in (
+                _volatile_exclude(model, exclude) for model in _model_types(annotation) if model is not model_type
+            ) if nested
+        ]
+        if not nested_specs:
+            continue
+        nested = {key: value for nested_spec in nested_specs for key, value in nested_spec.items()}
+        # Collections de modèles (y compris Optional[List[...]]) : exclusion sur chaque élément
+        origins = {typing.get_origin(annotation)}
+        if typing.get_origin(annotation) is Union:
+            origins.update(typing.get_origin(arg) for arg in typing.get_args(annotation))
+        is_collection = bool(origins & {list, tuple, set, frozenset, dict})
+        spec[name] = {"__all__": nested} if is_collection else nested
+    return spec or None
+
+
+def _canonicalize_mapping(value: dict, exclude: FrozenSet[str]) -> dict:
+    canonical = {}
+    for key, item in value.items():
+        key = str(key.value if isinstance(key, Enum) else key)
+        if key not in exclude:
+            canonical[key] = canonicalize(item, exclude)
+    return canonical
+
+
+def canonical_bytes(value: Any, exclude: FrozenSet[str] = VOLATILE_FIELDS) -> bytes:
+    """Sérialisation compacte, clés triées"""
+    canonical = canonicalize(value, exclude)
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # Entiers > 64 bits : même sortie via json
+    return json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def digest(data: bytes) -> str:
+    """Digest hexadécimal 64 bits (blake2b)"""
+    return hashlib.blake2b(data, digest_size=_DIGEST_SIZE).hexdigest()
+
+
+def fingerprint_text(text: str) -> str:
+    """🔑 Empreinte versionnée d'un texte déjà normalisé"""
+    return f"{FINGERPRINT_VERSION}_{digest(text.encode())}"
+
+
+def fingerprint(*parts: Any, exclude: Optional[FrozenSet[str]] = None) -> str:
+    """🔑 Empreinte versionnée d'un ensemble de valeurs (modèles, dicts, scalaires)"""
+    data = canonical_bytes(list(parts), VOLATILE_FIELDS if exclude is None else exclude)
+    return f"{FINGERPRINT_VERSION}_{digest(data)}"
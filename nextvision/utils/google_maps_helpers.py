@@ -7,9 +7,7 @@ Version: 2.0.0 - Google Maps Intelligence
 """
 
 import asyncio
-import json
 import time
-import hashlib
 import nextvision_logging as logging
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
@@ -17,7 +15,10 @@ from dataclasses import dataclass, asdict
 from functools import wraps
 import pickle
 
+import numpy as np
+
 from ..models.transport_models import GeocodeResult, TransportRoute, TravelMode
+from .fingerprint import fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -234,20 +235,8 @@ class GoogleMapsHelpers:
     
     @staticmethod
     def create_cache_key(prefix: str, *args) -> str:
-        """🔑 Crée clé cache sécurisée"""
-        # Normalisation des arguments
-        normalized_args = []
-        for arg in args:
-            if isinstance(arg, (dict, list)):
-                normalized_args.append(json.dumps(arg, sort_keys=True))
-            elif isinstance(arg, datetime):
-                normalized_args.append(arg.isoformat())
-            else:
-                normalized_args.append(str(arg))
-        
-        # Hash SHA-256 pour clé courte et sécurisée
-        combined = f"{prefix}:" + ":".join(normalized_args)
-        return hashlib.sha256(combined.encode()).hexdigest()[:16]
+        """🔑 Crée clé cache stable (forme canonique des arguments)"""
+        return f"{prefix}_{fingerprint(*args)}"
     
     @staticmethod
     def normalize_address(address: str) -> str:
@@ -294,6 +283,27 @@ class GoogleMapsHelpers:
         
         return R * c
     
+    @staticmethod
+    def calculate_haversine_distances(
+        lat: float, lon: float,
+        lats, lons
+    ) -> np.ndarray:
+        """📏 Distances haversine vectorisées (km) d'un point vers N points"""
+        
+        R = 6371  # Rayon terre en km
+        
+        lat1, lon1 = np.radians(lat), np.radians(lon)
+        lat2 = np.radians(np.asarray(lats, dtype=float))
+        lon2 = np.radians(np.asarray(lons, dtype=float))
+        
+        dlat = lat2 - lat1
+        dlon = lon2 - lon1
+        
+        a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
+        
+        return R * c
+    
     @staticmethod
     def estimate_travel_time_simple(
         distance_km: float, 
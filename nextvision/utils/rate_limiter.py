@@ -0,0 +1,260 @@
+"""
+🚦 Nextvision - Limitation de débit GCRA (Generic Cell Rate Algorithm)
+
+Équivalent d'un seau à jetons, sans fenêtre par minute ni liste par client :
+- État O(1) par clé : un seul horodatage théorique d'arrivée (TAT)
+- Limites par préfixe de route (parsing GPT plus strict, santé exemptée)
+- Balayage périodique des clés inactives (entièrement rechargées)
+- Middleware HTTP commun aux applications servant les routes coûteuses
+- Backend Redis partagé optionnel (script Lua atomique, horloge du serveur
+  Redis) pour les déploiements multi-workers, repli local en cas d'erreur
+
+Author: NEXTEN Team
+Version: 1.0.0 - GCRA Rate Limiter
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+
+import nextvision_logging as logging
+
+logger = logging.getLogger(__name__)
+
+# GCRA atomique côté Redis ; TIME évite les écarts d'horloge entre workers
+_GCRA_LUA = """
+local emission = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local delay = tat - now
+if delay > tolerance then
+    return {0, tostring(delay - tolerance)}
+end
+local new_tat = tat + emission
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+return {1, tostring(new_tat - now)}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """📏 Débit soutenu + rafale maximale autorisée"""
+    requests_per_minute: float
+    burst: int = 1
+
+    @property
+    def emission_interval(self) -> float:
+        """Intervalle entre deux requêtes au débit soutenu (secondes)"""
+        return 60.0 / self.requests_per_minute
+
+    @property
+    def tolerance(self) -> float:
+        """Avance maximale sur le débit soutenu (rafale de `burst` requêtes)"""
+        return self.emission_interval * (max(1, self.burst) - 1)
+
+
+@dataclass
+class RateLimitDecision:
+    """🚦 Résultat d'un contrôle de débit"""
+    allowed: bool
+    limit: RateLimit
+    remaining: int
+    retry_after: float = 0.0
+    reset_after: float = 0.0
+
+
+class GCRARateLimiter:
+    """🚦 Limiteur GCRA par client et par route"""
+
+    def __init__(
+        self,
+        default_limit: RateLimit,
+        route_limits: Optional[Dict[str, RateLimit]] = None,
+        exempt_paths: Iterable[str] = (),
+        redis_client=None,
+        key_prefix: str = "nextvision:ratelimit",
+        sweep_interval_seconds: float = 60.0
+    ):
+        self.default_limit = default_limit
+        # Préfixe le plus long d'abord
+        self.route_limits: List[Tuple[str, RateLimit]] = sorted(
+            (route_limits or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.exempt_paths = tuple(exempt_paths)
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self.sweep_interval_seconds = sweep_interval_seconds
+
+        self._script = redis_client.register_script(_GCRA_LUA) if redis_client is not None else None
+        self._tat: Dict[str, float] = {}
+        self._next_sweep = time.monotonic() + sweep_interval_seconds
+        self._redis_failing = False
+
+        self.stats = {
+            "allowed": 0,
+            "rejected": 0,
+            "exempt": 0,
+            "redis_errors": 0,
+            "keys_swept": 0
+        }
+
+    @classmethod
+    def from_config(cls, security_config, redis_client=None) -> "GCRARateLimiter":
+        """🔧 Construction depuis SecurityConfig"""
+        return cls(
+            default_limit=RateLimit(
+                security_config.rate_limit_requests_per_minute,
+                security_config.rate_limit_burst
+            ),
+            route_limits={
+                prefix: RateLimit(rule["requests_per_minute"], int(rule.get("burst", 1)))
+                for prefix, rule in security_config.rate_limit_route_limits.items()
+            },
+            exempt_paths=security_config.rate_limit_exempt_paths,
+            redis_client=redis_client
+        )
+
+    def resolve(self, path: str) -> Optional[Tuple[str, RateLimit]]:
+        """Règle applicable à une route : (nom de règle, limite), None si exemptée"""
+        if path.startswith(self.exempt_paths):
+            return None
+        for prefix, limit in self.route_limits:
+            if path.startswith(prefix):
+                return prefix, limit
+        return "default", self.default_limit
+
+    async def check(self, client_id: str, path: str) -> Optional[RateLimitDecision]:
+        """🚦 Contrôle (et consommation) d'une requête ; None si la route est exemptée"""
+        rule = self.resolve(path)
+        if rule is None:
+            self.stats["exempt"] += 1
+            return None
+        rule_name, limit = rule
+        key = f"{rule_name}|{client_id}"
+
+        decision = None
+        if self._script is not None:
+            decision = await self._check_redis(key, limit)
+        if decision is None:
+            decision = self.check_local(key, limit)
+
+        self.stats["allowed" if decision.allowed else "rejected"] += 1
+        return decision
+
+    def check_local(self, key: str, limit: RateLimit, now: Optional[float] = None) -> RateLimitDecision:
+        """GCRA en mémoire (par processus)"""
+        now = time.monotonic() if now is None else now
+        if now >= self._next_sweep:
+            self.sweep(now)
+
+        tat = self._tat.get(key, now)
+        if tat < now:
+            tat = now
+        delay = tat - now
+        if delay > limit.tolerance:
+            return RateLimitDecision(False, limit, 0, retry_after=delay - limit.tolerance, reset_after=delay)
+
+        new_tat = tat + limit.emission_interval
+        self._tat[key] = new_tat
+        return self._allowed(limit, new_tat - now)
+
+    async def _check_redis(self, key: str, limit: RateLimit) -> Optional[RateLimitDecision]:
+        try:
+            allowed, value = await self._script(
+                keys=[f"{self.key_prefix}:{key}"],
+                args=[limit.emission_interval, limit.tolerance]
+            )
+        except Exception as e:
+            # Repli local ; un seul avertissement par période de panne
+            self.stats["redis_errors"] += 1
+            if not self._redis_failing:
+                logger.warning(f"⚠️ Rate limiting Redis indisponible, repli local: {e}")
+                self._redis_failing = True
+            return None
+
+        if self._redis_failing:
+            logger.info("✅ Rate limiting Redis rétabli")
+            self._redis_failing = False
+        value = float(value)
+        if int(allowed):
+            return self._allowed(limit, value)
+        return RateLimitDecision(False, limit, 0, retry_after=value, reset_after=value + limit.tolerance)
+
+    @staticmethod
+    def _allowed(limit: RateLimit, reset_after: float) -> RateLimitDecision:
+        remaining = int((limit.tolerance + limit.emission_interval - reset_after) / limit.emission_interval + 1e-9)
+        return RateLimitDecision(True, limit, max(0, remaining), reset_after=reset_after)
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """🧹 Oublie les clés entièrement rechargées (équivalentes à une clé absente)"""
+        now = time.monotonic() if now is None else now
+        self._next_sweep = now + self.sweep_interval_seconds
+        idle = [key for key, tat in self._tat.items() if tat <= now]
+        for key in idle:
+            del self._tat[key]
+        self.stats["keys_swept"] += len(idle)
+        return len(idle)
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            "backend": "redis" if self._script is not None and not self._redis_failing else "memory",
+            "tracked_keys": len(self._tat),
+            "default_limit": {
+                "requests_per_minute": self.default_limit.requests_per_minute,
+                "burst": self.default_limit.burst
+            },
+            "route_limits": {
+                prefix: {"requests_per_minute": limit.requests_per_minute, "burst": limit.burst}
+                for prefix, limit in self.route_limits
+            }
+        }
+
+
+def rate_limit_headers(decision: RateLimitDecision) -> Dict[str, str]:
+    """En-têtes X-RateLimit-* (et Retry-After si refus)"""
+    headers = {
+        "X-RateLimit-Limit": str(decision.limit.burst),
+        "X-RateLimit-Remaining": str(decision.remaining),
+        "X-RateLimit-Reset": str(math.ceil(decision.reset_after))
+    }
+    if not decision.allowed:
+        headers["Retry-After"] = str(max(1, math.ceil(decision.retry_after)))
+    return headers
+
+
+def add_rate_limiting_middleware(app, get_limiter: Callable[[], Optional[GCRARateLimiter]]):
+    """🚦 Installe le contrôle de débit sur une application FastAPI
+
+    `get_limiter` est appelé à chaque requête (le limiteur peut être remplacé au
+    démarrage, ex: backend Redis) ; None désactive le contrôle.
+    """
+    @app.middleware("http")
+    async def rate_limiting_middleware(request, call_next):
+        limiter = get_limiter()
+        if limiter is None:
+            return await call_next(request)
+
+        client_ip = request.client.host if request.client else "unknown"
+        decision = await limiter.check(client_ip, request.url.path)
+        if decision is None:
+            return await call_next(request)
+
+        if not decision.allowed:
+            return JSONResponse(
+                status_code=429,
+                content={"error": "Rate limit exceeded", "retry_after_seconds": round(decision.retry_after, 3)},
+                headers=rate_limit_headers(decision)
+            )
+
+        response = await call_next(request)
+        response.headers.update(rate_limit_headers(decision))
+        return response
+
+    return rate_limiting_middleware
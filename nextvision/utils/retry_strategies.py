@@ -8,16 +8,23 @@ Features:
 - Service-specific retry policies
 - Intelligent failure analysis
 - Cost optimization for API calls
+- Retry budgets (ratio retries / requests par service)
+- Hedged requests pour les opérations idempotentes (relance après le p95)
+- Deadline propagation (aucun retry au-delà du timeout de l'appelant)
 """
 
 import asyncio
+import inspect
 import random
 import time
 import math
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable, Union, Type
+from typing import Deque, Dict, List, Optional, Any, Callable, Tuple, Union, Type
 import nextvision_logging as logging
 
 from ..logging.structured_logging import get_structured_logger
@@ -60,6 +67,100 @@ class RetryConfig:
     retryable_exceptions: List[Type[Exception]] = field(default_factory=list)
     non_retryable_exceptions: List[Type[Exception]] = field(default_factory=list)
     
+    # Retry budget : retries (et hedges) ≤ ratio × requêtes sur la fenêtre,
+    # avec un minimum de retries toujours autorisés (None = pas de budget)
+    retry_budget_ratio: Optional[float] = 0.2
+    retry_budget_min_retries: int = 10
+    retry_budget_window_seconds: float = 10.0
+    
+    # Hedging (opérations idempotentes uniquement) : seconde tentative lancée
+    # si la première dépasse le percentile de latence observé
+    idempotent: bool = False
+    hedge_percentile: Optional[float] = None
+    hedge_min_samples: int = 20
+    
+
+class DeadlineExceededError(TimeoutError):
+    """⏱️ Deadline de l'appelant atteinte : plus de tentative possible"""
+
+
+class RetryBudget:
+    """
+    💰 Budget de retries d'un service (fenêtre glissante)
+    
+    Sous panne partielle, chaque requête en échec ne peut plus multiplier
+    la charge par max_attempts : les retries sont plafonnés à `ratio` × requêtes.
+    """
+    
+    def __init__(self, ratio: float, min_retries: int = 10, window_seconds: float = 10.0):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window_seconds = window_seconds
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+    
+    def _expire(self, now: float):
+        for events in (self._requests, self._retries):
+            while events and now - events[0] > self.window_seconds:
+                events.popleft()
+    
+    def record_request(self):
+        now = time.monotonic()
+        self._expire(now)
+        self._requests.append(now)
+    
+    def try_acquire(self) -> bool:
+        """Réserve un retry si le budget le permet"""
+        now = time.monotonic()
+        self._expire(now)
+        if len(self._retries) >= max(self.min_retries, self.ratio * len(self._requests)):
+            return False
+        self._retries.append(now)
+        return True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        self._expire(time.monotonic())
+        return {
+            "ratio": self.ratio,
+            "min_retries": self.min_retries,
+            "window_seconds": self.window_seconds,
+            "requests_in_window": len(self._requests),
+            "retries_in_window": len(self._retries)
+        }
+
+
+# Deadline absolue (time.monotonic) héritée par les appels imbriqués
+_current_deadline: ContextVar[Optional[float]] = ContextVar("nextvision_retry_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(timeout_seconds: float):
+    """⏱️ Deadline pour tous les execute_with_retry du bloc (jamais plus tardive que l'englobante)"""
+    deadline = time.monotonic() + timeout_seconds
+    current = _current_deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+# Vrai dans la tâche d'une requête hedgée (l'opération ne doit pas rejoindre la tentative lente)
+_hedge_attempt: ContextVar[bool] = ContextVar("nextvision_retry_hedge", default=False)
+
+
+def is_hedge_attempt() -> bool:
+    """L'opération en cours est-elle la requête hedgée d'un RetryExecutor ?"""
+    return _hedge_attempt.get()
+
+
+def get_remaining_time() -> Optional[float]:
+    """Temps restant avant la deadline courante (None si aucune)"""
+    deadline = _current_deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
 
 @dataclass
 class RetryAttempt:
@@ -84,6 +185,9 @@ class RetryResult:
     attempts_history: List[RetryAttempt] = field(default_factory=list)
     fallback_used: bool = False
     cost_estimate: float = 0.0
+    hedges_made: int = 0
+    budget_exhausted: bool = False
+    deadline_exceeded: bool = False
 
 
 class FailureAnalyzer:
@@ -364,6 +468,11 @@ class RetryExecutor:
         
         # Configurations par service
         self.service_configs = self._setup_service_configs()
+        
+        # Budgets, latences (hedging) et amplification par service
+        self.retry_budgets: Dict[str, RetryBudget] = {}
+        self.latency_history: Dict[str, Deque[float]] = {}
+        self.amplification_stats: Dict[str, Dict[str, int]] = {}
     
     def _setup_service_configs(self) -> Dict[str, RetryConfig]:
         """🔧 Configurations spécifiques par service"""
@@ -373,7 +482,9 @@ class RetryExecutor:
                 base_delay=2.0,
                 max_delay=120.0,
                 strategy=RetryStrategy.SMART_BACKOFF,
-                retryable_exceptions=[ConnectionError, TimeoutError]
+                retryable_exceptions=[ConnectionError, TimeoutError],
+                idempotent=True,  # Géocodage et itinéraires : lectures pures
+                hedge_percentile=0.95
             ),
             "database": RetryConfig(
                 max_attempts=5,
@@ -404,172 +515,348 @@ class RetryExecutor:
             )
         }
     
+    # === BUDGET, HEDGING, DEADLINE ===
+    
+    @staticmethod
+    def _empty_amplification_stats() -> Dict[str, int]:
+        return {
+            "requests": 0,
+            "attempts": 0,
+            "retries": 0,
+            "hedges": 0,
+            "hedge_wins": 0,
+            "budget_exhausted": 0,
+            "deadline_exceeded": 0
+        }
+    
+    def _get_amplification_stats(self, service: str) -> Dict[str, int]:
+        if service not in self.amplification_stats:
+            self.amplification_stats[service] = self._empty_amplification_stats()
+        return self.amplification_stats[service]
+    
+    def _get_retry_budget(self, service: str, config: RetryConfig) -> Optional[RetryBudget]:
+        if config.retry_budget_ratio is None:
+            return None
+        if service not in self.retry_budgets:
+            self.retry_budgets[service] = RetryBudget(
+                config.retry_budget_ratio,
+                config.retry_budget_min_retries,
+                config.retry_budget_window_seconds
+            )
+        return self.retry_budgets[service]
+    
+    def _record_latency(self, service: str, response_time: float):
+        if service not in self.latency_history:
+            self.latency_history[service] = deque(maxlen=200)
+        self.latency_history[service].append(response_time)
+    
+    def get_hedge_delay(self, service: str, config: RetryConfig) -> Optional[float]:
+        """⏱️ Délai avant hedge : percentile des latences récentes (None si pas de hedging)"""
+        if not config.idempotent or config.hedge_percentile is None:
+            return None
+        latencies = self.latency_history.get(service)
+        if not latencies or len(latencies) < config.hedge_min_samples:
+            return None
+        ordered = sorted(latencies)
+        index = min(int(math.ceil(config.hedge_percentile * len(ordered))) - 1, len(ordered) - 1)
+        return ordered[max(index, 0)]
+    
+    @staticmethod
+    async def _invoke(operation: Callable) -> Any:
+        """Appel sync ou async (y compris lambda renvoyant une coroutine)"""
+        result = operation()
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    
+    async def _run_attempt(
+        self,
+        operation: Callable,
+        service: str,
+        config: RetryConfig,
+        deadline: Optional[float],
+        budget: Optional[RetryBudget],
+        stats: Dict[str, int]
+    ) -> Tuple[Any, int]:
+        """🎯 Une tentative bornée par la deadline, doublée d'un hedge si elle traîne"""
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceededError(f"Deadline atteinte avant tentative {service}")
+        
+        hedge_delay = self.get_hedge_delay(service, config)
+        if hedge_delay is None:
+            try:
+                return await asyncio.wait_for(self._invoke(operation), timeout=remaining), 0
+            except asyncio.TimeoutError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise DeadlineExceededError(f"Deadline atteinte pendant l'appel {service}")
+                raise
+        
+        tasks = [asyncio.ensure_future(self._invoke(operation))]
+        try:
+            done, _ = await asyncio.wait(
+                tasks, timeout=hedge_delay if remaining is None else min(hedge_delay, remaining)
+            )
+            in_time = deadline is None or time.monotonic() < deadline
+            if not done and in_time and (budget is None or budget.try_acquire()):
+                # Première tentative au-delà du p95 : seconde requête en parallèle
+                hedge_token = _hedge_attempt.set(True)
+                try:
+                    tasks.append(asyncio.ensure_future(self._invoke(operation)))
+                finally:
+                    _hedge_attempt.reset(hedge_token)
+                stats["hedges"] += 1
+                logger.info(f"🪁 Hedge {service} après {hedge_delay * 1000:.0f}ms")
+            
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                timeout = None if deadline is None else deadline - time.monotonic()
+                if timeout is not None and timeout <= 0:
+                    raise DeadlineExceededError(f"Deadline atteinte pendant l'appel {service}")
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                # Première réponse réussie retenue (ordre de lancement en cas d'égalité)
+                for task in sorted(done, key=tasks.index):
+                    if task.exception() is None:
+                        if task is not tasks[0]:
+                            stats["hedge_wins"] += 1
+                        return task.result(), len(tasks) - 1
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
     async def execute_with_retry(
         self,
         operation: Callable,
         service: str = "default",
         config: Optional[RetryConfig] = None,
         context: Dict[str, Any] = None,
-        fallback: Optional[Callable] = None
+        fallback: Optional[Callable] = None,
+        timeout: Optional[float] = None
     ) -> RetryResult:
-        """🚀 Exécution avec retry intelligent"""
+        """
+        🚀 Exécution avec retry intelligent
+        
+        `timeout` (ou la deadline englobante de deadline_scope) borne la durée
+        totale : tentatives, hedges et attentes ne la dépassent jamais.
+        """
         
         # Configuration
         retry_config = config or self.service_configs.get(service, self.service_configs["default"])
         context = context or {}
         
+        # Deadline effective, propagée aux appels imbriqués
+        deadline = _current_deadline.get()
+        if timeout is not None:
+            deadline = min(deadline, time.monotonic() + timeout) if deadline is not None else time.monotonic() + timeout
+        deadline_token = _current_deadline.set(deadline)
+        
+        budget = self._get_retry_budget(service, retry_config)
+        if budget:
+            budget.record_request()
+        stats = self._get_amplification_stats(service)
+        stats["requests"] += 1
+        
         # Initialisation
         start_time = time.time()
         attempts_history = []
         final_result = None
         final_error = None
+        hedges_made = 0
+        budget_exhausted = False
+        deadline_exceeded = False
         
         logger.info(f"🚀 Démarrage retry pour {service} (max {retry_config.max_attempts} tentatives)")
         
-        for attempt in range(1, retry_config.max_attempts + 1):
-            attempt_start = time.time()
-            
-            try:
-                # Exécution de l'opération
-                if asyncio.iscoroutinefunction(operation):
-                    result = await operation()
-                else:
-                    result = operation()
-                
-                # Succès !
-                response_time = time.time() - attempt_start
-                self.delay_calculator.record_service_performance(service, response_time)
-                
-                attempt_record = RetryAttempt(
-                    attempt_number=attempt,
-                    timestamp=datetime.now(),
-                    delay_used=0.0,
-                    success=True,
-                    response_time=response_time
-                )
-                attempts_history.append(attempt_record)
-                
-                total_time = time.time() - start_time
-                
-                # Métriques de succès
-                if self.metrics:
-                    self.metrics.increment_counter(f"retry_success_{service}")
-                    self.metrics.record_timer(f"retry_total_time_{service}", total_time)
-                    self.metrics.record_gauge(f"retry_attempts_{service}", attempt)
-                
-                logger.info(f"✅ Succès {service} tentative {attempt}/{retry_config.max_attempts} ({response_time:.3f}s)")
-                
-                return RetryResult(
-                    success=True,
-                    attempts_made=attempt,
-                    total_time=total_time,
-                    final_result=result,
-                    attempts_history=attempts_history
-                )
+        try:
+            for attempt in range(1, retry_config.max_attempts + 1):
+                attempt_start = time.time()
+                stats["attempts"] += 1
                 
-            except Exception as error:
-                response_time = time.time() - attempt_start
-                
-                # Analyse de l'échec
-                failure_category = self.failure_analyzer.analyze_failure(service, error, context)
-                
-                # Vérifier si l'erreur est retry-able
-                if not self._is_retryable_error(error, retry_config, failure_category):
-                    logger.warning(f"❌ Erreur non-retry-able {service}: {error}")
+                try:
+                    # Exécution de l'opération (hedgée si idempotente et lente)
+                    result, hedges = await self._run_attempt(
+                        operation, service, retry_config, deadline, budget, stats
+                    )
+                    hedges_made += hedges
+                    
+                    # Succès !
+                    response_time = time.time() - attempt_start
+                    self.delay_calculator.record_service_performance(service, response_time)
+                    if not hedges:
+                        self._record_latency(service, response_time)
+                    
+                    attempt_record = RetryAttempt(
+                        attempt_number=attempt,
+                        timestamp=datetime.now(),
+                        delay_used=0.0,
+                        success=True,
+                        response_time=response_time
+                    )
+                    attempts_history.append(attempt_record)
                     
-                    # Métriques d'échec non-retry-able
+                    total_time = time.time() - start_time
+                    
+                    # Métriques de succès
                     if self.metrics:
-                        self.metrics.increment_counter(f"retry_non_retryable_{service}")
+                        self.metrics.increment_counter(f"retry_success_{service}")
+                        self.metrics.record_timer(f"retry_total_time_{service}", total_time)
+                        self.metrics.record_gauge(f"retry_attempts_{service}", attempt)
                     
-                    # Tentative de fallback
-                    if fallback:
-                        try:
-                            fallback_result = await fallback() if asyncio.iscoroutinefunction(fallback) else fallback()
-                            return RetryResult(
-                                success=True,
-                                attempts_made=attempt,
-                                total_time=time.time() - start_time,
-                                final_result=fallback_result,
-                                attempts_history=attempts_history,
-                                fallback_used=True
-                            )
-                        except Exception as fallback_error:
-                            logger.error(f"❌ Fallback échoué {service}: {fallback_error}")
+                    logger.info(f"✅ Succès {service} tentative {attempt}/{retry_config.max_attempts} ({response_time:.3f}s)")
                     
                     return RetryResult(
-                        success=False,
+                        success=True,
                         attempts_made=attempt,
-                        total_time=time.time() - start_time,
-                        final_error=error,
-                        attempts_history=attempts_history
+                        total_time=total_time,
+                        final_result=result,
+                        attempts_history=attempts_history,
+                        hedges_made=hedges_made
                     )
-                
-                # Enregistrement de la tentative
-                attempt_record = RetryAttempt(
-                    attempt_number=attempt,
-                    timestamp=datetime.now(),
-                    delay_used=0.0,
-                    error=error,
-                    success=False,
-                    response_time=response_time,
-                    failure_category=failure_category
-                )
-                attempts_history.append(attempt_record)
-                
-                # Dernière tentative ?
-                if attempt >= retry_config.max_attempts:
-                    final_error = error
-                    logger.error(f"❌ Échec final {service} après {attempt} tentatives: {error}")
                     
-                    # Métriques d'échec final
-                    if self.metrics:
-                        self.metrics.increment_counter(f"retry_final_failure_{service}")
-                        self.metrics.record_gauge(f"retry_max_attempts_{service}", attempt)
+                except Exception as error:
+                    response_time = time.time() - attempt_start
                     
-                    # Tentative de fallback
-                    if fallback:
-                        try:
-                            fallback_result = await fallback() if asyncio.iscoroutinefunction(fallback) else fallback()
-                            return RetryResult(
-                                success=True,
-                                attempts_made=attempt,
-                                total_time=time.time() - start_time,
-                                final_result=fallback_result,
-                                attempts_history=attempts_history,
-                                fallback_used=True
-                            )
-                        except Exception as fallback_error:
-                            logger.error(f"❌ Fallback échoué {service}: {fallback_error}")
+                    # Analyse de l'échec
+                    failure_category = self.failure_analyzer.analyze_failure(service, error, context)
                     
-                    break
-                
-                # Calcul du délai avant prochaine tentative
-                delay = self.delay_calculator.calculate_delay(
-                    attempt + 1, retry_config, failure_category, service
-                )
-                
-                attempt_record.delay_used = delay
-                
-                logger.warning(
-                    f"⚠️ Échec {service} tentative {attempt}/{retry_config.max_attempts}: {error} "
-                    f"(catégorie: {failure_category.value}, délai: {delay:.1f}s)"
-                )
-                
-                # Métriques de retry
-                if self.metrics:
-                    self.metrics.increment_counter(f"retry_attempt_{service}")
-                    self.metrics.record_timer(f"retry_delay_{service}", delay)
-                
-                # Attente avant prochaine tentative
-                await asyncio.sleep(delay)
-        
-        # Échec après toutes les tentatives
-        total_time = time.time() - start_time
+                    # Vérifier si l'erreur est retry-able
+                    if isinstance(error, DeadlineExceededError) or not self._is_retryable_error(
+                        error, retry_config, failure_category
+                    ):
+                        if isinstance(error, DeadlineExceededError):
+                            deadline_exceeded = True
+                            stats["deadline_exceeded"] += 1
+                            logger.warning(f"⏱️ Deadline atteinte {service} (tentative {attempt})")
+                        else:
+                            logger.warning(f"❌ Erreur non-retry-able {service}: {error}")
+                        
+                        # Métriques d'échec non-retry-able
+                        if self.metrics:
+                            self.metrics.increment_counter(f"retry_non_retryable_{service}")
+                        
+                        # Tentative de fallback
+                        if fallback:
+                            try:
+                                fallback_result = await self._invoke(fallback)
+                                return RetryResult(
+                                    success=True,
+                                    attempts_made=attempt,
+                                    total_time=time.time() - start_time,
+                                    final_result=fallback_result,
+                                    attempts_history=attempts_history,
+                                    fallback_used=True,
+                                    hedges_made=hedges_made,
+                                    deadline_exceeded=deadline_exceeded
+                                )
+                            except Exception as fallback_error:
+                                logger.error(f"❌ Fallback échoué {service}: {fallback_error}")
+                        
+                        return RetryResult(
+                            success=False,
+                            attempts_made=attempt,
+                            total_time=time.time() - start_time,
+                            final_error=error,
+                            attempts_history=attempts_history,
+                            hedges_made=hedges_made,
+                            deadline_exceeded=deadline_exceeded
+                        )
+                    
+                    # Enregistrement de la tentative
+                    attempt_record = RetryAttempt(
+                        attempt_number=attempt,
+                        timestamp=datetime.now(),
+                        delay_used=0.0,
+                        error=error,
+                        success=False,
+                        response_time=response_time,
+                        failure_category=failure_category
+                    )
+                    attempts_history.append(attempt_record)
+                    
+                    # Calcul du délai avant prochaine tentative
+                    delay = 0.0
+                    if attempt < retry_config.max_attempts:
+                        delay = self.delay_calculator.calculate_delay(
+                            attempt + 1, retry_config, failure_category, service
+                        )
+                        
+                        # Un retry ne survit jamais à la deadline de l'appelant
+                        if deadline is not None and time.monotonic() + delay >= deadline:
+                            deadline_exceeded = True
+                            stats["deadline_exceeded"] += 1
+                            logger.warning(f"⏱️ Pas de retry {service}: délai {delay:.1f}s au-delà de la deadline")
+                        # Budget épuisé : pas d'amplification de la charge
+                        elif budget and not budget.try_acquire():
+                            budget_exhausted = True
+                            stats["budget_exhausted"] += 1
+                            logger.warning(f"💰 Budget de retry épuisé pour {service}")
+                    
+                    # Dernière tentative ?
+                    if attempt >= retry_config.max_attempts or deadline_exceeded or budget_exhausted:
+                        final_error = error
+                        logger.error(f"❌ Échec final {service} après {attempt} tentatives: {error}")
+                        
+                        # Métriques d'échec final
+                        if self.metrics:
+                            self.metrics.increment_counter(f"retry_final_failure_{service}")
+                            self.metrics.record_gauge(f"retry_max_attempts_{service}", attempt)
+                        
+                        # Tentative de fallback
+                        if fallback:
+                            try:
+                                fallback_result = await self._invoke(fallback)
+                                return RetryResult(
+                                    success=True,
+                                    attempts_made=attempt,
+                                    total_time=time.time() - start_time,
+                                    final_result=fallback_result,
+                                    attempts_history=attempts_history,
+                                    fallback_used=True,
+                                    hedges_made=hedges_made,
+                                    budget_exhausted=budget_exhausted,
+                                    deadline_exceeded=deadline_exceeded
+                                )
+                            except Exception as fallback_error:
+                                logger.error(f"❌ Fallback échoué {service}: {fallback_error}")
+                        
+                        return RetryResult(
+                            success=False,
+                            attempts_made=attempt,
+                            total_time=time.time() - start_time,
+                            final_error=final_error,
+                            attempts_history=attempts_history,
+                            hedges_made=hedges_made,
+                            budget_exhausted=budget_exhausted,
+                            deadline_exceeded=deadline_exceeded
+                        )
+                    
+                    attempt_record.delay_used = delay
+                    stats["retries"] += 1
+                    
+                    logger.warning(
+                        f"⚠️ Échec {service} tentative {attempt}/{retry_config.max_attempts}: {error} "
+                        f"(catégorie: {failure_category.value}, délai: {delay:.1f}s)"
+                    )
+                    
+                    # Métriques de retry
+                    if self.metrics:
+                        self.metrics.increment_counter(f"retry_attempt_{service}")
+                        self.metrics.record_timer(f"retry_delay_{service}", delay)
+                    
+                    # Attente avant prochaine tentative
+                    await asyncio.sleep(delay)
+        finally:
+            _current_deadline.reset(deadline_token)
         
+        # Échec après toutes les tentatives (max_attempts < 1)
         return RetryResult(
             success=False,
-            attempts_made=retry_config.max_attempts,
-            total_time=total_time,
+            attempts_made=0,
+            total_time=time.time() - start_time,
             final_error=final_error,
             attempts_history=attempts_history
         )
@@ -617,7 +904,18 @@ class RetryExecutor:
                 "max_delay": config.max_delay
             },
             "failure_analysis": failure_trends,
-            "performance_history": self.delay_calculator.service_performance.get(service, [])
+            "performance_history": self.delay_calculator.service_performance.get(service, []),
+            "retry_amplification": self.get_retry_amplification(service),
+            "retry_budget": self.retry_budgets[service].get_stats() if service in self.retry_budgets else None,
+            "hedge_delay_seconds": self.get_hedge_delay(service, config)
+        }
+    
+    def get_retry_amplification(self, service: str) -> Dict[str, Any]:
+        """📈 Amplification : appels réellement émis (tentatives + hedges) par requête"""
+        stats = self.amplification_stats.get(service) or self._empty_amplification_stats()
+        return {
+            **stats,
+            "amplification": (stats["attempts"] + stats["hedges"]) / max(stats["requests"], 1)
         }
     
     def get_all_stats(self) -> Dict[str, Any]:
@@ -631,6 +929,10 @@ class RetryExecutor:
             "global_failure_trends": {
                 service: self.failure_analyzer.get_failure_trends(service)
                 for service in self.failure_analyzer.failure_history.keys()
+            },
+            "retry_amplification": {
+                service: self.get_retry_amplification(service)
+                for service in self.amplification_stats.keys()
             }
         }
 
@@ -0,0 +1,48 @@
+"""
+🔀 Nextvision - Single-flight asynchrone (coalescence des appels concurrents)
+
+Les appels concurrents d'une même clé partagent une seule exécution :
+- Le calcul tourne dans sa propre tâche : l'annulation (ou le timeout) d'un
+  appelant n'interrompt pas le calcul et n'est jamais transmise aux autres
+- Seules les vraies exceptions du calcul sont propagées à tous les appelants
+- Le résultat d'un calcul dont tous les appelants sont partis reste utilisé
+  (mise en cache par la fonction de calcul elle-même)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Single Flight
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """🔀 Table des calculs en cours, par clé"""
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Calcul en cours pour cette clé (l'appel suivant sera coalescé)"""
+        return key in self._tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def do(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Résultat de `compute()`, exécuté une seule fois pour les appels concurrents de `key`"""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        # shield : annuler l'attente d'un appelant n'annule pas le calcul partagé
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Exception consommée ici si plus aucun appelant n'attend (pas d'avertissement asyncio)
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,228 @@
+"""
+🧠 Nextvision - Index de compétences précompilé
+
+Normalisation et indexation des compétences pour le matching sémantique :
+- Identifiants canoniques pour chaque compétence du dictionnaire de synonymes
+- Formes tokenisées (minuscules, sans accents) et trie de tokens pour la détection
+- Profils compilés une seule fois en ensembles de n-grammes, le matching
+  devient une intersection d'ensembles (recherche exacte au-delà du plafond de
+  n-grammes)
+- Mémoire bornée : seules les compétences du dictionnaire reçoivent un
+  identifiant, les textes libres ne vivent que dans les caches LRU
+
+Author: NEXTEN Team
+Version: 1.0.0 - Skill Index
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# Dictionnaire de synonymes par défaut (compétence canonique -> formes équivalentes)
+DEFAULT_SKILL_SYNONYMS: Dict[str, List[str]] = {
+    "comptabilité": ["comptable", "gestion comptable", "finance", "fiscalité"],
+    "cegid": ["sage", "erp comptable", "logiciel comptable"],
+    "python": ["programmation python", "développement python", "coding python"],
+    "javascript": ["js", "développement web", "frontend", "nodejs"],
+    "management": ["encadrement", "leadership", "gestion équipe"],
+}
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+
+
+Tokens = Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CompiledSkill:
+    """Compétence compilée : phrase tokenisée, ses n-grammes et les concepts détectés"""
+    text: str
+    phrase: Tokens
+    ngrams: FrozenSet[Tokens]
+    # Concepts dont le mot-clé canonique apparaît dans la compétence
+    concept_ids: FrozenSet[int]
+    # Concepts dont un synonyme apparaît dans la compétence
+    synonym_ids: FrozenSet[int]
+
+
+@dataclass(frozen=True)
+class CompiledSkillProfile:
+    """Ensemble de compétences compilé (profil candidat ou liste d'exigences)"""
+    skills: Tuple[CompiledSkill, ...]
+    phrases: FrozenSet[Tokens]
+    ngrams: FrozenSet[Tokens]
+    synonym_ids: FrozenSet[int]
+    # Phrases plus longues que le plafond de n-grammes (recherche exacte)
+    long_phrases: Tuple[Tokens, ...] = ()
+
+
+class SkillIndex:
+    """🧠 Index de normalisation et de synonymes des compétences
+
+    Une compétence A matche un profil si :
+    - la phrase A est contenue (en tokens) dans une compétence du profil, ou
+    - une compétence du profil est contenue (en tokens) dans A, ou
+    - A contient un mot-clé canonique dont un synonyme apparaît dans le profil
+      (synonymes, optionnel et directionnel : "comptabilité" est satisfait par
+      "gestion comptable", l'inverse non)
+
+    Les n-grammes sont plafonnés à `max_ngram` tokens (au moins la plus longue
+    forme du dictionnaire) ; les phrases plus longues sont vérifiées par
+    recherche exacte de sous-séquence.
+    """
+
+    def __init__(self, synonyms: Optional[Dict[str, List[str]]] = None,
+                 max_ngram: int = 8, cache_size: int = 4096):
+        self.synonyms = synonyms if synonyms is not None else DEFAULT_SKILL_SYNONYMS
+
+        # Identifiants canoniques (vocabulaire du dictionnaire uniquement) et tries
+        # séparés des mots-clés et des synonymes (le matching reste directionnel)
+        self.canonical_ids: Dict[str, int] = {}
+        self._canonical_trie: Dict = {}
+        self._synonym_trie: Dict = {}
+        longest_form = 1
+        for concept_id, (canonical, forms) in enumerate(self.synonyms.items()):
+            self.canonical_ids[canonical] = concept_id
+            tokens = self.tokenize(canonical)
+            longest_form = max(longest_form, len(tokens))
+            self._add_to_trie(self._canonical_trie, tokens, concept_id)
+            for form in forms:
+                tokens = self.tokenize(form)
+                longest_form = max(longest_form, len(tokens))
+                self._add_to_trie(self._synonym_trie, tokens, concept_id)
+
+        self.max_ngram = max(max_ngram, longest_form)
+
+        # Caches de compilation (clé = texte brut)
+        self.compile_skill = lru_cache(maxsize=cache_size)(self._compile_skill)
+        self._compile_profile_cached = lru_cache(maxsize=cache_size)(self._compile_profile)
+
+    # === NORMALISATION ===
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Minuscules et suppression des accents"""
+        decomposed = unicodedata.normalize("NFKD", text.lower())
+        return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+    @classmethod
+    def tokenize(cls, text: str) -> Tokens:
+        """Forme tokenisée normalisée d'une compétence"""
+        return tuple(_TOKEN_PATTERN.findall(cls.normalize(text)))
+
+    @staticmethod
+    def _contains(tokens: Tokens, phrase: Tokens) -> bool:
+        """La phrase apparaît-elle (tokens contigus) dans la séquence ?"""
+        size = len(phrase)
+        return any(tokens[start:start + size] == phrase for start in range(len(tokens) - size + 1))
+
+    @staticmethod
+    def _add_to_trie(trie: Dict, tokens: Tokens, concept_id: int):
+        node = trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node.setdefault(None, set()).add(concept_id)
+
+    @staticmethod
+    def _detect_concepts(trie: Dict, tokens: Tokens) -> FrozenSet[int]:
+        """Détecte en une passe toutes les formes du trie présentes dans les tokens"""
+        concepts = set()
+        for start in range(len(tokens)):
+            node = trie
+            for token in tokens[start:]:
+                node = node.get(token)
+                if node is None:
+                    break
+                if None in node:
+                    concepts.update(node[None])
+        return frozenset(concepts)
+
+    # === COMPILATION ===
+
+    def _compile_skill(self, text: str) -> CompiledSkill:
+        tokens = self.tokenize(text)
+        ngrams = frozenset(
+            tokens[start:end]
+            for start in range(len(tokens))
+            for end in range(start + 1, min(len(tokens), start + self.max_ngram) + 1)
+        )
+
+        return CompiledSkill(
+            text=text,
+            phrase=tokens,
+            ngrams=ngrams,
+            concept_ids=self._detect_concepts(self._canonical_trie, tokens),
+            synonym_ids=self._detect_concepts(self._synonym_trie, tokens)
+        )
+
+    def _compile_profile(self, skills: Tuple[str, ...]) -> CompiledSkillProfile:
+        compiled = tuple(self.compile_skill(skill) for skill in skills if skill and skill.strip())
+        return CompiledSkillProfile(
+            skills=compiled,
+            phrases=frozenset(skill.phrase for skill in compiled if skill.phrase),
+            ngrams=frozenset().union(*(skill.ngrams for skill in compiled)),
+            synonym_ids=frozenset().union(*(skill.synonym_ids for skill in compiled)),
+            long_phrases=tuple(skill.phrase for skill in compiled if len(skill.phrase) > self.max_ngram)
+        )
+
+    def compile_profile(self, skills: Iterable[str]) -> CompiledSkillProfile:
+        """Compile une liste de compétences (mise en cache par contenu)"""
+        return self._compile_profile_cached(tuple(skills))
+
+    # === MATCHING ===
+
+    def matches(self, skill, profile: CompiledSkillProfile, use_synonyms: bool = True) -> bool:
+        """Vérifie si une compétence (texte ou compilée) matche un profil compilé"""
+        if isinstance(skill, str):
+            skill = self.compile_skill(skill)
+        if not skill.ngrams:
+            return False
+
+        return (
+            self._in_profile(skill, profile)
+            or self.contains_profile_phrase(skill, profile)
+            or (use_synonyms and not skill.concept_ids.isdisjoint(profile.synonym_ids))
+        )
+
+    def _in_profile(self, skill: CompiledSkill, profile: CompiledSkillProfile) -> bool:
+        """La phrase de la compétence est contenue dans une compétence du profil"""
+        if len(skill.phrase) <= self.max_ngram:
+            return skill.phrase in profile.ngrams
+        return any(self._contains(other.phrase, skill.phrase) for other in profile.skills)
+
+    def contains_profile_phrase(self, skill: CompiledSkill, profile: CompiledSkillProfile) -> bool:
+        """Une compétence du profil est contenue dans la compétence"""
+        if not skill.ngrams.isdisjoint(profile.phrases):
+            return True
+        return any(self._contains(skill.phrase, phrase) for phrase in profile.long_phrases)
+
+    def count_matches(self, required: Iterable[str], profile: CompiledSkillProfile,
+                      use_synonyms: bool = True) -> int:
+        """Nombre de compétences requises présentes dans le profil"""
+        return sum(1 for skill in required if self.matches(skill, profile, use_synonyms))
+
+    def get_stats(self) -> Dict:
+        """Statistiques de l'index"""
+        skill_cache = self.compile_skill.cache_info()
+        profile_cache = self._compile_profile_cached.cache_info()
+        return {
+            "canonical_skills": len(self.canonical_ids),
+            "max_ngram": self.max_ngram,
+            "skill_cache_hits": skill_cache.hits,
+            "skill_cache_misses": skill_cache.misses,
+            "profile_cache_hits": profile_cache.hits,
+            "profile_cache_misses": profile_cache.misses
+        }
+
+
+_default_index: Optional[SkillIndex] = None
+
+
+def get_default_skill_index() -> SkillIndex:
+    """Index partagé construit sur DEFAULT_SKILL_SYNONYMS"""
+    global _default_index
+    if _default_index is None:
+        _default_index = SkillIndex()
+    return _default_index
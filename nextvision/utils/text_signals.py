@@ -0,0 +1,183 @@
+"""
+🔎 Nextvision - Détection de signaux textuels multi-catégories
+
+Les services d'analyse (niveau hiérarchique, intelligence job) testaient
+chaque mot-clé (`keyword in text`) et chaque regex de titre (`re.search`,
+IGNORECASE, le plus coûteux) séparément sur le texte complet, liste par liste :
+- Mots-clés dédupliqués toutes catégories confondues : chaque mot-clé distinct
+  n'est cherché qu'une fois par texte (recherche `in` native, plus rapide en
+  CPython qu'une regex combinée en trie ou un automate Aho-Corasick en Python)
+- Les regex sont préfiltrées par leur littéral de tête (ex. `\\bDAF\\b` → "daf") :
+  elles ne sont évaluées qu'aux positions où ce littéral apparaît
+- Matchers compilés une fois par spécification et partagés
+
+Author: NEXTEN Team
+Version: 1.0.0 - Text Signals
+"""
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+Spec = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+@dataclass(frozen=True)
+class TextSignals:
+    """🔎 Résultat d'un passage : entrées trouvées par catégorie (ordre de la spécification)"""
+    hits: Dict[str, Tuple[str, ...]]
+    terms: FrozenSet[str]
+
+    def count(self, category: str) -> int:
+        return len(self.hits.get(category, ()))
+
+    def found(self, category: str) -> Tuple[str, ...]:
+        return self.hits.get(category, ())
+
+    def has(self, term: str) -> bool:
+        """Mot-clé présent (équivalent de `term in text`)"""
+        return term in self.terms
+
+
+def _leading(nodes) -> Optional[Tuple[str, ...]]:
+    nodes = list(nodes)
+    # Assertions de tête (\b, ^) : sans largeur, ignorées
+    while nodes and nodes[0][0] is sre_parse.AT:
+        nodes.pop(0)
+    if not nodes:
+        return None
+
+    op, value = nodes[0]
+    if op is sre_parse.LITERAL:
+        chars = []
+        for op, value in nodes:
+            if op is not sre_parse.LITERAL:
+                break
+            chars.append(chr(value))
+        return ("".join(chars),)
+    if op is sre_parse.SUBPATTERN:
+        return _leading(value[-1])
+    if op is sre_parse.BRANCH:
+        literals = [_leading(branch) for branch in value[1]]
+        if any(branch is None for branch in literals):
+            return None
+        return tuple(literal for branch in literals for literal in branch)
+    return None
+
+
+def leading_literals(pattern: str, flags: int = 0) -> Optional[Tuple[str, ...]]:
+    """
+    Littéraux par lesquels toute correspondance de `pattern` commence
+    (`\\b(?:directeur|directrice)\\s+...` → ("direct",)), None si indéterminé
+    """
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except (re.error, TypeError):
+        return None
+
+    literals = _leading(parsed)
+    if literals is None:
+        return None
+    if parsed.state.flags & re.IGNORECASE:
+        literals = tuple(literal.lower() for literal in literals)
+    return tuple(dict.fromkeys(literals))
+
+
+class TextSignalMatcher:
+    """
+    🔎 MATCHER MULTI-CATÉGORIES
+    ============================
+
+    `keywords` : catégorie → mots-clés (présence comme `keyword in text`)
+    `patterns` : catégorie → regex (présence comme `re.search(pattern, text, flags)`)
+    Les mots-clés restent sensibles à la casse, comme les tests `in` d'origine.
+    """
+
+    def __init__(
+        self,
+        keywords: Mapping[str, Sequence[str]],
+        patterns: Optional[Mapping[str, Sequence[str]]] = None,
+        flags: int = re.IGNORECASE
+    ):
+        self.keywords = {category: tuple(terms) for category, terms in keywords.items()}
+        self.patterns = {category: tuple(items) for category, items in (patterns or {}).items()}
+
+        # Regex préfiltrées par littéral de tête, sinon évaluées sur tout le texte
+        self._anchored: Dict[str, List[Tuple[str, "re.Pattern"]]] = defaultdict(list)
+        self._unanchored: List[Tuple[str, "re.Pattern"]] = []
+        self._compiled: Dict[str, "re.Pattern"] = {}
+        self._ignore_case = bool(flags & re.IGNORECASE)
+        for pattern in dict.fromkeys(pattern for items in self.patterns.values() for pattern in items):
+            compiled = self._compiled[pattern] = re.compile(pattern, flags)
+            anchors = leading_literals(pattern, flags)
+            if anchors is None:
+                self._unanchored.append((pattern, compiled))
+            else:
+                for anchor in anchors:
+                    self._anchored[anchor].append((pattern, compiled))
+
+        # Mots-clés distincts toutes catégories confondues
+        self._terms = tuple(sorted({term for items in self.keywords.values() for term in items}))
+
+    def scan(self, text: str) -> TextSignals:
+        """🚀 Chaque terme distinct cherché une fois, toutes catégories"""
+        found = {term for term in self._terms if term in text}
+
+        # Littéraux IGNORECASE cherchés en minuscules (positions valides si même longueur)
+        folded = text.lower() if self._ignore_case else text
+        if len(folded) != len(text):
+            return self._scan_without_anchors(text, found)
+
+        matched = set()
+        for anchor, patterns in self._anchored.items():
+            positions = []
+            position = folded.find(anchor)
+            while position != -1:
+                positions.append(position)
+                position = folded.find(anchor, position + 1)
+            if not positions:
+                continue
+            for pattern, compiled in patterns:
+                if pattern not in matched and any(compiled.match(text, position) for position in positions):
+                    matched.add(pattern)
+        for pattern, compiled in self._unanchored:
+            if compiled.search(text):
+                matched.add(pattern)
+        return self._signals(found, matched)
+
+    def _scan_without_anchors(self, text: str, found: Set[str]) -> TextSignals:
+        matched = {
+            pattern for pattern, compiled in self._compiled.items() if compiled.search(text)
+        }
+        return self._signals(found, matched)
+
+    def _signals(self, found: Set[str], matched: Set[str]) -> TextSignals:
+        hits = {category: tuple(term for term in terms if term in found) for category, terms in self.keywords.items()}
+        for category, items in self.patterns.items():
+            hits[category] = tuple(pattern for pattern in items if pattern in matched)
+        return TextSignals(hits, frozenset(found))
+
+
+def _freeze(spec: Optional[Mapping[str, Sequence[str]]]) -> Spec:
+    return tuple((category, tuple(items)) for category, items in (spec or {}).items())
+
+
+@lru_cache(maxsize=32)
+def _compile(keywords: Spec, patterns: Spec, flags: int) -> TextSignalMatcher:
+    return TextSignalMatcher(dict(keywords), dict(patterns), flags)
+
+
+def get_text_signal_matcher(
+    keywords: Mapping[str, Sequence[str]],
+    patterns: Optional[Mapping[str, Sequence[str]]] = None,
+    flags: int = re.IGNORECASE
+) -> TextSignalMatcher:
+    """Matcher partagé pour une spécification donnée (compilé une seule fois)"""
+    return _compile(_freeze(keywords), _freeze(patterns), flags)
@@ -22,6 +22,9 @@ from typing import Dict, Any, Optional
 from gpt_modules.cv_parser import CVParserGPT
 from gpt_modules.job_parser import JobParserGPT
 from gpt_modules.integration import GPTNextvisionIntegrator
+from nextvision.services.document_extraction import (
+    LEGACY_WORD_EXTENSIONS, PDF_EXTENSIONS, WORD_EXTENSIONS, extract_text_from_bytes
+)
 import openai
 
 # Configuration
@@ -63,26 +66,27 @@ def allowed_file(filename):
     """Vérifie si le fichier est autorisé"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def document_format_label(file_path: str) -> str:
+    """Libellé du format d'un document (messages de fallback)"""
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in PDF_EXTENSIONS:
+        return "PDF"
+    if extension in WORD_EXTENSIONS + LEGACY_WORD_EXTENSIONS:
+        return "Document Word"
+    return "Document"
+
 def extract_text_from_file(file_path: str) -> str:
-    """Extrait le texte d'un fichier uploadé"""
+    """Extrait le texte d'un fichier uploadé (PDF page par page via l'extracteur partagé)"""
     try:
-        # Pour les PDF, utiliser pdfplumber
-        if file_path.lower().endswith('.pdf'):
-            try:
-                import pdfplumber
-                with pdfplumber.open(file_path) as pdf:
-                    text = ""
-                    for page in pdf.pages:
-                        text += page.extract_text() + "\n"
-                    return text
-            except ImportError:
-                logger.warning("pdfplumber non disponible, utilisation du fallback")
-                return f"[PDF non lisible - {os.path.basename(file_path)}]"
-        
-        # Pour les fichiers texte
-        else:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        
+        # Texte complet : le prompt CV Parser v4.0.3 n'est pas tronqué
+        extracted = extract_text_from_bytes(data, file_path, max_chars=None)
+        if extracted.error:
+            logger.warning(f"Extraction impossible ({extracted.error}), utilisation du fallback")
+            return f"[{document_format_label(file_path)} non lisible - {os.path.basename(file_path)}]"
+        return extracted.text
                 
     except Exception as e:
         logger.error(f"Erreur extraction texte: {str(e)}")
@@ -0,0 +1,127 @@
+"""
+📝 Nextvision - Benchmark du coût des logs par matching
+
+Mesure le temps moyen d'un matching bidirectionnel complet (cache ignoré)
+selon la configuration de logs du logger racine "nextvision" :
+- disabled : niveau WARNING (les gardes de niveau évitent tout formatage)
+- sync     : handler JSON structuré exécuté dans le thread appelant
+- async    : même handler derrière AsyncLogPipeline (thread d'écriture)
+Le surcoût par matching est la différence avec le mode "disabled".
+--sink-latency-us simule une écriture bloquante (disque saturé, pipe plein).
+
+Usage: python tests/benchmark_logging_overhead.py [nb_matchings] [--sink-latency-us N]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+
+from nextvision.models.bidirectional_models import BiDirectionalMatchingRequest
+from nextvision.nextvision_logging.structured_logging import (
+    AsyncLogPipeline, ContextualFilter, StructuredFormatter
+)
+from nextvision.services.bidirectional_matcher import BiDirectionalMatcher
+from tests.fixtures.v3_profiles import make_candidate_v3, make_company_v3
+
+DEFAULT_MATCHES = 2000
+
+
+class _SlowSink:
+    """Flux dont chaque écriture bloque `latency_s` secondes"""
+
+    def __init__(self, stream, latency_s: float):
+        self.stream = stream
+        self.latency_s = latency_s
+
+    def write(self, data):
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        return self.stream.write(data)
+
+    def flush(self):
+        self.stream.flush()
+
+
+class _LineCounter(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 1
+
+
+def _json_handler(stream) -> logging.Handler:
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(StructuredFormatter())
+    return handler
+
+
+async def run_matches(matcher: BiDirectionalMatcher, requests) -> float:
+    """Temps moyen par matching (µs)"""
+    start = time.perf_counter()
+    for request in requests:
+        await matcher.calculate_bidirectional_match(request, force_refresh=True)
+    return (time.perf_counter() - start) / len(requests) * 1e6
+
+
+async def main(matches: int, sink_latency_us: float):
+    root = logging.getLogger("nextvision")
+    root.propagate = False
+    requests = [
+        BiDirectionalMatchingRequest(
+            candidat=make_candidate_v3(i % 10).base_profile,
+            entreprise=make_company_v3(i % 7).base_profile
+        )
+        for i in range(matches)
+    ]
+    matcher = BiDirectionalMatcher()
+    # Préchauffage (caches internes des scorers) et comptage des lignes par matching
+    counter = _LineCounter()
+    root.addHandler(counter)
+    root.setLevel(logging.INFO)
+    await run_matches(matcher, requests[:50])
+    root.removeHandler(counter)
+    lines_per_match = counter.count / 50
+
+    results = {}
+    with open(os.devnull, "w") as null_stream:
+        devnull = _SlowSink(null_stream, sink_latency_us / 1e6)
+        root.setLevel(logging.WARNING)
+        results["disabled"] = await run_matches(matcher, requests)
+
+        root.setLevel(logging.INFO)
+        handler = _json_handler(devnull)
+        handler.addFilter(ContextualFilter())
+        root.addHandler(handler)
+        results["sync"] = await run_matches(matcher, requests)
+        root.removeHandler(handler)
+
+        pipeline = AsyncLogPipeline([_json_handler(devnull)], queue_size=100_000)
+        pipeline.start()
+        root.addHandler(pipeline.handler)
+        results["async"] = await run_matches(matcher, requests)
+        root.removeHandler(pipeline.handler)
+        drain_start = time.perf_counter()
+        pipeline.stop()
+        drain_ms = (time.perf_counter() - drain_start) * 1000
+
+    print(
+        f"📝 Coût des logs par matching ({matches} matchings, {lines_per_match:.0f} lignes INFO/matching, "
+        f"latence d'écriture {sink_latency_us:.0f}µs)"
+    )
+    print(f"{'mode':>10} {'µs/matching':>12} {'surcoût µs':>11}")
+    for mode, per_match in results.items():
+        print(f"{mode:>10} {per_match:>12.1f} {per_match - results['disabled']:>11.1f}")
+    print(f"(vidage final de la file async : {drain_ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("matches", nargs="?", type=int, default=DEFAULT_MATCHES)
+    parser.add_argument("--sink-latency-us", type=float, default=0.0)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.matches, args.sink_latency_us))
@@ -0,0 +1,101 @@
+"""
+⚙️ Nextvision V3.0 - Benchmark modes d'exécution du scorer Enhanced
+
+Compare le mode "inline" (scorers CPU sur la boucle d'événements) et le mode
+"process" (pool de processus) sur des lots de 1, 100 et 10 000 paires.
+Mesure aussi la réactivité de la boucle : retard maximal d'un tick de 10ms
+pendant le calcul du lot.
+
+Usage: python tests/benchmark_scorer_v3_execution.py [nb_paires ...] [--workers N]
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import time
+from typing import Dict, List
+
+from nextvision.models.extended_bidirectional_models_v3 import ExtendedMatchingRequestV3
+from nextvision.services.enhanced_bidirectional_scorer_v3 import EnhancedBidirectionalScorerV3
+from nextvision.services.scoring_process_pool import ScoringProcessPool
+from tests.fixtures.v3_profiles import make_candidate_v3, make_company_v3
+
+DEFAULT_SIZES = [1, 100, 10_000]
+TICK_SECONDS = 0.01
+
+
+def build_requests(pairs: int) -> List[ExtendedMatchingRequestV3]:
+    """Grille candidats × entreprises (profils partagés entre paires)"""
+    side = max(1, math.isqrt(pairs))
+    candidates = [make_candidate_v3(i) for i in range(side)]
+    companies = [make_company_v3(i) for i in range(math.ceil(pairs / side))]
+    return [
+        ExtendedMatchingRequestV3(candidate=candidates[i % side], company=companies[i // side])
+        for i in range(pairs)
+    ]
+
+
+async def _watch_event_loop(stop: asyncio.Event, delays: List[float]):
+    """Mesure le retard des ticks de la boucle pendant le calcul"""
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK_SECONDS
+        await asyncio.sleep(TICK_SECONDS)
+        delays.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+
+async def run_benchmark(scorer: EnhancedBidirectionalScorerV3, requests: List[ExtendedMatchingRequestV3]) -> Dict:
+    stop = asyncio.Event()
+    delays: List[float] = []
+    watcher = asyncio.create_task(_watch_event_loop(stop, delays))
+
+    start = time.perf_counter()
+    responses = await scorer.calculate_enhanced_bidirectional_scores_batch(requests)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await watcher
+
+    return {
+        "pairs": len(responses),
+        "total_s": elapsed,
+        "pairs_per_s": len(responses) / max(elapsed, 1e-9),
+        "max_loop_lag_ms": max(delays, default=elapsed * 1000)
+    }
+
+
+async def main(sizes: List[int], workers: int):
+    pool = ScoringProcessPool(max_workers=workers)
+    scorers = {
+        "inline": EnhancedBidirectionalScorerV3(),
+        "process": EnhancedBidirectionalScorerV3(execution_mode="process", process_pool=pool)
+    }
+    # Seuil à 1 : le benchmark mesure aussi le coût du pool sur les petits lots
+    scorers["process"].performance_config["process_min_batch_size"] = 1
+
+    # Démarrage des workers hors mesure
+    await scorers["process"].calculate_enhanced_bidirectional_scores_batch(build_requests(workers))
+
+    print(f"⚙️ Benchmark EnhancedBidirectionalScorerV3 ({pool.max_workers} workers)")
+    print(f"{'paires':>8} {'mode':>8} {'total (s)':>10} {'paires/s':>10} {'lag max (ms)':>13}")
+    try:
+        for size in sizes:
+            requests = build_requests(size)
+            for mode, scorer in scorers.items():
+                result = await run_benchmark(scorer, requests)
+                print(
+                    f"{result['pairs']:>8} {mode:>8} {result['total_s']:>10.3f} "
+                    f"{result['pairs_per_s']:>10.0f} {result['max_loop_lag_ms']:>13.1f}"
+                )
+    finally:
+        scorers["process"].close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main(args.sizes, args.workers or ScoringProcessPool().max_workers))
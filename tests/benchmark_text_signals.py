@@ -0,0 +1,107 @@
+"""
+🔎 Nextvision - Benchmark détection de signaux textuels
+
+Compare, sur N fiches de poste (10 000 par défaut, générées à partir de
+phrases d'offres comptables/finance réelles), les vérifications une à une
+(`re.search` par titre et `in` par mot-clé, liste par liste) et le matcher
+partagé de `nextvision.utils.text_signals`, pour HierarchicalDetector et
+JobIntelligenceService. Vérifie aussi que les résultats sont identiques.
+
+Usage: python tests/benchmark_text_signals.py [nb_offres] [--seed N]
+"""
+
+import argparse
+import logging
+import random
+import re
+import time
+from typing import Callable, Dict, List, Tuple
+
+from nextvision.services.hierarchical_detector import HierarchicalDetector
+from nextvision.services.job_intelligence_service import JobIntelligenceService
+
+SENTENCES = [
+    "Nous recherchons un Comptable Général H/F pour rejoindre notre équipe finance.",
+    "Rattaché(e) au Directeur Administratif et Financier (DAF), vous prenez en charge la comptabilité fournisseurs.",
+    "Au sein d'un groupe international coté, le Responsable Comptable encadre une équipe de 5 personnes.",
+    "Vous assurez la saisie comptable, les rapprochements bancaires et les déclarations de TVA.",
+    "Vous participez aux clôtures mensuelles et annuelles ainsi qu'au reporting groupe.",
+    "Startup en forte croissance, nous utilisons l'IA et le machine learning pour la fintech.",
+    "Télétravail 2 jours par semaine, horaires flexibles, RTT et mutuelle prise en charge.",
+    "Formation continue, mentoring et accompagnement vers une certification DSCG.",
+    "Profil : 5 ans d'expérience minimum en cabinet ou en entreprise, maîtrise de SAP.",
+    "Le Chef Comptable Principal pilote la consolidation et l'audit interne.",
+    "Poste de stagiaire comptable, découverte métier et initiation aux outils.",
+    "Autonomie, rigueur et esprit d'initiative sont indispensables pour ce poste.",
+    "Rémunération : 45-55 k€ selon profil, tickets restaurant et congés supplémentaires.",
+    "Multinationale du secteur industriel, siège à Paris, processus et procédures groupe.",
+    "Management transversal, gestion budgétaire et contrôle de gestion opérationnel.",
+    "Comptable senior, vous gérez un portefeuille de dossiers complexes en autonomie."
+]
+
+
+def build_job_descriptions(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(SENTENCES, k=rng.randint(6, 30))) for _ in range(count)]
+
+
+def legacy_level_scan(detector: HierarchicalDetector, text: str) -> Dict:
+    """Vérifications une à une (implémentation historique)"""
+    found = {}
+    for level, patterns in detector.level_patterns.items():
+        found[level] = (
+            tuple(p for p in patterns['titles'] if re.search(p, text, re.IGNORECASE)),
+            tuple(k for k in patterns['keywords'] if k in text),
+            tuple(r for r in patterns['responsibilities'] if r in text)
+        )
+    return found
+
+
+def matcher_level_scan(detector: HierarchicalDetector, text: str) -> Dict:
+    signals = detector._get_signal_matcher().scan(text)
+    return {
+        level: tuple(signals.found(f'{level.name}:{kind}') for kind in ('titles', 'keywords', 'responsibilities'))
+        for level in detector.level_patterns
+    }
+
+
+def legacy_job_scan(service: JobIntelligenceService, text: str) -> Dict:
+    return {
+        category: tuple(term for term in terms if term in text)
+        for category, terms in service.signal_matcher.keywords.items()
+    }
+
+
+def timed(function: Callable, texts: List[str]) -> Tuple[float, List]:
+    start = time.perf_counter()
+    results = [function(text) for text in texts]
+    return time.perf_counter() - start, results
+
+
+def main(count: int, seed: int):
+    texts = [text.lower() for text in build_job_descriptions(count, seed)]
+    detector = HierarchicalDetector()
+    service = JobIntelligenceService()
+
+    print(f"🔎 Benchmark signaux textuels ({count} offres, {sum(map(len, texts)) // count} caractères en moyenne)")
+    print(f"{'service':>22} {'mode':>8} {'total (s)':>10} {'µs/offre':>10}")
+    for name, legacy, fast in (
+        ("HierarchicalDetector", lambda t: legacy_level_scan(detector, t), lambda t: matcher_level_scan(detector, t)),
+        ("JobIntelligence", lambda t: legacy_job_scan(service, t), lambda t: service.signal_matcher.scan(t).hits)
+    ):
+        legacy_time, legacy_results = timed(legacy, texts)
+        fast_time, fast_results = timed(fast, texts)
+        for mode, elapsed in (("legacy", legacy_time), ("matcher", fast_time)):
+            print(f"{name:>22} {mode:>8} {elapsed:>10.3f} {elapsed / count * 1e6:>10.1f}")
+        mismatches = sum(1 for legacy_hits, fast_hits in zip(legacy_results, fast_results) if legacy_hits != fast_hits)
+        print(f"{'':>22} {'écarts':>8} {mismatches:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("count", nargs="?", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    main(args.count, args.seed)
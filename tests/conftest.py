@@ -0,0 +1,8 @@
+"""
+🧪 Configuration pytest partagée
+
+Author: NEXTEN Team
+Version: 1.0.0 - Shared Fixtures
+"""
+
+from tests.fixtures.stub_servers import google_maps_stub, openai_stub  # noqa: F401
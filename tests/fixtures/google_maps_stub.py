@@ -0,0 +1,106 @@
+"""
+🧪 Stub HTTP local Google Maps (Geocoding, Directions, Distance Matrix)
+
+Serveur aiohttp minimal pour tester GoogleMapsService hors ligne :
+les durées sont dérivées de la distance haversine entre coordonnées.
+
+Author: NEXTEN Team
+Version: 1.0.0 - Offline Google Maps Stub
+"""
+
+from math import radians, sin, cos, sqrt, atan2
+from typing import Dict, Optional, Tuple
+
+from aiohttp import web
+
+SPEED_KMH_BY_MODE = {"driving": 30, "transit": 20, "bicycling": 15, "walking": 5}
+
+
+def _parse_point(value: str) -> Tuple[float, float]:
+    lat, lng = value.split(",")
+    return float(lat), float(lng)
+
+
+def _distance_meters(origin: Tuple[float, float], destination: Tuple[float, float]) -> int:
+    lat1, lon1 = map(radians, origin)
+    lat2, lon2 = map(radians, destination)
+    a = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+    return int(6371000 * 2 * atan2(sqrt(a), sqrt(1 - a)))
+
+
+def _leg(origin: Tuple[float, float], destination: Tuple[float, float], mode: str) -> Dict:
+    distance = _distance_meters(origin, destination)
+    duration = int(distance / 1000 / SPEED_KMH_BY_MODE.get(mode, 20) * 3600)
+    return {
+        "status": "OK",
+        "distance": {"value": distance},
+        "duration": {"value": duration}
+    }
+
+
+class GoogleMapsStub:
+    """Serveur local compatible avec les endpoints utilisés par GoogleMapsService"""
+
+    def __init__(self, locations: Optional[Dict[str, Tuple[float, float]]] = None):
+        # Coordonnées par adresse (défaut : Paris centre)
+        self.locations = locations or {}
+        self.request_counts = {"geocode": 0, "directions": 0, "distancematrix": 0}
+        self.runner = None
+        self.base_url = None
+
+    async def _geocode(self, request: web.Request) -> web.Response:
+        self.request_counts["geocode"] += 1
+        address = request.query["address"]
+        if "introuvable" in address:
+            return web.json_response({"status": "ZERO_RESULTS", "results": []})
+        lat, lng = self.locations.get(address, (48.8566, 2.3522))
+        return web.json_response({
+            "status": "OK",
+            "results": [{
+                "formatted_address": address.title(),
+                "place_id": f"stub_{abs(hash(address))}",
+                "geometry": {"location": {"lat": lat, "lng": lng}, "location_type": "ROOFTOP"},
+                "address_components": []
+            }]
+        })
+
+    async def _directions(self, request: web.Request) -> web.Response:
+        self.request_counts["directions"] += 1
+        origin = _parse_point(request.query["origin"])
+        destination = _parse_point(request.query["destination"])
+        leg = _leg(origin, destination, request.query["mode"])
+        leg.pop("status")
+        leg["steps"] = []
+        return web.json_response({
+            "status": "OK",
+            "routes": [{"legs": [leg], "overview_polyline": {"points": ""}}]
+        })
+
+    async def _distance_matrix(self, request: web.Request) -> web.Response:
+        self.request_counts["distancematrix"] += 1
+        origin = _parse_point(request.query["origins"])
+        destinations = [_parse_point(value) for value in request.query["destinations"].split("|")]
+        if len(destinations) > 25:
+            return web.json_response({"status": "MAX_DIMENSIONS_EXCEEDED", "rows": []})
+        return web.json_response({
+            "status": "OK",
+            "rows": [{"elements": [_leg(origin, dest, request.query["mode"]) for dest in destinations]}]
+        })
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/geocode/json", self._geocode)
+        app.router.add_get("/directions/json", self._directions)
+        app.router.add_get("/distancematrix/json", self._distance_matrix)
+
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self.base_url
+
+    async def stop(self):
+        if self.runner:
+            await self.runner.cleanup()
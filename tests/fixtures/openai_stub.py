@@ -0,0 +1,97 @@
+"""
+🧪 Stub HTTP local OpenAI (Chat Completions)
+
+Serveur aiohttp minimal pour tester les services GPT hors ligne :
+réponses JSON déterministes, latence configurable et suivi de la concurrence.
+
+Author: NEXTEN Team
+Version: 1.0.0 - Offline OpenAI Stub
+"""
+
+import asyncio
+import json
+import time
+
+from aiohttp import web
+
+CV_PAYLOAD = {
+    "name": "Marie Dupont",
+    "email": "marie.dupont@example.com",
+    "phone": "0600000000",
+    "skills": ["Python", "SQL"],
+    "years_of_experience": 5,
+    "education": "Master Informatique",
+    "job_titles": ["Développeuse Python"],
+    "companies": ["Nexten"],
+    "location": "Paris, France",
+    "summary": "Développeuse backend",
+    "objective": "Lead developer",
+    "languages": ["Français", "Anglais"],
+    "certifications": []
+}
+
+JOB_PAYLOAD = {
+    "title": "Développeur Python Senior",
+    "company": "Nexten",
+    "location": "Paris, France",
+    "contract_type": "CDI",
+    "required_skills": ["Python", "FastAPI"],
+    "preferred_skills": ["Docker"],
+    "responsibilities": ["Développer l'API"],
+    "requirements": ["5 ans d'expérience"],
+    "benefits": ["Télétravail"],
+    "salary_range": {"min": 50000, "max": 60000},
+    "remote_policy": "Hybride"
+}
+
+
+class OpenAIStub:
+    """Serveur local compatible avec POST /v1/chat/completions"""
+
+    def __init__(self, delay_seconds: float = 0.0):
+        self.delay_seconds = delay_seconds
+        self.request_count = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.runner = None
+        self.base_url = None
+
+    async def _chat_completions(self, request: web.Request) -> web.Response:
+        self.request_count += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            body = await request.json()
+            await asyncio.sleep(self.delay_seconds)
+            system_prompt = body["messages"][0]["content"]
+            payload = JOB_PAYLOAD if "offres d'emploi" in system_prompt else CV_PAYLOAD
+            return web.json_response({
+                "id": f"chatcmpl-stub-{self.request_count}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body["model"],
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "```json" + json.dumps(payload) + "```"},
+                    "finish_reason": "stop"
+                }],
+                "usage": {"prompt_tokens": 200, "completion_tokens": 150, "total_tokens": 350}
+            })
+        finally:
+            self.in_flight -= 1
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._chat_completions)
+
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}/v1"
+        return self.base_url
+
+    async def stop(self):
+        if self.runner:
+            await self.runner.cleanup()
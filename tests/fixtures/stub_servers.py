@@ -0,0 +1,48 @@
+"""
+🧪 Fixtures pytest des stubs HTTP locaux (Google Maps, OpenAI)
+
+Chaque fixture fournit une fabrique : le stub est démarré à la demande
+avec ses paramètres et arrêté automatiquement en fin de test.
+
+Author: NEXTEN Team
+Version: 1.0.0 - Stub Server Fixtures
+"""
+
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+import pytest_asyncio
+
+from tests.fixtures.google_maps_stub import GoogleMapsStub
+from tests.fixtures.openai_stub import OpenAIStub
+
+
+@pytest_asyncio.fixture
+async def google_maps_stub() -> AsyncIterator[Callable[..., Awaitable[GoogleMapsStub]]]:
+    """Fabrique de stubs Google Maps démarrés : `stub = await google_maps_stub(locations)`"""
+    started = []
+
+    async def start(locations: Optional[Dict[str, Tuple[float, float]]] = None) -> GoogleMapsStub:
+        stub = GoogleMapsStub(locations)
+        await stub.start()
+        started.append(stub)
+        return stub
+
+    yield start
+    for stub in started:
+        await stub.stop()
+
+
+@pytest_asyncio.fixture
+async def openai_stub() -> AsyncIterator[Callable[..., Awaitable[OpenAIStub]]]:
+    """Fabrique de stubs OpenAI démarrés : `stub = await openai_stub(delay_seconds=0.2)`"""
+    started = []
+
+    async def start(delay_seconds: float = 0.0) -> OpenAIStub:
+        stub = OpenAIStub(delay_seconds=delay_seconds)
+        await stub.start()
+        started.append(stub)
+        return stub
+
+    yield start
+    for stub in started:
+        await stub.stop()
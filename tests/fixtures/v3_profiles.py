@@ -0,0 +1,85 @@
+"""
+🧪 Profils V3.0 de test (candidats / entreprises variés)
+
+Author: NEXTEN Team
+Version: 1.0.0 - V3 Test Profiles
+"""
+
+from nextvision.models.bidirectional_models import (
+    BiDirectionalCandidateProfile, BiDirectionalCompanyProfile,
+    PersonalInfoBidirectional, CompetencesProfessionnelles, AttentesCandidat,
+    MotivationsCandidat, InformationsEntreprise, DescriptionPoste, ExigencesPoste,
+    CriteresRecrutement, ConditionsTravail, RaisonEcouteCandidat, UrgenceRecrutement,
+    NiveauExperience, TypeContrat
+)
+from nextvision.models.extended_bidirectional_models_v3 import (
+    ExtendedCandidateProfileV3, ExtendedCompanyProfileV3, CompanyProfileV3,
+    TransportPreferencesV3, AvailabilityTimingV3, JobBenefitsV3,
+    CompanySize, WorkModalityType, CandidateStatusType
+)
+
+SKILLS = ["CEGID", "SAP", "Excel", "Gestion comptable et fiscale", "Paie", "Consolidation"]
+EXPERIENCES = list(NiveauExperience)
+MODALITIES = list(WorkModalityType)
+
+
+def make_candidate_v3(index: int = 0) -> ExtendedCandidateProfileV3:
+    salaire_min = 32000 + (index % 7) * 2000
+    return ExtendedCandidateProfileV3(
+        base_profile=BiDirectionalCandidateProfile(
+            personal_info=PersonalInfoBidirectional(
+                firstName="Marie", lastName=f"Dupont{index}", email=f"marie{index}@email.com"
+            ),
+            experience_globale=EXPERIENCES[index % len(EXPERIENCES)],
+            competences=CompetencesProfessionnelles(
+                competences_techniques=SKILLS[index % 3:index % 3 + 3],
+                logiciels_maitrise=["Excel", SKILLS[index % len(SKILLS)]]
+            ),
+            attentes=AttentesCandidat(
+                salaire_min=salaire_min,
+                salaire_max=salaire_min + 8000,
+                localisation_preferee="Paris 8ème"
+            ),
+            motivations=MotivationsCandidat(raison_ecoute=RaisonEcouteCandidat.REMUNERATION_TROP_FAIBLE)
+        ),
+        transport_preferences=TransportPreferencesV3(
+            max_travel_time=30 + (index % 4) * 10,
+            contract_ranking=[TypeContrat.CDI, TypeContrat.CDD],
+            office_preference=MODALITIES[index % len(MODALITIES)]
+        ),
+        availability_timing=AvailabilityTimingV3(
+            timing=["immediat", "1mois", "2mois", "3mois"][index % 4],
+            employment_status=CandidateStatusType.EN_POSTE,
+            notice_period_weeks=(index % 4) * 3
+        )
+    )
+
+
+def make_company_v3(index: int = 0) -> ExtendedCompanyProfileV3:
+    salaire_min = 30000 + (index % 5) * 3000
+    return ExtendedCompanyProfileV3(
+        base_profile=BiDirectionalCompanyProfile(
+            entreprise=InformationsEntreprise(
+                nom=f"Cabinet {index}", secteur="Comptabilité", localisation="Paris 8ème"
+            ),
+            poste=DescriptionPoste(
+                titre="Comptable H/F",
+                localisation="Paris 8ème",
+                type_contrat=TypeContrat.CDI if index % 3 else TypeContrat.CDD,
+                salaire_min=salaire_min,
+                salaire_max=salaire_min + 7000,
+                competences_requises=SKILLS[index % 4:index % 4 + 2]
+            ),
+            exigences=ExigencesPoste(
+                experience_requise=f"{index % 6} ans - {index % 6 + 5} ans",
+                competences_obligatoires=[SKILLS[index % len(SKILLS)]]
+            ),
+            recrutement=CriteresRecrutement(urgence=UrgenceRecrutement.NORMAL),
+            conditions=ConditionsTravail()
+        ),
+        company_profile_v3=CompanyProfileV3(
+            company_sector="Comptabilité",
+            company_size=list(CompanySize)[index % len(CompanySize)]
+        ),
+        job_benefits=JobBenefitsV3(remote_policy=MODALITIES[(index + 1) % len(MODALITIES)])
+    )
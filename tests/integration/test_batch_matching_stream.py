@@ -0,0 +1,91 @@
+"""
+🧪 Tests matching en lot streaming (concurrence bornée, seuil, top-K, endpoint NDJSON)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Streaming Batch Matching
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from nextvision.api.v2.bidirectional_endpoints import get_bidirectional_matcher, router_v2
+from nextvision.services.batch_matching_stream import StreamingBatchMatcher
+from nextvision.services.bidirectional_matcher import BiDirectionalMatcherFactory
+from tests.fixtures.v3_profiles import make_candidate_v3, make_company_v3
+
+
+@pytest.mark.asyncio
+async def test_streaming_batch_matching_is_bounded():
+    matcher = BiDirectionalMatcherFactory.create_basic_matcher()
+    in_flight = {"current": 0, "peak": 0}
+    original_match = matcher.calculate_bidirectional_match
+
+    async def tracked_match(request, **kwargs):
+        in_flight["current"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+        await asyncio.sleep(0.001)
+        try:
+            return await original_match(request, **kwargs)
+        finally:
+            in_flight["current"] -= 1
+
+    matcher.calculate_bidirectional_match = tracked_match
+    candidats = [make_candidate_v3(index).base_profile for index in range(8)]
+    entreprises = [make_company_v3(index).base_profile for index in range(5)]
+
+    streaming_matcher = StreamingBatchMatcher(matcher, max_concurrency=4, score_threshold=0.0, top_k=3)
+    events = [event async for event in streaming_matcher.stream(candidats, entreprises)]
+
+    matches = [event for event in events if event["type"] == "match"]
+    summary = events[-1]
+
+    assert summary["type"] == "summary"
+    assert summary["processed_combinations"] == 40
+    assert len(matches) == summary["total_matches"] == 40
+    assert in_flight["peak"] <= 4
+
+    top_scores = [match["matching_score"] for match in summary["top_matches"]]
+    assert top_scores == sorted((m["matching_score"] for m in matches), reverse=True)[:3]
+
+
+@pytest.mark.asyncio
+async def test_closed_stream_releases_its_workers():
+    matcher = BiDirectionalMatcherFactory.create_basic_matcher()
+    candidats = [make_candidate_v3(index).base_profile for index in range(6)]
+    entreprises = [make_company_v3(index).base_profile for index in range(6)]
+    before = asyncio.all_tasks()
+
+    # File minuscule : les workers sont bloqués sur une file pleine à la déconnexion
+    stream = StreamingBatchMatcher(matcher, max_concurrency=4, score_threshold=0.0, queue_size=1).stream(
+        candidats, entreprises
+    )
+    assert (await stream.__anext__())["type"] == "match"
+    await asyncio.sleep(0.01)
+    await asyncio.wait_for(stream.aclose(), timeout=5)
+
+    assert asyncio.all_tasks() == before
+
+
+def test_stream_endpoint_emits_ndjson():
+    app = FastAPI()
+    app.include_router(router_v2)
+    app.dependency_overrides[get_bidirectional_matcher] = BiDirectionalMatcherFactory.create_basic_matcher
+    payload = {
+        "candidats": [make_candidate_v3(index).base_profile.model_dump(mode="json") for index in range(3)],
+        "entreprises": [make_company_v3(index).base_profile.model_dump(mode="json") for index in range(4)],
+        "score_threshold": 0.0,
+        "top_k": 2
+    }
+
+    with TestClient(app) as client:
+        response = client.post("/api/v2/batch/matching/stream", json=payload)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines() if line]
+    assert [event["type"] for event in events].count("match") == 12
+    assert events[-1]["type"] == "summary" and len(events[-1]["top_matches"]) == 2
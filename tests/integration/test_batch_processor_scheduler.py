@@ -0,0 +1,116 @@
+"""
+🧪 Tests ordonnancement BatchProcessor (priorités, retries, annulation)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Priority Scheduler
+"""
+
+import threading
+
+import pytest
+
+from nextvision.performance.batch_processing import BatchJob, BatchProcessor, JobScheduler
+
+
+def _processor(**kwargs) -> BatchProcessor:
+    options = {"initial_batch_size": 10, "initial_concurrency": 1, "max_concurrency": 1, "retry_base_delay": 0.001}
+    options.update(kwargs)
+    return BatchProcessor(**options)
+
+
+def test_scheduler_pops_by_priority_then_arrival():
+    scheduler = JobScheduler()
+    for job_id, priority in [("a", 1), ("b", 5), ("c", 3), ("d", 5)]:
+        scheduler.push(BatchJob(id=job_id, data={}, priority=priority))
+
+    assert [job.id for job in scheduler.pop_ready(10)] == ["b", "d", "c", "a"]
+
+
+def test_retry_backoff_is_bounded():
+    scheduler = JobScheduler(retry_base_delay=0.1, retry_max_delay=0.5, retry_jitter=0.0)
+    job = BatchJob(id="job", data={}, max_retries=10)
+
+    delays = []
+    for attempt in range(1, 6):
+        job.retry_count = attempt
+        delays.append(scheduler.retry_delay(job))
+
+    assert delays == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5])
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_in_priority_order():
+    order = []
+
+    async def record(job: BatchJob):
+        order.append(job.id)
+        return {"ok": True}
+
+    jobs = [BatchJob(id=f"job_{i}", data={}, priority=i % 3) for i in range(9)]
+    result = await _processor().process_jobs(jobs, record)
+
+    assert result.successful_jobs == 9
+    assert [int(job_id.split("_")[1]) % 3 for job_id in order] == [2, 2, 2, 1, 1, 1, 0, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_failed_jobs_are_retried_until_max_retries():
+    attempts = {}
+
+    async def flaky(job: BatchJob):
+        attempts[job.id] = attempts.get(job.id, 0) + 1
+        if job.id == "always_fails" or attempts[job.id] < 3:
+            raise RuntimeError("boom")
+        return {"ok": True}
+
+    jobs = [BatchJob(id="recovers", data={}), BatchJob(id="always_fails", data={}, max_retries=2)]
+    result = await _processor().process_jobs(jobs, flaky)
+
+    assert attempts == {"recovers": 3, "always_fails": 3}
+    assert result.successful_jobs == 1
+    assert result.failed_jobs == 1
+    assert result.retried_jobs == 4
+    assert result.errors[0]["job_id"] == "always_fails"
+
+
+@pytest.mark.asyncio
+async def test_sync_jobs_share_one_thread_pool():
+    threads = set()
+
+    def sync_job(job: BatchJob):
+        threads.add(threading.current_thread().name)
+        return {"ok": True}
+
+    processor = _processor(max_concurrency=2)
+    try:
+        result = await processor.process_jobs([BatchJob(id=str(i), data={}) for i in range(50)], sync_job)
+        executor = processor._executor
+        await processor.process_jobs([BatchJob(id="again", data={})], sync_job)
+        assert processor._executor is executor
+    finally:
+        processor.shutdown()
+
+    assert result.successful_jobs == 50
+    assert all(name.startswith("nextvision-batch") for name in threads)
+    assert len(threads) <= 2
+
+
+@pytest.mark.asyncio
+async def test_cancel_batch_skips_pending_jobs():
+    processor = _processor(initial_batch_size=10)
+    processed = []
+
+    async def work(job: BatchJob):
+        processed.append(job.id)
+        return {"ok": True}
+
+    async def cancel_after_first_chunk(progress):
+        processor.cancel_batch(progress["batch_id"])
+
+    jobs = [BatchJob(id=str(i), data={}) for i in range(30)]
+    result = await processor.process_jobs(jobs, work, progress_callback=cancel_after_first_chunk)
+
+    assert len(processed) == 10
+    assert result.successful_jobs == 10
+    assert result.cancelled_jobs == 20
+    assert processor.active_batches == {}
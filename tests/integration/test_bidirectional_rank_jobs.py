@@ -0,0 +1,58 @@
+"""
+🧪 Tests ranking vectorisé BiDirectionalMatcher.rank_jobs (1 candidat vs N offres)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Vectorized Ranking
+"""
+
+import numpy as np
+import pytest
+
+from nextvision.models.bidirectional_models import BiDirectionalMatchingRequest, UrgenceRecrutement
+from nextvision.services.bidirectional_matcher import BiDirectionalMatcherFactory
+from tests.fixtures.v3_profiles import make_candidate_v3, make_company_v3
+
+
+def _companies(urgences):
+    companies = []
+    for index, urgence in enumerate(urgences):
+        company = make_company_v3(index).base_profile
+        company.recrutement.urgence = urgence
+        companies.append(company)
+    return companies
+
+
+@pytest.mark.asyncio
+async def test_rank_jobs_matches_single_pair_scores():
+    matcher = BiDirectionalMatcherFactory.create_basic_matcher()
+    candidat = make_candidate_v3(0).base_profile
+    entreprises = _companies(list(UrgenceRecrutement) * 2)
+
+    ranking = await matcher.rank_jobs(candidat, entreprises, top_k=5)
+
+    assert len(ranking) == 5
+    scores = [response.matching_score for _, response in ranking]
+    assert scores == sorted(scores, reverse=True)
+
+    # Le score vectorisé correspond au matching unitaire, quelle que soit l'urgence
+    for index, response in ranking:
+        single = await matcher.calculate_bidirectional_match(
+            BiDirectionalMatchingRequest(candidat=candidat, entreprise=entreprises[index])
+        )
+        assert abs(single.matching_score - response.matching_score) < 1e-6
+        assert isinstance(response.recommandations_candidat, list)
+
+
+@pytest.mark.asyncio
+async def test_boosted_weights_are_normalized():
+    matcher = BiDirectionalMatcherFactory.create_basic_matcher()
+    candidat = make_candidate_v3(0).base_profile
+
+    # Une seule offre urgente suffisait à faire échouer tout le ranking
+    ranking = await matcher.rank_jobs(candidat, _companies([UrgenceRecrutement.URGENT]), top_k=1)
+    weights = ranking[0][1].adaptive_weighting.entreprise_weights
+    assert sum(weights.model_dump().values()) == pytest.approx(1.0)
+
+    scores = matcher.score_jobs_vectorized(candidat, _companies(list(UrgenceRecrutement)))
+    np.testing.assert_allclose(scores["weights"].sum(axis=1), 1.0)
+    assert np.all(scores["final_scores"] <= scores["component_scores"].max(axis=1) + 1e-9)
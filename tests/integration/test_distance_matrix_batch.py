@@ -0,0 +1,46 @@
+"""
+🧪 Tests batch Distance Matrix - GoogleMapsService (stub HTTP local)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Distance Matrix Batch
+"""
+
+import pytest
+
+from nextvision.services.google_maps_service import GoogleMapsService
+from nextvision.models.transport_models import GeocodeResult, GeocodeQuality, TravelMode
+
+
+def _point(name: str, lat: float, lng: float) -> GeocodeResult:
+    return GeocodeResult(
+        address=name, formatted_address=name, latitude=lat, longitude=lng,
+        quality=GeocodeQuality.EXACT, place_id=name
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_routes_use_distance_matrix(google_maps_stub):
+    """60 destinations x 2 modes = 6 requêtes Distance Matrix au lieu de 120 Directions"""
+    stub = await google_maps_stub()
+    service = GoogleMapsService("TEST_API_KEY_MOCK", base_url=stub.base_url)
+    origin = _point("Origine", 48.8584, 2.2945)
+    destinations = [_point(f"Job {i}", 48.80 + i * 0.002, 2.30 + i * 0.001) for i in range(60)]
+    modes = [TravelMode.DRIVING, TravelMode.TRANSIT]
+
+    results = await service.batch_calculate_routes(origin, destinations, modes)
+
+    assert len(results) == 60
+    assert all(set(routes) == set(modes) for routes in results.values())
+    assert stub.request_counts["distancematrix"] == 6
+    assert stub.request_counts["directions"] == 0
+    assert service.batch_stats["api_calls_saved"] == 120 - 6
+
+    # Deuxième appel : toutes les paires viennent du cache
+    await service.batch_calculate_routes(origin, destinations, modes)
+    assert stub.request_counts["distancematrix"] == 6
+    assert service.batch_stats["matrix_cache_hits"] == 120
+
+    # Les paires du batch servent aussi le calcul unitaire
+    route = await service.calculate_route(origin, destinations[0], TravelMode.DRIVING)
+    assert route.distance_meters == results["Job 0"][TravelMode.DRIVING].distance_meters
+    assert stub.request_counts["directions"] == 0
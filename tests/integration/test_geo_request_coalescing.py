@@ -0,0 +1,92 @@
+"""
+🧪 Tests single-flight géocodage / itinéraires - GoogleMapsService (stub HTTP local)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Geo Request Coalescing
+"""
+
+import asyncio
+
+import pytest
+
+from nextvision.models.transport_models import TravelMode
+from nextvision.services.geo_cache_store import GeoCacheStore, MemoryLRUBackend, RedisGeoBackend
+from nextvision.services.google_maps_service import GoogleMapsService
+
+
+class SlowRedisCache:
+    """Double d'IntelligentRedisCache (get/set/delete asynchrones, latence réseau simulée)"""
+
+    def __init__(self):
+        self.values = {}
+        self.gets = 0
+        self.is_connected = True
+
+    async def get(self, key):
+        self.gets += 1
+        await asyncio.sleep(0.01)
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl):
+        self.values[key] = value
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_call(google_maps_stub):
+    stub = await google_maps_stub()
+    redis_cache = SlowRedisCache()
+    store = GeoCacheStore([MemoryLRUBackend(), RedisGeoBackend(redis_cache)])
+    service = GoogleMapsService("TEST_API_KEY_MOCK", cache_store=store, base_url=stub.base_url)
+
+    # Même adresse (casse différente) demandée par 20 candidats en parallèle
+    addresses = ["10 rue de Rivoli, Paris", "10 RUE DE RIVOLI, Paris"] * 10
+    geocodes = await asyncio.gather(*[service.geocode_address(address) for address in addresses])
+
+    assert stub.request_counts["geocode"] == 1
+    assert redis_cache.gets == 1  # lecture Redis partagée elle aussi
+    assert len({geocode.place_id for geocode in geocodes}) == 1
+    assert service.coalescing_stats["geocode_coalesced"] == 19
+
+    origin = geocodes[0]
+    destination = origin.model_copy(update={"latitude": 48.90, "longitude": 2.25})
+    routes = await asyncio.gather(*[
+        service.calculate_route(origin, destination, TravelMode.TRANSIT) for _ in range(10)
+    ])
+    assert stub.request_counts["directions"] == 1
+    assert len({route.duration_minutes for route in routes}) == 1
+
+    stats = service.get_cache_stats()["coalescing"]
+    assert (stats["route_coalesced"], stats["inflight"]) == (9, 0)
+
+    # Rafraîchissement forcé ou requête hedgée : appel dédié
+    await service.geocode_address("10 rue de Rivoli, Paris", force_refresh=True)
+    assert stub.request_counts["geocode"] == 2
+    await asyncio.gather(
+        service.calculate_route(origin, destination, TravelMode.DRIVING),
+        service.calculate_route(origin, destination, TravelMode.DRIVING, coalesce=False)
+    )
+    assert stub.request_counts["directions"] == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_followers(google_maps_stub):
+    stub = await google_maps_stub()
+    service = GoogleMapsService(
+        "TEST_API_KEY_MOCK",
+        cache_store=GeoCacheStore([MemoryLRUBackend(), RedisGeoBackend(SlowRedisCache())]),
+        base_url=stub.base_url
+    )
+
+    leader = asyncio.ensure_future(service.geocode_address("5 avenue Foch, Paris"))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(service.geocode_address("5 AVENUE FOCH, Paris"))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    geocode = await follower
+    assert leader.cancelled()
+    assert geocode.formatted_address == "5 Avenue Foch Paris"
+    assert stub.request_counts["geocode"] == 1
@@ -0,0 +1,82 @@
+"""
+🧪 Tests pool client OpenAI asynchrone - GPTDirectService (stub HTTP local)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Async OpenAI Pool
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from nextvision.services.gpt_direct_service import GPTDirectService
+from nextvision.services.openai_client_pool import OpenAIClientPool, TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_parsing_runs_concurrently_with_bounded_pool(openai_stub):
+    """8 parsings en parallèle, jamais plus de 4 requêtes simultanées"""
+    stub = await openai_stub(delay_seconds=0.2)
+    pool = OpenAIClientPool("sk-test", base_url=stub.base_url, max_concurrency=4)
+    try:
+        service = GPTDirectService(client_pool=pool)
+        start = time.time()
+        results = await asyncio.gather(
+            *[service.parse_cv_direct(f"CV {i}") for i in range(4)],
+            *[service.parse_job_direct(f"Offre {i}") for i in range(4)]
+        )
+        elapsed = time.time() - start
+    finally:
+        await pool.close()
+
+    assert [r.name for r in results[:4]] == ["Marie Dupont"] * 4
+    assert [r.title for r in results[4:]] == ["Développeur Python Senior"] * 4
+    assert stub.peak_in_flight == 4
+    assert elapsed < 0.2 * 8 / 2
+    assert pool.get_stats()["tokens_used"] == 8 * 350
+
+
+@pytest.mark.asyncio
+async def test_request_timeout_falls_back(openai_stub):
+    """Un timeout ne bloque pas : fallback CV immédiat"""
+    stub = await openai_stub(delay_seconds=1.0)
+    pool = OpenAIClientPool("sk-test", base_url=stub.base_url, request_timeout=0.1)
+    try:
+        cv = await GPTDirectService(client_pool=pool).parse_cv_direct("CV lent")
+    finally:
+        await pool.close()
+
+    assert cv.name == "Candidat Test"
+    assert pool.get_stats()["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_calls_refund_their_token_reservation(openai_stub):
+    stub = await openai_stub(delay_seconds=1.0)
+    slow_pool = OpenAIClientPool("sk-test", base_url=stub.base_url, request_timeout=0.05, tokens_per_minute=6000)
+    # Port fermé : erreur de connexion immédiate
+    down_pool = OpenAIClientPool("sk-test", base_url="http://127.0.0.1:9/v1", tokens_per_minute=6000)
+    messages = [{"role": "user", "content": "CV"}]
+    try:
+        for pool in (slow_pool, down_pool):
+            for _ in range(4):
+                with pytest.raises(Exception):
+                    await pool.chat_completion(messages, max_tokens=1000)
+    finally:
+        await slow_pool.close()
+        await down_pool.close()
+
+    assert slow_pool.get_stats()["timeouts"] == 4
+    assert down_pool.get_stats()["errors"] == 4
+    # Sans restitution : 4 x 1000 tokens réservés sur 6000
+    assert slow_pool.token_bucket.available == pytest.approx(6000, abs=1)
+    assert down_pool.token_bucket.available == pytest.approx(6000, abs=1)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_when_empty():
+    bucket = TokenBucket(rate_per_minute=600, capacity=2)  # 10 unités/s
+    await bucket.acquire(2)
+    wait = await bucket.acquire(1)
+    assert 0.05 < wait <= 0.11
@@ -0,0 +1,91 @@
+"""
+🧪 Tests cache de parsing adressé par contenu - GPTDirectService / CVParserGPT (stub HTTP local)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Parse Cache
+"""
+
+import asyncio
+
+import openai
+import pytest
+
+from gpt_modules.cv_parser import CVParserGPT, CVData as GPTModuleCVData
+from nextvision.services.gpt_direct_service import GPTDirectService, CVData
+from nextvision.services.openai_client_pool import OpenAIClientPool
+from nextvision.utils.parse_cache import ParseCache, SQLiteParseBackend
+
+CV_TEXT = "Marie Dupont\nDéveloppeuse Python - 5 ans d'expérience\nParis"
+
+
+@pytest.mark.asyncio
+async def test_gpt_direct_parse_cache_tiers_and_single_flight(tmp_path, openai_stub):
+    stub = await openai_stub(delay_seconds=0.2)
+    pool = OpenAIClientPool("sk-test", base_url=stub.base_url)
+    l2 = SQLiteParseBackend(str(tmp_path / "parse_cache.db"))
+    try:
+        service = GPTDirectService(client_pool=pool, cv_parse_cache=ParseCache("cv_test", "v1", CVData, l2=l2))
+
+        # 5 uploads simultanés du même CV : un seul appel GPT
+        results = await asyncio.gather(*[service.parse_cv_direct(CV_TEXT) for _ in range(5)])
+        assert {cv.name for cv in results} == {"Marie Dupont"}
+        assert stub.request_count == 1
+        assert service.cv_parse_cache.stats["coalesced"] == 4
+
+        # Même texte aux espaces près : hit L1
+        await service.parse_cv_direct("  Marie Dupont Développeuse Python -  5 ans d'expérience Paris ")
+        assert stub.request_count == 1
+
+        # Nouveau processus (L1 vide) : hit L2 SQLite
+        other = GPTDirectService(client_pool=pool, cv_parse_cache=ParseCache("cv_test", "v1", CVData, l2=l2))
+        assert (await other.parse_cv_direct(CV_TEXT)).name == "Marie Dupont"
+        assert other.cv_parse_cache.stats["l2_hits"] == 1
+        assert stub.request_count == 1
+
+        # Changement de prompt : invalidation puis nouveau parsing
+        assert other.cv_parse_cache.invalidate() == 1
+        await other.parse_cv_direct(CV_TEXT)
+        assert stub.request_count == 2
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_cv_parser_gpt_threads_share_one_parse(openai_stub):
+    stub = await openai_stub(delay_seconds=0.2)
+    client = openai.OpenAI(api_key="sk-test", base_url=stub.base_url)
+    parser = CVParserGPT(client, parse_cache=ParseCache("cv_gpt_test", "v1", GPTModuleCVData))
+
+    results = await asyncio.gather(*[asyncio.to_thread(parser.parse_cv_text, CV_TEXT) for _ in range(3)])
+
+    assert stub.request_count == 1
+    assert all(cv.email == results[0].email for cv in results)
+    # Chaque appelant reçoit sa propre copie
+    results[0].competences.append("Muté")
+    assert "Muté" not in parser.parse_cv_text(CV_TEXT).competences
+
+
+@pytest.mark.asyncio
+async def test_caller_timeout_does_not_cancel_coalesced_parse():
+    cache = ParseCache("timeout_test", "v1", dict)
+    parses = 0
+
+    async def slow_parse(text):
+        nonlocal parses
+        parses += 1
+        await asyncio.sleep(0.1)
+        return {"text": text}
+
+    # Le premier appelant abandonne (timeout), l'appelant coalescé obtient le résultat
+    leader = asyncio.ensure_future(asyncio.wait_for(cache.aget_or_parse(CV_TEXT, slow_parse), timeout=0.02))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(cache.aget_or_parse(CV_TEXT, slow_parse))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await leader
+    assert (await follower)["text"] == CV_TEXT
+    assert (parses, cache.stats["coalesced"]) == (1, 1)
+
+    # Le parsing abandonné a tout de même alimenté le cache
+    assert (await cache.aget_or_parse(CV_TEXT, slow_parse))["text"] == CV_TEXT
+    assert parses == 1
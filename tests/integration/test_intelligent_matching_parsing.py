@@ -0,0 +1,91 @@
+"""
+🧪 Tests parsing parallèle CV + Job - IntelligentMatchingService
+
+Author: NEXTEN Team
+Version: 1.0.0 - Parallel Parsing
+"""
+
+import asyncio
+import io
+import os
+import time
+
+import pytest
+from fastapi import UploadFile
+
+os.environ.setdefault("GOOGLE_MAPS_API_KEY", "TEST_API_KEY_MOCK")
+
+from nextvision.api.v3 import intelligent_matching  # noqa: E402
+from nextvision.api.v3.intelligent_matching import IntelligentMatchingService  # noqa: E402
+from nextvision.services.gpt_direct_service import GPTDirectService  # noqa: E402
+
+FALLBACK_SERVICE = GPTDirectService(api_key=None)
+
+
+def _upload(name: str, content: str) -> UploadFile:
+    return UploadFile(file=io.BytesIO(content.encode()), filename=name)
+
+
+def _slow_parser(delay: float, parse):
+    async def parser(content: str):
+        await asyncio.sleep(delay)
+        return await parse(content)
+    return parser
+
+
+@pytest.mark.asyncio
+async def test_cv_and_job_are_parsed_concurrently(monkeypatch):
+    monkeypatch.setattr(intelligent_matching, "parse_cv_direct", _slow_parser(0.3, FALLBACK_SERVICE.parse_cv_direct))
+    monkeypatch.setattr(intelligent_matching, "parse_job_direct", _slow_parser(0.3, FALLBACK_SERVICE.parse_job_direct))
+    service = IntelligentMatchingService()
+
+    start = time.time()
+    cv_data, job_data, breakdown = await service._parse_files_with_gpt_direct(
+        _upload("cv.txt", "CV Marie Dupont"), _upload("job.txt", "Offre Python")
+    )
+    elapsed = time.time() - start
+
+    assert elapsed < 0.5
+    assert cv_data["name"] == "Candidat Test"
+    assert job_data["title"] == "Poste à définir"
+    assert breakdown["cv"]["parse_ms"] >= 300 and breakdown["job"]["parse_ms"] >= 300
+    assert not breakdown["cv"]["fallback"] and not breakdown["job"]["fallback"]
+
+
+@pytest.mark.asyncio
+async def test_cv_timeout_does_not_block_job(monkeypatch):
+    monkeypatch.setattr(intelligent_matching, "parse_cv_direct", _slow_parser(2.0, FALLBACK_SERVICE.parse_cv_direct))
+    monkeypatch.setattr(intelligent_matching, "parse_job_direct", _slow_parser(0.05, FALLBACK_SERVICE.parse_job_direct))
+    service = IntelligentMatchingService(cv_parse_timeout=0.2)
+
+    start = time.time()
+    cv_data, job_data, breakdown = await service._parse_files_with_gpt_direct(
+        _upload("cv.txt", "CV lent"), _upload("job.txt", "Offre rapide")
+    )
+
+    assert time.time() - start < 0.5
+    assert breakdown["cv"]["fallback"] is True
+    assert breakdown["job"]["fallback"] is False
+    assert job_data["title"] == "Poste à définir"
+    assert cv_data
+
+
+@pytest.mark.asyncio
+async def test_foreign_cancellation_uses_fallback(monkeypatch):
+    async def cancelled_parse(content: str):
+        # Parsing partagé annulé par un autre appelant
+        raise asyncio.CancelledError()
+
+    monkeypatch.setattr(intelligent_matching, "parse_cv_direct", cancelled_parse)
+    service = IntelligentMatchingService()
+
+    cv_data, timings = await service._parse_cv_file(_upload("cv.txt", "CV Marie Dupont"))
+    assert timings["fallback"] is True and cv_data
+
+    # Annulation de la requête elle-même : propagée
+    monkeypatch.setattr(intelligent_matching, "parse_cv_direct", _slow_parser(5, FALLBACK_SERVICE.parse_cv_direct))
+    request = asyncio.ensure_future(service._parse_cv_file(_upload("cv.txt", "CV lent")))
+    await asyncio.sleep(0.05)
+    request.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await request
@@ -0,0 +1,146 @@
+"""
+🧪 Tests cache de résultats BiDirectionalMatcher (borné, invalidation, stats par endpoint)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Shared Matching Cache
+"""
+
+import pickle
+
+import pytest
+
+from nextvision.models.bidirectional_models import BiDirectionalMatchingRequest
+from nextvision.services.bidirectional_matcher import BiDirectionalMatcher
+from nextvision.services.matching_result_cache import (
+    LocalMatchingCache, decode_response, encode_response
+)
+from tests.fixtures.v3_profiles import make_candidate_v3, make_company_v3
+
+
+def _request(candidate_index: int = 0, company_index: int = 0) -> BiDirectionalMatchingRequest:
+    return BiDirectionalMatchingRequest(
+        candidat=make_candidate_v3(candidate_index).base_profile,
+        entreprise=make_company_v3(company_index).base_profile
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_match_is_served_from_cache():
+    matcher = BiDirectionalMatcher()
+
+    first = await matcher.calculate_bidirectional_match(_request(), endpoint="matching")
+    # Profils reconstruits (autres horodatages) : même clé de cache
+    second = await matcher.calculate_bidirectional_match(_request(), endpoint="matching")
+    await matcher.calculate_bidirectional_match(_request(), endpoint="batch", force_refresh=True)
+
+    assert second.matching_score == first.matching_score
+    assert second.component_scores == first.component_scores
+    stats = matcher.get_performance_stats()
+    assert stats["total_matches"] == 3
+    assert stats["cache_hits"] == 1
+    assert stats["cache"]["endpoints"] == {
+        "matching": {"hits": 1, "misses": 1, "hit_rate_percent": 50.0},
+        "batch": {"hits": 0, "misses": 1, "hit_rate_percent": 0.0}
+    }
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded():
+    matcher = BiDirectionalMatcher(cache_max_entries=3)
+
+    for company_index in range(6):
+        await matcher.calculate_bidirectional_match(_request(0, company_index))
+
+    stats = matcher.get_performance_stats()["cache"]
+    assert stats["size"] == 3
+    assert stats["evictions"] == 3
+
+
+@pytest.mark.asyncio
+async def test_profile_change_invalidates_its_results():
+    matcher = BiDirectionalMatcher()
+    for company_index in range(3):
+        await matcher.calculate_bidirectional_match(_request(0, company_index))
+    await matcher.calculate_bidirectional_match(_request(1, 0))
+
+    updated = _request(0, 0)
+    updated.candidat.attentes.salaire_min += 5000
+    await matcher.calculate_bidirectional_match(updated)
+
+    stats = matcher.get_performance_stats()
+    # Les 3 résultats de l'ancienne version du candidat 0 sont retirés, pas ceux du candidat 1
+    assert stats["cache"]["invalidated_entries"] == 3
+    assert stats["cache_size"] == 2
+    assert stats["cache_hits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    matcher = BiDirectionalMatcher()
+    calls = 0
+
+    async def failing_semantic(*_args):
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("boom")
+
+    matcher._calculate_semantic_score = failing_semantic
+    for _ in range(2):
+        response = await matcher.calculate_bidirectional_match(_request())
+        assert response.compatibility == "incompatible"
+
+    assert calls == 2
+    assert matcher.cache.size == 0
+
+
+@pytest.mark.asyncio
+async def test_local_cache_expires_entries():
+    cache = LocalMatchingCache(ttl_seconds=0)
+    calls = 0
+
+    async def compute(*_args, **_context):
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await cache.matching_cache("c", "j", compute) == 1
+    assert await cache.matching_cache("c", "j", compute) == 2
+
+
+@pytest.mark.asyncio
+async def test_compressed_response_round_trips():
+    response = await BiDirectionalMatcher().calculate_bidirectional_match(_request())
+
+    raw = encode_response(response)
+
+    assert decode_response(raw) == response
+    assert len(raw) < len(pickle.dumps(response)) / 2
+
+
+@pytest.mark.asyncio
+async def test_same_title_offers_do_not_invalidate_each_other():
+    matcher = BiDirectionalMatcher()
+    paris = _request()
+    lyon = _request()
+    lyon.entreprise.poste.localisation = "Lyon 3ème"
+
+    for _ in range(3):
+        await matcher.calculate_bidirectional_match(paris)
+        await matcher.calculate_bidirectional_match(lyon)
+
+    stats = matcher.get_performance_stats()
+    assert stats["cache"]["invalidated_entries"] == 0
+    assert stats["cache_hits"] == 4
+
+
+def test_configure_bidirectional_matcher_shares_cache_manager():
+    from nextvision.api.v2 import bidirectional_endpoints
+
+    previous = bidirectional_endpoints._shared_matcher
+    cache_manager = LocalMatchingCache(max_entries=8)
+    try:
+        matcher = bidirectional_endpoints.configure_bidirectional_matcher(cache_manager=cache_manager)
+        assert bidirectional_endpoints.get_bidirectional_matcher() is matcher
+        assert matcher.cache.backend is cache_manager
+    finally:
+        bidirectional_endpoints._shared_matcher = previous
@@ -0,0 +1,43 @@
+"""
+🧪 Tests limitation de débit sur les routes de parsing GPT montées par main.py
+
+Author: NEXTEN Team
+Version: 1.0.0 - GCRA Rate Limiter
+"""
+
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from nextvision.config.production_settings import SecurityConfig
+from nextvision.utils.rate_limiter import GCRARateLimiter
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "TEST_API_KEY")
+    main = importlib.import_module("main")
+    # Limites par défaut de la configuration (activées quel que soit l'environnement)
+    monkeypatch.setattr(main, "rate_limiter", GCRARateLimiter.from_config(SecurityConfig()))
+    return TestClient(main.app)
+
+
+@pytest.mark.parametrize("path", ["/api/v2/jobs/parse", "/api/v3/intelligent-matching"])
+def test_gpt_parse_routes_use_strict_limit(client, path):
+    # Requêtes incomplètes : rejetées par la validation (422) tant que la rafale n'est pas épuisée
+    responses = [client.post(path) for _ in range(6)]
+
+    assert [r.status_code for r in responses] == [422] * 5 + [429]
+    assert responses[0].headers["X-RateLimit-Limit"] == "5"
+    assert int(responses[-1].headers["Retry-After"]) >= 1
+
+
+@pytest.mark.parametrize("path", [
+    "/api/v1/health", "/api/v1/integration/health", "/api/v2/maps/health", "/api/v3/health"
+])
+def test_health_probes_are_exempt(client, path):
+    responses = [client.get(path) for _ in range(30)]
+
+    assert all(response.status_code != 429 for response in responses)
+    assert all("X-RateLimit-Limit" not in response.headers for response in responses)
@@ -0,0 +1,95 @@
+"""
+🧪 Tests mode d'exécution "process" - EnhancedBidirectionalScorerV3
+
+Author: NEXTEN Team
+Version: 1.0.0 - Process Pool Scoring
+"""
+
+import pickle
+
+import pytest
+
+from nextvision.models.extended_bidirectional_models_v3 import ExtendedMatchingRequestV3
+from nextvision.services.enhanced_bidirectional_scorer_v3 import EnhancedBidirectionalScorerV3
+from nextvision.services.scoring_process_pool import ScoringProcessPool, snapshot_profile
+from tests.fixtures.v3_profiles import make_candidate_v3, make_company_v3
+
+COMPONENTS = [
+    "semantic_score", "salary_score", "experience_score", "location_score",
+    "contract_flexibility_score", "timing_compatibility_score", "work_modality_score"
+]
+
+
+def _requests(candidates: int, companies: int):
+    candidats = [make_candidate_v3(i) for i in range(candidates)]
+    entreprises = [make_company_v3(i) for i in range(companies)]
+    return [
+        ExtendedMatchingRequestV3(candidate=candidat, company=entreprise)
+        for candidat in candidats for entreprise in entreprises
+    ]
+
+
+def test_snapshot_round_trips_full_profile():
+    candidate = make_candidate_v3(3)
+    snapshot = snapshot_profile(candidate)
+
+    assert len(pickle.dumps(snapshot)) < len(pickle.dumps(candidate))
+    restored = type(candidate).model_validate(snapshot)
+    assert restored.model_dump() == candidate.model_dump()
+
+
+def test_snapshot_keeps_defaults_mutated_in_place():
+    candidate = make_candidate_v3(3)
+    # Défaut non renseigné à la construction, modifié ensuite sur place
+    candidate.motivations_ranking.secteurs_preferes.append("Comptabilité")
+
+    restored = type(candidate).model_validate(snapshot_profile(candidate))
+    assert restored.model_dump() == candidate.model_dump()
+
+
+@pytest.mark.asyncio
+async def test_process_batch_matches_inline_scores():
+    requests = _requests(8, 9)
+    inline_scorer = EnhancedBidirectionalScorerV3()
+    process_scorer = EnhancedBidirectionalScorerV3(
+        execution_mode="process", process_pool=ScoringProcessPool(max_workers=2, chunk_size=16)
+    )
+
+    try:
+        inline = await inline_scorer.calculate_enhanced_bidirectional_scores_batch(requests)
+        processed = await process_scorer.calculate_enhanced_bidirectional_scores_batch(requests)
+        pool_stats = process_scorer.get_global_performance_stats()["process_pool"]
+    finally:
+        process_scorer.close()
+
+    assert len(processed) == len(requests) == 72
+    assert pool_stats["pairs"] == 72
+    assert pool_stats["chunks"] == 5
+    for expected, actual in zip(inline, processed):
+        assert actual.matching_score == pytest.approx(expected.matching_score)
+        for component in COMPONENTS:
+            assert getattr(actual.component_scores, component) == pytest.approx(
+                getattr(expected.component_scores, component)
+            )
+
+
+@pytest.mark.asyncio
+async def test_single_request_in_process_mode():
+    request = _requests(1, 1)[0]
+    scorer = EnhancedBidirectionalScorerV3(
+        execution_mode="process", process_pool=ScoringProcessPool(max_workers=1)
+    )
+
+    try:
+        response = await scorer.calculate_enhanced_bidirectional_score(request)
+    finally:
+        scorer.close()
+
+    expected = await EnhancedBidirectionalScorerV3().calculate_enhanced_bidirectional_score(request)
+    assert response.algorithm_version == expected.algorithm_version
+    assert response.matching_score == pytest.approx(expected.matching_score)
+
+
+def test_unknown_execution_mode_is_rejected():
+    with pytest.raises(ValueError):
+        EnhancedBidirectionalScorerV3(execution_mode="threads")
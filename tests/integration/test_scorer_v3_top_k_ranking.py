@@ -0,0 +1,76 @@
+"""
+🧪 Tests classement top-k V3.0 avec élagage par borne supérieure
+
+Author: NEXTEN Team
+Version: 1.0.0 - Top-K Early Termination
+"""
+
+import pytest
+
+from nextvision.services.enhanced_bidirectional_scorer_v3 import EnhancedBidirectionalScorerV3
+from nextvision.services.scoring_process_pool import compute_cpu_component_scores
+from tests.fixtures.v3_profiles import make_candidate_v3, make_company_v3
+
+
+def _location_score(company) -> float:
+    index = int(company.base_profile.entreprise.nom.split()[-1])
+    return 0.3 + (index * 7 % 10) / 20
+
+
+def _scorer_with_counted_location():
+    """Location/transport déterministe par offre, appels comptés"""
+    scorer = EnhancedBidirectionalScorerV3()
+    calls = []
+
+    async def location_score(candidate, company, use_google_maps_intelligence=True):
+        calls.append(company.base_profile.entreprise.nom)
+        return {"final_score": _location_score(company)}
+
+    scorer._calculate_location_score = location_score
+    return scorer, calls
+
+
+def _full_scores(scorer, candidate, companies):
+    request = type("Request", (), {"use_adaptive_weighting": True})()
+    weights = scorer._determine_adaptive_weights(candidate, companies[0], request)
+    scores = []
+    for company in companies:
+        component_scores = scorer._assemble_component_scores(
+            compute_cpu_component_scores(scorer, candidate, company)
+            + [("location_transport", {"final_score": _location_score(company)})]
+        )
+        scores.append(scorer._calculate_weighted_final_score(component_scores, weights))
+    return scores
+
+
+@pytest.mark.asyncio
+async def test_top_k_matches_full_evaluation_and_prunes():
+    candidate = make_candidate_v3(2)
+    companies = [make_company_v3(i) for i in range(60)]
+    scorer, calls = _scorer_with_counted_location()
+
+    ranking = await scorer.rank_companies_top_k(candidate, companies, top_k=5)
+
+    full_scores = _full_scores(scorer, candidate, companies)
+    expected = sorted(range(len(companies)), key=lambda index: (-full_scores[index], index))[:5]
+    assert [index for index, _ in ranking] == expected
+    for index, response in ranking:
+        assert response.matching_score == pytest.approx(full_scores[index])
+
+    stats = scorer.get_global_performance_stats()["top_k_ranking"]
+    assert stats["expensive_evaluations"] == len(calls) < len(companies)
+    assert stats["expensive_pruned"] == len(companies) - len(calls)
+    assert stats["pairs_scored"] == 60
+
+
+@pytest.mark.asyncio
+async def test_top_k_larger_than_offers_scores_everything():
+    scorer, calls = _scorer_with_counted_location()
+    companies = [make_company_v3(i) for i in range(3)]
+
+    ranking = await scorer.rank_companies_top_k(make_candidate_v3(0), companies, top_k=10)
+
+    assert sorted(index for index, _ in ranking) == [0, 1, 2]
+    assert len(calls) == 3
+    assert scorer.ranking_stats["expensive_pruned"] == 0
+    assert await scorer.rank_companies_top_k(make_candidate_v3(0), [], top_k=10) == []
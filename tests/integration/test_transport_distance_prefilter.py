@@ -0,0 +1,98 @@
+"""
+🧪 Tests pré-filtre distance (haversine) - TransportCalculator (stub HTTP local)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Distance Pre-filter
+"""
+
+import asyncio
+
+import pytest
+
+from nextvision.services.google_maps_service import GoogleMapsService
+from nextvision.services.transport_calculator import TransportCalculator
+from nextvision.models.transport_models import ConfigTransport, GeocodeQuality, GeocodeResult
+from nextvision.models.questionnaire_advanced import TransportPreferences, MoyenTransport
+
+LOCATIONS = {
+    "domicile paris": (48.8566, 2.3522),
+    "job la defense": (48.8920, 2.2360),
+    "job lyon": (45.7640, 4.8357),
+    "job marseille": (43.2965, 5.3698),
+}
+
+
+def _config(moyen: MoyenTransport = MoyenTransport.VOITURE, temps_max: int = 60) -> ConfigTransport:
+    return ConfigTransport(
+        adresse_domicile="domicile paris",
+        transport_preferences=TransportPreferences(
+            moyens_selectionnes=[moyen],
+            temps_max={moyen.value.lower().replace(" ", "_"): temps_max}
+        )
+    )
+
+
+def _location(address: str, latitude: float, longitude: float) -> GeocodeResult:
+    return GeocodeResult(
+        address=address, formatted_address=address, latitude=latitude, longitude=longitude,
+        quality=GeocodeQuality.EXACT, place_id=address
+    )
+
+
+@pytest.mark.asyncio
+async def test_distance_pre_filter_skips_routing(google_maps_stub):
+    """Les jobs hors du rayon atteignable sont exclus sans appel Directions"""
+    stub = await google_maps_stub(LOCATIONS)
+    service = GoogleMapsService("TEST_API_KEY_MOCK", base_url=stub.base_url)
+    calculator = TransportCalculator(service)
+    config = _config()
+
+    # Rayon voiture : 130 km/h x 1h
+    assert calculator.get_reachable_radius_km(config) == {"driving": 130.0}
+
+    compatible, incompatible, reasons = await calculator.pre_filter_jobs_by_transport(
+        config, ["job la defense", "job lyon", "job marseille"]
+    )
+
+    assert compatible == ["job la defense"]
+    assert sorted(incompatible) == ["job lyon", "job marseille"]
+    assert "vol d'oiseau" in reasons["job lyon"]
+    assert stub.request_counts["directions"] == 1
+    assert calculator.stage_counts == {
+        "received": 3,
+        "geocoding_failed": 0,
+        "rejected_by_distance": 2,
+        "routed": 1,
+        "rejected_by_routing": 0,
+        "compatible": 1
+    }
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batches_keep_their_own_stage_counts(google_maps_stub):
+    stub = await google_maps_stub(LOCATIONS)
+    calculator = TransportCalculator(GoogleMapsService("TEST_API_KEY_MOCK", base_url=stub.base_url))
+    near, far = {}, {}
+    await asyncio.gather(
+        calculator.batch_calculate_job_compatibility(_config(), ["job la defense"], stage_counts=near),
+        calculator.batch_calculate_job_compatibility(_config(), ["job lyon", "job marseille"], stage_counts=far)
+    )
+
+    assert (near["received"], near["routed"], near["rejected_by_distance"]) == (1, 1, 0)
+    assert (far["received"], far["routed"], far["rejected_by_distance"]) == (2, 0, 2)
+    assert calculator.stage_counts["received"] == 3
+
+
+@pytest.mark.parametrize("moyen, job", [
+    # 120 km plein nord : moins d'une heure d'autoroute à 130 km/h
+    (MoyenTransport.VOITURE, ("job a1 120km", 49.9366, 2.3522)),
+    # ~205 km en TGV direct en 1h (Paris → Lille)
+    (MoyenTransport.TRANSPORT_COMMUN, ("job lille", 50.6292, 3.0573)),
+])
+def test_fast_links_are_never_dropped_by_distance(moyen, job):
+    calculator = TransportCalculator(GoogleMapsService("TEST_API_KEY_MOCK"))
+    domicile = _location("domicile paris", *LOCATIONS["domicile paris"])
+
+    rejected = calculator.distance_pre_filter(_config(moyen), domicile, {job[0]: _location(*job)})
+
+    assert rejected == {}
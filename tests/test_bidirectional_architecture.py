@@ -215,7 +215,19 @@ class TestScorers:
         
         # Test match parfait (même compétences)
         assert result.score > 0.7  # Bon match attendu
-    
+
+    def test_semantic_scorer_skill_index(self):
+        """Test index de compétences : inclusion, synonymes et accents"""
+        scorer = SemanticScorer()
+
+        candidat_skills = ["Développement Python avancé", "Gestion comptable", "CEGID"]
+
+        assert scorer._is_competence_match("python", candidat_skills)
+        assert scorer._is_competence_match("Maîtrise du logiciel comptable CEGID", candidat_skills)
+        assert scorer._is_competence_match("Comptabilite", candidat_skills)  # Synonyme sans accent
+        assert not scorer._is_competence_match("Excel", ["Excellent relationnel"])
+        assert scorer._match_competences(candidat_skills, ["Python", "Management"]) == 0.5
+
     def test_salary_scorer(self, sample_candidat_profile, sample_entreprise_profile):
         """Test SalaryScorer - budget entreprise vs attentes candidat"""
         scorer = SalaryScorer()
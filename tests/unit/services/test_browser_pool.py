@@ -0,0 +1,195 @@
+"""
+🧪 Tests pool Playwright préchauffé (réutilisation, recyclage, attente événementielle)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Warm Browser Pool
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from nextvision.services.parsing.browser_pool import (
+    PLAYWRIGHT_AVAILABLE, BrowserContextPool
+)
+
+PARSER_FIXTURE = Path(__file__).parents[2] / "fixtures" / "commitment_parser.html"
+
+
+class FakePage:
+    """Page minimale : localStorage en mémoire, hook setItem relayé comme le script injecté"""
+
+    def __init__(self):
+        self.storage = {}
+        self.binding = None
+        self.loads = 0
+
+    async def expose_function(self, name, callback):
+        self.binding = callback
+
+    async def goto(self, url, timeout=None):
+        self.loads += 1
+
+    async def reload(self, timeout=None):
+        self.loads += 1
+
+    async def wait_for_selector(self, selector, timeout=None):
+        return True
+
+    async def evaluate(self, script, keys=None):
+        if "removeItem" in script:
+            for key in keys:
+                self.storage.pop(key, None)
+            return None
+        for key in keys:
+            if key in self.storage:
+                return [key, self.storage[key]]
+        return None
+
+    def set_item(self, key, value, hooked=True):
+        self.storage[key] = json.dumps(value)
+        if hooked:
+            self.binding(key, self.storage[key])
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def add_init_script(self, script):
+        pass
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def is_connected(self):
+        return True
+
+    async def new_context(self):
+        self.contexts.append(FakeContext())
+        return self.contexts[-1]
+
+    async def close(self):
+        pass
+
+
+def _pool(**kwargs):
+    browser = FakeBrowser()
+
+    async def launcher():
+        return browser
+
+    return BrowserContextPool(browser_launcher=launcher, **kwargs), browser
+
+
+async def _settle(pool):
+    await asyncio.gather(*list(pool._background))
+
+
+@pytest.mark.asyncio
+async def test_prewarmed_pages_are_reused_and_reset():
+    pool, browser = _pool(size=2)
+    await pool.start(["cv", "job"])
+    assert len(browser.contexts) == 4
+
+    async with pool.acquire("cv") as slot:
+        waiter = slot.arm()
+        asyncio.get_running_loop().call_later(0.01, slot.page.set_item, "lastCVParseResult", {"nom": "Marie"})
+        assert await pool.wait_for_result(slot, waiter, timeout_seconds=5) == {"nom": "Marie"}
+    await _settle(pool)
+
+    # Résultat effacé et page rechargée avant retour au pool
+    assert slot.page.storage == {} and slot.page.loads == 2
+    async with pool.acquire("cv") as again:
+        pass
+    await _settle(pool)
+
+    stats = pool.get_stats()
+    assert len(browser.contexts) == 4
+    assert stats["warm_hits"] == 2 and stats["cold_starts"] == 0
+    assert stats["browser_launches"] == 1 and stats["results"] == 1
+    await pool.close()
+    assert all(context.closed for context in browser.contexts)
+
+
+@pytest.mark.asyncio
+async def test_contexts_are_recycled_after_max_uses_and_errors():
+    pool, browser = _pool(size=1, max_uses=2)
+
+    for _ in range(2):
+        async with pool.acquire("cv"):
+            pass
+        await _settle(pool)
+    assert browser.contexts[0].closed and len(browser.contexts) == 2
+
+    with pytest.raises(RuntimeError):
+        async with pool.acquire("cv"):
+            raise RuntimeError("page plantée")
+    await _settle(pool)
+
+    stats = pool.get_stats()
+    assert (stats["contexts_recycled"], stats["contexts_discarded"]) == (1, 1)
+    assert stats["contexts"] == {"cv": 1} and stats["idle"] == {"cv": 1}
+    assert stats["cold_starts"] == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_when_pool_is_exhausted():
+    pool, _ = _pool(size=1)
+
+    async def parse(delay):
+        async with pool.acquire("job"):
+            await asyncio.sleep(delay)
+
+    await asyncio.gather(parse(0.02), parse(0), parse(0))
+    assert pool.get_stats()["waits"] == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_result_written_without_set_item_is_read_on_timeout():
+    pool, _ = _pool(size=1)
+
+    async with pool.acquire("cv") as slot:
+        waiter = slot.arm()
+        slot.page.set_item("lastCVParseResult", {"nom": "Paul"}, hooked=False)
+        assert await pool.wait_for_result(slot, waiter, timeout_seconds=0.01) == {"nom": "Paul"}
+        slot.page.storage.clear()
+        assert await pool.wait_for_result(slot, slot.arm(), timeout_seconds=0.01) is None
+
+    assert pool.get_stats()["result_timeouts"] == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not PLAYWRIGHT_AVAILABLE, reason="Playwright non installé")
+async def test_local_parser_copy_with_real_chromium(tmp_path):
+    cv_file = tmp_path / "cv.txt"
+    cv_file.write_text("Marie Dupont - Comptable")
+    pool = BrowserContextPool(size=1, max_uses=3, page_timeout_seconds=10)
+    url = PARSER_FIXTURE.as_uri()
+    try:
+        await pool.start([url])
+        for _ in range(4):
+            async with pool.acquire(url) as slot:
+                waiter = slot.arm()
+                await (await slot.page.query_selector('input[type="file"]')).set_input_files(str(cv_file))
+                result = await pool.wait_for_result(slot, waiter, timeout_seconds=10)
+                assert result == {"nom_fichier": "cv.txt", "taille": cv_file.stat().st_size}
+            await _settle(pool)
+        stats = pool.get_stats()
+        assert stats["results"] == 4 and stats["result_timeouts"] == 0
+        assert stats["contexts_recycled"] == 1
+    finally:
+        await pool.close()
@@ -0,0 +1,29 @@
+"""
+🧪 Tests initialisation paresseuse du pool Playwright - CommitmentParsingBridge
+
+Author: NEXTEN Team
+Version: 1.0.0 - Warm Browser Pool
+"""
+
+import asyncio
+
+import pytest
+
+from nextvision.services.parsing.commitment_bridge_optimized import CommitmentParsingBridge
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_start_a_single_pool():
+    bridge = CommitmentParsingBridge(enable_playwright=False)
+    starts = []
+
+    async def slow_init():
+        starts.append(object())
+        await asyncio.sleep(0.01)
+        bridge.browser_pool = starts[-1]
+
+    bridge._init_browser = slow_init
+    pools = await asyncio.gather(*[bridge._get_browser_pool() for _ in range(5)])
+
+    assert len(starts) == 1
+    assert all(pool is starts[0] for pool in pools)
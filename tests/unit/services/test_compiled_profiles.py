@@ -0,0 +1,96 @@
+"""
+🧪 Tests profils compilés (équivalence avec les profils bruts, cache par empreinte, immutabilité)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Compiled Profiles
+"""
+
+import dataclasses
+
+import pytest
+
+from nextvision.services.bidirectional_scorer import (
+    ExperienceScorer, LocationScorer, SalaryScorer, SemanticScorer
+)
+from nextvision.services.compiled_profiles import ProfileCompiler
+from nextvision.services.scorers_v3 import AvailabilityTimingScorer
+from nextvision.utils.fingerprint import fingerprint
+from tests.fixtures.v3_profiles import make_candidate_v3, make_company_v3
+
+
+@pytest.mark.parametrize("index", range(4))
+def test_compiled_scores_match_raw_profiles(index):
+    compiler = ProfileCompiler()
+    candidate_v3, company_v3 = make_candidate_v3(index), make_company_v3(index + 1)
+    candidat, entreprise = candidate_v3.base_profile, company_v3.base_profile
+    compiled = (compiler.compile_candidate(candidate_v3), compiler.compile_company(company_v3))
+
+    for scorer in (
+        SemanticScorer(weight=0.3, profile_compiler=compiler),
+        SalaryScorer(weight=0.25),
+        ExperienceScorer(weight=0.2),
+        LocationScorer(weight=0.25)
+    ):
+        raw = scorer.calculate_score(candidat, entreprise)
+        fast = scorer.calculate_score(candidat, entreprise, *compiled)
+        assert fast.score == raw.score, type(scorer).__name__
+        assert fast.confidence == raw.confidence
+
+    timing_scorer = AvailabilityTimingScorer()
+    assert timing_scorer._extract_candidate_timing(candidate_v3, compiled[0].timing_weeks) == \
+        timing_scorer._extract_candidate_timing(candidate_v3)
+    assert compiled[1].recruitment_weeks == timing_scorer._parse_recruitment_delays(
+        company_v3.recruitment_process.recruitment_delays
+    )
+
+
+def test_profiles_are_compiled_once_per_fingerprint():
+    compiler = ProfileCompiler(max_entries=2)
+
+    def compile_candidate(profile):
+        return compiler.compile_candidate(profile, fingerprint(profile))
+
+    first = compile_candidate(make_candidate_v3(0).base_profile)
+    # Profil reconstruit (autres horodatages) : même empreinte, même enregistrement
+    assert compile_candidate(make_candidate_v3(0).base_profile) is first
+    assert first.key == fingerprint(make_candidate_v3(0).base_profile)
+
+    changed = make_candidate_v3(0).base_profile
+    changed.attentes.localisation_preferee = "Lyon"
+    recompiled = compile_candidate(changed)
+    assert recompiled is not first
+    assert recompiled.location == "lyon"
+
+    company = make_company_v3(0).base_profile
+    compiler.compile_company(company, fingerprint(company))
+    # Sans empreinte : compilation directe, hors cache
+    assert compiler.compile_company(company) is not compiler.compile_company(company)
+    stats = compiler.get_stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (1, 3, 1, 2)
+    assert stats["uncached"] == 2
+
+
+def test_compiled_records_are_immutable_and_slotted():
+    compiler = ProfileCompiler()
+    compiled = compiler.compile_company(make_company_v3(0))
+
+    assert not hasattr(compiled, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        compiled.salary_min = 0
+
+
+def test_v3_fields_are_compiled():
+    compiler = ProfileCompiler()
+    candidate_v3, company_v3 = make_candidate_v3(0), make_company_v3(0)
+
+    compiled_v3 = compiler.build_candidate(candidate_v3)
+    compiled_base = compiler.build_candidate(candidate_v3.base_profile)
+    company = compiler.build_company(company_v3)
+
+    assert compiled_v3.timing_weeks is not None
+    assert compiled_base.timing_weeks is None
+    assert company.recruitment_weeks is not None
+    assert compiled_v3.experience_years == compiled_base.experience_years
+    assert company.mandatory_lower == tuple(
+        skill.lower() for skill in company_v3.base_profile.exigences.competences_obligatoires
+    )
@@ -0,0 +1,104 @@
+"""
+🧪 Tests extraction de texte (arrêt anticipé par page, cache par empreinte, pool de processus)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Document Extraction Pool
+"""
+
+import asyncio
+
+import pytest
+
+from nextvision.services.document_extraction import (
+    DocumentTextExtractor, collect_pages, extract_text_from_bytes
+)
+
+
+def test_pages_are_streamed_until_max_chars():
+    consumed = []
+
+    def pages():
+        for index in range(100):
+            consumed.append(index)
+            yield "x" * 1000
+
+    text, pages_read, truncated = collect_pages(pages(), max_chars=3000)
+
+    assert len(text) == 3000
+    assert pages_read == 3 and truncated
+    # Les pages suivantes ne sont jamais extraites
+    assert consumed == [0, 1, 2]
+
+    full_text, pages_read, truncated = collect_pages(["a", "b"], max_chars=None)
+    assert (full_text, pages_read, truncated) == ("a\nb", 2, False)
+
+
+def test_legacy_word_files_are_not_decoded_as_text():
+    extracted = extract_text_from_bytes(b"\xd0\xcf\x11\xe0binary", "cv.doc")
+
+    assert extracted.text == ""
+    assert extracted.extractor == "fallback"
+    assert ".doc" in extracted.error
+
+
+def test_text_files_are_decoded_and_truncated():
+    latin1 = "Comptable expérimentée".encode("latin-1")
+
+    assert extract_text_from_bytes(latin1, "cv.txt").text == "Comptable expérimentée"
+    long_text = extract_text_from_bytes(b"a" * 5000, "cv.txt", max_chars=3000)
+    assert len(long_text.text) == 3000 and long_text.truncated
+
+
+@pytest.mark.asyncio
+async def test_identical_uploads_are_extracted_once():
+    extractor = DocumentTextExtractor()
+    data = b"Marie Dupont - Comptable\n" * 10
+
+    results = await asyncio.gather(*[extractor.extract(data, "cv.txt") for _ in range(3)])
+    again = await extractor.extract(data, "copie.txt")
+
+    assert all(result.text == data.decode() for result in results + [again])
+    stats = extractor.get_stats()
+    assert stats["extractions"] == 1
+    assert stats["coalesced"] + stats["cache_hits"] == 3
+    # Autre limite de caractères : entrée distincte
+    await extractor.extract(data, "cv.txt", max_chars=10)
+    assert extractor.get_stats()["extractions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_coalesced_extraction():
+    extractor = DocumentTextExtractor()
+    extract_uncached = extractor._extract_uncached
+
+    async def slow_extract(*args):
+        await asyncio.sleep(0.05)
+        return await extract_uncached(*args)
+
+    extractor._extract_uncached = slow_extract
+    data = b"Marie Dupont - Comptable"
+
+    leader = asyncio.ensure_future(extractor.extract(data, "cv.txt"))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(extractor.extract(data, "cv.txt"))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert (await follower).text == data.decode()
+    assert leader.cancelled()
+    assert extractor.get_stats()["extractions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_large_documents_run_in_process_pool():
+    extractor = DocumentTextExtractor(max_workers=1, offload_min_bytes=0)
+    try:
+        result = await extractor.extract(b"%PDF-1.4 not really a pdf", "offre.pdf")
+    finally:
+        extractor.shutdown()
+
+    stats = extractor.get_stats()
+    assert stats["offloaded"] == 1 and stats["inline"] == 0
+    # Échec d'extraction (bibliothèque absente ou PDF invalide) : non mis en cache
+    if result.error:
+        assert result.text == "" and stats["cache_size"] == 0
@@ -0,0 +1,117 @@
+"""
+🧪 Tests store de cache géographique (cascade, remontée avec TTL restant, cache négatif)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Shared Geo Cache
+"""
+
+import time
+
+import pytest
+
+from nextvision.models.transport_models import GeocodeQuality, GeocodeResult
+from nextvision.services.geo_cache_store import (
+    GEOCODE_NOT_FOUND, GeoCacheBackend, GeoCacheStore, MemoryLRUBackend, SQLiteGeoBackend
+)
+
+KEY = "geocode_10 rue de rivoli, paris"
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FailingBackend(GeoCacheBackend):
+    name = "failing"
+
+    async def get(self, key):
+        raise ConnectionError("niveau indisponible")
+
+    async def set(self, key, value, ttl_seconds):
+        raise ConnectionError("niveau indisponible")
+
+    async def delete(self, key):
+        raise ConnectionError("niveau indisponible")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def sqlite_tier(tmp_path):
+    tier = SQLiteGeoBackend(str(tmp_path / "geo_cache.sqlite"))
+    yield tier
+    tier.close()
+
+
+def _geocode() -> GeocodeResult:
+    return GeocodeResult(
+        address="10 rue de Rivoli, Paris", formatted_address="10 Rue de Rivoli, 75004 Paris, France",
+        latitude=48.8556, longitude=2.3601, quality=GeocodeQuality.EXACT, place_id="place_rivoli"
+    )
+
+
+@pytest.mark.asyncio
+async def test_lookup_falls_through_to_lower_tier(clock, sqlite_tier):
+    memory = MemoryLRUBackend()
+    store = GeoCacheStore([memory, FailingBackend(), sqlite_tier])
+    await sqlite_tier.set(KEY, GeoCacheStore._encode(_geocode(), clock.now + 600), 600)
+
+    result = await store.get(KEY)
+
+    assert result.place_id == "place_rivoli"
+    stats = store.get_stats()
+    assert stats["tier_hits"] == {"memory": 0, "failing": 0, "sqlite": 1}
+    assert stats["errors"] == 2  # lecture + remontée sur le niveau en panne
+    assert await memory.get(KEY) == result
+
+
+@pytest.mark.asyncio
+async def test_promotion_keeps_remaining_ttl(clock, sqlite_tier):
+    memory = MemoryLRUBackend()
+    store = GeoCacheStore([memory, sqlite_tier])
+    await store.set(KEY, _geocode(), ttl_seconds=600)
+    expires_at = clock.now + 600
+
+    clock.now += 500
+    await memory.delete(KEY)
+    assert (await store.get(KEY)).place_id == "place_rivoli"
+    assert memory._entries[KEY][1] == pytest.approx(expires_at)
+
+    # Entrée remontée : expire avec l'originale, pas une heure plus tard
+    clock.now += 101
+    assert await store.get(KEY) is None
+    assert store.get_stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_payload_expiry_wins_over_tier_ttl(clock, sqlite_tier):
+    store = GeoCacheStore([MemoryLRUBackend(), sqlite_tier])
+    # TTL natif du niveau plus long que l'expiration portée par la valeur
+    await sqlite_tier.set(KEY, GeoCacheStore._encode(_geocode(), clock.now + 10), 3600)
+
+    clock.now += 11
+    assert await store.get(KEY) is None
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_cached_on_every_tier(clock, sqlite_tier):
+    memory = MemoryLRUBackend()
+    store = GeoCacheStore([memory, sqlite_tier])
+    await store.set_not_found(KEY, ttl_seconds=60)
+
+    assert await store.get(KEY) == GEOCODE_NOT_FOUND
+    await memory.delete(KEY)
+    assert await store.get(KEY) == GEOCODE_NOT_FOUND
+    assert store.get_stats()["negative_hits"] == 2
+
+    clock.now += 61
+    assert await store.get(KEY) is None
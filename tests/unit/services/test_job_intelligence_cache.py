@@ -0,0 +1,88 @@
+"""
+🧪 Tests cache d'analyse JobIntelligenceService (empreinte du contenu, LRU borné, signaux figés, niveau 2)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Job Intelligence Cache
+"""
+
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from nextvision.services.gpt_direct_service import JobData
+from nextvision.services.job_intelligence_service import JobIntelligenceService, JobIntelligenceSignals
+from nextvision.utils.parse_cache import ParseCache, SQLiteParseBackend
+
+
+def _job(title: str = "Comptable Général", **overrides) -> JobData:
+    fields = dict(
+        title=title, company="Startup Fintech", location="Paris", contract_type="CDI",
+        required_skills=["SAP"], preferred_skills=[],
+        responsibilities=["Saisie comptable", "Management d'une petite équipe"],
+        requirements=["3 ans d'expérience"],
+        benefits=["Télétravail hybride", "Formation continue", "RTT"],
+        salary_range={"min": 40000, "max": 48000}, remote_policy="hybride"
+    )
+    fields.update(overrides)
+    return JobData(**fields)
+
+
+def _service(**cache_kwargs) -> JobIntelligenceService:
+    return JobIntelligenceService(ParseCache("job_intelligence_test", "v1", JobIntelligenceSignals, **cache_kwargs))
+
+
+@pytest.mark.asyncio
+async def test_job_is_analyzed_once_per_content():
+    service = _service()
+
+    # Mêmes textes (objets distincts, champs non analysés différents) : une seule analyse
+    results = await asyncio.gather(*[service.analyze_job_intelligence(_job()) for _ in range(3)])
+    again = await service.analyze_job_intelligence(_job(location="Lyon", required_skills=["Cegid"]))
+    assert service.get_cache_key(_job()) == service.get_cache_key(_job(location="Lyon"))
+
+    stats = service.get_cache_stats()
+    assert stats["parses"] == 1
+    assert stats["coalesced"] + stats["l1_hits"] == 3
+    first = results[0].model_dump(exclude={"processing_time_ms"})
+    assert all(result.model_dump(exclude={"processing_time_ms"}) == first for result in results + [again])
+    assert "Formation continue" in again.learning_opportunities and again.remote_flexibility == 0.7
+
+    # Contenu modifié : nouvelle empreinte, nouvelle analyse
+    assert service.get_cache_key(_job("Responsable Comptable")) != service.get_cache_key(_job())
+    await service.analyze_job_intelligence(_job("Responsable Comptable"))
+    assert service.get_cache_stats()["parses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_signals_are_never_mutated():
+    service = _service()
+    await service.analyze_job_intelligence(_job())
+    cached = service.analysis_cache._get_l1(service.get_cache_key(_job()))
+    cached_time = cached.processing_time_ms
+
+    hit = await service.analyze_job_intelligence(_job())
+
+    assert hit is not cached
+    assert cached.processing_time_ms == cached_time
+    with pytest.raises(ValidationError):
+        hit.culture_type = "corporate"
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded_and_shared_through_l2(tmp_path):
+    l2 = SQLiteParseBackend(str(tmp_path / "job_intelligence.db"))
+    service = _service(l2=l2, l1_max_entries=2)
+    for index in range(4):
+        await service.analyze_job_intelligence(_job(f"Comptable {index}"))
+    assert service.get_cache_stats()["l1_size"] == 2
+
+    # Autre worker (L1 vide) : analyse relue depuis le niveau 2
+    other = _service(l2=l2)
+    signals = await other.analyze_job_intelligence(_job("Comptable 0"))
+    stats = other.get_cache_stats()
+    assert (stats["l2_hits"], stats["parses"]) == (1, 0)
+    assert signals.learning_opportunities == ("Formation continue",)
+
+    service.clear_cache()
+    assert service.get_cache_stats()["l1_size"] == 0
@@ -0,0 +1,84 @@
+"""
+🧪 Tests empreintes canoniques des clés de cache
+
+Author: NEXTEN Team
+Version: 1.0.0 - Canonical Fingerprints
+"""
+
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+from nextvision.models.bidirectional_models import (
+    BiDirectionalCandidateProfile, PersonalInfoBidirectional, CompetencesProfessionnelles,
+    AttentesCandidat, MotivationsCandidat, RaisonEcouteCandidat, NiveauExperience, TypeContrat
+)
+from nextvision.utils.fingerprint import FINGERPRINT_VERSION, FLOAT_TAG, canonicalize, fingerprint
+
+
+def _candidate(**attentes) -> BiDirectionalCandidateProfile:
+    return BiDirectionalCandidateProfile(
+        personal_info=PersonalInfoBidirectional(firstName="Marie", lastName="Dupont", email="marie@email.com"),
+        experience_globale=NiveauExperience.CONFIRME,
+        competences=CompetencesProfessionnelles(
+            competences_techniques=["CEGID"], langues={"Français": "Natif", "Anglais": "Courant"}
+        ),
+        attentes=AttentesCandidat(salaire_min=38000, salaire_max=45000, localisation_preferee="Paris", **attentes),
+        motivations=MotivationsCandidat(raison_ecoute=RaisonEcouteCandidat.REMUNERATION_TROP_FAIBLE)
+    )
+
+
+def test_fingerprint_ignores_key_order_and_volatile_fields():
+    first = {"b": 1, "a": [1, 2], "timestamp": datetime(2024, 1, 1)}
+    second = {"a": [1, 2], "b": 1.0, "timestamp": datetime(2025, 6, 1)}
+
+    assert fingerprint(first) == fingerprint(second)
+    assert fingerprint(first).startswith(f"{FINGERPRINT_VERSION}_")
+
+
+def test_fingerprint_distinguishes_content():
+    assert fingerprint({"a": [1, 2]}) != fingerprint({"a": [2, 1]})
+    assert fingerprint(_candidate()) != fingerprint(_candidate(distance_max_km=10))
+
+
+def test_equal_profiles_built_separately_share_a_fingerprint():
+    # parsed_at diffère entre les deux instances
+    assert fingerprint(_candidate()) == fingerprint(_candidate())
+
+
+def test_canonical_form_of_enums_sets_and_floats():
+    assert canonicalize({TypeContrat.CDI: {3, 1, 2}, "ratio": 0.1, "salaire": 45000.0}) == {
+        "CDI": [1, 2, 3], "ratio": [FLOAT_TAG, (0.1).hex()], "salaire": 45000
+    }
+
+
+def test_floats_do_not_collide_with_strings_or_close_floats():
+    assert fingerprint({"seuil": 0.1}) != fingerprint({"seuil": "0.1"})
+    assert fingerprint({"seuil": 0.1}) != fingerprint({"seuil": 0.1 + 1e-15})
+    assert fingerprint(float("nan")) == fingerprint(float("nan"))
+    assert fingerprint(float("inf")) != fingerprint("inf")
+
+
+def test_model_and_its_dict_share_a_fingerprint():
+    candidate = _candidate()
+    candidate.confidence_score = 0.1
+
+    assert fingerprint(candidate) == fingerprint(candidate.model_dump())
+    assert canonicalize(candidate)["confidence_score"] == [FLOAT_TAG, (0.1).hex()]
+
+    candidate.confidence_score = float("nan")
+    assert fingerprint(candidate) == fingerprint(candidate.model_dump())
+    assert fingerprint(candidate) != fingerprint(_candidate())
+
+
+def test_fingerprint_is_stable_across_processes():
+    script = "from nextvision.utils.fingerprint import fingerprint; print(fingerprint({'x': {'b', 'a'}, 'y': 2.5}))"
+    outputs = set()
+    for seed in ("1", "2"):
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        outputs.add(subprocess.run(
+            [sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True
+        ).stdout.strip())
+
+    assert outputs == {fingerprint({"x": {"a", "b"}, "y": 2.5})}
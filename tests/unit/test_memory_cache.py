@@ -0,0 +1,108 @@
+"""
+🧪 Tests cache mémoire niveau 1 (LRU, expiration par tas, budgets, statistiques)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Memory Cache
+"""
+
+import time
+
+import pytest
+
+from nextvision.cache.redis_intelligent_cache import MemoryCache
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_access_refreshes_lru_order(clock):
+    cache = MemoryCache(max_size=3)
+    for key in ("a", "b", "c"):
+        await cache.set(key, key)
+
+    assert await cache.get("a") == "a"
+    await cache.set("d", "d")
+
+    assert list(cache.cache) == ["c", "a", "d"]
+    assert await cache.get("b") is None
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiry_on_read_and_through_heap(clock):
+    cache = MemoryCache()
+    await cache.set("short", 1, ttl=10)
+    await cache.set("long", 2, ttl=100)
+
+    clock.now += 10
+    assert await cache.get("short") is None
+    assert cache.get_stats()["expirations"] == 1
+
+    # Entrée jamais relue : purgée par le tas lors d'une écriture ultérieure
+    await cache.set("other", 3, ttl=100)
+    clock.now += 95
+    await cache.set("trigger", 4, ttl=100)
+
+    assert "long" not in cache.cache
+    assert cache.get_stats()["expirations"] == 2
+    assert cache.get_size() == 2
+
+
+@pytest.mark.asyncio
+async def test_rewritten_key_is_not_expired_by_stale_heap_entry(clock):
+    cache = MemoryCache()
+    await cache.set("key", "old", ttl=10)
+    await cache.set("key", "new", ttl=100)
+
+    clock.now += 20
+    await cache.set("trigger", 1, ttl=100)
+
+    assert await cache.get("key") == "new"
+    assert cache.get_stats()["expirations"] == 0
+
+
+@pytest.mark.asyncio
+async def test_byte_limit_evicts_least_recently_used(clock):
+    cache = MemoryCache(max_bytes=250)
+    for key in ("a", "b", "c"):
+        await cache.set(key, key, size_bytes=100)
+
+    assert list(cache.cache) == ["b", "c"]
+    stats = cache.get_stats()
+    assert stats["total_size_bytes"] == 200
+    assert stats["evictions"] == 1
+
+    await cache.delete("b")
+    assert cache.get_stats()["total_size_bytes"] == 100
+
+
+@pytest.mark.asyncio
+async def test_namespace_budget_only_evicts_its_namespace(clock):
+    cache = MemoryCache(max_size=10, namespace_budgets={"geocode": 2})
+    await cache.set("route:1", 1, namespace="route")
+    for i in range(4):
+        await cache.set(f"geocode:{i}", i, namespace="geocode")
+
+    assert list(cache.namespaces["geocode"]) == ["geocode:2", "geocode:3"]
+    assert "route:1" in cache.cache
+    stats = cache.get_stats()
+    assert stats["evictions"] == 2
+    assert stats["namespaces"] == {
+        "route": {"size": 1, "budget": None},
+        "geocode": {"size": 2, "budget": 2}
+    }
@@ -0,0 +1,108 @@
+"""
+🧪 Tests stockage compact des métriques (anneaux, expiration, quantiles, export Prometheus)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Compact Metric Store
+"""
+
+import random
+
+import pytest
+
+from nextvision.monitoring.metric_store import (
+    PROMETHEUS_AVAILABLE, MetricStore, PrometheusStoreCollector, QuantileSketch
+)
+
+
+def test_label_sets_are_interned_independently_of_order():
+    store = MetricStore()
+
+    first = store.record("api_requests_total", 1, {"endpoint": "/match", "method": "POST"}, "counter")
+    second = store.record("api_requests_total", 1, {"method": "POST", "endpoint": "/match"}, "counter")
+    store.record("api_requests_total", 1, {"endpoint": "/health", "method": "GET"}, "counter")
+
+    assert first is second
+    assert first.labels == (("endpoint", "/match"), ("method", "POST"))
+    assert len(store) == 2
+    assert first.total == 2
+
+
+def test_ring_buffer_keeps_latest_samples_in_order():
+    store = MetricStore(capacity=5)
+    for i in range(12):
+        store.record("queue_depth", i, timestamp=1000.0 + i)
+
+    series = store.series_for("queue_depth")[0]
+    assert len(series) == 5
+    assert series.count == 12
+
+    summary = store.summarize("queue_depth", window_seconds=3600, now=1012.0)
+    assert summary["sample_count"] == 5
+    assert (summary["min_value"], summary["max_value"], summary["current_value"]) == (7, 11, 11)
+    assert summary["sum_value"] == sum(range(7, 12))
+
+    # Fenêtre courte : recherche dichotomique dans l'anneau
+    assert store.summarize("queue_depth", window_seconds=2.5, now=1012.0)["sample_count"] == 2
+    assert store.summarize("queue_depth", window_seconds=3600, now=1012.0)["recent_trend"] == "increasing"
+
+
+def test_idle_series_expire_on_periodic_sweep():
+    store = MetricStore(retention_seconds=60, sweep_interval_seconds=10)
+    store._next_sweep = 1010.0
+    store.record("old_gauge", 1, {"service": "a"}, timestamp=1000.0)
+    store.record("live_gauge", 1, timestamp=1005.0)
+
+    # Pas de nettoyage par échantillon
+    store.record("live_gauge", 2, timestamp=1009.0)
+    assert len(store) == 2
+
+    store.record("live_gauge", 3, timestamp=1065.0)
+    assert store.names() == ["live_gauge"]
+    assert store.series_expired == 1
+    assert store.summarize("old_gauge", 3600, now=1065.0) is None
+
+
+@pytest.mark.parametrize("q", [0.5, 0.95, 0.99])
+def test_sketch_quantiles_within_relative_error(q):
+    rng = random.Random(7)
+    values = [rng.lognormvariate(-3, 1) for _ in range(20000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    exact = sorted(values)[int(q * (len(values) - 1))]
+    assert sketch.quantile(q) == pytest.approx(exact, rel=0.03)
+    assert len(sketch.positive) < 1000
+
+
+def test_timer_summary_reports_percentiles():
+    store = MetricStore()
+    for i in range(1, 101):
+        store.record("matching_time", i / 1000, {"endpoint": "/match"}, "timer", timestamp=1000.0 + i / 100)
+
+    summary = store.summarize("matching_time", 3600, now=1001.0)
+
+    assert summary["p50"] == pytest.approx(0.050, rel=0.03)
+    assert summary["p95"] == pytest.approx(0.095, rel=0.03)
+    assert summary["p99"] == pytest.approx(0.099, rel=0.03)
+
+
+@pytest.mark.skipif(not PROMETHEUS_AVAILABLE, reason="prometheus_client non installé")
+def test_prometheus_export_reads_store():
+    store = MetricStore()
+    store.record("api_requests_total", 1, {"endpoint": "/match"}, "counter")
+    store.record("api_requests_total", 2, {"endpoint": "/match"}, "counter")
+    store.record("api_request_duration", 0.2, {"endpoint": "/match"}, "timer")
+    store.record("system_cpu_usage", 42.0)
+
+    collector = PrometheusStoreCollector(store, {
+        "system_cpu_usage": ("nextvision_system_cpu_usage_percent", "System CPU usage percentage")
+    })
+    families = {family.name: family for family in collector.collect()}
+
+    assert families["nextvision_api_requests"].type == "counter"
+    assert families["nextvision_api_requests"].samples[0].value == 3
+    duration = families["nextvision_api_request_duration_seconds"]
+    assert duration.type == "summary"
+    assert {sample.labels.get("quantile") for sample in duration.samples} >= {"0.5", "0.95", "0.99"}
+    assert families["nextvision_system_cpu_usage_percent"].samples[0].value == 42.0
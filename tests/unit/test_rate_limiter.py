@@ -0,0 +1,97 @@
+"""
+🧪 Tests limiteur de débit GCRA (rafale, recharge, limites par route, balayage, repli Redis)
+
+Author: NEXTEN Team
+Version: 1.0.0 - GCRA Rate Limiter
+"""
+
+import pytest
+
+from nextvision.utils.rate_limiter import GCRARateLimiter, RateLimit, rate_limit_headers
+
+
+def _limiter(**kwargs) -> GCRARateLimiter:
+    return GCRARateLimiter(
+        default_limit=RateLimit(requests_per_minute=60, burst=3),
+        route_limits={"/api/v2/jobs/parse": RateLimit(requests_per_minute=6, burst=1)},
+        exempt_paths=["/health"],
+        **kwargs
+    )
+
+
+def test_burst_then_sustained_rate():
+    limiter = _limiter()
+    limit = limiter.default_limit
+
+    burst = [limiter.check_local("ip", limit, now=100.0) for _ in range(4)]
+    assert [d.allowed for d in burst] == [True, True, True, False]
+    assert [d.remaining for d in burst[:3]] == [2, 1, 0]
+    assert burst[3].retry_after == pytest.approx(1.0)
+
+    # 1 requête/seconde au débit soutenu
+    assert limiter.check_local("ip", limit, now=101.0).allowed
+    assert not limiter.check_local("ip", limit, now=101.5).allowed
+    # Autre client : état indépendant
+    assert limiter.check_local("other", limit, now=101.5).allowed
+
+
+def test_rejected_requests_do_not_consume_capacity():
+    limiter = _limiter()
+    limit = limiter.default_limit
+    for _ in range(50):
+        limiter.check_local("ip", limit, now=100.0)
+
+    assert limiter.check_local("ip", limit, now=103.0).remaining == 2
+
+
+@pytest.mark.asyncio
+async def test_route_limits_and_exempt_paths():
+    limiter = _limiter()
+
+    parse = [await limiter.check("ip", "/api/v2/jobs/parse") for _ in range(2)]
+    other = await limiter.check("ip", "/api/v1/matching/candidate/1")
+
+    assert [d.allowed for d in parse] == [True, False]
+    assert parse[1].retry_after > 9
+    assert other.allowed
+    assert await limiter.check("ip", "/health/live") is None
+    assert limiter.stats["rejected"] == 1 and limiter.stats["exempt"] == 1
+
+    headers = rate_limit_headers(parse[1])
+    assert headers["Retry-After"] == "10"
+    assert headers["X-RateLimit-Remaining"] == "0"
+
+
+def test_idle_keys_are_swept():
+    limiter = _limiter(sweep_interval_seconds=30)
+    limiter._next_sweep = 130.0
+    limit = limiter.default_limit
+    for i in range(100):
+        limiter.check_local(f"ip-{i}", limit, now=100.0)
+    for _ in range(3):
+        limiter.check_local("busy", limit, now=129.0)
+    assert limiter.get_stats()["tracked_keys"] == 101
+
+    limiter.check_local("busy", limit, now=130.0)
+
+    assert limiter.get_stats()["tracked_keys"] == 1
+    assert limiter.stats["keys_swept"] == 100
+
+
+class _UnavailableRedis:
+    def register_script(self, _script):
+        async def call(keys, args):
+            raise ConnectionError("redis down")
+        return call
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_local_limits():
+    limiter = _limiter(redis_client=_UnavailableRedis())
+
+    decisions = [await limiter.check("ip", "/api/v1/x") for _ in range(4)]
+
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+    stats = limiter.get_stats()
+    assert stats["redis_errors"] == 4
+    assert stats["backend"] == "memory"
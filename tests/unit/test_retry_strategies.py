@@ -0,0 +1,101 @@
+"""
+🧪 Tests RetryExecutor (budget de retries, hedging, deadline, amplification)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Retry Budgets & Hedging
+"""
+
+import asyncio
+import time
+from collections import deque
+
+import pytest
+
+from nextvision.utils.retry_strategies import (
+    DeadlineExceededError, RetryConfig, RetryExecutor, RetryStrategy, deadline_scope, get_remaining_time,
+    is_hedge_attempt
+)
+
+
+def _config(**overrides) -> RetryConfig:
+    fields = dict(max_attempts=4, base_delay=0.01, max_delay=0.01, jitter_range=0.0,
+                  strategy=RetryStrategy.FIXED_DELAY, retryable_exceptions=[ConnectionError])
+    fields.update(overrides)
+    return RetryConfig(**fields)
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_caps_amplification():
+    executor = RetryExecutor()
+    config = _config(retry_budget_ratio=0.1, retry_budget_min_retries=2)
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        raise ConnectionError("backend down")
+
+    results = [await executor.execute_with_retry(failing, "api", config) for _ in range(10)]
+
+    # 10 requêtes, 2 retries autorisés au total (au lieu de 30)
+    assert calls == 12
+    assert all(result.budget_exhausted for result in results)
+    amplification = executor.get_all_stats()["retry_amplification"]["api"]
+    assert (amplification["requests"], amplification["retries"]) == (10, 2)
+    assert amplification["amplification"] == pytest.approx(1.2)
+
+
+@pytest.mark.asyncio
+async def test_slow_idempotent_call_is_hedged():
+    executor = RetryExecutor()
+    config = _config(idempotent=True, hedge_percentile=0.95, hedge_min_samples=5)
+    executor.latency_history["maps"] = deque([0.01] * 5)
+    calls = 0
+    hedge_flags = []
+
+    async def lookup():
+        nonlocal calls
+        calls += 1
+        hedge_flags.append(is_hedge_attempt())
+        # Premier appel bloqué (tail latency), le hedge répond vite
+        await asyncio.sleep(5 if calls == 1 else 0.005)
+        return calls
+
+    start = time.monotonic()
+    result = await executor.execute_with_retry(lookup, "maps", config)
+
+    assert result.success and result.final_result == 2 and result.hedges_made == 1
+    assert hedge_flags == [False, True]
+    assert time.monotonic() - start < 1
+    stats = executor.get_retry_amplification("maps")
+    assert (stats["hedges"], stats["hedge_wins"]) == (1, 1)
+
+    # Opération non idempotente : jamais doublée
+    assert executor.get_hedge_delay("maps", _config(hedge_percentile=0.95, hedge_min_samples=5)) is None
+
+
+@pytest.mark.asyncio
+async def test_retry_never_outlives_deadline():
+    executor = RetryExecutor()
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        raise ConnectionError("backend down")
+
+    # Backoff (1s) plus long que le temps restant : aucun retry
+    result = await executor.execute_with_retry(failing, "api", _config(base_delay=1.0, max_delay=1.0), timeout=0.2)
+    assert (calls, result.deadline_exceeded) == (1, True)
+
+    async def slow():
+        await asyncio.sleep(5)
+
+    # Deadline héritée de l'appelant, la tentative en cours est interrompue
+    start = time.monotonic()
+    with deadline_scope(0.05):
+        assert 0 < get_remaining_time() <= 0.05
+        result = await executor.execute_with_retry(slow, "api", _config(), timeout=10)
+    assert isinstance(result.final_error, DeadlineExceededError)
+    assert time.monotonic() - start < 1
+    assert get_remaining_time() is None
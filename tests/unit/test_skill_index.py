@@ -0,0 +1,59 @@
+"""
+🧪 Tests index de compétences (inclusion, phrases longues, mémoire bornée)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Skill Index
+"""
+
+from nextvision.utils.skill_index import SkillIndex
+
+LONG_SKILL = "Gestion de la paie et des déclarations sociales pour les PME du secteur industriel"
+
+
+def test_phrase_inclusion_both_ways():
+    index = SkillIndex()
+    profile = index.compile_profile(["Développement Python avancé", "CEGID"])
+
+    assert index.matches("python avancé", profile)
+    assert index.matches("Maîtrise du logiciel CEGID", profile)
+    assert not index.matches("Excel", index.compile_profile(["Excellent relationnel"]))
+
+
+def test_phrases_longer_than_ngram_cap_still_match():
+    index = SkillIndex(max_ngram=4)
+    assert len(index.tokenize(LONG_SKILL)) > index.max_ngram
+
+    # Compétence requise longue contenue dans une compétence du profil
+    profile = index.compile_profile([f"Expert {LONG_SKILL} depuis 10 ans"])
+    assert index.matches(LONG_SKILL, profile, use_synonyms=False)
+    # Compétence du profil longue contenue dans la compétence requise
+    profile = index.compile_profile([LONG_SKILL])
+    assert index.matches(f"{LONG_SKILL} (multi-sites)", profile, use_synonyms=False)
+    assert not index.matches(LONG_SKILL.replace("paie", "formation"), profile, use_synonyms=False)
+
+
+def test_ngram_cap_covers_longest_dictionary_form():
+    index = SkillIndex(
+        synonyms={"paie": ["gestion de la paie et des déclarations sociales"]}, max_ngram=2
+    )
+    assert index.max_ngram == 8
+
+
+def test_free_text_is_not_interned():
+    index = SkillIndex(cache_size=4)
+    for i in range(50):
+        index.compile_profile([f"compétence libre numéro {i}"])
+
+    stats = index.get_stats()
+    assert stats["canonical_skills"] == len(index.canonical_ids)
+    assert "interned_ngrams" not in stats
+    assert index.compile_skill.cache_info().currsize <= 4
+
+
+def test_synonyms_match_in_one_direction_only():
+    index = SkillIndex()
+
+    assert index.matches("Comptabilité", index.compile_profile(["Gestion comptable"]))
+    assert not index.matches("Gestion comptable", index.compile_profile(["Comptabilité"]))
+    assert not index.matches("Finance", index.compile_profile(["Fiscalité"]))
+    assert not index.matches("Comptabilité", index.compile_profile(["Fiscalité"]), use_synonyms=False)
@@ -0,0 +1,145 @@
+"""
+🧪 Tests logging structuré (formateur une passe, échantillonnage, pipeline asynchrone)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Async Log Pipeline
+"""
+
+import json
+import logging
+import threading
+
+import pytest
+
+from nextvision.nextvision_logging import structured_logging
+from nextvision.nextvision_logging.structured_logging import (
+    AsyncLogPipeline, LogContext, SamplingFilter, StructuredFormatter, log_context
+)
+
+
+class _CaptureHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.threads.add(threading.current_thread().name)
+        self.records.append(record)
+
+
+def _record(name="nextvision.test", level=logging.INFO, msg="message", created=None, **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, None, None)
+    record.__dict__.update(extra)
+    if created is not None:
+        record.created = created
+    return record
+
+
+def test_formatter_serializes_extra_fields_in_one_pass():
+    formatter = StructuredFormatter()
+    record = _record(request_id="req-1", duration_ms=12.5, payload={"a": 1}, obj=object(), _private=1)
+
+    entry = json.loads(formatter.format(record))
+
+    assert entry["context"] == {"request_id": "req-1"}
+    assert set(entry["extra"]) == {"duration_ms", "payload", "obj"}
+    assert entry["extra"]["payload"] == {"a": 1}
+    assert entry["extra"]["obj"].startswith("<object object")
+    assert entry["thread"]["name"] == threading.current_thread().name
+
+    # Disposition d'attributs mise en cache et réutilisée
+    formatter.format(_record(request_id="req-2", duration_ms=1.0, payload={}, obj=None, _private=2))
+    assert len(formatter._extra_keys_cache) == 1
+
+
+def test_sampling_and_rate_limit_per_logger():
+    sampling = SamplingFilter({
+        "nextvision.hot": {"sample_rate": 0.25},
+        "nextvision.hot.limited": {"max_per_second": 10}
+    })
+
+    sampled = [sampling.filter(_record("nextvision.hot.scorer", created=100.0)) for _ in range(100)]
+    limited = [sampling.filter(_record("nextvision.hot.limited", created=100.0)) for _ in range(50)]
+    refilled = sampling.filter(_record("nextvision.hot.limited", created=100.5))
+    warnings = [sampling.filter(_record("nextvision.hot.scorer", level=logging.WARNING)) for _ in range(10)]
+    other = sampling.filter(_record("nextvision.cold"))
+
+    assert sum(sampled) == 25
+    assert sum(limited) == 10
+    assert refilled
+    assert all(warnings) and other
+    assert sampling.dropped == {"nextvision.hot": 75, "nextvision.hot.limited": 40}
+
+
+def test_sampling_decision_is_shared_between_handlers():
+    sampling = SamplingFilter({"nextvision": {"sample_rate": 0.5}})
+    record = _record()
+
+    assert [sampling.filter(record) for _ in range(4)] == [False] * 4
+
+
+def test_pipeline_writes_from_background_thread_with_caller_context():
+    capture = _CaptureHandler()
+    pipeline = AsyncLogPipeline([capture], queue_size=100)
+    logger = logging.getLogger("nextvision.test.pipeline")
+    logger.setLevel(logging.INFO)
+    logger.addHandler(pipeline.handler)
+    logger.propagate = False
+
+    pipeline.start()
+    try:
+        with log_context(LogContext(request_id="req-42")):
+            logger.info("valeur %s", [1, 2])
+    finally:
+        pipeline.stop()
+        logger.removeHandler(pipeline.handler)
+
+    assert len(capture.records) == 1
+    record = capture.records[0]
+    assert record.getMessage() == "valeur [1, 2]"
+    assert record.request_id == "req-42"
+    assert threading.current_thread().name not in capture.threads
+
+
+def test_full_queue_drops_instead_of_blocking():
+    pipeline = AsyncLogPipeline([_CaptureHandler()], queue_size=2)
+    logger = logging.getLogger("nextvision.test.full")
+    logger.addHandler(pipeline.handler)
+    logger.propagate = False
+
+    try:
+        # Listener non démarré : la file se remplit
+        for i in range(5):
+            logger.warning(f"record {i}")
+    finally:
+        logger.removeHandler(pipeline.handler)
+
+    assert pipeline.get_stats()["dropped_queue_full"] == 3
+    assert pipeline.queue.qsize() == 2
+
+
+@pytest.fixture
+def restore_nextvision_logging():
+    root = logging.getLogger("nextvision")
+    saved = (list(root.handlers), root.level, root.propagate)
+    yield
+    structured_logging.shutdown_logging()
+    structured_logging._production_root_configured = False
+    root.handlers[:] = saved[0]
+    root.setLevel(saved[1])
+    root.propagate = saved[2]
+
+
+def test_production_setup_routes_structured_loggers_through_pipeline(restore_nextvision_logging):
+    module_logger = structured_logging.get_structured_logger("nextvision.test.module")
+    assert module_logger.handlers
+
+    config = structured_logging.setup_production_logging(enable_file_logging=False, queue_size=50)
+
+    assert config["async_logging"] is True
+    assert not module_logger.handlers and module_logger.propagate
+    assert structured_logging.get_logging_stats()["running"] is True
+
+    structured_logging.shutdown_logging()
+    assert structured_logging.get_logging_stats() == {"async_logging": False}
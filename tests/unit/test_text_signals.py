@@ -0,0 +1,81 @@
+"""
+🧪 Tests détection de signaux textuels (équivalence avec `in` / `re.search`, préfiltre par littéral)
+
+Author: NEXTEN Team
+Version: 1.0.0 - Text Signals
+"""
+
+import random
+import re
+
+from nextvision.services.hierarchical_detector import HierarchicalDetector, HierarchicalLevel
+from nextvision.utils.text_signals import (
+    TextSignalMatcher, get_text_signal_matcher, leading_literals
+)
+
+KEYWORDS = {
+    "formation": ["formation", "formation équipe", "formation junior"],
+    "tech": ["tech", "technologies", "ia", "ai"],
+    "vide": []
+}
+PATTERNS = {
+    "titres": [
+        r"\b(?:directeur|directrice)\s+(?:comptable|financier)\b",
+        r"\b(?:directeur|directrice)\s+(?:administratif|financier)\b",
+        r"\bDAF\b",
+        r"\bcomptable\b(?!\s+(?:senior|principal))",
+        r"(\d+)\s+ans?\s+d'expérience"
+    ]
+}
+VOCABULARY = [
+    "formation", "formations", "formation équipe", "technologies", "initiative", "directeur financier",
+    "Directrice Comptable", "DAF", "dafs", "comptable", "comptable senior", "comptables", "12 ans d'expérience",
+    "le", "et", "maintenance"
+]
+
+
+def _expected(text):
+    hits = {category: tuple(term for term in terms if term in text) for category, terms in KEYWORDS.items()}
+    hits["titres"] = tuple(pattern for pattern in PATTERNS["titres"] if re.search(pattern, text, re.IGNORECASE))
+    return hits
+
+
+def test_scan_matches_naive_checks():
+    matcher = TextSignalMatcher(KEYWORDS, PATTERNS)
+    rng = random.Random(7)
+    texts = [" ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(0, 25))) for _ in range(500)]
+
+    for text in texts + [text.lower() for text in texts]:
+        assert matcher.scan(text).hits == _expected(text), text
+
+    signals = matcher.scan("directeur financier - formation équipe")
+    assert signals.count("titres") == 2 and signals.count("formation") == 2
+    assert signals.has("formation") and not signals.has("tech")
+
+
+def test_leading_literals():
+    assert leading_literals(r"\b(?:directeur|directrice)\s+comptable") == ("direct",)
+    assert leading_literals(r"\b(?:pdg|drh)\b") == ("pdg", "drh")
+    assert leading_literals(r"\bDAF\b", re.IGNORECASE) == ("daf",)
+    assert leading_literals(r"\bDAF\b") == ("DAF",)
+    # Sans littéral de tête : regex évaluée sur tout le texte
+    assert leading_literals(r"(\d+)\s+ans") is None
+    assert leading_literals(r"a|\d") is None
+
+
+def test_matchers_are_shared_per_specification():
+    matcher = get_text_signal_matcher(KEYWORDS, PATTERNS)
+    assert get_text_signal_matcher(dict(KEYWORDS), PATTERNS) is matcher
+    assert get_text_signal_matcher({"tech": ["tech"]}) is not matcher
+
+
+def test_hierarchical_detector_uses_extended_patterns():
+    detector = HierarchicalDetector()
+    daf = detector.detect_hierarchical_level("Directeur Administratif et Financier (DAF) - 15 ans d'expérience")
+    assert daf.detected_level == HierarchicalLevel.EXECUTIVE
+    assert r"\bDAF\b" in daf.keywords_found
+
+    # Patterns étendus après construction : matcher recompilé
+    detector.level_patterns[HierarchicalLevel.EXECUTIVE]["titles"].append(r"\bsecrétaire\s+général\b")
+    result = detector.detect_hierarchical_level("Secrétaire Général", is_job_posting=True)
+    assert result.detected_level == HierarchicalLevel.EXECUTIVE